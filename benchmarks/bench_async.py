@@ -0,0 +1,49 @@
+"""Thousands of concurrent operations on one event loop.
+
+Run with: python -m benchmarks.bench_async [N]
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from todolist.core.services.async_project_service import AsyncProjectService
+from todolist.core.services.async_task_service import AsyncTaskService
+from todolist.storage.async_storage import AsyncMemoryStorage, ExecutorStorage
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+
+
+async def _drive(storage, n: int) -> float:
+    projects = AsyncProjectService(storage)
+    tasks = AsyncTaskService(storage)
+    proj = await projects.create_project("async bench", "")
+    tasks.quotas.set_task_limit(proj.id, n)
+
+    async def one(i: int) -> None:
+        task = await tasks.add_task(proj.id, f"task {i}", "")
+        await tasks.change_status(proj.id, task.id, "doing")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(n)), return_exceptions=True)
+    return time.perf_counter() - start
+
+
+async def _run(label: str, storage, n: int) -> None:
+    elapsed = await _drive(storage, n)
+    print(f"{label:<26} {n} concurrent add+status in {elapsed:.2f}s  ({2 * n / elapsed:,.0f} calls/s)")
+
+
+def main(n: int = 10_000) -> None:
+    asyncio.run(_run("AsyncMemoryStorage", AsyncMemoryStorage(MemoryStorage()), n))
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = ExecutorStorage(SQLiteStorage(os.path.join(tmp, "todo.db")))
+        asyncio.run(_run("ExecutorStorage(SQLite)", storage, n))
+        storage.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
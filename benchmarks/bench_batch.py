@@ -0,0 +1,131 @@
+"""Batch mode: commands per second vs. scripting the interactive menu.
+
+Generates a script of project and task commands (add, change status, edit,
+a few listings), runs it through BatchRunner on the memory and journal
+backends, quiet and not, and feeds a short prefix of the same work to the
+interactive CLI by answering its prompts, as a script driving ``input()``
+would. Also runs the whole script end to end through
+``python -m todolist.main --batch --quiet``. Checks that every command
+succeeds and the tasks all arrive.
+
+Run with: python -m benchmarks.bench_batch [COMMANDS]
+"""
+from __future__ import annotations
+
+import builtins
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+from todolist.cli.batch import BatchRunner
+from todolist.cli.menu import CLI
+from todolist.core.services.quota import quotas_for
+from todolist.storage.journal_storage import JournalStorage
+from todolist.storage.memory_storage import MemoryStorage
+
+PROJECTS = 20
+
+
+def _script(n: int) -> List[str]:
+    lines = [f"create_project name=p{p} description=bench as=p{p}" for p in range(PROJECTS)]
+    i = 0
+    while len(lines) < n:
+        p = i % PROJECTS
+        lines.append(f'add_task project=$p{p} title="task {i}" deadline=2026-0{1 + i % 9}-15 as=t{i}')
+        lines.append(f"change_status project=$p{p} task=$t{i} status=doing")
+        lines.append(f'{{"op": "edit_task", "project": "$p{p}", "task": "$t{i}", "title": "edited {i}"}}')
+        if i % 1000 == 999:
+            lines.append(f"summary project=$p{p} as_of=2026-03-01")
+        i += 1
+    return lines[:n]
+
+
+def _limits(storage) -> None:
+    quotas = quotas_for(storage)
+    quotas.max_projects = PROJECTS
+    quotas.max_tasks = 10 ** 7
+
+
+def _batch(label: str, storage, lines: List[str], quiet: bool) -> None:
+    _limits(storage)
+    out = io.StringIO()
+    runner = BatchRunner(storage, out, quiet=quiet)
+    start = time.perf_counter()
+    failed = runner.run(lines)
+    elapsed = time.perf_counter() - start
+    assert failed == 0, out.getvalue()[-2000:]
+    assert sum(storage.count_tasks(p.id) for p in storage.get_all_projects()) == runner.counts["add_task"]
+    print(f"{label:<28} {len(lines):>8,} commands {elapsed:7.2f}s  {len(lines) / elapsed:>10,.0f}/s"
+          f"  output {len(out.getvalue()) / 1e6:5.1f}MB")
+
+
+def _interactive(n: int) -> None:
+    # The same work as add_task + change_status pairs, typed into the menu.
+    storage = MemoryStorage()
+    _limits(storage)
+    cli = CLI(storage)
+    cli.pager.more = lambda: False
+    pids = [cli.project_service.create_project(f"p{p}", "bench").id for p in range(PROJECTS)]
+    answers: List[str] = []
+    real_input = builtins.input
+    builtins.input = lambda prompt="": answers.pop()
+    try:
+        screen = io.StringIO()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(screen):
+            for i in range(n // 2):
+                pid = pids[i % PROJECTS]
+                # add_task: project, title, description, deadline, pause
+                answers[:] = reversed([pid, f"task {i}", "", "2026-01-15", ""])
+                screen.seek(0)
+                screen.truncate()
+                cli.add_task()
+                tid = screen.getvalue().rsplit("Task added: ", 1)[1].split(" |", 1)[0]
+                # change_task_status: project, task, status, pause
+                answers[:] = reversed([pid, tid, "doing", ""])
+                cli.change_task_status()
+        elapsed = time.perf_counter() - start
+    finally:
+        builtins.input = real_input
+    print(f"{'interactive menu (memory)':<28} {n:>8,} commands {elapsed:7.2f}s  {n / elapsed:>10,.0f}/s")
+
+
+def _end_to_end(lines: List[str]) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "commands.txt")
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write("\n".join(lines))
+        env = dict(os.environ, MAX_NUMBER_OF_PROJECTS=str(PROJECTS), MAX_NUMBER_OF_TASKS=str(10 ** 7))
+        start = time.perf_counter()
+        done = subprocess.run(
+            [sys.executable, "-m", "todolist.main", "--batch", path, "--quiet"],
+            env=env, capture_output=True, text=True, check=False,
+        )
+        elapsed = time.perf_counter() - start
+    assert done.returncode == 0, done.stdout[-2000:] + done.stderr[-2000:]
+    print(f"{'python -m todolist.main':<28} {len(lines):>8,} commands {elapsed:7.2f}s  {len(lines) / elapsed:>10,.0f}/s"
+          f"  (with startup)")
+    print(done.stdout.splitlines()[0])
+
+
+def main(n: int = 100_000) -> None:
+    lines = _script(n)
+    _interactive(2_000)
+    _batch("batch, memory", MemoryStorage(), lines, quiet=False)
+    _batch("batch, memory, --quiet", MemoryStorage(), lines, quiet=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = JournalStorage(os.path.join(tmp, "todo.journal"))
+        try:
+            _batch("batch, journal, --quiet", journal, lines, quiet=True)
+        finally:
+            journal.close()
+    _end_to_end(lines)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,100 @@
+"""Bulk import vs. one TaskService.add_task call per row, plus export speed.
+
+Run with: python -m benchmarks.bench_bulk_import [N]
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+# The per-project task limit is read at import time; lift it for a 1M-row project.
+os.environ.setdefault("MAX_NUMBER_OF_TASKS", str(10 ** 9))
+
+from todolist.core.entities.project import Project  # noqa: E402
+from todolist.core.services.task_service import TaskService  # noqa: E402
+from todolist.storage.memory_storage import MemoryStorage  # noqa: E402
+
+
+def _write_file(path: str, n: int) -> None:
+    base = date(2026, 1, 1)
+    with open(path, "w", encoding="utf-8") as fh:
+        for i in range(n):
+            deadline = (base + timedelta(days=i % 700)).isoformat() if i % 10 < 7 else None
+            fh.write(json.dumps({"id": f"t{i}", "title": f"task {i % 5000}", "description": "migrated",
+                                 "deadline": deadline}))
+            fh.write("\n")
+
+
+def _service() -> TaskService:
+    storage = MemoryStorage()
+    storage.add_project(Project(id="p", name="bench", description=""))
+    return TaskService(storage)
+
+
+def _per_call(path: str) -> int:
+    # What a migration script does today: one add_task call per row.
+    tasks = _service()
+    n = 0
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            row = json.loads(line)
+            deadline = date.fromisoformat(row["deadline"]) if row["deadline"] else None
+            tasks.add_task("p", row["title"], row["description"], deadline)
+            n += 1
+    return n
+
+
+def _bulk(path: str, fmt: str) -> int:
+    tasks = _service()
+    with open(path, newline="", encoding="utf-8") as fh:
+        result = tasks.import_stream("p", fh, fmt)
+    assert not result.errors, result.errors[:5]
+    assert tasks.count_tasks("p") == result.added
+    return result.added
+
+
+def _export(path: str, fmt: str) -> int:
+    tasks = _service()
+    with open(path, encoding="utf-8") as fh:
+        tasks.import_stream("p", fh, "jsonl")
+    out = path + "." + fmt
+    start = time.perf_counter()
+    with open(out, "w", newline="", encoding="utf-8") as fh:
+        n = tasks.export_stream("p", fh, fmt)
+    elapsed = time.perf_counter() - start
+    print(f"export {fmt:<5}  {n:>9,} rows  {elapsed:7.2f}s  {n / elapsed:>11,.0f} rows/s")
+    return n
+
+
+def main(n: int = 1_000_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        jsonl = os.path.join(tmp, "tasks.jsonl")
+        _write_file(jsonl, n)
+
+        rows = {}
+        for label, fn in (
+            ("per-call add_task", lambda: _per_call(jsonl)),
+            ("import_stream jsonl", lambda: _bulk(jsonl, "jsonl")),
+        ):
+            start = time.perf_counter()
+            count = fn()
+            elapsed = time.perf_counter() - start
+            rows[label] = count / elapsed
+            print(f"{label:<20} {count:>9,} rows  {elapsed:7.2f}s  {count / elapsed:>11,.0f} rows/s")
+
+        _export(jsonl, "csv")
+        start = time.perf_counter()
+        count = _bulk(jsonl + ".csv", "csv")
+        elapsed = time.perf_counter() - start
+        print(f"{'import_stream csv':<20} {count:>9,} rows  {elapsed:7.2f}s  {count / elapsed:>11,.0f} rows/s")
+        _export(jsonl, "jsonl")
+
+        print(f"speedup (jsonl): {rows['import_stream jsonl'] / rows['per-call add_task']:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
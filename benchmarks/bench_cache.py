@@ -0,0 +1,211 @@
+"""Read-through cache: backend round trips and throughput in front of a slow backend.
+
+The backend is a SQLite database in memory behind a fixed delay per call,
+standing in for a remote database. Counts the backend calls one
+``CLI.edit_task`` interaction makes with and without the cache, then runs
+a skewed mix of task reads, status changes and edits through TaskService
+with LRUs of several sizes. Finally, checks that the cache never answers
+differently from the backend: with constant eviction, through updates,
+deletes, project removals and rolled-back transactions, and under threads.
+
+Run with: python -m benchmarks.bench_cache [OPERATIONS]
+"""
+from __future__ import annotations
+
+import builtins
+import contextlib
+import io
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, List, Optional, Tuple
+
+from todolist.cli.menu import CLI
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.quota import quotas_for
+from todolist.core.services.task_service import TaskService
+from todolist.storage.caching_storage import CachingStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+
+DELAY = 100e-6
+PROJECTS = 50
+TASKS_PER_PROJECT = 200
+
+
+class SlowStorage:
+    """A SQLite database in memory that sleeps ``delay`` seconds on every call and counts them."""
+
+    def __init__(self, delay: float = DELAY) -> None:
+        self.inner = SQLiteStorage(":memory:")
+        self.delay = delay
+        self.calls: Counter = Counter()
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.inner, name)
+        if not callable(attr) or name == "transaction":
+            return attr
+
+        def slow(*args: Any, **kwargs: Any) -> Any:
+            self.calls[name] += 1
+            if self.delay:
+                time.sleep(self.delay)
+            return attr(*args, **kwargs)
+
+        return slow
+
+
+def _fill(storage) -> List[Tuple[str, str]]:
+    quotas = quotas_for(storage)
+    quotas.max_projects = PROJECTS
+    quotas.max_tasks = TASKS_PER_PROJECT
+    projects = ProjectService(storage)
+    tasks = TaskService(storage)
+    keys = []
+    for p in range(PROJECTS):
+        pid = projects.create_project(f"p{p}", "bench").id
+        rows = [{"title": f"task {i}"} for i in range(TASKS_PER_PROJECT)]
+        tasks.add_tasks_bulk(pid, rows)
+        keys.extend((pid, t.id) for t in storage.list_tasks(pid))
+    return keys
+
+
+def _cli_edit_task() -> None:
+    for cached in (False, True):
+        slow = SlowStorage(delay=0)
+        storage = CachingStorage(slow) if cached else slow
+        pid, tid = _fill(storage)[0]
+        cli = CLI(storage)
+        cli.pager.more = lambda: False
+        answers: List[str] = []
+        real_input = builtins.input
+        builtins.input = lambda prompt="": answers.pop()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                for i in range(2):  # the second time round is the warm one
+                    # project, task, title, description, status, deadline, pause
+                    answers[:] = reversed([pid, tid, f"edited {i}", "", "doing", "", ""])
+                    before = Counter(slow.calls)
+                    cli.edit_task()
+        finally:
+            builtins.input = real_input
+        used = slow.calls - before
+        label = "cached" if cached else "uncached"
+        print(f"CLI.edit_task {label:<9} backend calls {sum(used.values()):>3}"
+              f"   get_project {used['get_project']}   get_task {used['get_task']}")
+
+
+def _mix(n: int, maxsize: Optional[int]) -> None:
+    slow = SlowStorage()
+    storage = CachingStorage(slow, maxsize) if maxsize else slow
+    keys = _fill(storage)
+    tasks = TaskService(storage)
+    rng = random.Random(7)
+    # Skewed: four in five operations go to a fifth of the tasks.
+    hot = keys[: len(keys) // 5]
+    ops = [(rng.random(), rng.choice(hot if rng.random() < 0.8 else keys)) for _ in range(n)]
+    slow.calls.clear()
+    start = time.perf_counter()
+    for r, (pid, tid) in ops:
+        if r < 0.7:
+            tasks.get_task(pid, tid)
+        elif r < 0.9:
+            tasks.change_status(pid, tid, "doing" if r < 0.8 else "todo")
+        else:
+            tasks.edit_task(pid, tid, title=f"t{r:.3f}")
+    elapsed = time.perf_counter() - start
+    label = f"LRU {maxsize:,}" if maxsize else "no cache"
+    line = f"{label:<12} {n / elapsed:>9,.0f} ops/s   backend calls/op {sum(slow.calls.values()) / n:5.2f}"
+    if maxsize:
+        stats = storage.cache_stats()
+        line += f"   hit rate {stats.hit_rate:5.1%}   evictions {stats.evictions:,}"
+    print(line)
+
+
+def _task(tid: str, step: int) -> Task:
+    return Task(id=tid, title=f"new {step}", description="", status="todo", deadline=None)
+
+
+def _same(cache: CachingStorage, backend: SQLiteStorage, pid: str, tid: str) -> None:
+    p, q = cache.get_project(pid), backend.get_project(pid)
+    assert (p and (p.id, p.name, p.description)) == (q and (q.id, q.name, q.description)), (pid, p, q)
+    assert cache.get_task(pid, tid) == backend.get_task(pid, tid), (pid, tid)
+
+
+def _consistency(n: int) -> None:
+    backend = SQLiteStorage(":memory:")
+    cache = CachingStorage(backend, maxsize=16)
+    rng = random.Random(11)
+    pids = [f"p{i}" for i in range(8)]
+    tids = [f"t{i}" for i in range(30)]
+    for step in range(n):
+        pid, tid, r = rng.choice(pids), rng.choice(tids), rng.random()
+        if cache.get_project(pid) is None:
+            cache.add_project(Project(id=pid, name=pid, description=""))
+        elif r < 0.25:
+            if cache.get_task(pid, tid) is None:
+                cache.add_task(pid, _task(tid, step))
+        elif r < 0.5:
+            cache.update_task(pid, tid, title=f"e{step}", status=rng.choice(["todo", "doing", "done"]))
+        elif r < 0.6:
+            cache.remove_task(pid, tid)
+        elif r < 0.65:
+            cache.update_project(pid, description=f"d{step}")
+        elif r < 0.67:
+            cache.remove_project(pid)
+        elif r < 0.75:
+            try:
+                with cache.transaction():
+                    cache.update_task(pid, tid, title=f"rolled back {step}")
+                    cache.update_project(pid, description=f"rolled back {step}")
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        for _ in range(3):
+            _same(cache, backend, rng.choice(pids), rng.choice(tids))
+    stats = cache.cache_stats()
+    print(f"consistency ok: {n:,} steps, LRU 16, hit rate {stats.hit_rate:.1%}, evictions {stats.evictions:,}")
+    _threads(backend, pids, tids)
+
+
+def _threads(backend: SQLiteStorage, pids: List[str], tids: List[str]) -> None:
+    cache = CachingStorage(backend, maxsize=64)
+    for pid in pids:
+        if backend.get_project(pid) is None:
+            cache.add_project(Project(id=pid, name=pid, description=""))
+        for tid in tids:
+            if backend.get_task(pid, tid) is None:
+                cache.add_task(pid, _task(tid, 0))
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        for i in range(3000):
+            pid, tid = rng.choice(pids), rng.choice(tids)
+            if rng.random() < 0.3:
+                cache.update_task(pid, tid, title=f"w{seed}-{i}")
+            else:
+                cache.get_task(pid, tid)
+
+    pool = [threading.Thread(target=worker, args=(seed,)) for seed in range(4)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    for pid in pids:
+        for tid in tids:
+            _same(cache, backend, pid, tid)
+    print("threads ok: 4 threads, every cached entry matches the backend")
+
+
+def main(n: int = 5_000) -> None:
+    _cli_edit_task()
+    for maxsize in (None, 100, 1_000, 20_000):
+        _mix(n, maxsize)
+    _consistency(n * 4)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000)
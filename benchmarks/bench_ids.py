@@ -0,0 +1,121 @@
+"""Id allocation: ids per second under threads, uniqueness, and resuming after a restart.
+
+Compares the per-store allocator with the old ``uuid4().hex[:4]`` ids on
+one thread, then draws ids from 1, 2, 4 and 8 threads at once and checks
+that every id is distinct and that each thread's ids come out in sorted
+order. Restarts a journal and a SQLite store and checks that ids are never
+handed out twice, including after a rolled-back SQLite transaction and an
+import that brought its own ids.
+
+Run with: python -m benchmarks.bench_ids [IDS_PER_THREAD]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+from todolist.core.entities.project import Project
+from todolist.core.services.task_service import TaskService
+from todolist.storage.journal_storage import JournalStorage
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+from todolist.utils.ids import IdAllocator, decode_id, encode_id, ids_for
+
+
+def _rate(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return n / (time.perf_counter() - start)
+
+
+def _single(n: int) -> None:
+    old = _rate(lambda: uuid.uuid4().hex[:4], n)
+    new = _rate(ids_for(MemoryStorage()).next_id, n)
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = JournalStorage(os.path.join(tmp, "j"))
+        journaled = _rate(ids_for(journal).next_id, n)
+        journal.close()
+    start = time.perf_counter()
+    ids_for(MemoryStorage()).take(n)
+    batch = n / (time.perf_counter() - start)
+    print(f"1 thread   uuid4().hex[:4] {old:>12,.0f} ids/s")
+    print(f"           next_id memory  {new:>12,.0f} ids/s   journal {journaled:>12,.0f} ids/s")
+    print(f"           take({n}) batch {batch:>12,.0f} ids/s")
+
+
+def _threads(threads: int, n: int) -> None:
+    allocator = ids_for(MemoryStorage())
+    barrier = threading.Barrier(threads + 1)
+    drawn = [[] for _ in range(threads)]
+
+    def worker(out: list) -> None:
+        next_id = allocator.next_id
+        barrier.wait()
+        for _ in range(n):
+            out.append(next_id())
+
+    pool = [threading.Thread(target=worker, args=(out,)) for out in drawn]
+    for t in pool:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - start
+    every = [i for out in drawn for i in out]
+    assert len(set(every)) == threads * n, "duplicate id"
+    assert all(out == sorted(out) for out in drawn), "ids out of order within a thread"
+    print(f"{threads} thread(s) next_id         {threads * n / elapsed:>12,.0f} ids/s   all {threads * n:,} distinct")
+
+
+def _restarts() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "todo.journal")
+        storage = JournalStorage(path)
+        first = [ids_for(storage).next_id() for _ in range(10)]
+        storage.close()
+        storage = JournalStorage(path)
+        again = ids_for(storage).next_id()
+        assert again not in first and decode_id(again) > decode_id(first[-1])
+        storage.compact()
+        storage.close()
+        storage = JournalStorage(path)
+        assert decode_id(ids_for(storage).next_id()) > decode_id(again)
+        storage.close()
+
+        db = os.path.join(tmp, "todo.db")
+        storage = SQLiteStorage(db)
+        storage.add_project(Project(id="p", name="p", description=""))
+        tasks = TaskService(storage)
+        try:
+            with storage.transaction():
+                reserved = tasks.ids.next_id()  # reserves a block inside the transaction
+                raise RuntimeError("roll back")
+        except RuntimeError:
+            pass
+        assert storage.reserve_ids(0) > decode_id(reserved), "rollback gave reserved ids back"
+        # An import bringing ids of another store's numbering.
+        result = tasks.add_tasks_bulk("p", [{"id": encode_id(5_000), "title": "imported"}, {"title": "new"}])
+        assert result.added == 2
+        storage.close()
+        storage = SQLiteStorage(db)
+        after = IdAllocator(storage.reserve_ids).next_id()
+        assert decode_id(after) > max(decode_id(reserved), 5_000)
+        storage.close()
+    print("restarts ok: journal, journal after compaction, SQLite after rollback and import")
+
+
+def main(n: int = 200_000) -> None:
+    _single(n)
+    for threads in (1, 2, 4, 8):
+        _threads(threads, n // threads)
+    _restarts()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
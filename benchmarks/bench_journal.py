@@ -0,0 +1,53 @@
+"""JournalStorage write throughput and cold-start replay time.
+
+Run with: python -m benchmarks.bench_journal [N]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.storage.journal_storage import JournalStorage
+
+
+def main(n: int = 1_000_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "todo.journal")
+
+        # compact_every is raised so the replay below measures the raw journal.
+        storage = JournalStorage(path, compact_every=n * 2)
+        storage.add_project(Project(id="p", name="bench", description=""))
+        start = time.perf_counter()
+        for i in range(n):
+            storage.add_task("p", Task(id=f"t{i}", title=f"task {i}", description=""))
+        storage.close()
+        write_s = time.perf_counter() - start
+        size_mb = os.path.getsize(path) / 1e6
+
+        start = time.perf_counter()
+        storage = JournalStorage(path, compact_every=n * 2)
+        replay_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        storage.compact()
+        compact_s = time.perf_counter() - start
+        storage.close()
+
+        start = time.perf_counter()
+        storage = JournalStorage(path)
+        snapshot_s = time.perf_counter() - start
+        storage.close()
+
+    print(f"tasks={n}  journal={size_mb:.1f} MB")
+    print(f"append          {write_s:.2f}s  ({n / write_s:,.0f} writes/s)")
+    print(f"replay journal  {replay_s:.2f}s")
+    print(f"compact         {compact_s:.2f}s")
+    print(f"load snapshot   {snapshot_s:.2f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,55 @@
+"""Time to first row and peak memory of full-copy vs paged task listings.
+
+Run with: python -m benchmarks.bench_listing [N ...]
+"""
+from __future__ import annotations
+
+import io
+import sys
+import time
+import tracemalloc
+from typing import Callable, Iterable
+
+from todolist.cli.pager import Pager
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.core.services.task_service import TaskService
+from todolist.storage.memory_storage import MemoryStorage
+
+
+def _measure(label: str, n: int, first_row: Callable[[], object]) -> None:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    first_row()
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<14} n={n:<9} first row {elapsed * 1e3:8.3f} ms  peak {peak / 1024:9.1f} KiB")
+
+
+def _first_screen(rows: Iterable[str]) -> None:
+    # One page is rendered, then the user stops.
+    Pager(out=io.StringIO(), more=lambda: False).render("", rows)
+
+
+def main(sizes: Iterable[int] = (1_000, 100_000, 1_000_000)) -> None:
+    for n in sizes:
+        storage = MemoryStorage()
+        proj = Project.create(name="big", description="")
+        storage.add_project(proj)
+        for i in range(n):
+            storage.add_task(proj.id, Task(id=f"t{i}", title=f"task {i}", description=""))
+        service = TaskService(storage)
+
+        _measure("list_tasks", n, lambda: service.list_tasks(proj.id)[0])
+        _measure("iter_tasks", n, lambda: next(service.iter_tasks(proj.id, page_size=50)))
+        _measure("pager (list)", n, lambda: _first_screen(t.title for t in service.list_tasks(proj.id)))
+        _measure("pager (iter)", n, lambda: _first_screen(t.title for t in service.iter_tasks(proj.id, 50)))
+
+        # Walking every page must see each task exactly once.
+        seen = sum(1 for _ in service.iter_tasks(proj.id, page_size=1000))
+        assert seen == n, (seen, n)
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or (1_000, 100_000, 1_000_000))
@@ -0,0 +1,52 @@
+"""Cost of the metrics layer: never enabled, enabled, and switched back off.
+
+Run with: python -m benchmarks.bench_metrics [N]
+"""
+from __future__ import annotations
+
+import gc
+import sys
+import time
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import STATUSES, Task
+from todolist.core.services.task_service import TaskService
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.utils import metrics
+
+
+def _ns_per_op(tasks: TaskService, n: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter_ns()
+        for i in range(n):
+            tid = f"t{i % 1000}"
+            tasks.get_task("p", tid)
+            tasks.change_status("p", tid, STATUSES[i % 3])
+        best = min(best, (time.perf_counter_ns() - start) / (2 * n))
+        gc.enable()
+    return best
+
+
+def main(n: int = 50_000) -> None:
+    storage = MemoryStorage()
+    storage.add_project(Project(id="p", name="bench", description=""))
+    for i in range(1000):
+        storage.add_task("p", Task(id=f"t{i}", title="t", description=""))
+    tasks = TaskService(storage)
+
+    never = _ns_per_op(tasks, n)
+    metrics.instrument()
+    enabled = _ns_per_op(tasks, n)
+    metrics.uninstrument()
+    disabled = _ns_per_op(tasks, n)
+
+    print(f"never enabled  {never:8.0f} ns/call")
+    print(f"enabled        {enabled:8.0f} ns/call  ({enabled / never:.2f}x)")
+    print(f"disabled again {disabled:8.0f} ns/call  ({disabled / never:.2f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,42 @@
+"""Task lookup/removal inside a single large project.
+
+Run with: python -m benchmarks.bench_project_tasks [N]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+
+
+def main(n: int = 100_000) -> None:
+    proj = Project(id="p", name="bench", description="")
+    start = time.perf_counter()
+    for i in range(n):
+        proj.add_task(Task(id=f"t{i}", title=f"task {i}", description=""))
+    add_s = time.perf_counter() - start
+
+    ids = [f"t{i}" for i in range(n)]
+    random.shuffle(ids)
+
+    start = time.perf_counter()
+    for tid in ids:
+        proj.get_task(tid)
+    get_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for tid in ids:
+        proj.remove_task(tid)
+    remove_s = time.perf_counter() - start
+
+    print(f"tasks={n}")
+    print(f"add     {add_s:.3f}s  ({n / add_s:,.0f}/s)")
+    print(f"get     {get_s:.3f}s  ({n / get_s:,.0f}/s)")
+    print(f"remove  {remove_s:.3f}s  ({n / remove_s:,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,114 @@
+"""Limit checks: quota counters vs. counting in storage, and exactness under threads.
+
+The SQLite backend answers count_tasks with COUNT(*), so a check that
+counts per add grows with the project; the quota engine's check does not.
+Also races threads for the last slots of a project and of the project
+limit, and checks that exactly the limit gets through.
+
+Run with: python -m benchmarks.bench_quota [N]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.core.exceptions.limit_exceeded import LimitExceededError
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.quota import QuotaEngine
+from todolist.core.services.task_service import TaskService
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+
+
+def _check_cost(n: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = SQLiteStorage(os.path.join(tmp, "todo.db"))
+        storage.add_project(Project(id="p", name="big", description=""))
+        with storage.transaction():
+            storage.add_tasks("p", [Task(id=f"t{i}", title="t", description="") for i in range(n)])
+        quotas = QuotaEngine(storage, max_tasks=n + 10 ** 6)
+        rounds = 2_000
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            full = storage.count_tasks("p") >= quotas.max_tasks
+        counted = (time.perf_counter() - start) / rounds
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            quotas.reserve_tasks("p")
+            quotas.release_tasks("p")
+        engine = (time.perf_counter() - start) / rounds
+        storage.close()
+    assert not full
+    print(f"tasks={n:<9} COUNT(*) check {counted * 1e6:9.1f}us   quota reserve+release {engine * 1e6:6.2f}us")
+
+
+def _race_tasks(threads: int, limit: int) -> None:
+    storage = MemoryStorage()
+    storage.add_project(Project(id="p", name="raced", description=""))
+    tasks = TaskService(storage)
+    tasks.set_task_limit("p", limit)
+    barrier = threading.Barrier(threads)
+    added, refused = [], []
+
+    def worker(w: int) -> None:
+        barrier.wait()
+        for i in range(limit):
+            try:
+                added.append(tasks.add_task("p", f"w{w} {i}", ""))
+            except LimitExceededError:
+                refused.append(w)
+
+    pool = [threading.Thread(target=worker, args=(w,)) for w in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    assert len(added) == limit, (len(added), limit)
+    assert len(refused) == threads * limit - limit
+    assert tasks.quotas.task_count("p") == limit
+    assert storage.count_tasks("p") == limit
+    print(f"tasks race     {threads} threads x {limit} adds, limit {limit}: {len(added)} added, {len(refused)} refused")
+
+
+def _race_projects(threads: int) -> None:
+    storage = MemoryStorage()
+    projects = ProjectService(storage)
+    limit = projects.quotas.max_projects
+    barrier = threading.Barrier(threads)
+    created, refused = [], []
+
+    def worker(w: int) -> None:
+        barrier.wait()
+        try:
+            created.append(projects.create_project(f"racer {w}", ""))
+        except LimitExceededError:
+            refused.append(w)
+
+    pool = [threading.Thread(target=worker, args=(w,)) for w in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    assert len(created) == min(limit, threads) == storage.count_projects()
+    projects.delete_project(created[0].id)
+    projects.create_project("after delete", "")
+    assert storage.count_projects() == projects.quotas.project_count() == min(limit, threads)
+    print(f"projects race  {threads} threads, limit {limit}: {len(created)} created, {len(refused)} refused")
+
+
+def main(n: int = 100_000) -> None:
+    for size in (1_000, n):
+        _check_cost(size)
+    _race_tasks(8, 200)
+    _race_projects(32)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,148 @@
+"""Deadline reminders: cost of a run vs. scanning, and correctness on a fake clock.
+
+A run pops only the due entries of the scheduler's heap, so with the same
+number of tasks due it should cost the same at any total size; scanning
+every task list grows with the total. The fake clock then walks a small
+project day by day through adds, deadline edits, completions, reopenings,
+deletes and a unit-of-work move, checking who gets reminded when.
+
+Run with: python -m benchmarks.bench_reminders [N]
+"""
+from __future__ import annotations
+
+import sys
+import time
+from datetime import date, timedelta
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.reminders import ReminderScheduler, reminders_for
+from todolist.core.services.task_service import TaskService
+from todolist.storage.memory_storage import MemoryStorage
+
+START = date(2026, 1, 1)
+DUE_PER_DAY = 50
+
+
+class FakeClock:
+    def __init__(self, today: date) -> None:
+        self.today = today
+
+    def __call__(self) -> date:
+        return self.today
+
+    def advance(self, days: int = 1) -> None:
+        self.today += timedelta(days=days)
+
+
+def _fill(n: int) -> MemoryStorage:
+    storage = MemoryStorage()
+    days = max(n // DUE_PER_DAY, 1)
+    for p in range(10):
+        storage.add_project(Project(id=f"p{p}", name=f"project {p}", description=""))
+        storage.add_tasks(
+            f"p{p}",
+            [
+                Task(id=f"t{i}", title="t", description="", deadline=START + timedelta(days=i % days))
+                for i in range(p, n, 10)
+            ],
+        )
+    return storage
+
+
+def _scan(storage: MemoryStorage, today: date) -> int:
+    return sum(
+        1
+        for proj in storage.get_all_projects()
+        for task in storage.list_tasks(proj.id)
+        if task.deadline == today and task.status != "done"
+    )
+
+
+def _cost(n: int) -> None:
+    storage = _fill(n)
+    clock = FakeClock(START)
+    scheduler = ReminderScheduler(storage, clock=clock)
+    start = time.perf_counter()
+    scheduler.load()
+    load = time.perf_counter() - start
+    fired = 0
+    days = 20
+    start = time.perf_counter()
+    for _ in range(days):
+        fired += len(scheduler.run_pending())
+        clock.advance()
+    run = (time.perf_counter() - start) / days
+    assert fired == days * DUE_PER_DAY, fired
+
+    start = time.perf_counter()
+    scanned = _scan(storage, START)
+    scan = time.perf_counter() - start
+    assert scanned == DUE_PER_DAY
+    print(
+        f"tasks={n:<8} due/day={DUE_PER_DAY}  load {load * 1e3:8.1f}ms  run {run * 1e6:8.1f}us"
+        f"  full scan {scan * 1e3:8.1f}ms"
+    )
+
+
+def _check_fake_clock() -> None:
+    storage = MemoryStorage()
+    projects, tasks = ProjectService(storage), TaskService(storage)
+    clock = FakeClock(START)
+    scheduler = reminders_for(storage)
+    scheduler.clock = clock
+    reminded = []
+    scheduler.add_callback(lambda pid, task: reminded.append(task.title))
+
+    def day(n: int) -> date:
+        return START + timedelta(days=n)
+
+    def run_until(n: int) -> list:
+        while clock.today < day(n):
+            clock.advance()
+            scheduler.run_pending()
+        fired = sorted(reminded)
+        reminded.clear()
+        return fired
+
+    home = projects.create_project("home", "")
+    work = projects.create_project("work", "")
+    tasks.add_task(home.id, "a", "", deadline=day(1))
+    b = tasks.add_task(home.id, "b", "", deadline=day(2))
+    c = tasks.add_task(home.id, "c", "", deadline=day(2))
+    d = tasks.add_task(home.id, "d", "", deadline=day(3))
+    tasks.add_task(home.id, "no deadline", "")
+    tasks.edit_task(home.id, b.id, deadline=day(4))  # moved later
+    tasks.change_status(home.id, c.id, "done")  # finished before due
+    tasks.delete_task(home.id, d.id)
+    assert scheduler.pending() == 2 and scheduler.next_due() == day(1)
+    assert run_until(1) == ["a"]
+    assert run_until(3) == []
+
+    tasks.change_status(home.id, c.id, "todo")  # reopened, already overdue
+    with tasks.unit_of_work() as unit:
+        unit.move_task(home.id, b.id, work.id)
+    assert run_until(4) == ["b", "c"]
+    assert scheduler.pending() == 0
+
+    # Written straight to storage: caught when the old entry surfaces.
+    e = tasks.add_task(work.id, "e", "", deadline=day(5))
+    storage.update_task(work.id, e.id, deadline=day(7))
+    assert run_until(6) == []
+    assert run_until(7) == ["e"]
+
+    scheduler.lead = timedelta(days=2)
+    tasks.add_task(work.id, "f", "", deadline=day(10))
+    assert run_until(7) == [] and run_until(8) == ["f"]
+    print("fake clock ok")
+
+
+def main(n: int = 1_000_000) -> None:
+    for size in (10_000, 100_000, n):
+        _cost(size)
+    _check_fake_clock()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,56 @@
+"""Search index build time, per-update cost and query latency.
+
+Run with: python -m benchmarks.bench_search [N]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.storage.memory_storage import MemoryStorage
+
+WORDS = (
+    "deploy review write test fix refactor design release docs billing invoice "
+    "login signup search cache database migrate schema backup monitor alert "
+    "report export import sync api client server mobile web android ios"
+).split()
+
+
+def _text(rng: random.Random, k: int) -> str:
+    return " ".join(rng.choice(WORDS) + str(rng.randrange(500)) for _ in range(k))
+
+
+def main(n: int = 100_000) -> None:
+    rng = random.Random(0)
+    tasks = [Task(id=f"t{i}", title=_text(rng, 3), description=_text(rng, 8)) for i in range(n)]
+
+    storage = MemoryStorage()
+    storage.add_project(Project(id="p", name="bench", description=""))
+    start = time.perf_counter()
+    for t in tasks:
+        storage.add_task("p", t)
+    build_s = time.perf_counter() - start
+
+    updates = 10_000
+    start = time.perf_counter()
+    for i in range(updates):
+        storage.update_task("p", f"t{rng.randrange(n)}", title=_text(rng, 3))
+    update_s = time.perf_counter() - start
+
+    queries = ["deploy12", "rev", "billing1 report", "web4 ios"]
+    print(f"tasks={n}")
+    print(f"build (add_task incl. all indexes)  {build_s:.2f}s  ({build_s / n * 1e6:.1f} us/task)")
+    print(f"update title                        {update_s / updates * 1e6:.1f} us/update")
+    for q in queries:
+        start = time.perf_counter()
+        for _ in range(20):
+            hits = storage.search(q)
+        query_s = (time.perf_counter() - start) / 20
+        print(f"query {q!r:<20} {query_s * 1e3:8.2f} ms  ({len(hits)} shown)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
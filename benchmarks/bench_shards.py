@@ -0,0 +1,77 @@
+"""Sharded storage: write throughput and fan-out queries at 1, 2, 4 and 8 shards.
+
+Writer threads add and edit tasks through TaskService, each in its own
+project, so with enough cores the shards work in parallel. The in-process
+MemoryStorage is the baseline; a 1-shard run shows the cost of the process
+hop alone. Searches go to every shard and are merged in the router. The
+sharded runs are also checked against the baseline: same counts and the
+same number of search hits.
+
+Run with: python -m benchmarks.bench_shards [TASKS_PER_WRITER]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from datetime import date
+
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.task_service import TaskService
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sharded_storage import ShardedStorage
+
+WRITERS = 8
+SEARCHES = 200
+
+
+def _run(storage, per_writer: int):
+    projects = ProjectService(storage)
+    tasks = TaskService(storage)
+    projects.quotas.max_projects = WRITERS
+    tasks.quotas.max_tasks = per_writer
+    ids = [projects.create_project(f"writer {w}", "").id for w in range(WRITERS)]
+    barrier = threading.Barrier(WRITERS + 1)
+
+    def writer(pid: str) -> None:
+        barrier.wait()
+        for i in range(per_writer):
+            task = tasks.add_task(pid, f"task {i} report", "", deadline=date(2026, 1, 1 + i % 28))
+            if i % 4 == 0:
+                tasks.change_status(pid, task.id, "done")
+
+    pool = [threading.Thread(target=writer, args=(pid,)) for pid in ids]
+    for t in pool:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in pool:
+        t.join()
+    write = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(SEARCHES):
+        hits = tasks.search("report", 20)
+    search = (time.perf_counter() - start) / SEARCHES
+    counts = sorted(storage.count_tasks(pid) for pid in ids)
+    return write, search, counts, len(hits), len(tasks.tasks_by_status("done"))
+
+
+def main(per_writer: int = 2_000) -> None:
+    total = WRITERS * per_writer
+    print(f"cpus={os.cpu_count()}  writers={WRITERS}  tasks={total}")
+    write, search, *expected = _run(MemoryStorage(), per_writer)
+    print(f"in-process memory  writes {total / write:9.0f}/s   search {search * 1e3:7.2f}ms")
+    for shards in (1, 2, 4, 8):
+        storage = ShardedStorage(shards)
+        try:
+            write, search, *seen = _run(storage, per_writer)
+        finally:
+            storage.close()
+        assert seen == expected, (seen, expected)
+        print(f"{shards} shard(s)         writes {total / write:9.0f}/s   search {search * 1e3:7.2f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
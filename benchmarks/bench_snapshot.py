@@ -0,0 +1,105 @@
+"""Snapshots of MemoryStorage: cost to take, read and keep alive under writes.
+
+Compares taking a snapshot with copying the task list, and measures the
+memory a live snapshot makes writers spend: it should follow the number of
+changes, not the number of tasks. Also checks that a reader iterating a
+snapshot sees exactly the state at snapshot time while a writer thread
+edits, adds and removes tasks.
+
+Run with: python -m benchmarks.bench_snapshot [N]
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import tracemalloc
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.storage.memory_storage import MemoryStorage
+
+
+def _fill(n: int) -> MemoryStorage:
+    storage = MemoryStorage()
+    storage.add_project(Project(id="p", name="big", description=""))
+    storage.add_tasks("p", [Task(id=f"t{i}", title=f"task {i}", description="") for i in range(n)])
+    return storage
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def _write_cost(storage: MemoryStorage, n: int, changes: int) -> float:
+    """Bytes allocated per update_task while a snapshot is alive."""
+    snap = storage.snapshot()
+    title = snap.get_task("p", "t0").title
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(changes):
+        storage.update_task("p", f"t{(i * 7919) % n}", title=f"edited {i}")
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert snap.get_task("p", "t0").title == title
+    return (after - before) / changes
+
+
+def _check_consistency(storage: MemoryStorage, n: int) -> None:
+    snap = storage.snapshot()
+    expected = [(t.id, t.title) for t in storage.list_tasks("p")]
+    stop = threading.Event()
+
+    def writer() -> None:
+        i = 0
+        while not stop.is_set():
+            storage.update_task("p", f"t{(i * 31) % n}", title=f"racing {i}")
+            storage.add_task("p", Task(id=f"new{i}", title="new", description=""))
+            storage.remove_task("p", f"new{i}")
+            i += 1
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        for _ in range(3):
+            seen = [(t.id, t.title) for t in snap.iter_tasks("p")]
+            assert seen == expected, "snapshot changed under a writer"
+            assert snap.count_tasks("p") == len(expected)
+    finally:
+        stop.set()
+        thread.join()
+
+
+def main(n: int = 200_000) -> None:
+    storage = _fill(n)
+    print(f"tasks={n}")
+
+    copy, t_copy = _timed(lambda: storage.list_tasks("p"))
+    snap, t_snap = _timed(storage.snapshot)
+    print(f"take       list_tasks copy {t_copy * 1e3:9.3f}ms  snapshot {t_snap * 1e6:8.1f}us")
+
+    _, t_live = _timed(lambda: sum(1 for _ in copy))
+    count, t_iter = _timed(lambda: sum(1 for _ in snap.iter_tasks("p")))
+    assert count == n
+    print(f"iterate    copied list     {t_live * 1e3:9.3f}ms  snapshot {t_iter * 1e3:8.3f}ms")
+    del copy, snap
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    copy = storage.list_tasks("p")
+    full = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del copy
+    print(f"memory     list_tasks copy {full / 1024:9.1f}KiB  (with no snapshot held)")
+    for changes in (100, 1_000, 10_000):
+        per_change = _write_cost(storage, n, changes)
+        print(f"memory     {changes:>6} updates under a live snapshot: {per_change:7.0f} bytes/update")
+
+    _check_consistency(storage, n)
+    print("consistency ok")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,53 @@
+"""SQLiteStorage: per-call commits vs. one transaction per batch.
+
+Run with: python -m benchmarks.bench_sqlite [N]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+
+from todolist.core.entities.task import Task
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.task_service import TaskService
+from todolist.storage.sqlite_storage import SQLiteStorage
+
+
+def _add_tasks(storage: SQLiteStorage, project_id: str, n: int) -> float:
+    # Fixed ids keep the rows identical from run to run.
+    start = time.perf_counter()
+    for i in range(n):
+        storage.add_task(project_id, Task(id=f"t{i}", title=f"task {i}", description=""))
+    return time.perf_counter() - start
+
+
+def main(n: int = 20_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = SQLiteStorage(os.path.join(tmp, "todo.db"))
+        projects = ProjectService(storage)
+        tasks = TaskService(storage)
+
+        p1 = projects.create_project("autocommit", "")
+        auto_s = _add_tasks(storage, p1.id, n)
+
+        p2 = projects.create_project("batched", "")
+        with storage.transaction():
+            batch_s = _add_tasks(storage, p2.id, n)
+
+        start = time.perf_counter()
+        ids = [t.id for t in tasks.list_tasks(p2.id)]
+        for tid in ids:
+            tasks.change_status(p2.id, tid, "done")
+        update_s = time.perf_counter() - start
+        storage.close()
+
+    print(f"tasks={n}")
+    print(f"add, commit per call   {auto_s:.2f}s  ({n / auto_s:,.0f}/s)")
+    print(f"add, one transaction   {batch_s:.2f}s  ({n / batch_s:,.0f}/s)")
+    print(f"change_status          {update_s:.2f}s  ({n / update_s:,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,89 @@
+"""Cold start: import time and time to the first batch command, with caps.
+
+Runs fresh interpreters, best of several, from an empty working directory:
+``python -X importtime -c "import todolist.main"`` for the import cost of
+the entry point, and ``python -m todolist.main --batch --quiet`` on a
+single command for the time to the first command, less the time a bare
+``python -c pass`` takes. Fails if either is above its cap, if
+python-dotenv is imported when there is no .env file, or if a .env file in
+the working directory is not honoured.
+
+Run with: python -m benchmarks.bench_startup [IMPORT_CAP_MS] [FIRST_COMMAND_CAP_MS]
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import todolist
+
+RUNS = 7
+READ_SETTINGS = "from todolist.utils.settings import get_settings; get_settings()"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(todolist.__file__)))
+SETTING_PREFIXES = ("MAX_NUMBER_OF", "DATABASE_", "JOURNAL_", "METRICS_", "STORAGE_")
+
+
+def _env() -> Dict[str, str]:
+    env = {k: v for k, v in os.environ.items() if not k.startswith(SETTING_PREFIXES)}
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def _run(args: List[str], cwd: str, stdin: str = "") -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], cwd=cwd, env=_env(), input=stdin, capture_output=True, text=True, check=False
+    )
+
+
+def _imports(cwd: str, code: str = "import todolist.main") -> Dict[str, int]:
+    """Cumulative microseconds per module, from -X importtime."""
+    done = _run(["-X", "importtime", "-c", code], cwd)
+    assert done.returncode == 0, done.stderr[-2000:]
+    times = {}
+    for line in done.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line and "imported package" not in line:
+            _, cumulative, name = line.split("|")
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def _wall(args: List[str], cwd: str, stdin: str = "") -> float:
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        done = _run(args, cwd, stdin)
+        best = min(best, time.perf_counter() - start)
+        assert done.returncode == 0, done.stdout[-2000:] + done.stderr[-2000:]
+    return best * 1000
+
+
+def main(import_cap_ms: float = 60.0, first_command_cap_ms: float = 120.0) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = [_imports(tmp) for _ in range(RUNS)]
+        assert not any("dotenv" in r for r in runs), "python-dotenv imported without a .env file"
+        assert "dotenv" not in _imports(tmp, READ_SETTINGS)
+        imported = min(r["todolist.main"] for r in runs) / 1000
+        bare = _wall(["-c", "pass"], tmp)
+        first = _wall(["-m", "todolist.main", "--batch", "--quiet"], tmp, stdin="list_projects\n") - bare
+        print(f"import todolist.main      {imported:7.1f}ms   cap {import_cap_ms:5.0f}ms")
+        print(f"first batch command       {first:7.1f}ms   cap {first_command_cap_ms:5.0f}ms"
+              f"   (on top of {bare:.1f}ms for a bare interpreter)")
+
+        with open(os.path.join(tmp, ".env"), "w", encoding="utf-8") as fh:
+            fh.write("MAX_NUMBER_OF_PROJECTS=2\n")
+        script = "".join(f"create_project name=p{i}\n" for i in range(3))
+        done = _run(["-m", "todolist.main", "--batch", "--quiet"], tmp, stdin=script)
+        assert done.returncode == 1 and "Maximum number of projects reached." in done.stdout, done.stdout
+        assert "dotenv" in _imports(tmp, READ_SETTINGS), "python-dotenv not used with a .env file"
+        print(".env honoured when present, python-dotenv not imported otherwise")
+
+    assert imported <= import_cap_ms, f"import todolist.main took {imported:.1f}ms"
+    assert first <= first_command_cap_ms, f"first batch command took {first:.1f}ms"
+
+
+if __name__ == "__main__":
+    main(*(float(a) for a in sys.argv[1:3]))
@@ -0,0 +1,69 @@
+"""Maintained project summary vs. recounting every task, plus a consistency check.
+
+Run with: python -m benchmarks.bench_summary [N]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.project_summary import ProjectSummary
+from todolist.core.entities.task import STATUSES, Task
+from todolist.core.services.task_service import TaskService
+from todolist.storage.consistency import check_summaries
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+
+
+def _time(fn, repeat: int = 20) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def _fill(storage, n: int, rng: random.Random, base: date) -> None:
+    storage.add_project(Project(id="p", name="bench", description=""))
+    for i in range(n):
+        deadline = base + timedelta(days=rng.randrange(-365, 365)) if i % 3 else None
+        task = Task(id=f"t{i}", title="t", description="", status=rng.choice(STATUSES), deadline=deadline)
+        storage.add_task("p", task)
+
+
+def _churn(storage, n: int, rng: random.Random, base: date) -> None:
+    # Status flips, deadline moves and removals, each of which the counters must follow.
+    for i in range(n // 2):
+        tid = f"t{rng.randrange(n)}"
+        op = rng.random()
+        if op < 0.4:
+            storage.update_task("p", tid, status=rng.choice(STATUSES))
+        elif op < 0.8:
+            storage.update_task("p", tid, deadline=base + timedelta(days=rng.randrange(-365, 365)))
+        else:
+            storage.remove_task("p", tid)
+
+
+def main(n: int = 100_000) -> None:
+    base = date(2026, 6, 1)
+    for name, storage in (("memory", MemoryStorage()), ("sqlite", SQLiteStorage())):
+        rng = random.Random(0)
+        _fill(storage, n, rng, base)
+        _churn(storage, n, rng, base)
+        tasks = TaskService(storage)
+
+        recount = _time(lambda: ProjectSummary.from_tasks("p", tasks.list_tasks("p"), base))
+        live = _time(lambda: tasks.project_summary("p", base), repeat=200)
+        print(f"{name:<7} tasks={storage.count_tasks('p'):<8} recount {recount * 1e3:9.3f} ms  "
+              f"summary {live * 1e3:8.3f} ms  ({recount / live:,.0f}x)")
+
+        for offset in (-400, 0, 400):
+            problems = check_summaries(storage, base + timedelta(days=offset))
+            assert not problems, problems
+        print(f"{name:<7} counters consistent with a full recount")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
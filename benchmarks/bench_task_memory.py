@@ -0,0 +1,34 @@
+"""Bytes allocated per Task, measured with tracemalloc.
+
+Run with: python -m benchmarks.bench_task_memory [N]
+"""
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from datetime import date
+
+from todolist.core.entities.task import Task
+
+
+def main(n: int = 200_000) -> None:
+    # Strings are built up front so only the Task and what it keeps alive
+    # (its deadline, as parsed per task by the CLI) are measured.
+    ids = [f"t{i}" for i in range(n)]
+    titles = [f"task {i}" for i in range(n)]
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tasks = [
+        Task(id=ids[i], title=titles[i], description="", status="doing", deadline=date.fromordinal(738000 + i % 1000))
+        for i in range(n)
+    ]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    per_task = (after - before) / len(tasks)
+    print(f"tasks={n}  bytes/task={per_task:.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,64 @@
+"""Status/deadline queries through the indexes vs. filtering list_tasks.
+
+Run with: python -m benchmarks.bench_task_queries [N]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import STATUSES, Task
+from todolist.core.services.task_service import TaskService
+from todolist.storage.memory_storage import MemoryStorage
+
+
+def _time(fn, repeat: int = 20) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(n: int = 100_000) -> None:
+    rng = random.Random(0)
+    storage = MemoryStorage()
+    storage.add_project(Project(id="p", name="bench", description=""))
+    base = date(2026, 1, 1)
+    for i in range(n):
+        deadline = base + timedelta(days=rng.randrange(3650))
+        # A few "doing" tasks, as on a real board.
+        status = "doing" if i % 100 == 0 else rng.choice((STATUSES[0], STATUSES[2]))
+        storage.add_task("p", Task(id=f"t{i}", title="t", description="", status=status, deadline=deadline))
+    tasks = TaskService(storage)
+
+    week = (base + timedelta(days=100), base + timedelta(days=107))
+    as_of = base + timedelta(days=30)
+
+    rows = [
+        (
+            "by status 'doing'",
+            lambda: [t for t in tasks.list_tasks("p") if t.status == "doing"],
+            lambda: tasks.tasks_by_status("doing", "p"),
+        ),
+        (
+            "due in one week",
+            lambda: [t for t in tasks.list_tasks("p") if t.deadline and week[0] <= t.deadline <= week[1]],
+            lambda: tasks.tasks_due_between(week[0], week[1], "p"),
+        ),
+        (
+            "overdue",
+            lambda: [t for t in tasks.list_tasks("p") if t.deadline and t.deadline < as_of and t.status != "done"],
+            lambda: tasks.overdue_tasks(as_of, "p"),
+        ),
+    ]
+    print(f"tasks={n}")
+    for label, scan, indexed in rows:
+        scan_s, indexed_s = _time(scan), _time(indexed)
+        print(f"{label:<20} scan {scan_s * 1e3:8.2f} ms   index {indexed_s * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
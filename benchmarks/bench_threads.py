@@ -0,0 +1,96 @@
+"""Multi-threaded stress run over shared storage, scaling the worker count.
+
+Each worker drives TaskService/ProjectService against its own projects on
+one shared storage, then the storage is checked for consistency (task
+counts, status index and search index all agree). A second phase races
+every worker on the same project names; exactly one create per name must
+win.
+
+Run with: python -m benchmarks.bench_threads [OPS_PER_WORKER]
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import STATUSES, Task
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.task_service import TaskService
+from todolist.storage.consistency import check_summaries
+from todolist.storage.memory_storage import MemoryStorage
+
+
+def _worker(storage: MemoryStorage, worker: int, ops: int) -> None:
+    tasks = TaskService(storage)
+    pid = f"w{worker}"
+    storage.add_project(Project(id=pid, name=f"worker {worker}", description=""))
+    base = date(2026, 1, 1)
+    for i in range(ops):
+        tid = f"{pid}-{i}"
+        # Fixed ids, so the worker can address its tasks without keeping them.
+        storage.add_task(pid, Task(id=tid, title=f"task {i}", description="stress", deadline=base))
+        tasks.change_status(pid, tid, STATUSES[i % 3])
+        tasks.edit_task(pid, tid, title=f"edited {i}", deadline=base + timedelta(days=i % 30))
+        if i % 4 == 0:
+            tasks.delete_task(pid, tid)
+        if i % 100 == 0:
+            tasks.overdue_tasks(base + timedelta(days=1), pid)
+
+
+def _check(storage: MemoryStorage, workers: int, ops: int) -> None:
+    expected = ops - (ops + 3) // 4
+    total = 0
+    for p in storage.get_all_projects():
+        n = storage.count_tasks(p.id)
+        assert n == expected, (p.id, n, expected)
+        by_status = sum(len(storage.tasks_by_status(s, p.id)) for s in STATUSES)
+        assert by_status == n, (p.id, by_status, n)
+        total += n
+    assert len(storage._search_index()) == workers + total
+    problems = check_summaries(storage)
+    assert not problems, problems
+
+
+def _race_names(storage: MemoryStorage, workers: int) -> None:
+    projects = ProjectService(storage)
+    wins = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(workers)
+
+    def create(worker: int) -> None:
+        barrier.wait()
+        for k in range(20):
+            try:
+                # Storage ids are unique per worker so only the name can collide.
+                storage.add_project(Project(id=f"race{worker}-{k}", name=f"shared {k}", description=""))
+                with lock:
+                    wins.append(k)
+            except InvalidEntityError:
+                pass
+
+    with ThreadPoolExecutor(workers) as pool:
+        list(pool.map(create, range(workers)))
+    assert sorted(wins) == list(range(20)), wins
+    assert projects.storage.find_project_by_name("shared 0") is not None
+
+
+def main(ops: int = 5_000) -> None:
+    print(f"ops/worker={ops}  (each op = add + status + edit, 1/4 deleted)")
+    for workers in (1, 2, 4, 8, 16):
+        storage = MemoryStorage()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(workers) as pool:
+            list(pool.map(lambda w: _worker(storage, w, ops), range(workers)))
+        elapsed = time.perf_counter() - start
+        _check(storage, workers, ops)
+        _race_names(storage, workers)
+        print(f"workers={workers:<3} {workers * ops / elapsed:>10,.0f} ops/s  consistent")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000)
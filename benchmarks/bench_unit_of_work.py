@@ -0,0 +1,111 @@
+"""Moving tasks between projects: one service call per step vs. one unit of work.
+
+Also checks that a unit failing halfway leaves storage exactly as it was.
+
+Run with: python -m benchmarks.bench_unit_of_work [N]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.core.services.quota import quotas_for
+from todolist.core.services.task_service import TaskService
+from todolist.storage.base import Storage
+from todolist.storage.consistency import check_summaries
+from todolist.storage.journal_storage import JournalStorage
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+
+
+def _fill(storage: Storage, n: int) -> List[str]:
+    storage.add_project(Project(id="src", name="source", description=""))
+    storage.add_project(Project(id="dst", name="target", description=""))
+    for pid in ("src", "dst"):
+        quotas_for(storage).set_task_limit(pid, n + 1)
+    ids = [f"t{i}" for i in range(n)]
+    with storage.transaction():
+        for tid in ids:
+            storage.add_task("src", Task(id=tid, title=f"task {tid}", description="to move"))
+    return ids
+
+
+def _per_call(tasks: TaskService, ids: List[str]) -> None:
+    # Without a unit a move is a delete plus an add, each its own commit.
+    storage = tasks.storage
+    for tid in ids:
+        task = tasks.get_task("src", tid)
+        tasks.delete_task("src", tid)
+        storage.add_task("dst", task)
+        tasks.change_status("dst", tid, "doing")
+
+
+def _unit(tasks: TaskService, ids: List[str]) -> None:
+    with tasks.unit_of_work() as unit:
+        for tid in ids:
+            unit.move_task("src", tid, "dst")
+            unit.change_status("dst", tid, "doing")
+
+
+def _state(storage: Storage) -> list:
+    return sorted(
+        (p.id, p.name, sorted(repr(t) for t in storage.list_tasks(p.id))) for p in storage.get_all_projects()
+    )
+
+
+def _check_rollback(storage: Storage, ids: List[str]) -> None:
+    before = _state(storage)
+    unit = TaskService(storage).unit_of_work()
+    for tid in ids[:100]:
+        unit.move_task("dst", tid, "src")
+        unit.edit_task("src", tid, title="moved back")
+    unit.add_task("src", "last", "")
+    real_add = storage.add_task
+
+    def failing_add(project_id: str, task: Task) -> None:
+        if task.title == "last":
+            raise OSError("simulated write failure")
+        real_add(project_id, task)
+
+    storage.add_task = failing_add  # type: ignore[method-assign]
+    try:
+        unit.commit()
+    except OSError:
+        pass
+    finally:
+        del storage.add_task
+    assert _state(storage) == before, "unit was not rolled back"
+    assert not check_summaries(storage)
+
+
+def _run(label: str, make: Callable[[str], Storage], n: int, tmp: str) -> None:
+    times = {}
+    for i, (mode, fn) in enumerate((("per call", _per_call), ("one unit", _unit))):
+        storage = make(os.path.join(tmp, f"{label.split(',')[0]}{i}"))
+        ids = _fill(storage, n)
+        start = time.perf_counter()
+        fn(TaskService(storage), ids)
+        times[mode] = time.perf_counter() - start
+        assert storage.count_tasks("dst") == n
+        _check_rollback(storage, ids)
+        if hasattr(storage, "close"):
+            storage.close()
+    per_call, unit = times["per call"], times["one unit"]
+    print(f"{label:<22} per call {per_call:7.2f}s  one unit {unit:7.2f}s  {per_call / unit:6.1f}x")
+
+
+def main(n: int = 2_000) -> None:
+    print(f"moves={n} (delete + add + change_status each)")
+    with tempfile.TemporaryDirectory() as tmp:
+        _run("memory", lambda path: MemoryStorage(), n, tmp)
+        _run("journal, fsync/record", lambda path: JournalStorage(path + ".log", sync_every=1), n, tmp)
+        _run("sqlite file", lambda path: SQLiteStorage(path + ".db"), n, tmp)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -0,0 +1,101 @@
+"""Local load generator for the HTTP API: requests/s and latency percentiles.
+
+Starts an in-process server on an ephemeral port unless --url is given.
+Each client thread holds one keep-alive connection.
+
+Run with: python -m benchmarks.loadgen [--clients 16] [--requests 2000] [--url http://host:port]
+"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from urllib.parse import urlsplit
+
+from todolist.api.server import TodoHTTPServer
+from todolist.core.services.quota import quotas_for
+from todolist.storage.memory_storage import MemoryStorage
+
+
+def _request(conn: http.client.HTTPConnection, method: str, path: str, body: dict | None = None) -> dict:
+    payload = json.dumps(body).encode() if body is not None else None
+    headers = {"Content-Type": "application/json"} if payload else {}
+    conn.request(method, path, body=payload, headers=headers)
+    resp = conn.getresponse()
+    data = resp.read()
+    if resp.status >= 500:
+        raise RuntimeError(f"{method} {path} -> {resp.status}")
+    return json.loads(data) if data and resp.getheader("Content-Type") == "application/json" else {}
+
+
+def _client(host: str, port: int, worker: int, n: int) -> List[float]:
+    conn = http.client.HTTPConnection(host, port)
+    rng = random.Random(worker)
+    proj = _request(conn, "POST", "/projects", {"name": f"load {worker}", "description": ""})
+    pid = proj["id"]
+    task_ids: List[str] = []
+    latencies = []
+    for i in range(n):
+        roll = rng.random()
+        start = time.perf_counter()
+        if roll < 0.3 or not task_ids:
+            task = _request(conn, "POST", f"/projects/{pid}/tasks", {"title": f"t{i}", "description": "load"})
+            if "id" in task:
+                task_ids.append(task["id"])
+        elif roll < 0.5:
+            _request(conn, "PATCH", f"/projects/{pid}/tasks/{rng.choice(task_ids)}", {"status": "doing"})
+        elif roll < 0.8:
+            _request(conn, "GET", f"/projects/{pid}/tasks?limit=50")
+        else:
+            _request(conn, "GET", f"/projects/{pid}/tasks/{rng.choice(task_ids)}")
+        latencies.append(time.perf_counter() - start)
+    conn.close()
+    return latencies
+
+
+def _percentile(sorted_values: List[float], p: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000, help="requests per client")
+    parser.add_argument("--url", help="target an already running server")
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname or "127.0.0.1", parts.port or 80
+    else:
+        storage = MemoryStorage()
+        # One project per client, and room for every task it may add.
+        quotas = quotas_for(storage)
+        quotas.max_projects = max(quotas.max_projects, args.clients)
+        quotas.max_tasks = max(quotas.max_tasks, args.requests)
+        server = TodoHTTPServer(("127.0.0.1", 0), storage)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address[0], server.server_address[1]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.clients) as pool:
+        results = list(pool.map(lambda w: _client(host, port, w, args.requests), range(args.clients)))
+    elapsed = time.perf_counter() - start
+    if server is not None:
+        server.shutdown()
+
+    lat = sorted(x for r in results for x in r)
+    print(f"clients={args.clients}  requests={len(lat)}  elapsed={elapsed:.2f}s")
+    print(f"throughput  {len(lat) / elapsed:,.0f} req/s")
+    print(f"latency     p50 {_percentile(lat, 0.50) * 1e3:.2f} ms   "
+          f"p99 {_percentile(lat, 0.99) * 1e3:.2f} ms   max {lat[-1] * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""Benchmark suite over storage, services and CLI rendering, checked against a baseline.
+
+Every case runs at each size (tasks in one large project), keeps the best of
+a few repeats and reports nanoseconds per operation. Results are written as
+JSON; any case slower than ``--tolerance`` times its baseline fails the run.
+
+Run with: python -m benchmarks.suite [--sizes 1000,100000,1000000]
+          [--output results.json] [--baseline benchmarks/baseline.json]
+          [--tolerance 2.0] [--update-baseline]
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from todolist.cli.menu import CLI
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import STATUSES, Task
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.task_service import TaskService
+from todolist.storage.memory_storage import MemoryStorage
+
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+REPEAT = 5
+SAMPLE = 10_000
+BASE_DAY = date(2026, 6, 1)
+
+
+class Context:
+    """One populated storage plus the services and CLI driving it."""
+
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.rng = random.Random(n)
+        self.storage = MemoryStorage()
+        self.projects = ProjectService(self.storage)
+        self.tasks = TaskService(self.storage)
+        self.cli = CLI(self.storage)
+        self.storage.add_project(Project(id="big", name="big", description="the large project"))
+        for i in range(8):
+            self.storage.add_project(Project(id=f"p{i}", name=f"small {i}", description="a small project"))
+        # Room for every repeat of the add_task case.
+        self.tasks.set_task_limit("p7", REPEAT * SAMPLE)
+        self.ids = [f"t{i}" for i in range(n)]
+        self.sample = [self.rng.choice(self.ids) for _ in range(min(SAMPLE, n))]
+
+    def fill(self) -> None:
+        rng = self.rng
+        add = self.storage.add_task
+        for tid in self.ids:
+            deadline = BASE_DAY + timedelta(days=rng.randrange(-200, 200)) if rng.random() < 0.7 else None
+            # Titles share a small vocabulary, as real ones do, rather than one new word per task.
+            add("big", Task(id=tid, title=f"task {rng.randrange(1000)}", description="benchmark task",
+                            status=STATUSES[rng.randrange(3)], deadline=deadline))
+
+
+Case = Callable[[Context], int]
+
+
+def _storage_get_task(ctx: Context) -> int:
+    get = ctx.storage.get_task
+    for tid in ctx.sample:
+        get("big", tid)
+    return len(ctx.sample)
+
+
+def _storage_update_task(ctx: Context) -> int:
+    update = ctx.storage.update_task
+    for i, tid in enumerate(ctx.sample):
+        update("big", tid, status=STATUSES[i % 3])
+    return len(ctx.sample)
+
+
+def _service_add_task(ctx: Context) -> int:
+    add = ctx.tasks.add_task
+    for i in range(SAMPLE):
+        add("p7", f"added {i % 7}", "benchmark task", BASE_DAY)
+    return SAMPLE
+
+
+def _service_get_task(ctx: Context) -> int:
+    get = ctx.tasks.get_task
+    for tid in ctx.sample:
+        get("big", tid)
+    return len(ctx.sample)
+
+
+def _service_change_status(ctx: Context) -> int:
+    change = ctx.tasks.change_status
+    for i, tid in enumerate(ctx.sample):
+        change("big", tid, STATUSES[i % 3])
+    return len(ctx.sample)
+
+
+def _service_edit_task(ctx: Context) -> int:
+    edit = ctx.tasks.edit_task
+    for i, tid in enumerate(ctx.sample):
+        edit("big", tid, title=f"edited {i % 7}", deadline=BASE_DAY + timedelta(days=i % 50))
+    return len(ctx.sample)
+
+
+def _service_list_tasks(ctx: Context) -> int:
+    ctx.tasks.list_tasks("big")
+    return 1
+
+
+def _service_first_page(ctx: Context) -> int:
+    for _ in range(1000):
+        ctx.tasks.list_tasks_page("big", limit=100)
+    return 1000
+
+
+def _service_iter_tasks(ctx: Context) -> int:
+    return sum(1 for _ in ctx.tasks.iter_tasks("big"))
+
+
+def _service_by_status(ctx: Context) -> int:
+    ctx.tasks.tasks_by_status("doing", "big")
+    return 1
+
+
+def _service_overdue(ctx: Context) -> int:
+    ctx.tasks.overdue_tasks(BASE_DAY, "big")
+    return 1
+
+
+def _service_summary(ctx: Context) -> int:
+    for _ in range(1000):
+        ctx.tasks.project_summary("big", BASE_DAY)
+    return 1000
+
+
+def _service_search(ctx: Context) -> int:
+    for i in range(100):
+        ctx.tasks.search(f"task {i}")
+    return 100
+
+
+def _project_get(ctx: Context) -> int:
+    for i in range(SAMPLE):
+        ctx.projects.get_project(f"p{i % 8}")
+    return SAMPLE
+
+
+def _project_edit(ctx: Context) -> int:
+    for i in range(1000):
+        ctx.projects.edit_project(f"p{i % 8}", f"small {i % 8}", f"edited {i}")
+    return 1000
+
+
+def _cli_show_projects(ctx: Context) -> int:
+    with contextlib.redirect_stdout(io.StringIO()):
+        ctx.cli.show_projects(pause=False)
+    return 1
+
+
+def _cli_show_tasks_first_page(ctx: Context) -> int:
+    ctx.cli.pager.more = lambda: False
+    with contextlib.redirect_stdout(io.StringIO()):
+        ctx.cli.show_tasks("big", pause=False)
+    return 1
+
+
+def _cli_show_tasks_all(ctx: Context) -> int:
+    ctx.cli.pager.more = lambda: True
+    with contextlib.redirect_stdout(io.StringIO()):
+        ctx.cli.show_tasks("big", pause=False)
+    return ctx.storage.count_tasks("big")
+
+
+CASES: List[Tuple[str, Case]] = [
+    ("storage.get_task", _storage_get_task),
+    ("storage.update_task", _storage_update_task),
+    ("tasks.get_task", _service_get_task),
+    ("tasks.change_status", _service_change_status),
+    ("tasks.edit_task", _service_edit_task),
+    ("tasks.list_tasks", _service_list_tasks),
+    ("tasks.list_tasks_page", _service_first_page),
+    ("tasks.iter_tasks/task", _service_iter_tasks),
+    ("tasks.tasks_by_status", _service_by_status),
+    ("tasks.overdue_tasks", _service_overdue),
+    ("tasks.project_summary", _service_summary),
+    ("tasks.search", _service_search),
+    ("projects.get_project", _project_get),
+    ("projects.edit_project", _project_edit),
+    ("cli.show_projects", _cli_show_projects),
+    ("cli.show_tasks first page", _cli_show_tasks_first_page),
+    ("cli.show_tasks/row", _cli_show_tasks_all),
+    # Last: the tasks it adds would change what the other cases measure.
+    ("tasks.add_task", _service_add_task),
+]
+
+
+def _best_ns_per_op(fn: Callable[[], int], repeat: int = REPEAT) -> float:
+    # Like timeit: the collector is paused while timing so its pauses land
+    # on whichever case happens to trigger them rather than adding noise.
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            ops = fn()
+            elapsed = time.perf_counter_ns() - start
+        finally:
+            gc.enable()
+        best = min(best, elapsed / ops)
+    return best
+
+
+def run(sizes: List[int]) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    for n in sizes:
+        ctx = Context(n)
+        start = time.perf_counter_ns()
+        ctx.fill()
+        results[f"storage.add_task@{n}"] = (time.perf_counter_ns() - start) / n
+        for name, case in CASES:
+            results[f"{name}@{n}"] = _best_ns_per_op(lambda: case(ctx))
+        print(f"size {n:,} done", file=sys.stderr)
+        del ctx
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> List[str]:
+    """Print a results table and return the keys slower than ``tolerance`` x baseline."""
+    regressions = []
+    print(f"{'case':<40} {'ns/op':>14} {'baseline':>14} {'ratio':>7}")
+    for key, value in results.items():
+        base = baseline.get(key)
+        if base is None:
+            print(f"{key:<40} {value:>14,.1f} {'—':>14} {'new':>7}")
+            continue
+        ratio = value / base if base else float("inf")
+        flag = ""
+        if ratio > tolerance:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"{key:<40} {value:>14,.1f} {base:>14,.1f} {ratio:>7.2f}{flag}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--output", default="bench-results.json")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=2.0)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    results = run(sizes)
+    payload = {
+        "meta": {"python": platform.python_version(), "machine": platform.machine(), "sizes": sizes},
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+    if args.update_baseline:
+        baseline: Dict[str, float] = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)["results"]
+        baseline.update(results)
+        payload["results"] = baseline
+        payload["meta"]["sizes"] = sorted({int(k.rsplit("@", 1)[1]) for k in baseline})
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; rerun with --update-baseline", file=sys.stderr)
+        return 1
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than {args.tolerance}x baseline:", file=sys.stderr)
+        for key in regressions:
+            print(f"  {key}", file=sys.stderr)
+        return 1
+    print(f"\nall {len(results)} cases within {args.tolerance}x of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
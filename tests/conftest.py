@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable
+
+import pytest
+
+
+@pytest.fixture
+def run_async() -> Callable[..., Any]:
+    """Run a coroutine on a fresh event loop in another thread, failing on timeout.
+
+    A coroutine that blocks its loop (e.g. deadlocked on a backend lock)
+    cannot be cancelled by ``asyncio.wait_for``; the thread join still
+    returns, so the test fails instead of hanging.
+    """
+
+    def run(coro: Awaitable[Any], timeout: float = 10.0) -> Any:
+        result: dict = {}
+
+        def target() -> None:
+            try:
+                result["value"] = asyncio.run(coro)
+            except BaseException as exc:  # handed to the test thread below
+                result["error"] = exc
+
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        thread.join(timeout)
+        if thread.is_alive():
+            pytest.fail(f"coroutine still running after {timeout}s (event loop blocked?)")
+        if "error" in result:
+            raise result["error"]
+        return result.get("value")
+
+    return run
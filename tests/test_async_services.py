@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.services.async_project_service import AsyncProjectService
+from todolist.core.services.async_task_service import AsyncTaskService
+from todolist.core.services.quota import quotas_for
+from todolist.storage.async_storage import AsyncMemoryStorage, ExecutorStorage
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+
+
+@pytest.fixture(params=["memory", "executor-sqlite"])
+def storage(request):
+    if request.param == "memory":
+        yield AsyncMemoryStorage(MemoryStorage())
+        return
+    backend = SQLiteStorage()
+    storage = ExecutorStorage(backend)
+    yield storage
+    storage.close()
+    backend.close()
+
+
+def test_crud(storage, run_async):
+    projects, tasks = AsyncProjectService(storage), AsyncTaskService(storage)
+
+    async def scenario():
+        proj = await projects.create_project("home", "chores")
+        assert (await projects.get_project(proj.id)).name == "home"
+        await projects.edit_project(proj.id, "house", "chores")
+        assert [p.name for p in await projects.list_projects()] == ["house"]
+
+        milk = await tasks.add_task(proj.id, "milk", "", date(2026, 3, 10))
+        bread = await tasks.add_task(proj.id, "bread", "")
+        await tasks.edit_task(proj.id, milk.id, title="oat milk")
+        await tasks.change_status(proj.id, bread.id, "done")
+        assert [(t.title, t.status) for t in await tasks.list_tasks(proj.id)] == [
+            ("oat milk", "todo"), ("bread", "done"),
+        ]
+        assert (await tasks.get_task(proj.id, milk.id)).deadline == date(2026, 3, 10)
+        assert [t.id for _, t in await tasks.tasks_by_status("done")] == [bread.id]
+        assert await tasks.count_tasks(proj.id) == 2
+
+        assert await tasks.delete_task(proj.id, milk.id)
+        assert not await tasks.delete_task(proj.id, milk.id)
+        assert await tasks.get_task(proj.id, milk.id) is None
+        assert await projects.delete_project(proj.id)
+        assert await projects.get_project(proj.id) is None
+        assert quotas_for(storage.storage).project_count() == 0
+
+    run_async(scenario())
+
+
+def test_validation_errors_are_raised_through_the_awaitable(storage, run_async):
+    projects, tasks = AsyncProjectService(storage), AsyncTaskService(storage)
+
+    async def scenario():
+        proj = await projects.create_project("home", "")
+        with pytest.raises(InvalidEntityError):
+            await projects.create_project("home", "")
+        with pytest.raises(InvalidEntityError):
+            await tasks.add_task(proj.id, "", "")
+        task = await tasks.add_task(proj.id, "milk", "")
+        with pytest.raises(InvalidEntityError):
+            await tasks.change_status(proj.id, task.id, "blocked")
+        with pytest.raises(InvalidEntityError):
+            await tasks.add_task("missing", "milk", "")
+        return proj.id
+
+    pid = run_async(scenario())
+    assert [t.title for t in storage.storage.list_tasks(pid)] == ["milk"]
+
+
+def test_rolled_back_transaction_leaves_nothing(run_async):
+    backend = SQLiteStorage()
+    storage = ExecutorStorage(backend)
+    projects, tasks = AsyncProjectService(storage), AsyncTaskService(storage)
+
+    async def scenario():
+        proj = await projects.create_project("home", "")
+        await tasks.add_task(proj.id, "kept", "")
+        with pytest.raises(RuntimeError):
+            async with storage.transaction():
+                await tasks.add_task(proj.id, "rolled back", "")
+                await projects.create_project("work", "")
+                raise RuntimeError("boom")
+        return proj.id, [t.title for t in await tasks.list_tasks(proj.id)], await storage.count_projects()
+
+    try:
+        pid, titles, project_count = run_async(scenario())
+    finally:
+        storage.close()
+    assert titles == ["kept"] and project_count == 1
+    assert [t.title for t in backend.list_tasks(pid)] == ["kept"]
+    backend.close()
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from todolist.cli import batch
+from todolist.cli.batch import BatchRunner, parse_command
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.services.quota import quotas_for
+from todolist.main import main
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+from todolist.utils.settings import reload_settings
+
+
+def _run(storage, lines, quiet=False):
+    out = io.StringIO()
+    failed = BatchRunner(storage, out, quiet=quiet).run(lines)
+    return failed, out.getvalue().splitlines()
+
+
+def test_parse_command_syntaxes():
+    assert parse_command('add_task project=$p title="Buy milk"') == ("add_task", {"project": "$p", "title": "Buy milk"})
+    assert parse_command('{"op": "search", "query": "milk"}') == ("search", {"query": "milk"})
+    for bad in ("add_task title", '{"title": "x"}', "{not json", '"unterminated'):
+        with pytest.raises(InvalidEntityError):
+            parse_command(bad)
+
+
+def test_names_chain_ids_between_commands():
+    storage = MemoryStorage()
+    failed, out = _run(storage, [
+        "create_project name=home as=home",
+        "add_task project=$home title=milk deadline=2026-01-15 as=milk",
+        '{"op": "change_status", "project": "$home", "task": "$milk", "status": "done"}',
+        "summary project=$home as_of=2026-02-01",
+    ])
+    assert failed == 0
+    pid = storage.find_project_by_name("home").id
+    assert storage.list_tasks(pid)[0].status == "done"
+    assert out[3].startswith("[OK] summary: 1 task(s), 0 overdue")
+
+
+def test_failures_are_reported_and_the_run_goes_on():
+    storage = MemoryStorage()
+    failed, out = _run(storage, [
+        "create_project name=a as=a",
+        "frobnicate x=1",
+        "add_task project=$nope title=x",
+        "add_task project=$a",
+        "add_task project=$a title=ok",
+    ])
+    assert failed == 3
+    errors = [line for line in out if line.startswith("[ERROR]")]
+    assert [e.split()[2] for e in errors] == ["2", "3", "4"]
+    assert "Missing argument 'title'" in errors[2]
+    assert storage.count_tasks(storage.find_project_by_name("a").id) == 1
+
+
+def test_quiet_prints_only_errors_and_the_summary():
+    failed, out = _run(MemoryStorage(), ["create_project name=a", "create_project name=a"], quiet=True)
+    assert failed == 1
+    assert not any(line.startswith("[OK]") for line in out)
+    assert out[0].startswith("[ERROR] line 2 create_project")
+    assert "2 command(s) from 2 line(s), 1 failed" in out[1]
+
+
+def test_malformed_argument_mid_chunk_fails_only_that_command(tmp_path, monkeypatch):
+    # One SQLite transaction per chunk: a command that raised out of the runner
+    # rolled back every command of its chunk.
+    monkeypatch.setattr(batch, "FLUSH_EVERY", 10)
+    path = str(tmp_path / "todo.db")
+    storage = SQLiteStorage(path)
+    quotas_for(storage).max_projects = 100
+    lines = [f"create_project name=p{i}" for i in range(4)]
+    lines += [
+        json.dumps({"op": "create_project", "name": 123}),
+        json.dumps({"op": "add_task", "project": ["x"], "title": "t"}),
+    ]
+    lines += [f"create_project name=q{i}" for i in range(4)]
+    failed, out = _run(storage, lines)
+    storage.close()
+    assert failed == 2
+    errors = [line for line in out if line.startswith("[ERROR]")]
+    assert errors == [
+        "[ERROR] line 5 create_project: Argument 'name' must be text.",
+        "[ERROR] line 6 add_task: Argument 'project' must be text.",
+    ]
+    storage = SQLiteStorage(path)
+    try:
+        assert storage.count_projects() == 8
+    finally:
+        storage.close()
+
+
+def test_unexpected_error_is_that_commands_failure(monkeypatch):
+    storage = MemoryStorage()
+    runner = BatchRunner(storage, io.StringIO())
+
+    def broken(args):
+        raise AttributeError("boom")
+
+    runner._ops["list_projects"] = broken
+    assert runner.run(["create_project name=a", "list_projects", "create_project name=b"]) == 1
+    assert storage.count_projects() == 2
+    assert runner.counts["list_projects failed"] == 1
+
+
+@pytest.fixture
+def env(monkeypatch):
+    yield monkeypatch
+    monkeypatch.undo()
+    reload_settings()
+
+
+def test_main_batch_exit_codes(tmp_path, env, capsys):
+    env.setenv("DATABASE_PATH", str(tmp_path / "todo.db"))
+    reload_settings()
+    script = tmp_path / "commands.txt"
+    script.write_text("create_project name=a\ncreate_project name=b\n")
+    assert main(["--batch", str(script), "--quiet"]) == 0
+    script.write_text('create_project name=c\n{"op": "create_project", "name": 1}\n')
+    assert main(["--batch", str(script)]) == 1
+    out = capsys.readouterr().out
+    assert "[OK] create_project" in out and "line 2 create_project" in out
+    storage = SQLiteStorage(str(tmp_path / "todo.db"))
+    try:
+        assert storage.count_projects() == 3
+    finally:
+        storage.close()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import io
+from datetime import date
+
+import pytest
+
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.quota import quotas_for
+from todolist.core.services.task_service import TaskService
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.utils.task_io import read_rows
+
+
+@pytest.fixture
+def service():
+    storage = MemoryStorage()
+    quotas_for(storage).max_tasks = 1000
+    tasks = TaskService(storage)
+    pid = ProjectService(storage).create_project("home", "").id
+    return tasks, pid
+
+
+def test_read_rows_numbers_lines_and_skips_blanks():
+    stream = io.StringIO('{"title":"a"}\n\n{"title":"b"}\nnot json\n[1, 2]\n{"title":"c"}\n')
+    assert list(read_rows(stream, "jsonl")) == [
+        (1, {"title": "a"}),
+        (3, {"title": "b"}),
+        (4, None),
+        (5, None),
+        (6, {"title": "c"}),
+    ]
+
+
+def test_read_rows_rejects_a_line_holding_two_objects():
+    stream = io.StringIO('{"title":"a"}\n{"title":"b"},{"title":"evil"}\n{"title":"c"}\n{"title":"d"}\n')
+    assert list(read_rows(stream, "jsonl")) == [
+        (1, {"title": "a"}),
+        (2, None),
+        (3, {"title": "c"}),
+        (4, {"title": "d"}),
+    ]
+
+
+def test_read_rows_does_not_let_an_open_bracket_swallow_the_next_line():
+    lines = ['{"title":"a"}],[{"title":"b"}', "[[1", "2]]", '{"title":"c"}']
+    rows = list(read_rows(io.StringIO("\n".join(lines) + "\n"), "jsonl"))
+    assert rows == [(1, None), (2, None), (3, None), (4, {"title": "c"})]
+
+
+def test_import_stream_reports_the_pair_line_and_keeps_the_rest(service):
+    tasks, pid = service
+    data = '{"title":"a"}\n{"title":"b"},{"title":"evil"}\n{"title":"c"}\n'
+    result = tasks.import_stream(pid, io.StringIO(data), "jsonl", batch_size=2)
+    assert result.added == 2
+    assert [(e.row, e.message) for e in result.errors] == [(2, "Row could not be parsed.")]
+    assert [t.title for t in tasks.list_tasks(pid)] == ["a", "c"]
+
+
+def test_add_tasks_bulk_reports_row_errors_without_stopping(service):
+    tasks, pid = service
+    result = tasks.add_tasks_bulk(pid, [
+        {"title": "ok", "deadline": "2026-01-15"},
+        {"title": ""},
+        {"title": "bad status", "status": "later"},
+        {"title": "bad date", "deadline": "15/01/2026"},
+        {"title": "dup", "id": "x1"},
+        {"title": "dup again", "id": "x1"},
+    ])
+    assert result.added == 2
+    assert [e.row for e in result.errors] == [2, 3, 4, 6]
+    assert tasks.get_task(pid, "x1").title == "dup"
+    assert tasks.list_tasks(pid)[0].deadline == date(2026, 1, 15)
+
+
+def test_add_tasks_bulk_stops_at_the_task_limit(service):
+    tasks, pid = service
+    tasks.set_task_limit(pid, 3)
+    result = tasks.add_tasks_bulk(pid, [{"title": f"t{i}"} for i in range(5)])
+    assert result.added == 3
+    assert [e.row for e in result.errors] == [4, 5]
+
+
+def test_add_tasks_bulk_needs_an_existing_project(service):
+    tasks, _ = service
+    with pytest.raises(InvalidEntityError):
+        tasks.add_tasks_bulk("missing", [{"title": "a"}])
+
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+def test_export_then_import_round_trip(service, fmt):
+    tasks, pid = service
+    tasks.add_task(pid, "with, comma", 'and "quotes"', date(2026, 2, 1))
+    tasks.add_task(pid, "plain", "")
+    out = io.StringIO()
+    assert tasks.export_stream(pid, out, fmt) == 2
+
+    storage = MemoryStorage()
+    other = TaskService(storage)
+    target = ProjectService(storage).create_project("copy", "").id
+    result = other.import_stream(target, io.StringIO(out.getvalue()), fmt)
+    assert result.added == 2 and not result.errors
+    key = lambda t: (t.id, t.title, t.description, t.status, t.deadline)  # noqa: E731
+    assert [key(t) for t in other.list_tasks(target)] == [key(t) for t in tasks.list_tasks(pid)]
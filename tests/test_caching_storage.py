@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import pytest
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.task_service import TaskService
+from todolist.storage.caching_storage import CachingStorage
+from todolist.storage.factory import close_storage, open_storage_from_env
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+from todolist.utils.settings import reload_settings
+
+
+class CountingSQLite(SQLiteStorage):
+    def __init__(self, path: str = ":memory:") -> None:
+        super().__init__(path)
+        self.reads = 0
+
+    def get_task(self, project_id, task_id):
+        self.reads += 1
+        return super().get_task(project_id, task_id)
+
+    def get_project(self, project_id):
+        self.reads += 1
+        return super().get_project(project_id)
+
+
+@pytest.fixture
+def cached():
+    backend = CountingSQLite()
+    backend.add_project(Project(id="p", name="home", description=""))
+    for i in range(5):
+        backend.add_task("p", Task(id=f"t{i}", title=f"task {i}", description=""))
+    storage = CachingStorage(backend, maxsize=3)
+    yield storage, backend
+    storage.close()
+
+
+def test_repeated_reads_are_served_from_the_cache(cached):
+    storage, backend = cached
+    for _ in range(3):
+        assert storage.get_task("p", "t0").title == "task 0"
+    assert storage.get_task("p", "missing") is None
+    assert storage.get_task("p", "missing") is None
+    assert backend.reads == 3  # one miss for t0; misses for absent tasks are not cached
+    stats = storage.cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 3, 1)
+    assert stats.hit_rate == pytest.approx(0.4)
+
+
+def test_least_recently_used_entry_is_evicted(cached):
+    storage, backend = cached
+    for tid in ("t0", "t1", "t2"):
+        storage.get_task("p", tid)
+    storage.get_task("p", "t0")  # t1 is now the oldest
+    storage.get_task("p", "t3")
+    backend.reads = 0
+    storage.get_task("p", "t0")
+    storage.get_task("p", "t2")
+    storage.get_task("p", "t3")
+    assert backend.reads == 0
+    storage.get_task("p", "t1")
+    assert backend.reads == 1
+    assert storage.cache_stats().evictions == 2 and storage.cache_stats().size == 3
+
+
+def test_writes_through_the_wrapper_are_seen(cached):
+    storage, backend = cached
+    storage.get_task("p", "t0")
+    storage.get_project("p")
+    storage.update_task("p", "t0", title="renamed", status="done")
+    storage.update_project("p", name="house")
+    backend.reads = 0
+    assert storage.get_task("p", "t0").title == "renamed"
+    assert storage.get_project("p").name == "house"
+    assert backend.reads == 0
+    assert storage.remove_task("p", "t0")
+    assert storage.get_task("p", "t0") is None
+    storage.get_task("p", "t1")
+    assert storage.remove_project("p")
+    assert storage.get_task("p", "t1") is None and storage.get_project("p") is None
+
+
+def test_rollback_drops_what_the_transaction_cached(cached):
+    storage, _ = cached
+    storage.get_task("p", "t0")
+    with pytest.raises(RuntimeError):
+        with storage.transaction():
+            storage.update_task("p", "t0", title="rolled back")
+            storage.add_task("p", Task(id="t9", title="rolled back", description=""))
+            assert storage.get_task("p", "t0").title == "rolled back"
+            raise RuntimeError("abort")
+    assert storage.get_task("p", "t0").title == "task 0"
+    assert storage.get_task("p", "t9") is None
+    assert storage.cache_stats().size == 1
+
+
+def test_services_work_through_the_cache():
+    storage = CachingStorage(SQLiteStorage(), maxsize=100)
+    try:
+        pid = ProjectService(storage).create_project("home", "").id
+        tasks = TaskService(storage)
+        task = tasks.add_task(pid, "milk", "")
+        tasks.change_status(pid, task.id, "done")
+        assert tasks.get_task(pid, task.id).status == "done"
+        assert [t.status for t in tasks.list_tasks(pid)] == ["done"]
+    finally:
+        storage.close()
+
+
+def test_cache_needs_room():
+    with pytest.raises(ValueError):
+        CachingStorage(SQLiteStorage(), maxsize=0)
+
+
+def test_factory_puts_the_cache_in_front_of_sqlite(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "todo.db"))
+    monkeypatch.setenv("STORAGE_CACHE_SIZE", "50")
+    reload_settings()
+    try:
+        storage = open_storage_from_env()
+        assert isinstance(storage, CachingStorage) and storage.maxsize == 50
+        close_storage(storage)
+        monkeypatch.setenv("STORAGE_CACHE_SIZE", "0")
+        reload_settings()
+        storage = open_storage_from_env()
+        assert isinstance(storage, SQLiteStorage)
+        close_storage(storage)
+    finally:
+        monkeypatch.undo()
+        reload_settings()
+
+
+def test_dropping_a_project_keeps_other_entries(cached):
+    storage, backend = cached
+    backend.add_project(Project(id="q", name="work", description=""))
+    backend.add_task("q", Task(id="t0", title="other", description=""))
+    storage.get_task("p", "t0")
+    storage.get_task("q", "t0")
+    storage.get_project("q")
+    storage.get_task("p", "t1")  # evicts ("p", "t0")
+    assert storage.remove_project("p")
+    backend.reads = 0
+    assert storage.get_task("q", "t0").title == "other" and storage.get_project("q").name == "work"
+    assert backend.reads == 0
+    assert storage.cache_stats().size == 2 and set(storage._task_ids) == {"q"}
+    storage.add_project(Project(id="p", name="home again", description=""))
+    assert storage.get_project("p").name == "home again"
+
+
+def test_only_known_backend_extras_are_passed_through():
+    storage = CachingStorage(SQLiteStorage())
+    try:
+        assert storage.transactional
+        assert not hasattr(storage, "restore_task") and not hasattr(storage, "conn")
+    finally:
+        storage.close()
+
+
+def test_restores_through_the_wrapper_drop_stale_entries():
+    backend = MemoryStorage()
+    storage = CachingStorage(backend, maxsize=10)
+    backend.add_project(Project(id="p", name="home", description=""))
+    backend.add_task("p", Task(id="t", title="before", description=""))
+    project, seq = storage.get_project("p"), storage.project_seq("p")
+    task_seq = storage.task_seq("p", "t")
+    assert storage.remove_task("p", "t")
+    storage.restore_task("p", Task(id="t", title="restored", description=""), task_seq)
+    assert storage.get_task("p", "t").title == "restored"
+    assert storage.remove_project("p")
+    assert storage.get_project("p") is None
+    storage.restore_project(project, seq)
+    assert storage.get_project("p").name == "home"
+    assert storage.get_task("p", "t").title == "restored"
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.quota import quotas_for
+from todolist.core.services.task_service import TaskService
+from todolist.storage.memory_storage import MemoryStorage
+
+
+def _run(workers):
+    errors = []
+
+    def guard(fn):
+        try:
+            fn()
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=guard, args=(fn,)) for fn in workers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors, errors
+
+
+@pytest.fixture
+def storage():
+    storage = MemoryStorage()
+    quotas = quotas_for(storage)
+    quotas.max_projects = 1000
+    quotas.max_tasks = 100_000
+    return storage
+
+
+def test_writers_on_shared_projects_lose_nothing(storage):
+    projects = [ProjectService(storage).create_project(f"p{i}", "").id for i in range(4)]
+    tasks = TaskService(storage)
+
+    def worker(n):
+        def run():
+            for i in range(300):
+                pid = projects[(n + i) % len(projects)]
+                task = tasks.add_task(pid, f"w{n}-{i}", "")
+                if i % 2:
+                    tasks.change_status(pid, task.id, "doing")
+                if i % 3 == 0:
+                    tasks.delete_task(pid, task.id)
+        return run
+
+    _run([worker(n) for n in range(8)])
+    total = sum(tasks.count_tasks(pid) for pid in projects)
+    assert total == 8 * (300 - 100)
+    for pid in projects:
+        listed = tasks.list_tasks(pid)
+        assert len(listed) == tasks.count_tasks(pid) == len({t.id for t in listed})
+        doing = {t.id for _, t in tasks.tasks_by_status("doing", pid)}
+        assert doing == {t.id for t in listed if t.status == "doing"}
+
+
+def test_racing_creates_keep_names_unique(storage):
+    service = ProjectService(storage)
+    won, lost = [], []
+    barrier = threading.Barrier(8)
+
+    def create():
+        barrier.wait()
+        try:
+            won.append(service.create_project("same", ""))
+        except InvalidEntityError:
+            lost.append(1)
+
+    _run([create] * 8)
+    assert len(won) == 1 and len(lost) == 7
+    assert storage.find_project_by_name("same").id == won[0].id
+    assert storage.count_projects() == 1
+
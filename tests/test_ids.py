@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+
+from todolist.core.entities.project import Project
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.task_service import TaskService
+from todolist.storage.async_storage import ExecutorStorage
+from todolist.storage.journal_storage import JournalStorage
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+from todolist.utils.ids import IdAllocator, decode_id, encode_id, ids_for, random_id
+
+
+def test_encode_decode_round_trip_and_sort_order():
+    numbers = [0, 1, 35, 36, 1295, 1296, 50_000, 10 ** 12]
+    ids = [encode_id(n) for n in numbers]
+    assert [decode_id(i) for i in ids] == numbers
+    assert ids == sorted(ids)
+    assert encode_id(0) == "g0" and encode_id(36) == "h10"
+
+
+def test_decode_rejects_foreign_ids():
+    for value in ("", "g", "abcd", "0123abcd", "gZ", "h1", random_id()):
+        assert decode_id(value) is None
+
+
+def test_next_id_unique_and_increasing_across_blocks():
+    allocator = IdAllocator(MemoryStorage().reserve_ids, block=8)
+    ids = [allocator.next_id() for _ in range(100)]
+    assert len(set(ids)) == 100
+    assert [decode_id(i) for i in ids] == sorted(decode_id(i) for i in ids)
+
+
+def test_next_id_unique_under_threads():
+    allocator = IdAllocator(MemoryStorage().reserve_ids, block=16)
+    drawn = [[] for _ in range(8)]
+
+    def worker(out):
+        for _ in range(2000):
+            out.append(allocator.next_id())
+
+    threads = [threading.Thread(target=worker, args=(out,)) for out in drawn]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    every = [i for out in drawn for i in out]
+    assert len(set(every)) == len(every)
+    assert all(out == sorted(out, key=decode_id) for out in drawn)
+
+
+def test_take_reserves_a_batch_and_note_used_skips_foreign_ids():
+    allocator = ids_for(MemoryStorage())
+    batch = allocator.take(5)
+    assert len(set(batch)) == 5
+    allocator.note_used([encode_id(10_000)])
+    assert decode_id(allocator.next_id()) > 10_000
+
+
+def test_services_use_the_store_allocator():
+    storage = MemoryStorage()
+    proj = ProjectService(storage).create_project("home", "")
+    task = TaskService(storage).add_task(proj.id, "milk", "")
+    assert decode_id(proj.id) is not None and decode_id(task.id) > decode_id(proj.id)
+
+
+def test_journal_resumes_after_restart(tmp_path):
+    path = str(tmp_path / "todo.journal")
+    storage = JournalStorage(path)
+    first = ids_for(storage).next_id()
+    storage.close()
+    storage = JournalStorage(path)
+    try:
+        assert decode_id(ids_for(storage).next_id()) > decode_id(first)
+    finally:
+        storage.close()
+
+
+def test_sqlite_keeps_ids_reserved_after_rollback(tmp_path):
+    path = str(tmp_path / "todo.db")
+    storage = SQLiteStorage(path)
+    storage.add_project(Project(id="p", name="p", description=""))
+    try:
+        with storage.transaction():
+            reserved = ids_for(storage).next_id()
+            raise RuntimeError("roll back")
+    except RuntimeError:
+        pass
+    storage.close()
+    storage = SQLiteStorage(path)
+    try:
+        assert decode_id(IdAllocator(storage.reserve_ids).next_id()) > decode_id(reserved)
+    finally:
+        storage.close()
+
+
+def test_async_refill_inside_an_executor_transaction(run_async):
+    # The block refill must go through the executor: calling the SQLite backend
+    # from the event loop while the executor thread holds its transaction deadlocks.
+    async def scenario():
+        storage = ExecutorStorage(SQLiteStorage())
+        allocator = IdAllocator(storage.storage.reserve_ids, block=4)
+        try:
+            async with storage.transaction():
+                return [await allocator.next_id_async(storage.reserve_ids) for _ in range(10)]
+        finally:
+            storage.close()
+
+    ids = run_async(scenario())
+    assert len(set(ids)) == 10
+    assert [decode_id(i) for i in ids] == sorted(decode_id(i) for i in ids)
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.storage import journal_storage
+from todolist.storage.journal_storage import JournalStorage
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "todo.journal")
+
+
+def _fill(storage):
+    storage.add_project(Project(id="p", name="home", description=""))
+    storage.add_task("p", Task(id="a", title="milk", description="", deadline=date(2026, 1, 15)))
+    storage.add_task("p", Task(id="b", title="bread", description=""))
+    storage.update_task("p", "a", status="done")
+    storage.remove_task("p", "b")
+    storage.update_project("p", name="house")
+
+
+def _state(storage):
+    return [
+        (p.id, p.name, [(t.id, t.title, t.status, t.deadline) for t in storage.list_tasks(p.id)])
+        for p in storage.get_all_projects()
+    ]
+
+
+def test_replay_restores_every_change(path):
+    storage = JournalStorage(path)
+    _fill(storage)
+    before = _state(storage)
+    storage.close()
+    storage = JournalStorage(path)
+    try:
+        assert _state(storage) == before == [("p", "house", [("a", "milk", "done", date(2026, 1, 15))])]
+    finally:
+        storage.close()
+
+
+def test_records_reach_the_file_before_any_sync(path):
+    # A process crash must not lose writes sitting in the userspace buffer.
+    storage = JournalStorage(path, sync_every=10_000, sync_interval=3600)
+    try:
+        _fill(storage)
+        with open(path, encoding="utf-8") as fh:
+            assert len(fh.read().splitlines()) == 6
+    finally:
+        storage.close()
+
+
+def test_pending_records_are_synced_without_further_writes(path, monkeypatch):
+    synced = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: (synced.append(fd), real_fsync(fd)))
+    storage = JournalStorage(path, sync_every=10_000, sync_interval=0.02)
+    try:
+        storage._last_sync = time.monotonic() + 3600  # keep the write itself from syncing
+        storage.add_project(Project(id="p", name="home", description=""))
+        assert storage._pending == 1 and not synced
+        storage._last_sync = time.monotonic()
+        deadline = time.monotonic() + 5
+        while storage._pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert storage._pending == 0 and synced
+    finally:
+        storage.close()
+    assert not storage._flusher.is_alive()
+
+
+def test_torn_tail_is_dropped_on_load(path):
+    storage = JournalStorage(path)
+    _fill(storage)
+    storage.close()
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write('[99,"add_task","p",["c","half')
+    storage = JournalStorage(path)
+    try:
+        assert [t.id for t in storage.list_tasks("p")] == ["a"]
+        storage.add_task("p", Task(id="d", title="after", description=""))
+    finally:
+        storage.close()
+    storage = JournalStorage(path)
+    try:
+        assert [t.id for t in storage.list_tasks("p")] == ["a", "d"]
+    finally:
+        storage.close()
+
+
+def test_transaction_is_one_record(path):
+    storage = JournalStorage(path)
+    storage.add_project(Project(id="p", name="home", description=""))
+    with storage.transaction():
+        for i in range(5):
+            storage.add_task("p", Task(id=f"t{i}", title=f"t{i}", description=""))
+    storage.close()
+    with open(path, encoding="utf-8") as fh:
+        lines = fh.read().splitlines()
+    assert len(lines) == 2 and '"unit"' in lines[1]
+    # Cut the unit short: none of its writes may come back.
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(lines[0] + "\n" + lines[1][:-10])
+    storage = JournalStorage(path)
+    try:
+        assert storage.count_tasks("p") == 0
+    finally:
+        storage.close()
+
+
+def test_compaction_snapshot_then_replay(path):
+    storage = JournalStorage(path, compact_every=4)
+    _fill(storage)
+    storage.add_task("p", Task(id="c", title="jam", description=""))
+    before = _state(storage)
+    storage.close()
+    assert os.path.exists(path + ".snapshot")
+    with open(path, encoding="utf-8") as fh:
+        assert len(fh.read().splitlines()) < 7
+    storage = JournalStorage(path)
+    try:
+        assert _state(storage) == before
+    finally:
+        storage.close()
+
+
+def test_writers_to_other_projects_do_not_wait(path, monkeypatch):
+    storage = JournalStorage(path)
+    slow_pid = "p0"
+    fast_pid = next(f"p{i}" for i in range(1, 100) if storage._lock_for(f"p{i}") is not storage._lock_for(slow_pid))
+    for pid in (slow_pid, fast_pid):
+        storage.add_project(Project(id=pid, name=pid, description=""))
+    entered, release = threading.Event(), threading.Event()
+    real_encode = journal_storage._encode_task
+
+    def encode(task):
+        if task.title == "slow":
+            entered.set()
+            release.wait(10)
+        return real_encode(task)
+
+    monkeypatch.setattr(journal_storage, "_encode_task", encode)
+    slow = threading.Thread(target=storage.add_task, args=(slow_pid, Task(id="s", title="slow", description="")))
+    slow.start()
+    try:
+        assert entered.wait(5)
+        same = threading.Thread(target=storage.add_task, args=(slow_pid, Task(id="s2", title="x", description="")))
+        other = threading.Thread(target=storage.add_task, args=(fast_pid, Task(id="f", title="x", description="")))
+        same.start()
+        other.start()
+        other.join(5)
+        assert not other.is_alive(), "a write to another project waited for the slow one"
+        assert same.is_alive(), "a write to the same project must wait its turn"
+    finally:
+        release.set()
+        slow.join()
+        same.join()
+    storage.close()
+    storage = JournalStorage(path)
+    try:
+        assert [t.id for t in storage.list_tasks(slow_pid)] == ["s", "s2"]
+        assert [t.id for t in storage.list_tasks(fast_pid)] == ["f"]
+    finally:
+        storage.close()
+
+
+def test_concurrent_writers_replay_to_the_same_state(path):
+    storage = JournalStorage(path, sync_every=16, compact_every=300)
+    errors = []
+
+    def worker(n):
+        try:
+            pid = f"p{n}"
+            storage.add_project(Project(id=pid, name=f"project {n}", description=""))
+            for i in range(150):
+                storage.add_task(pid, Task(id=f"{pid}-{i}", title=f"t{i}", description=""))
+                if i % 3 == 0:
+                    storage.update_task(pid, f"{pid}-{i}", status="doing")
+                if i % 5 == 0:
+                    storage.remove_task(pid, f"{pid}-{i}")
+                if i % 50 == 0:
+                    storage.update_project(pid, name=f"project {n} v{i}")
+                    storage.reserve_ids(4)
+            with storage.transaction():
+                storage.add_tasks(pid, [Task(id=f"{pid}-x{i}", title="bulk", description="") for i in range(5)])
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    before = _state(storage)
+    ids_end = storage._ids_end
+    storage.close()
+    storage = JournalStorage(path)
+    try:
+        assert sorted(_state(storage)) == sorted(before)
+        assert storage._ids_end == ids_end
+    finally:
+        storage.close()
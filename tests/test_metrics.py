@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from todolist.core.entities.project import Project
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.task_service import TaskService
+from todolist.core.validators import task_validator
+from todolist.storage.caching_storage import CachingStorage
+from todolist.storage.journal_storage import JournalStorage
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+from todolist.utils import metrics
+
+
+def test_validators_are_measured_where_they_are_defined():
+    original = task_validator.validate_task_title
+    metrics.instrument()
+    try:
+        hist = metrics.REGISTRY.histogram("task_validator.validate_task_title")
+        before = hist.count
+        storage = MemoryStorage()
+        pid = ProjectService(storage).create_project("home", "").id
+        TaskService(storage).add_task(pid, "milk", "")
+        assert task_validator.validate_task_title is not original
+        assert hist.count == before + 1
+        assert metrics.REGISTRY.histogram("TaskService.add_task").count >= 1
+    finally:
+        metrics.uninstrument()
+    assert task_validator.validate_task_title is original
+    assert not metrics.is_instrumented()
+
+
+def test_the_storage_in_use_is_measured(tmp_path):
+    storage = CachingStorage(SQLiteStorage(str(tmp_path / "todo.db")))
+    metrics.instrument(storage)
+    try:
+        pid = ProjectService(storage).create_project("home", "").id
+        TaskService(storage).add_task(pid, "milk", "")
+        for name in ("CachingStorage.add_task", "SQLiteStorage.add_task", "SQLiteStorage.add_project"):
+            assert metrics.REGISTRY.histogram(name).count >= 1
+    finally:
+        metrics.uninstrument()
+        storage.close()
+
+
+def test_transaction_is_timed_around_the_block(tmp_path):
+    storage = JournalStorage(str(tmp_path / "todo.journal"))
+    metrics.instrument(storage)
+    try:
+        hist = metrics.REGISTRY.histogram("JournalStorage.transaction")
+        before = hist.count, hist.sum
+        with storage.transaction():
+            time.sleep(0.01)
+        with pytest.raises(RuntimeError):
+            with storage.transaction():
+                raise RuntimeError("boom")
+        assert hist.count == before[0] + 2 and hist.errors >= 1
+        assert hist.sum - before[1] >= 0.01
+        storage.add_project(Project(id="p", name="home", description=""))
+        assert metrics.REGISTRY.histogram("JournalStorage.add_project").count >= 1
+    finally:
+        metrics.uninstrument()
+        storage.close()
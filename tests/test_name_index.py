@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pytest
+
+from todolist.core.entities.project import Project
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.services.project_service import ProjectService
+from todolist.storage.journal_storage import JournalStorage
+from todolist.storage.memory_storage import MemoryStorage
+
+
+@pytest.fixture(params=["memory", "journal"])
+def storage(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryStorage()
+        return
+    storage = JournalStorage(str(tmp_path / "todo.journal"))
+    yield storage
+    storage.close()
+
+
+def _names(storage) -> dict:
+    found = {name: storage.find_project_by_name(name) for name in ("home", "house", "work")}
+    return {name: proj.id for name, proj in found.items() if proj is not None}
+
+
+def test_rename_moves_the_name(storage):
+    storage.add_project(Project(id="p", name="home", description=""))
+    assert storage.update_project("p", name="house").name == "house"
+    assert storage.find_project_by_name("home") is None
+    assert storage.find_project_by_name("house").id == "p"
+    # The old name is free for another project.
+    storage.add_project(Project(id="q", name="home", description=""))
+    assert _names(storage) == {"home": "q", "house": "p"}
+
+
+def test_rename_onto_a_taken_name_changes_nothing(storage):
+    storage.add_project(Project(id="p", name="home", description="mine"))
+    storage.add_project(Project(id="q", name="work", description=""))
+    with pytest.raises(InvalidEntityError):
+        storage.update_project("q", name="home", description="changed")
+    assert _names(storage) == {"home": "p", "work": "q"}
+    assert storage.get_project("q").name == "work" and storage.get_project("q").description == ""
+    # Renaming a project to its own name, or changing only the description, keeps its entry.
+    storage.update_project("p", name="home", description="still mine")
+    storage.update_project("q", description="other")
+    assert _names(storage) == {"home": "p", "work": "q"}
+
+
+def test_removed_project_frees_its_name(storage):
+    storage.add_project(Project(id="p", name="home", description=""))
+    assert storage.remove_project("p")
+    assert storage.find_project_by_name("home") is None
+
+
+def test_service_rename_goes_through_the_index():
+    storage = MemoryStorage()
+    projects = ProjectService(storage)
+    home = projects.create_project("home", "")
+    work = projects.create_project("work", "")
+    projects.edit_project(home.id, "house", "")
+    assert storage.find_project_by_name("home") is None
+    assert storage.find_project_by_name("house").id == home.id
+    with pytest.raises(InvalidEntityError):
+        projects.edit_project(work.id, "house", "")
+    assert storage.find_project_by_name("work").id == work.id
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from todolist.cli.pager import Pager
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.quota import quotas_for
+from todolist.core.services.task_service import TaskService
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def services(request):
+    storage = MemoryStorage() if request.param == "memory" else SQLiteStorage()
+    quotas_for(storage).max_tasks = 1000
+    yield ProjectService(storage), TaskService(storage)
+    if request.param == "sqlite":
+        storage.close()
+
+
+def _walk(fetch) -> list:
+    seen, cursor = [], None
+    while True:
+        page = fetch(cursor)
+        seen.extend(item.id for item in page.items)
+        if page.next_cursor is None:
+            return seen
+        cursor = page.next_cursor
+
+
+def test_paged_walk_sees_every_item_once(services):
+    projects, tasks = services
+    pids = [projects.create_project(f"p{i}", "").id for i in range(7)]
+    added = [tasks.add_task(pids[0], f"task {i}", "").id for i in range(23)]
+    assert _walk(lambda c: projects.list_projects_page(c, 3)) == pids
+    for size in (1, 5, 23, 100):
+        assert _walk(lambda c: tasks.list_tasks_page(pids[0], c, size)) == added
+    assert _walk(lambda c: tasks.list_tasks_page(pids[1], c, 5)) == []
+
+
+def test_cursor_survives_deletions(services):
+    projects, tasks = services
+    pid = projects.create_project("home", "").id
+    ids = [tasks.add_task(pid, f"task {i}", "").id for i in range(10)]
+    page = tasks.list_tasks_page(pid, None, 4)
+    assert [t.id for t in page.items] == ids[:4]
+    # The cursor's own item and earlier ones are gone; the walk carries on after them.
+    for tid in ids[1:4]:
+        assert tasks.delete_task(pid, tid)
+    page = tasks.list_tasks_page(pid, page.next_cursor, 4)
+    assert [t.id for t in page.items] == ids[4:8]
+    tasks.delete_task(pid, ids[8])
+    late = tasks.add_task(pid, "late", "").id
+    page = tasks.list_tasks_page(pid, page.next_cursor, 4)
+    assert [t.id for t in page.items] == [ids[9], late] and page.next_cursor is None
+
+
+def test_invalid_and_foreign_cursors_are_refused(services):
+    projects, tasks = services
+    home = projects.create_project("home", "").id
+    work = projects.create_project("work", "").id
+    for pid in (home, work):
+        for i in range(3):
+            tasks.add_task(pid, f"task {i}", "")
+    home_cursor = tasks.list_tasks_page(home, None, 1).next_cursor
+    project_cursor = projects.list_projects_page(None, 1).next_cursor
+    assert tasks.list_tasks_page(home, home_cursor, 1).items
+    for bad in ("garbage", "", "-1", home_cursor + "x", project_cursor):
+        with pytest.raises(InvalidEntityError):
+            tasks.list_tasks_page(home, bad, 1)
+    with pytest.raises(InvalidEntityError):
+        tasks.list_tasks_page(work, home_cursor, 1)
+    with pytest.raises(InvalidEntityError):
+        projects.list_projects_page(home_cursor, 1)
+
+
+def test_pager_stops_when_declined():
+    out = io.StringIO()
+    asked = []
+
+    def more() -> bool:
+        asked.append(out.getvalue().count("\n"))
+        return len(asked) < 2
+
+    pulled = []
+
+    def rows():
+        for i in range(100):
+            pulled.append(i)
+            yield f"row {i}"
+
+    shown = Pager(page_size=10, out=out, more=more).render("header\n", rows(), "footer\n")
+    assert shown == 20 and len(asked) == 2
+    assert out.getvalue().splitlines() == ["header"] + [f"row {i}" for i in range(20)]
+    # Rows are pulled lazily: one past the last page shown, to know there is more.
+    assert len(pulled) == 21
+
+
+def test_pager_writes_everything_when_continued():
+    out = io.StringIO()
+    shown = Pager(page_size=4, out=out, more=lambda: True).render("h\n", (f"r{i}" for i in range(9)), "f\n")
+    assert shown == 9
+    assert out.getvalue() == "h\n" + "".join(f"r{i}\n" for i in range(9)) + "f\n"
+    assert Pager(out=out, more=lambda: False).render("h\n", iter([]), "f\n") == 0
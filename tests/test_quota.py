@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from todolist.core.exceptions.limit_exceeded import LimitExceededError
+from todolist.core.services.async_project_service import AsyncProjectService
+from todolist.core.services.async_task_service import AsyncTaskService
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.quota import QuotaEngine, quotas_for
+from todolist.core.services.task_service import TaskService
+from todolist.storage.async_storage import AsyncMemoryStorage, ExecutorStorage
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+
+
+def _limited(storage, projects=10, tasks=100):
+    quotas = quotas_for(storage)
+    quotas.max_projects = projects
+    quotas.max_tasks = tasks
+    return quotas
+
+
+def test_project_limit_and_release_on_delete():
+    storage = MemoryStorage()
+    _limited(storage, projects=2)
+    projects = ProjectService(storage)
+    a = projects.create_project("a", "")
+    projects.create_project("b", "")
+    with pytest.raises(LimitExceededError):
+        projects.create_project("c", "")
+    assert projects.delete_project(a.id)
+    projects.create_project("c", "")
+    assert storage.count_projects() == 2
+
+
+def test_task_limit_and_per_project_override():
+    storage = MemoryStorage()
+    _limited(storage, tasks=2)
+    pid = ProjectService(storage).create_project("a", "").id
+    tasks = TaskService(storage)
+    tasks.add_task(pid, "one", "")
+    tasks.add_task(pid, "two", "")
+    with pytest.raises(LimitExceededError):
+        tasks.add_task(pid, "three", "")
+    tasks.set_task_limit(pid, 3)
+    tasks.add_task(pid, "three", "")
+    assert storage.count_tasks(pid) == 3
+
+
+def test_counters_start_from_existing_data():
+    storage = MemoryStorage()
+    ProjectService(storage).create_project("a", "")
+    engine = QuotaEngine(storage, max_projects=1)
+    with pytest.raises(LimitExceededError):
+        engine.reserve_project()
+
+
+def test_limit_holds_under_concurrent_callers():
+    storage = MemoryStorage()
+    _limited(storage, tasks=50)
+    pid = ProjectService(storage).create_project("a", "").id
+    tasks = TaskService(storage)
+    refused = []
+
+    def worker():
+        for i in range(20):
+            try:
+                tasks.add_task(pid, f"t{i}", "")
+            except LimitExceededError:
+                refused.append(i)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert storage.count_tasks(pid) == 50
+    assert len(refused) == 8 * 20 - 50
+
+
+def test_async_services_share_counters_with_sync_ones(run_async):
+    storage = MemoryStorage()
+    _limited(storage, projects=1)
+    ProjectService(storage).create_project("a", "")
+
+    async def scenario():
+        await AsyncProjectService(AsyncMemoryStorage(storage)).create_project("b", "")
+
+    with pytest.raises(LimitExceededError):
+        run_async(scenario())
+
+
+def test_async_create_inside_transaction_over_sqlite(run_async):
+    # The quota counts must be awaited through the executor: reading them from
+    # the loop while the executor thread holds the SQLite transaction deadlocks.
+    backend = SQLiteStorage()
+    _limited(backend, projects=5, tasks=5)
+    storage = ExecutorStorage(backend)
+
+    async def scenario():
+        projects = AsyncProjectService(storage)
+        tasks = AsyncTaskService(storage)
+        async with storage.transaction():
+            proj = await projects.create_project("home", "")
+            for i in range(5):
+                await tasks.add_task(proj.id, f"task {i}", "")
+            with pytest.raises(LimitExceededError):
+                await tasks.add_task(proj.id, "one too many", "")
+        return proj.id
+
+    try:
+        pid = run_async(scenario())
+    finally:
+        storage.close()
+    assert backend.count_projects() == 1
+    assert backend.count_tasks(pid) == 5
+
+
+def test_counters_follow_a_rolled_back_transaction():
+    storage = SQLiteStorage()
+    quotas = _limited(storage, projects=2, tasks=5)
+    projects, tasks = ProjectService(storage), TaskService(storage)
+    proj = projects.create_project("home", "")
+    for i in range(4):
+        tasks.add_task(proj.id, f"task {i}", "")
+    with pytest.raises(RuntimeError):
+        with storage.transaction():
+            tasks.add_task(proj.id, "rolled back", "")
+            projects.create_project("work", "")
+            raise RuntimeError("boom")
+    assert quotas.task_count(proj.id) == storage.count_tasks(proj.id) == 4
+    assert quotas.project_count() == storage.count_projects() == 1
+    # The slots are free again: the last task and project still fit.
+    tasks.add_task(proj.id, "fifth", "")
+    projects.create_project("work", "")
+    with pytest.raises(LimitExceededError):
+        tasks.add_task(proj.id, "sixth", "")
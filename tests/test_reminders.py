@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.quota import quotas_for
+from todolist.core.services.reminders import reminders_for
+from todolist.core.services.task_service import TaskService
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+
+D1 = date(2026, 3, 1)
+D2 = date(2026, 3, 2)
+D3 = date(2026, 3, 3)
+
+
+@pytest.fixture
+def setup():
+    storage = MemoryStorage()
+    quotas_for(storage).max_tasks = 1000
+    tasks = TaskService(storage)
+    pid = ProjectService(storage).create_project("home", "").id
+    scheduler = reminders_for(storage)
+    scheduler.clock = lambda: D1 - timedelta(days=30)
+    fired = []
+    scheduler.add_callback(lambda p, task: fired.append(task.title))
+    return tasks, pid, scheduler, fired
+
+
+def test_fires_in_deadline_order_and_only_when_due(setup):
+    tasks, pid, scheduler, fired = setup
+    tasks.add_task(pid, "third", "", D3)
+    tasks.add_task(pid, "first", "", D1)
+    tasks.add_task(pid, "second", "", D2)
+    tasks.add_task(pid, "no deadline", "")
+    assert scheduler.next_due() == D1
+    assert scheduler.run_pending() == []
+    scheduler.run_pending(D2)
+    assert fired == ["first", "second"]
+    scheduler.run_pending(D3)
+    assert fired == ["first", "second", "third"]
+    assert scheduler.next_due() is None and scheduler.pending() == 0
+
+
+def test_load_picks_up_tasks_added_before_the_scheduler():
+    storage = MemoryStorage()
+    tasks = TaskService(storage)
+    pid = ProjectService(storage).create_project("home", "").id
+    tasks.add_task(pid, "early", "", D2)
+    tasks.add_task(pid, "done", "", D1)
+    tasks.change_status(pid, storage.list_tasks(pid)[1].id, "done")
+    fired = reminders_for(storage).run_pending(D3)
+    assert [task.title for _, task in fired] == ["early"]
+
+
+def test_unrelated_edit_or_status_change_does_not_fire_again(setup):
+    tasks, pid, scheduler, fired = setup
+    task = tasks.add_task(pid, "milk", "", D1)
+    scheduler.run_pending(D1)
+    tasks.edit_task(pid, task.id, title="oat milk")
+    tasks.change_status(pid, task.id, "doing")
+    tasks.change_status(pid, task.id, "done")
+    tasks.change_status(pid, task.id, "todo")
+    tasks.edit_task(pid, task.id, deadline=D1)
+    scheduler.run_pending(D3)
+    assert fired == ["milk"]
+
+
+def test_deadline_edit_rearms(setup):
+    tasks, pid, scheduler, fired = setup
+    task = tasks.add_task(pid, "milk", "", D1)
+    scheduler.run_pending(D1)
+    tasks.edit_task(pid, task.id, deadline=D2)
+    scheduler.run_pending(D1)
+    assert fired == ["milk"]
+    scheduler.run_pending(D2)
+    assert fired == ["milk", "milk"]
+    # Moving back to an earlier deadline is a change too.
+    tasks.edit_task(pid, task.id, deadline=D1)
+    scheduler.run_pending(D3)
+    assert fired == ["milk", "milk", "milk"]
+
+
+def test_deadline_edit_before_firing_reminds_once_at_the_new_date(setup):
+    tasks, pid, scheduler, fired = setup
+    task = tasks.add_task(pid, "milk", "", D1)
+    tasks.edit_task(pid, task.id, deadline=D3)
+    scheduler.run_pending(D2)
+    assert fired == []
+    scheduler.run_pending(D3)
+    assert fired == ["milk"]
+
+
+def test_done_and_deleted_tasks_are_not_reminded(setup):
+    tasks, pid, scheduler, fired = setup
+    done = tasks.add_task(pid, "done", "", D1)
+    gone = tasks.add_task(pid, "gone", "", D1)
+    tasks.add_task(pid, "kept", "", D1)
+    tasks.change_status(pid, done.id, "done")
+    tasks.delete_task(pid, gone.id)
+    scheduler.run_pending(D3)
+    assert fired == ["kept"]
+
+
+def test_stale_entries_are_compacted(setup):
+    tasks, pid, scheduler, fired = setup
+    task = tasks.add_task(pid, "busy", "", D1)
+    for i in range(1000):
+        tasks.edit_task(pid, task.id, deadline=D1 + timedelta(days=i % 7 + 1))
+    assert len(scheduler._heap) <= 2 * len(scheduler._due) + 64 + 1
+    scheduler.run_pending(D1 + timedelta(days=10))
+    assert fired == ["busy"]
+
+
+def test_failing_callback_does_not_stop_the_others(setup):
+    tasks, pid, scheduler, fired = setup
+    tasks.add_task(pid, "a", "", D1)
+    tasks.add_task(pid, "b", "", D2)
+
+    def broken(project_id, task):
+        raise RuntimeError("boom")
+
+    scheduler.add_callback(broken)
+    with pytest.raises(RuntimeError):
+        scheduler.run_pending(D3)
+    assert fired == ["a", "b"]
+
+
+def test_deleting_a_project_forgets_its_tasks(setup):
+    tasks, pid, scheduler, fired = setup
+    projects = ProjectService(tasks.storage)
+    other = projects.create_project("work", "").id
+    for day in (D1, D2, D3):
+        tasks.add_task(pid, f"home {day.day}", "", day)
+    tasks.add_task(other, "work", "", D2)
+    assert scheduler.pending() == 4
+    assert projects.delete_project(pid)
+    assert scheduler.pending() == 1
+    scheduler.run_pending(D3)
+    assert fired == ["work"]
+
+
+@pytest.mark.parametrize("make", [MemoryStorage, SQLiteStorage], ids=["memory", "sqlite"])
+def test_rolled_back_project_delete_is_reminded_again(make, monkeypatch):
+    storage = make()
+    tasks = TaskService(storage)
+    pid = ProjectService(storage).create_project("home", "").id
+    tasks.add_task(pid, "kept", "", D1)
+    scheduler = reminders_for(storage)
+    unit = tasks.unit_of_work()
+    unit.delete_project(pid)
+    other = ProjectService(storage).create_project("work", "").id
+    unit.add_task(other, "boom", "")
+
+    def failing_add(project_id, task):
+        raise OSError("simulated write failure")
+
+    monkeypatch.setattr(storage, "add_task", failing_add)
+    with pytest.raises(OSError):
+        unit.commit()
+    assert storage.get_project(pid) is not None
+    assert scheduler.pending() == 1 and scheduler.next_due() == D1
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import random
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.search_index import SearchIndex, tokenize
+
+WORDS = "deploy review release report web mobile billing bill".split()
+
+
+def _text(rng):
+    return " ".join(rng.choice(WORDS) + str(rng.randrange(5)) for _ in range(rng.randrange(1, 4)))
+
+
+def _scan(docs, query):
+    terms = set(tokenize(query))
+    if not terms:
+        return []
+    hits = []
+    for key, text in docs.items():
+        tokens = set(tokenize(text))
+        if all(any(tok.startswith(term) for tok in tokens) for term in terms):
+            hits.append((-sum(term in tokens for term in terms), key[0], key[1] or ""))
+    return [(pid, tid or None) for _, pid, tid in sorted(hits)]
+
+
+def test_index_agrees_with_a_scan():
+    rng = random.Random(7)
+    index = SearchIndex()
+    docs = {}
+    for i in range(3000):
+        op = rng.random()
+        pid = f"p{rng.randrange(4)}"
+        if op < 0.4:
+            key = (pid, rng.choice([None, f"t{rng.randrange(200)}"]))
+            text = _text(rng)
+            index.put(key, text)
+            docs[key] = text
+        elif op < 0.5:
+            batch = [((pid, f"n{i}-{j}"), _text(rng), "") for j in range(rng.randrange(1, 20))]
+            index.put_new(batch)
+            docs.update((key, title) for key, title, _ in batch)
+        elif op < 0.9:
+            key = (pid, f"t{rng.randrange(200)}")
+            index.remove(key)
+            docs.pop(key, None)
+        elif op < 0.92:
+            index.remove_project(pid)
+            docs = {key: text for key, text in docs.items() if key[0] != pid}
+        assert len(index) == len(docs)
+        query = rng.choice(["rev", "deploy1", "bill", "re web", "report2 mobile", "zzz", ""])
+        assert index.search(query, limit=10_000) == _scan(docs, query)
+    # Removed documents' numbers are reused rather than growing the tables.
+    assert len(index._doc_tokens) <= len(docs) + len(index._free)
+    for postings in index._postings.values():
+        assert type(postings) is int or (len(postings) > 1 and all(type(doc) is int for doc in postings))
+
+
+def test_storage_builds_the_index_on_first_search():
+    storage = MemoryStorage()
+    storage.add_project(Project(id="p", name="home chores", description=""))
+    storage.add_task("p", Task(id="t1", title="buy milk", description="before friday"))
+    storage.add_tasks("p", [Task(id="t2", title="fix bike", description="")])
+    assert storage._search is None
+
+    assert [(pid, t and t.id) for pid, t in storage.search("milk")] == [("p", "t1")]
+    assert [(pid, t) for pid, t in storage.search("chores")] == [("p", None)]
+    assert storage._search is not None
+
+    storage.update_task("p", "t2", title="fix car")
+    storage.add_task("p", Task(id="t3", title="buy bread", description=""))
+    storage.remove_task("p", "t1")
+    assert [t.id for _, t in storage.search("buy")] == ["t3"]
+    assert storage.search("bike") == [] and [t.id for _, t in storage.search("car")] == ["t2"]
+    storage.update_project("p", name="house")
+    assert storage.search("chores") == [] and storage.search("house") == [("p", None)]
+    storage.remove_project("p")
+    assert storage.search("buy") == [] and len(storage._search_index()) == 0
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import http.client
+import json
+import socket
+import threading
+from datetime import date
+
+import pytest
+
+from todolist.api import server as api
+from todolist.api.server import TodoHTTPServer
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.services.quota import quotas_for
+from todolist.core.services.task_service import TaskService
+from todolist.storage.memory_storage import MemoryStorage
+
+
+@pytest.fixture
+def served():
+    storage = MemoryStorage()
+    quotas_for(storage).max_tasks = 10_000
+    httpd = TodoHTTPServer(("127.0.0.1", 0), storage)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _conn(httpd):
+    return http.client.HTTPConnection("127.0.0.1", httpd.server_address[1], timeout=5)
+
+
+def _call(conn, method, path, body=None):
+    data = None if body is None else json.dumps(body)
+    conn.request(method, path, body=data, headers={"Content-Type": "application/json"} if data else {})
+    response = conn.getresponse()
+    return response.status, json.loads(response.read() or b"null")
+
+
+def _raw(httpd, request: bytes) -> bytes:
+    with socket.create_connection(("127.0.0.1", httpd.server_address[1]), timeout=5) as sock:
+        sock.sendall(request)
+        chunks = []
+        while True:
+            data = sock.recv(65536)
+            if not data:
+                return b"".join(chunks)
+            chunks.append(data)
+
+
+def test_crud_round_trip(served):
+    conn = _conn(served)
+    status, proj = _call(conn, "POST", "/projects", {"name": "home", "description": "d"})
+    assert status == 201
+    status, task = _call(conn, "POST", f"/projects/{proj['id']}/tasks", {"title": "milk", "deadline": "2026-01-15"})
+    assert status == 201 and task["deadline"] == "2026-01-15"
+    status, task = _call(conn, "PATCH", f"/projects/{proj['id']}/tasks/{task['id']}", {"status": "done"})
+    assert status == 200 and task["status"] == "done"
+    assert _call(conn, "GET", f"/projects/{proj['id']}")[1]["tasks"] == 1
+    assert _call(conn, "GET", f"/projects/{proj['id']}/summary?as_of=2026-02-01")[1]["by_status"]["done"] == 1
+    assert _call(conn, "DELETE", f"/projects/{proj['id']}/tasks/{task['id']}")[0] == 200
+    assert _call(conn, "GET", f"/projects/{proj['id']}/tasks/{task['id']}")[0] == 404
+    conn.close()
+
+
+def test_unread_bodies_do_not_break_keep_alive(served):
+    conn = _conn(served)
+    # Unmatched route, error before the body is parsed, unknown project.
+    assert _call(conn, "POST", "/nowhere", {"name": "x" * 100})[0] == 404
+    assert _call(conn, "POST", "/projects?limit=x", {"name": 5})[0] == 400
+    assert _call(conn, "POST", "/projects/missing/tasks", {"title": "t"})[0] == 404
+    status, body = _call(conn, "GET", "/projects")
+    assert status == 200 and body["items"] == []
+    conn.close()
+
+
+def test_non_string_fields_are_bad_requests(served):
+    conn = _conn(served)
+    assert _call(conn, "POST", "/projects", {"name": 123}) == (400, {"error": "name must be a string."})
+    _, proj = _call(conn, "POST", "/projects", {"name": "home"})
+    path = f"/projects/{proj['id']}/tasks"
+    assert _call(conn, "POST", path, {"title": ["t"]})[0] == 400
+    assert _call(conn, "POST", path, {"title": "t", "deadline": 20260115})[0] == 400
+    assert _call(conn, "POST", path, [1, 2])[0] == 400
+    conn.close()
+
+
+def test_bad_content_length_is_a_bad_request(served):
+    reply = _raw(served, b"POST /projects HTTP/1.1\r\nHost: x\r\nContent-Length: abc\r\n\r\n{}")
+    assert reply.startswith(b"HTTP/1.1 400")
+    assert b"Connection: close" in reply
+
+
+def test_oversized_body_is_refused_unread(served):
+    reply = _raw(served, b"POST /projects HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n{}" % (api.MAX_BODY + 1))
+    assert reply.startswith(b"HTTP/1.1 413")
+    assert b"Connection: close" in reply
+
+
+def test_not_found_is_told_apart_by_type(served, monkeypatch):
+    conn = _conn(served)
+    _, proj = _call(conn, "POST", "/projects", {"name": "home"})
+    assert _call(conn, "PATCH", f"/projects/{proj['id']}/tasks/missing", {"title": "t"})[0] == 404
+    assert _call(conn, "PATCH", "/projects/missing", {"name": "x"})[0] == 404
+
+    def rejected(*args, **kwargs):
+        raise InvalidEntityError("Parent task not found.")
+
+    monkeypatch.setattr(TaskService, "edit_task", rejected)
+    assert _call(conn, "PATCH", f"/projects/{proj['id']}/tasks/t", {"title": "t"})[0] == 400
+    conn.close()
+
+
+def test_cursor_pagination_and_stream(served):
+    conn = _conn(served)
+    _, proj = _call(conn, "POST", "/projects", {"name": "home"})
+    path = f"/projects/{proj['id']}/tasks"
+    for i in range(25):
+        _call(conn, "POST", path, {"title": f"t{i}"})
+    seen, cursor = [], ""
+    while True:
+        _, page = _call(conn, "GET", f"{path}?limit=10" + (f"&cursor={cursor}" if cursor else ""))
+        seen += [t["title"] for t in page["items"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert seen == [f"t{i}" for i in range(25)]
+    conn.request("GET", f"{path}?stream=1")
+    response = conn.getresponse()
+    lines = response.read().decode().splitlines()
+    assert response.getheader("Transfer-Encoding") == "chunked"
+    assert [json.loads(line)["title"] for line in lines] == seen
+    conn.close()
+
+
+def test_query_tasks_pages_and_streams(served):
+    conn = _conn(served)
+    _, proj = _call(conn, "POST", "/projects", {"name": "home"})
+    for day in (3, 1, 2):
+        _call(conn, "POST", f"/projects/{proj['id']}/tasks", {"title": f"d{day}", "deadline": f"2026-01-0{day}"})
+    _, body = _call(conn, "GET", "/tasks?due_from=2026-01-01&due_to=2026-01-31&limit=2")
+    assert body["total"] == 3 and [t["title"] for t in body["items"]] == ["d1", "d2"]
+    conn.request("GET", "/tasks?overdue_as_of=2026-01-03&stream=1")
+    rows = [json.loads(line) for line in conn.getresponse().read().decode().splitlines()]
+    assert [(r["title"], r["project_id"]) for r in rows] == [("d1", proj["id"]), ("d2", proj["id"])]
+    assert _call(conn, "GET", "/tasks")[0] == 400
+    conn.close()
+
+
+def test_error_mid_stream_closes_without_a_json_body(served, monkeypatch):
+    storage = served.storage
+    pid = served.project_service.create_project("home", "").id
+    for i in range(api.STREAM_CHUNK + 10):
+        served.task_service.add_task(pid, f"t{i}", "", date(2026, 1, 1))
+    calls = []
+    real = api.task_to_json
+
+    def flaky(task):
+        calls.append(task)
+        if len(calls) > api.STREAM_CHUNK:
+            raise RuntimeError("storage went away")
+        return real(task)
+
+    monkeypatch.setattr(api, "task_to_json", flaky)
+    reply = _raw(served, f"GET /projects/{pid}/tasks?stream=1 HTTP/1.1\r\nHost: x\r\n\r\n".encode())
+    head, _, body = reply.partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 200")
+    assert b"error" not in body
+    assert not body.endswith(b"0\r\n\r\n")
+    assert body.count(b"\"title\"") == api.STREAM_CHUNK
+    assert storage.count_tasks(pid) == api.STREAM_CHUNK + 10
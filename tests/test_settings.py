@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import todolist
+from todolist.core.services.quota import QuotaEngine
+from todolist.core.validators import project_validator, task_validator
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.utils import env_loader
+from todolist.utils.settings import Settings, get_settings, reload_settings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(todolist.__file__)))
+IMPORT_CAP_US = 120_000
+KEYS = (
+    "MAX_NUMBER_OF_PROJECTS", "MAX_NUMBER_OF_PROJECT", "MAX_NUMBER_OF_TASKS", "MAX_NUMBER_OF_TASK",
+    "DATABASE_PATH", "JOURNAL_PATH", "STORAGE_SHARDS", "STORAGE_CACHE_SIZE", "METRICS_ENABLED", "METRICS_PATH",
+)
+
+
+@pytest.fixture
+def env(monkeypatch):
+    for key in KEYS:
+        monkeypatch.delenv(key, raising=False)
+    yield monkeypatch
+    monkeypatch.undo()
+    reload_settings()
+
+
+def test_defaults_and_values_from_the_environment(env):
+    assert Settings.from_env() == Settings()
+    env.setenv("MAX_NUMBER_OF_PROJECTS", "3")
+    env.setenv("MAX_NUMBER_OF_TASK", "7")  # the old singular key still works
+    env.setenv("DATABASE_PATH", "/tmp/x.db")
+    env.setenv("STORAGE_CACHE_SIZE", "not a number")
+    env.setenv("METRICS_ENABLED", " Yes ")
+    settings = Settings.from_env()
+    assert (settings.max_projects, settings.max_tasks) == (3, 7)
+    assert settings.database_path == "/tmp/x.db" and settings.journal_path is None
+    assert settings.storage_cache_size == 0
+    assert settings.metrics_enabled
+
+
+def test_settings_are_read_once_until_reloaded(env):
+    env.setenv("MAX_NUMBER_OF_PROJECTS", "3")
+    first = reload_settings()
+    env.setenv("MAX_NUMBER_OF_PROJECTS", "4")
+    assert get_settings() is first and first.max_projects == 3
+    assert reload_settings().max_projects == 4 and get_settings().max_projects == 4
+
+
+def test_limits_come_from_the_settings(env):
+    env.setenv("MAX_NUMBER_OF_PROJECTS", "2")
+    env.setenv("MAX_NUMBER_OF_TASKS", "5")
+    reload_settings()
+    assert project_validator.MAX_PROJECTS == 2 and task_validator.MAX_TASKS == 5
+    engine = QuotaEngine(MemoryStorage())
+    assert (engine.max_projects, engine.max_tasks) == (2, 5)
+    with pytest.raises(AttributeError):
+        project_validator.MAX_SOMETHING
+
+
+def test_dotenv_in_the_working_directory_is_loaded_once(env, tmp_path):
+    pytest.importorskip("dotenv")
+    (tmp_path / ".env").write_text("MAX_NUMBER_OF_TASKS=42\n")
+    env.chdir(tmp_path)
+    env.setattr(env_loader, "_loaded", False)
+    env.setattr(env_loader, "_find_dotenv", lambda: os.path.join(os.getcwd(), ".env"))
+    try:
+        assert reload_settings().max_tasks == 42
+        (tmp_path / ".env").write_text("MAX_NUMBER_OF_TASKS=43\n")
+        assert reload_settings().max_tasks == 42
+    finally:
+        os.environ.pop("MAX_NUMBER_OF_TASKS", None)
+
+
+def test_entry_point_imports_only_what_it_needs(tmp_path):
+    lazy = [
+        "dotenv", "sqlite3", "json", "csv", "asyncio", "multiprocessing",
+        "todolist.cli.menu", "todolist.cli.batch", "todolist.utils.metrics",
+        "todolist.storage.sqlite_storage", "todolist.storage.journal_storage",
+    ]
+    code = f"import sys, todolist.main; print([m for m in {lazy!r} if m in sys.modules])"
+    env = {k: v for k, v in os.environ.items() if k not in KEYS}
+    env["PYTHONPATH"] = ROOT
+    done = subprocess.run(
+        [sys.executable, "-c", code], cwd=tmp_path, env=env, capture_output=True, text=True, check=True
+    )
+    assert done.stdout.strip() == "[]"
+
+
+def _import_times(cwd) -> dict:
+    """Cumulative microseconds per module for ``import todolist.main``, from -X importtime."""
+    env = {k: v for k, v in os.environ.items() if k not in KEYS}
+    env["PYTHONPATH"] = ROOT
+    done = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import todolist.main"],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in done.stderr.splitlines():
+        if line.startswith("import time:") and "imported package" not in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_entry_point_import_time(tmp_path):
+    runs = [_import_times(tmp_path) for _ in range(3)]
+    heavy = ("sqlite3", "http.server", "json", "csv", "todolist.core.services", "todolist.api")
+    assert [m for m in runs[0] if m.startswith(heavy)] == []
+    # Several times the ~25 ms it takes, so a loaded machine does not fail it;
+    # the check above is what catches a single heavy module coming back.
+    assert min(r["todolist.main"] for r in runs) < IMPORT_CAP_US
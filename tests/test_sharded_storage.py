@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import os
+from functools import partial
+
+import pytest
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.core.validators.project_validator import MemoryStorageSingleton
+from todolist.storage import factory
+from todolist.storage.factory import close_storage, open_storage_from_env
+from todolist.storage.journal_storage import JournalStorage
+from todolist.storage.sharded_storage import ShardedStorage, journal_shard
+from todolist.utils.settings import reload_settings
+
+
+def _open(path: str, shards: int = 2) -> ShardedStorage:
+    return ShardedStorage(shards, partial(journal_shard, path), manifest=path + ".shards")
+
+
+def _ids(storage) -> list:
+    ids, cursor = [], None
+    while True:
+        page, cursor = storage.list_projects_page(cursor, 3)
+        ids.extend(p.id for p in page)
+        if cursor is None:
+            return ids
+
+
+def test_project_order_survives_a_restart(tmp_path):
+    path = str(tmp_path / "todo.journal")
+    storage = _open(path)
+    try:
+        for i in range(12):
+            storage.add_project(Project(id=f"p{i}", name=f"project {i}", description=""))
+        storage.add_task("p3", Task(id="t", title="kept", description=""))
+        storage.remove_project("p5")
+        storage.add_project(Project(id="p5", name="back", description=""))
+        assert len({storage.shard_of(f"p{i}") for i in range(12)}) == 2
+        before = _ids(storage)
+    finally:
+        storage.close()
+    storage = _open(path)
+    try:
+        assert _ids(storage) == before
+        assert storage.get_task("p3", "t").title == "kept"
+        storage.add_project(Project(id="late", name="late", description=""))
+        assert _ids(storage) == before + ["late"]
+    finally:
+        storage.close()
+
+
+def test_shards_written_before_global_numbers_still_open(tmp_path):
+    path = str(tmp_path / "todo.journal")
+    storage = _open(path)
+    storage.close()
+    placed = {0: [], 1: []}
+    for i in range(6):
+        placed[storage.shard_of(f"p{i}")].append(f"p{i}")
+    for index, ids in placed.items():
+        with JournalStorage(f"{path}.{index}") as shard:
+            for pid in ids:
+                shard.add_project(Project(id=pid, name=pid, description=""))
+    storage = _open(path)
+    try:
+        first = _ids(storage)
+        assert sorted(first) == [f"p{i}" for i in range(6)]
+        storage.add_project(Project(id="new", name="new", description=""))
+    finally:
+        storage.close()
+    storage = _open(path)
+    try:
+        assert _ids(storage) == first + ["new"]
+    finally:
+        storage.close()
+
+
+def test_another_shard_count_is_refused(tmp_path):
+    path = str(tmp_path / "todo.journal")
+    _open(path).close()
+    with pytest.raises(ValueError):
+        _open(path, shards=3)
+
+
+@pytest.fixture
+def env(monkeypatch):
+    for key in ("DATABASE_PATH", "JOURNAL_PATH", "STORAGE_SHARDS", "STORAGE_CACHE_SIZE"):
+        monkeypatch.delenv(key, raising=False)
+    yield monkeypatch
+    monkeypatch.undo()
+    reload_settings()
+
+
+def test_factory_does_not_shard_on_one_cpu(env, tmp_path):
+    env.setattr(factory.os, "cpu_count", lambda: 1)
+    env.setenv("STORAGE_SHARDS", "4")
+    reload_settings()
+    assert open_storage_from_env() is MemoryStorageSingleton.get_instance()
+    env.setenv("JOURNAL_PATH", str(tmp_path / "todo.journal"))
+    reload_settings()
+    storage = open_storage_from_env()
+    assert isinstance(storage, JournalStorage)
+    close_storage(storage)
+
+
+def test_factory_opens_a_split_journal_only_as_shards(env, tmp_path):
+    path = str(tmp_path / "todo.journal")
+    _open(path).close()
+    env.setenv("JOURNAL_PATH", path)
+    env.setattr(factory.os, "cpu_count", lambda: 1)
+    env.setenv("STORAGE_SHARDS", "2")
+    reload_settings()
+    storage = open_storage_from_env()
+    assert isinstance(storage, ShardedStorage)
+    close_storage(storage)
+    env.setenv("STORAGE_SHARDS", "1")
+    reload_settings()
+    with pytest.raises(ValueError):
+        open_storage_from_env()
+    assert not os.path.exists(path)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import gc
+import random
+import threading
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import STATUSES, Task
+from todolist.storage.journal_storage import JournalStorage
+from todolist.storage.memory_storage import MemoryStorage
+
+
+def _task(tid: str, title: str = "") -> Task:
+    return Task(id=tid, title=title or tid, description="")
+
+
+def _state(view, project_ids):
+    """Everything a reader can see, through the snapshot/storage read API."""
+    projects = []
+    cursor = None
+    while True:
+        page, cursor = view.list_projects_page(cursor, 2)
+        projects.extend((p.id, p.name, p.description) for p in page)
+        if cursor is None:
+            break
+    tasks = {}
+    for pid in project_ids:
+        listed = []
+        cursor = None
+        while True:
+            page, cursor = view.list_tasks_page(pid, cursor, 3)
+            listed.extend((t.id, t.title, t.status) for t in page)
+            if cursor is None:
+                break
+        tasks[pid] = (listed, view.count_tasks(pid))
+        for tid, title, status in listed:
+            task = view.get_task(pid, tid)
+            assert (task.title, task.status) == (title, status)
+    return projects, view.count_projects(), tasks
+
+
+def test_update_changes_the_stored_task_in_place():
+    storage = MemoryStorage()
+    storage.add_project(Project(id="p", name="home", description=""))
+    storage.add_task("p", _task("t"))
+    held = storage.get_task("p", "t")
+    snap = storage.snapshot()
+    assert storage.update_task("p", "t", title="renamed", status="done") is held
+    assert held.title == "renamed" and storage.get_task("p", "t") is held
+    assert snap.get_task("p", "t").title == "t" and snap.get_task("p", "t").status == "todo"
+    assert storage.tasks_by_status("done") == [("p", held)]
+
+
+def test_writes_save_nothing_without_a_live_snapshot():
+    storage = MemoryStorage()
+    storage.add_project(Project(id="p", name="home", description=""))
+    storage.add_task("p", _task("t"))
+    snap = storage.snapshot()
+    storage.update_task("p", "t", title="seen")
+    assert set(snap._tasks["p"]) == {"t"}
+    del snap
+    gc.collect()
+    assert not storage._snapshots
+    storage.update_task("p", "t", title="again")
+    storage.add_task("p", _task("u"))
+    later = storage.snapshot()
+    assert later._tasks == {} and later._projects == {}
+    assert [t.title for t in later.iter_tasks("p")] == ["again", "u"]
+
+
+def test_snapshot_keeps_its_state_through_every_kind_of_write():
+    rng = random.Random(17)
+    storage = MemoryStorage()
+    pids = [f"p{i}" for i in range(6)]
+    for pid in pids[:4]:
+        storage.add_project(Project(id=pid, name=pid, description=""))
+        storage.add_tasks(pid, [_task(f"{pid}-{i}") for i in range(rng.randrange(12))])
+    snaps = []
+    removed_projects = {}
+    for step in range(600):
+        if step % 60 == 0:
+            snaps.append((storage.snapshot(), _state(storage, pids)))
+        pid = rng.choice(pids)
+        proj = storage.get_project(pid)
+        op = rng.random()
+        if proj is None:
+            if pid in removed_projects and op < 0.5:
+                storage.restore_project(*removed_projects.pop(pid))
+            else:
+                storage.add_project(Project(id=pid, name=f"{pid}-{step}", description=""))
+        elif op < 0.05:
+            removed_projects[pid] = (proj, storage.project_seq(pid))
+            storage.remove_project(pid)
+        elif op < 0.1:
+            storage.update_project(pid, name=f"{pid}-{step}", description=str(step))
+        elif op < 0.4:
+            storage.add_task(pid, _task(f"{pid}-n{step}"))
+        elif op < 0.45:
+            storage.add_tasks(pid, [_task(f"{pid}-b{step}-{i}") for i in range(3)])
+        elif op < 0.75 and len(proj.tasks):
+            task = rng.choice(proj.tasks.copy())
+            storage.update_task(pid, task.id, title=f"edit {step}", status=rng.choice(STATUSES))
+        elif len(proj.tasks):
+            task = rng.choice(proj.tasks.copy())
+            seq = storage.task_seq(pid, task.id)
+            storage.remove_task(pid, task.id)
+            if rng.random() < 0.3:
+                storage.restore_task(pid, task, seq)
+    for snap, expected in snaps:
+        assert _state(snap, pids) == expected
+        for pid in pids:
+            assert [t.id for t in snap.iter_tasks(pid)] == [tid for tid, _, _ in expected[2][pid][0]]
+        assert [p.id for p in snap.iter_projects()] == [pid for pid, _, _ in expected[0]]
+
+
+def test_snapshot_of_the_journal_backend(tmp_path):
+    with JournalStorage(str(tmp_path / "todo.journal")) as storage:
+        storage.add_project(Project(id="p", name="home", description=""))
+        storage.add_tasks("p", [_task(f"t{i}") for i in range(5)])
+        snap = storage.snapshot()
+        storage.update_task("p", "t0", title="changed")
+        storage.remove_project("p")
+        assert [t.title for t in snap.iter_tasks("p")] == ["t0", "t1", "t2", "t3", "t4"]
+        assert snap.get_project("p").name == "home" and storage.get_project("p") is None
+
+
+def test_reader_sees_one_state_while_a_writer_runs():
+    storage = MemoryStorage()
+    storage.add_project(Project(id="p", name="home", description=""))
+    storage.add_tasks("p", [_task(f"t{i}") for i in range(3000)])
+    snap = storage.snapshot()
+    expected = [(t.id, t.title) for t in storage.list_tasks("p")]
+    stop = threading.Event()
+
+    def writer() -> None:
+        i = 0
+        while not stop.is_set():
+            storage.update_task("p", f"t{(i * 31) % 3000}", title=f"racing {i}")
+            storage.add_task("p", _task(f"new{i}"))
+            storage.remove_task("p", f"t{(i * 17) % 3000}")
+            i += 1
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        for _ in range(3):
+            assert [(t.id, t.title) for t in snap.iter_tasks("p")] == expected
+            assert snap.count_tasks("p") == 3000
+    finally:
+        stop.set()
+        thread.join()
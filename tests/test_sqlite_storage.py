@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import STATUSES, Task
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+
+TODAY = date(2026, 3, 10)
+
+
+@pytest.fixture
+def sqlite(tmp_path):
+    storage = SQLiteStorage(str(tmp_path / "todo.db"))
+    yield storage
+    storage.close()
+
+
+def _project(pid: str, name: str = "") -> Project:
+    return Project(id=pid, name=name or pid, description="")
+
+
+def _task(tid: str, title: str = "", **kwargs) -> Task:
+    return Task(id=tid, title=title or tid, description="", **kwargs)
+
+
+def _titles(storage, pid: str) -> list:
+    return [t.title for t in storage.list_tasks(pid)]
+
+
+def test_crud(sqlite):
+    sqlite.add_project(Project(id="p", name="home", description="chores"))
+    sqlite.add_task("p", _task("t", "milk", deadline=TODAY))
+    assert sqlite.get_project("p").name == "home"
+    assert sqlite.find_project_by_name("home").id == "p"
+    assert sqlite.get_task("p", "t") == _task("t", "milk", deadline=TODAY)
+
+    assert sqlite.update_project("p", name="house").description == "chores"
+    assert sqlite.find_project_by_name("home") is None
+    task = sqlite.update_task("p", "t", status="done", deadline=TODAY + timedelta(days=1))
+    assert (task.title, task.status, task.deadline) == ("milk", "done", TODAY + timedelta(days=1))
+    assert sqlite.update_task("p", "missing", title="x") is None
+    assert sqlite.update_project("missing", name="x") is None
+
+    assert sqlite.remove_task("p", "t") and not sqlite.remove_task("p", "t")
+    sqlite.add_task("p", _task("u"))
+    assert sqlite.remove_project("p")
+    assert sqlite.get_project("p") is None and sqlite.count_tasks("p") == 0
+    assert sqlite.count_projects() == 0
+
+
+def test_integrity_errors_are_invalid_entities(sqlite):
+    sqlite.add_project(_project("p", "home"))
+    sqlite.add_project(_project("q", "work"))
+    with pytest.raises(InvalidEntityError):
+        sqlite.add_project(_project("r", "home"))
+    with pytest.raises(InvalidEntityError):
+        sqlite.add_project(_project("p", "other"))
+    with pytest.raises(InvalidEntityError):
+        sqlite.update_project("q", name="home")
+    sqlite.add_task("p", _task("t"))
+    with pytest.raises(InvalidEntityError):
+        sqlite.add_task("p", _task("t"))
+    with pytest.raises(InvalidEntityError):
+        sqlite.add_task("missing", _task("t"))
+    with pytest.raises(InvalidEntityError):
+        sqlite.add_tasks("p", [_task("a"), _task("t")])
+    assert [p.name for p in sqlite.get_all_projects()] == ["home", "work"]
+    assert _titles(sqlite, "p") == ["t"]
+
+
+def test_queries_agree_with_the_memory_backend(sqlite):
+    rng = random.Random(11)
+    memory = MemoryStorage()
+    for storage in (memory, sqlite):
+        for i in range(4):
+            storage.add_project(_project(f"p{i}"))
+    for i in range(300):
+        pid = f"p{rng.randrange(4)}"
+        deadline = TODAY + timedelta(days=rng.randrange(-10, 10)) if rng.random() < 0.7 else None
+        task = _task(f"t{i}", status=rng.choice(STATUSES), deadline=deadline)
+        memory.add_task(pid, task.copy())
+        sqlite.add_task(pid, task.copy())
+
+    for status in STATUSES:
+        assert sorted(sqlite.tasks_by_status(status), key=repr) == sorted(memory.tasks_by_status(status), key=repr)
+        assert sqlite.tasks_by_status(status, "p1") == memory.tasks_by_status(status, "p1")
+    assert sqlite.overdue_tasks(TODAY) == memory.overdue_tasks(TODAY)
+    assert sqlite.overdue_tasks(TODAY, "p2") == memory.overdue_tasks(TODAY, "p2")
+    for i in range(4):
+        assert sqlite.project_summary(f"p{i}", TODAY) == memory.project_summary(f"p{i}", TODAY)
+    assert sqlite.project_summary("missing", TODAY) is None
+
+
+def test_paging_walks_every_row_once(sqlite):
+    for i in range(7):
+        sqlite.add_project(_project(f"p{i}"))
+    sqlite.add_tasks("p0", [_task(f"t{i}") for i in range(10)])
+    projects, cursor = [], None
+    while True:
+        page, cursor = sqlite.list_projects_page(cursor, 3)
+        projects.extend(p.id for p in page)
+        if cursor is None:
+            break
+    assert projects == [f"p{i}" for i in range(7)]
+
+    page, cursor = sqlite.list_tasks_page("p0", None, 4)
+    assert [t.id for t in page] == ["t0", "t1", "t2", "t3"]
+    sqlite.remove_task("p0", "t3")
+    page, cursor = sqlite.list_tasks_page("p0", cursor, 4)
+    assert [t.id for t in page] == ["t4", "t5", "t6", "t7"]
+    page, cursor = sqlite.list_tasks_page("p0", cursor, 4)
+    assert [t.id for t in page] == ["t8", "t9"] and cursor is None
+    with pytest.raises(InvalidEntityError):
+        sqlite.list_tasks_page("p0", "not a cursor", 4)
+
+
+def test_transaction_commits_together(sqlite):
+    with sqlite.transaction():
+        sqlite.add_project(_project("p"))
+        sqlite.add_tasks("p", [_task("a"), _task("b")])
+        sqlite.update_task("p", "a", title="changed")
+    assert _titles(sqlite, "p") == ["changed", "b"]
+    assert not sqlite.conn.in_transaction
+
+
+def test_transaction_rolls_back_every_write(sqlite):
+    sqlite.add_project(_project("p"))
+    sqlite.add_task("p", _task("a"))
+    with pytest.raises(RuntimeError):
+        with sqlite.transaction():
+            sqlite.add_task("p", _task("b"))
+            sqlite.update_task("p", "a", title="changed")
+            sqlite.add_project(_project("q"))
+            raise RuntimeError("boom")
+    assert _titles(sqlite, "p") == ["a"]
+    assert sqlite.get_project("q") is None
+    assert not sqlite.conn.in_transaction
+
+
+def test_failed_nested_block_rolls_back_only_itself(sqlite):
+    sqlite.add_project(_project("p"))
+    with sqlite.transaction():
+        sqlite.add_task("p", _task("before"))
+        with pytest.raises(RuntimeError):
+            with sqlite.transaction():
+                sqlite.add_task("p", _task("inner"))
+                sqlite.update_task("p", "before", title="edited")
+                raise RuntimeError("boom")
+        # A bulk insert that fails part-way leaves none of its rows behind.
+        with pytest.raises(InvalidEntityError):
+            sqlite.add_tasks("p", [_task("x"), _task("before")])
+        sqlite.add_task("p", _task("after"))
+    assert _titles(sqlite, "p") == ["before", "after"]
+
+
+def test_search_after_a_rollback(sqlite):
+    sqlite.add_project(_project("p", "home"))
+    sqlite.add_task("p", _task("t", "buy milk"))
+    assert [t.id for _, t in sqlite.search("milk")] == ["t"]
+    with pytest.raises(RuntimeError):
+        with sqlite.transaction():
+            sqlite.add_task("p", _task("u", "milk the cow"))
+            sqlite.update_task("p", "t", title="buy bread")
+            assert [t.id for _, t in sqlite.search("milk")] == ["u"]
+            raise RuntimeError("boom")
+    assert [t.id for _, t in sqlite.search("milk")] == ["t"]
+    assert sqlite.search("bread") == []
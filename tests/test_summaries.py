@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from todolist.core.entities.task import Task
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.quota import quotas_for
+from todolist.core.services.task_service import TaskService
+from todolist.storage.consistency import check_summaries
+from todolist.storage.journal_storage import JournalStorage
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+
+TODAY = date(2026, 3, 10)
+
+
+@pytest.fixture(params=["memory", "sqlite", "journal"])
+def storage(request, tmp_path):
+    if request.param == "memory":
+        storage = MemoryStorage()
+    elif request.param == "sqlite":
+        storage = SQLiteStorage()
+    else:
+        storage = JournalStorage(str(tmp_path / "todo.journal"))
+    quotas_for(storage).max_tasks = 10_000
+    yield storage
+    if hasattr(storage, "close"):
+        storage.close()
+
+
+def test_summary_follows_each_change(storage):
+    tasks = TaskService(storage)
+    pid = ProjectService(storage).create_project("home", "").id
+    late = tasks.add_task(pid, "late", "", TODAY - timedelta(days=2))
+    soon = tasks.add_task(pid, "soon", "", TODAY + timedelta(days=1))
+    tasks.add_task(pid, "someday", "")
+
+    summary = tasks.project_summary(pid, TODAY)
+    assert (summary.total, summary.overdue, summary.next_deadline) == (3, 1, TODAY + timedelta(days=1))
+    assert summary.by_status == {"todo": 3, "doing": 0, "done": 0}
+
+    tasks.change_status(pid, late.id, "done")
+    tasks.change_status(pid, soon.id, "doing")
+    summary = tasks.project_summary(pid, TODAY)
+    assert summary.overdue == 0 and summary.by_status == {"todo": 1, "doing": 1, "done": 1}
+
+    tasks.edit_task(pid, soon.id, deadline=TODAY - timedelta(days=1))
+    summary = tasks.project_summary(pid, TODAY)
+    assert summary.overdue == 1 and summary.next_deadline is None
+
+    tasks.delete_task(pid, soon.id)
+    summary = tasks.project_summary(pid, TODAY)
+    assert (summary.total, summary.overdue) == (2, 0)
+    # Overdue is relative to the day asked about.
+    tasks.add_task(pid, "later", "", TODAY + timedelta(days=3))
+    assert tasks.project_summary(pid, TODAY).next_deadline == TODAY + timedelta(days=3)
+    assert tasks.project_summary(pid, TODAY + timedelta(days=5)).overdue == 1
+    assert not check_summaries(storage, TODAY)
+
+
+def test_checker_agrees_after_random_changes(storage):
+    rng = random.Random(12)
+    tasks = TaskService(storage)
+    pids = [ProjectService(storage).create_project(f"p{i}", "").id for i in range(3)]
+    live = {pid: [] for pid in pids}
+    for _ in range(600):
+        pid = rng.choice(pids)
+        op = rng.random()
+        if op < 0.5 or not live[pid]:
+            deadline = TODAY + timedelta(days=rng.randint(-10, 10)) if rng.random() < 0.7 else None
+            live[pid].append(tasks.add_task(pid, "t", "", deadline).id)
+        elif op < 0.8:
+            tid = rng.choice(live[pid])
+            tasks.edit_task(
+                pid,
+                tid,
+                status=rng.choice(["todo", "doing", "done"]),
+                deadline=TODAY + timedelta(days=rng.randint(-10, 10)) if rng.random() < 0.5 else None,
+            )
+        else:
+            tasks.delete_task(pid, live[pid].pop(rng.randrange(len(live[pid]))))
+    tasks.add_tasks_bulk(pids[0], [{"title": f"b{i}", "deadline": "2026-03-01"} for i in range(100)])
+    for as_of in (TODAY - timedelta(days=20), TODAY, TODAY + timedelta(days=20)):
+        assert check_summaries(storage, as_of) == []
+
+
+def test_checker_reports_a_drifted_counter():
+    storage = MemoryStorage()
+    pid = ProjectService(storage).create_project("home", "").id
+    TaskService(storage).add_task(pid, "t", "", TODAY)
+    storage._indexes[pid].add(Task(id="ghost", title="ghost", description="", status="done"))
+    problems = check_summaries(storage, TODAY)
+    assert len(problems) == 1 and problems[0].startswith(f"{pid}: maintained")
+
+
+def test_summary_of_a_missing_project_is_not_found():
+    with pytest.raises(InvalidEntityError):
+        TaskService(MemoryStorage()).project_summary("missing", TODAY)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from todolist.core.entities.task import STATUSES, Task
+
+
+def test_status_is_stored_as_its_code():
+    task = Task(id="t", title="milk", description="")
+    assert task.status == "todo" and task.status_code == 0
+    for code, status in enumerate(STATUSES):
+        task.status = status
+        assert task.status == status and task.status_code == code
+
+
+def test_deadline_is_stored_as_an_ordinal():
+    day = date(2026, 3, 10)
+    task = Task(id="t", title="milk", description="", deadline=day)
+    assert task.deadline == day and task.deadline_ordinal == day.toordinal()
+    task.deadline = None
+    assert task.deadline is None and task.deadline_ordinal == 0
+    assert Task(id="u", title="bread", description="").deadline_ordinal == 0
+
+
+def test_unknown_status_is_refused():
+    with pytest.raises(ValueError):
+        Task(id="t", title="milk", description="", status="blocked")
+    task = Task(id="t", title="milk", description="", status="doing")
+    with pytest.raises(ValueError):
+        task.status = "Done"
+    assert task.status == "doing"
+
+
+def test_slots_leave_no_instance_dict():
+    task = Task(id="t", title="milk", description="")
+    assert not hasattr(task, "__dict__")
+    with pytest.raises(AttributeError):
+        task.priority = 1
+
+
+def test_copy_and_equality():
+    task = Task(id="t", title="milk", description="d", status="doing", deadline=date(2026, 3, 10))
+    clone = task.copy()
+    assert clone == task and clone is not task
+    clone.status = "done"
+    assert clone != task and task.status == "doing"
+    clone = task.copy()
+    clone.deadline = None
+    assert clone != task
+    assert task != "t" and Task(id="t", title="milk", description="d") != task
+    with pytest.raises(TypeError):
+        hash(task)
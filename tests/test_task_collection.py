@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pytest
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.core.entities.task_collection import TaskCollection
+from todolist.utils.seq_order import SeqOrder
+
+
+def _tasks(n):
+    return [Task(id=f"t{i}", title=f"task {i}", description="") for i in range(n)]
+
+
+def test_lookup_and_removal_by_id_keep_insertion_order():
+    tasks = _tasks(5)
+    coll = TaskCollection(tasks)
+    assert coll.get("t3") is tasks[3] and coll.get("nope") is None
+    assert coll.remove("t1") and not coll.remove("t1")
+    coll.add(Task(id="t9", title="late", description=""))
+    assert [t.id for t in coll] == ["t0", "t2", "t3", "t4", "t9"]
+    assert len(coll) == 5 and "t2" in coll and "t1" not in coll
+    assert tasks[0] in coll and Task(id="t0", title="copy", description="") not in coll
+
+
+def test_behaves_like_the_list_it_replaced():
+    tasks = _tasks(3)
+    coll = TaskCollection()
+    for t in tasks:
+        coll.append(t)
+    assert coll == tasks and coll == TaskCollection(tasks)
+    assert coll[0] is tasks[0] and coll[-1] is tasks[-1] and coll[1:] == tasks[1:]
+    copy = coll.copy()
+    copy.pop()
+    assert len(coll) == 3
+
+
+def test_page_resumes_from_a_cursor_across_removals():
+    coll = TaskCollection(_tasks(10))
+    first, cursor = coll.page(0, 4)
+    assert [t.id for t in first] == ["t0", "t1", "t2", "t3"]
+    # Removing seen and unseen tasks must not shift the cursor.
+    coll.remove("t2")
+    coll.remove("t5")
+    rest, cursor = coll.page(cursor, 4)
+    assert [t.id for t in rest] == ["t4", "t6", "t7", "t8"]
+    last, cursor = coll.page(cursor, 4)
+    assert [t.id for t in last] == ["t9"] and cursor is None
+
+
+def test_seq_order_compacts_tombstones():
+    order: SeqOrder[int] = SeqOrder()
+    for i in range(1000):
+        order.add(i)
+    for i in range(0, 1000, 2):
+        order.remove(i)
+    for i in range(1, 900, 2):
+        order.remove(i)
+    assert len(order) == 50
+    assert len(order._keys) < 1000
+    assert [k for _, k in order.after(0, 100)] == list(range(901, 1000, 2))
+    assert order.add(901) == order.seq_of(901)
+
+
+def test_project_wraps_plain_lists_and_delegates():
+    tasks = _tasks(3)
+    proj = Project(id="p", name="home", description="", tasks=tasks)
+    assert isinstance(proj.tasks, TaskCollection)
+    assert proj.get_task("t1") is tasks[1]
+    assert proj.remove_task("t1") and proj.get_task("t1") is None
+    proj.add_task(Task(id="t7", title="new", description=""))
+    assert [t.id for t in proj.tasks] == ["t0", "t2", "t7"]
+
+
+def test_restore_puts_a_task_back_in_its_place():
+    coll = TaskCollection(_tasks(6))
+    page, cursor = coll.page(0, 2)
+    removed = [coll.get("t1"), coll.get("t3")]
+    coll.remove("t1")
+    coll.remove("t3")
+    coll.restore(removed[1], 4)
+    assert [t.id for t in coll] == ["t0", "t2", "t3", "t4", "t5"]
+    coll._order._compact()  # the tombstone of t1 is gone; it is inserted instead
+    coll.restore(removed[0], 2)
+    assert [t.id for t in coll] == [t.id for t in _tasks(6)]
+    assert [t.id for t in coll.page(cursor, 10)[0]] == ["t2", "t3", "t4", "t5"]
+    coll.add(Task(id="t6", title="new", description=""))
+    assert coll.seq_of("t6") == 7 and coll.copy()[-1].id == "t6"
+    with pytest.raises(ValueError):
+        coll._order.add("other", 3)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import random
+from bisect import bisect_left, insort
+from datetime import date, timedelta
+
+import pytest
+
+from todolist.core.entities.task import STATUSES, Task
+from todolist.storage.task_index import TaskIndex
+from todolist.utils.sorted_blocks import SortedBlocks
+
+BASE = date(2026, 1, 1)
+
+
+@pytest.mark.parametrize("load", [2, 4, 1000])
+def test_sorted_blocks_match_a_sorted_list(load):
+    rng = random.Random(load)
+    blocks: SortedBlocks[int] = SortedBlocks(load=load)
+    expected = []
+    for _ in range(3000):
+        op = rng.random()
+        if op < 0.55:
+            value = rng.randrange(500)
+            blocks.add(value)
+            insort(expected, value)
+        elif op < 0.95:
+            value = rng.randrange(500)
+            found = value in expected
+            assert blocks.discard(value) is found
+            if found:
+                expected.remove(value)
+        else:
+            batch = [rng.randrange(500) for _ in range(rng.randrange(1, 200))]
+            blocks.update(batch)
+            expected = sorted(expected + batch)
+        probe = rng.randrange(-5, 505)
+        lo, hi = sorted((rng.randrange(-5, 505), rng.randrange(-5, 505)))
+        assert len(blocks) == len(expected)
+        assert blocks.index(probe) == bisect_left(expected, probe)
+        first = bisect_left(expected, probe)
+        assert blocks.first_from(probe) == (expected[first] if first < len(expected) else None)
+        assert blocks.irange(lo, hi) == expected[bisect_left(expected, lo):bisect_left(expected, hi)]
+        assert blocks.irange(None, hi) == expected[:bisect_left(expected, hi)]
+        assert blocks.irange(lo) == expected[bisect_left(expected, lo):]
+    assert list(blocks) == expected
+
+
+def test_blocks_split_and_stay_bounded():
+    blocks: SortedBlocks[int] = SortedBlocks(range(10_000), load=100)
+    for i in range(10_000):
+        blocks.add(i)
+    assert max(len(b) for b in blocks._blocks) <= 200
+    for i in range(10_000):
+        blocks.discard(i)
+    assert len(blocks) == 10_000 and list(blocks) == list(range(10_000))
+    assert all(len(b) >= 1 for b in blocks._blocks)
+
+
+def _deadline(rng):
+    return BASE + timedelta(days=rng.randrange(100)) if rng.random() < 0.7 else None
+
+
+def test_task_index_agrees_with_a_scan():
+    rng = random.Random(6)
+    index = TaskIndex()
+    tasks = {}
+    for i in range(2000):
+        op = rng.random()
+        if op < 0.5 or not tasks:
+            task = Task(id=f"t{i}", title="t", description="", status=rng.choice(STATUSES), deadline=_deadline(rng))
+            tasks[task.id] = task
+            index.add(task)
+        elif op < 0.8:
+            task = tasks[rng.choice(list(tasks))]
+            old = (task.status_code, task.deadline_ordinal)
+            task.status = rng.choice(STATUSES)
+            task.deadline = _deadline(rng)
+            index.update(task, *old)
+        else:
+            index.remove(tasks.pop(rng.choice(list(tasks))))
+    batch = [Task(id=f"b{i}", title="b", description="", deadline=BASE) for i in range(500)]
+    tasks.update((t.id, t) for t in batch)
+    index.add_many(batch)
+
+    as_of = (BASE + timedelta(days=50)).toordinal()
+    start, end = (BASE + timedelta(days=20)).toordinal(), (BASE + timedelta(days=30)).toordinal()
+    open_due = sorted((t.deadline_ordinal, t.id) for t in tasks.values() if t.deadline_ordinal and t.status != "done")
+    all_due = sorted((t.deadline_ordinal, t.id) for t in tasks.values() if t.deadline_ordinal)
+    assert index.overdue(as_of) == [e for e in open_due if e[0] < as_of]
+    assert index.count_overdue(as_of) == len(index.overdue(as_of))
+    assert index.next_open_deadline(as_of) == min((e[0] for e in open_due if e[0] >= as_of), default=0)
+    assert index.due_between(start, end) == [e for e in all_due if start <= e[0] <= end]
+    for code, status in enumerate(STATUSES):
+        assert {t.id for t in index.by_status(code)} == {t.id for t in tasks.values() if t.status == status}
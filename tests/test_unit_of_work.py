@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.core.services.quota import quotas_for
+from todolist.core.services.unit_of_work import UnitOfWork
+from todolist.storage.journal_storage import JournalStorage
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.sqlite_storage import SQLiteStorage
+
+
+def _fill(storage):
+    for pid in ("a", "b", "c"):
+        storage.add_project(Project(id=pid, name=f"project {pid}", description=""))
+        for i in range(6):
+            storage.add_task(pid, Task(id=f"{pid}{i}", title=f"task {i}", description=""))
+    storage.remove_task("a", "a1")  # leaves a gap in the sequence numbers
+
+
+def _state(storage):
+    return [
+        (p.id, p.name, [(t.id, t.title, t.status, t.deadline) for t in storage.list_tasks(p.id)])
+        for p in storage.get_all_projects()
+    ]
+
+
+def _pages(storage):
+    """Every project and task page of two, with the cursors that lead to them."""
+    pages = []
+    cursor = None
+    while True:
+        projects, cursor = storage.list_projects_page(cursor, 2)
+        pages.append(([p.id for p in projects], cursor))
+        for p in projects:
+            task_cursor = None
+            while True:
+                tasks, task_cursor = storage.list_tasks_page(p.id, task_cursor, 2)
+                pages.append(([t.id for t in tasks], task_cursor))
+                if task_cursor is None:
+                    break
+        if cursor is None:
+            return pages
+
+
+def _failing_unit(storage, monkeypatch):
+    unit = UnitOfWork(storage)
+    unit.edit_task("a", "a2", title="renamed", deadline=date(2026, 3, 1))
+    unit.delete_task("a", "a3")
+    unit.move_task("a", "a4", "c")
+    unit.delete_project("b")
+    unit.change_status("c", "c0", "done")
+    unit.add_task("c", "boom", "")
+    real_add = storage.add_task
+
+    def failing_add(project_id, task):
+        if task.title == "boom":
+            raise OSError("simulated write failure")
+        real_add(project_id, task)
+
+    monkeypatch.setattr(storage, "add_task", failing_add)
+    with pytest.raises(OSError):
+        unit.commit()
+    monkeypatch.undo()
+
+
+@pytest.mark.parametrize("make", [MemoryStorage, SQLiteStorage], ids=["memory", "sqlite"])
+def test_rollback_puts_everything_back_in_place(make, monkeypatch):
+    storage = make()
+    _fill(storage)
+    quotas = quotas_for(storage)
+    quotas.set_task_limit("b", 9)
+    counts = [quotas.project_count()] + [quotas.task_count(pid) for pid in "abc"]
+    state, pages = _state(storage), _pages(storage)
+
+    _failing_unit(storage, monkeypatch)
+
+    assert _state(storage) == state
+    assert _pages(storage) == pages
+    assert [quotas.project_count()] + [quotas.task_count(pid) for pid in "abc"] == counts
+    assert quotas.task_limit("b") == 9
+
+
+def test_rollback_is_journaled_in_place(tmp_path, monkeypatch):
+    path = str(tmp_path / "todo.journal")
+    storage = JournalStorage(path)
+    _fill(storage)
+    state = _state(storage)
+    _failing_unit(storage, monkeypatch)
+    storage.close()
+
+    reopened = JournalStorage(path)
+    assert _state(reopened) == state
+    # A snapshot keeps the sequence numbers, so later restores land in place too.
+    reopened.compact()
+    reopened.remove_task("a", "a2")
+    reopened.restore_task("a", Task(id="a2", title="task 2", description=""), 3)
+    reopened.close()
+    again = JournalStorage(path)
+    assert _state(again) == state
+    again.close()
+
+
+def test_transactional_backend_needs_no_undo_writes(monkeypatch):
+    storage = SQLiteStorage()
+    _fill(storage)
+    state = _state(storage)
+    writes = []
+    for name in ("remove_task", "remove_project", "update_task", "update_project"):
+        real = getattr(storage, name)
+
+        def record(*args, _real=real, _name=name):
+            writes.append(_name)
+            return _real(*args)
+
+        monkeypatch.setattr(storage, name, record)
+    _failing_unit(storage, monkeypatch)
+    # Only the unit's own writes: the rollback needed none to undo them.
+    assert writes == ["update_task", "remove_task", "remove_task", "remove_project", "update_task"]
+    assert _state(storage) == state
@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from itertools import islice
+from datetime import date
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.project_summary import ProjectSummary
+from todolist.core.entities.task import Task
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.exceptions.limit_exceeded import LimitExceededError
+from todolist.core.exceptions.not_found import NotFoundError
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.task_service import TaskService
+from todolist.storage.base import Storage
+from todolist.storage.factory import close_storage, open_storage_from_env
+from todolist.utils import metrics
+from todolist.utils.settings import get_settings
+
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+STREAM_CHUNK = 500
+MAX_BODY = 1 << 20  # bytes
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def task_to_json(task: Task) -> Dict[str, Any]:
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "status": task.status,
+        "deadline": task.deadline.isoformat() if task.deadline else None,
+    }
+
+
+def project_to_json(project: Project, task_count: int) -> Dict[str, Any]:
+    return {
+        "id": project.id,
+        "name": project.name,
+        "description": project.description,
+        "tasks": task_count,
+    }
+
+
+def summary_to_json(summary: ProjectSummary) -> Dict[str, Any]:
+    return {
+        "project_id": summary.project_id,
+        "total": summary.total,
+        "by_status": summary.by_status,
+        "next_deadline": summary.next_deadline.isoformat() if summary.next_deadline else None,
+        "overdue": summary.overdue,
+        "as_of": summary.as_of.isoformat(),
+    }
+
+
+def _text(body: Dict[str, Any], field: str, default: Optional[str] = None) -> Optional[str]:
+    value = body.get(field, default)
+    if value is not None and not isinstance(value, str):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"{field} must be a string.")
+    return value
+
+
+def _parse_date(value: Optional[str], field: str) -> Optional[date]:
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"{field} must be in YYYY-MM-DD format.")
+
+
+Route = Tuple[str, "re.Pattern[str]", str]
+
+ROUTES: List[Route] = [
+    ("GET", re.compile(r"^/projects$"), "list_projects"),
+    ("POST", re.compile(r"^/projects$"), "create_project"),
+    ("GET", re.compile(r"^/projects/(?P<pid>[^/]+)$"), "get_project"),
+    ("PATCH", re.compile(r"^/projects/(?P<pid>[^/]+)$"), "edit_project"),
+    ("DELETE", re.compile(r"^/projects/(?P<pid>[^/]+)$"), "delete_project"),
+    ("GET", re.compile(r"^/projects/(?P<pid>[^/]+)/summary$"), "project_summary"),
+    ("GET", re.compile(r"^/projects/(?P<pid>[^/]+)/tasks$"), "list_tasks"),
+    ("POST", re.compile(r"^/projects/(?P<pid>[^/]+)/tasks$"), "add_task"),
+    ("GET", re.compile(r"^/projects/(?P<pid>[^/]+)/tasks/(?P<tid>[^/]+)$"), "get_task"),
+    ("PATCH", re.compile(r"^/projects/(?P<pid>[^/]+)/tasks/(?P<tid>[^/]+)$"), "edit_task"),
+    ("DELETE", re.compile(r"^/projects/(?P<pid>[^/]+)/tasks/(?P<tid>[^/]+)$"), "delete_task"),
+    ("GET", re.compile(r"^/tasks$"), "query_tasks"),
+    ("GET", re.compile(r"^/search$"), "search"),
+    ("GET", re.compile(r"^/metrics$"), "metrics"),
+]
+
+
+class TodoRequestHandler(BaseHTTPRequestHandler):
+    """JSON API over ProjectService/TaskService.
+
+    HTTP/1.1 so clients can keep connections alive. Project and task listings
+    are cursor paginated; ``?stream=1`` instead streams every task as NDJSON using
+    chunked transfer encoding. The request body is read before routing, so
+    a request that fails early still leaves the connection at the start of
+    the next one.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY a
+    # kept-alive connection stalls on delayed ACKs for every response.
+    disable_nagle_algorithm = True
+    server: "TodoHTTPServer"
+
+    # ---------- Plumbing ----------
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PATCH(self) -> None:
+        self._dispatch("PATCH")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        self.query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        self.body = b""
+        try:
+            self.body = self._read_body()
+            for route_method, pattern, name in ROUTES:
+                match = pattern.match(url.path)
+                if match and route_method == method:
+                    handler: Callable[..., None] = getattr(self, "handle_" + name)
+                    handler(**match.groupdict())
+                    return
+            raise HTTPError(HTTPStatus.NOT_FOUND, "No such endpoint.")
+        except HTTPError as exc:
+            self._send_json(exc.status, {"error": str(exc)})
+        except LimitExceededError as exc:
+            self._send_json(HTTPStatus.CONFLICT, {"error": str(exc)})
+        except NotFoundError as exc:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": str(exc)})
+        except InvalidEntityError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+        except Exception:
+            self.log_error("Unhandled error on %s %s", method, self.path)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error."})
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding"):
+            self.close_connection = True
+            raise HTTPError(HTTPStatus.LENGTH_REQUIRED, "Send the body with a Content-Length.")
+        raw = self.headers.get("Content-Length")
+        if not raw:
+            return b""
+        try:
+            length = int(raw)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # Where this body ends is unknown, so the connection cannot be reused.
+            self.close_connection = True
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Content-Length must be a non-negative integer.")
+        if length > MAX_BODY:
+            # Not read, so the rest of the connection is that body.
+            self.close_connection = True
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"The body must be at most {MAX_BODY} bytes.")
+        return self.rfile.read(length)
+
+    def _read_json(self) -> Dict[str, Any]:
+        if not self.body:
+            return {}
+        try:
+            body = json.loads(self.body)
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be valid JSON.")
+        if not isinstance(body, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object.")
+        return body
+
+    def _send_json(self, status: HTTPStatus, payload: Any) -> None:
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_text(self, status: HTTPStatus, text: str, content_type: str) -> None:
+        body = text.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_stream(self, rows: Iterable[Dict[str, Any]]) -> None:
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        it = iter(rows)
+        try:
+            while True:
+                batch = list(islice(it, STREAM_CHUNK))
+                if not batch:
+                    break
+                chunk = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in batch).encode()
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        except Exception:
+            # The status is already out; closing without the last chunk is
+            # how the client learns that the body is incomplete.
+            self.log_error("Stream aborted on %s", self.path)
+            self.close_connection = True
+            return
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _page_size(self) -> int:
+        try:
+            limit = int(self.query.get("limit", DEFAULT_PAGE_SIZE))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "limit must be an integer.")
+        return max(1, min(limit, MAX_PAGE_SIZE))
+
+    @property
+    def projects(self) -> ProjectService:
+        return self.server.project_service
+
+    @property
+    def tasks(self) -> TaskService:
+        return self.server.task_service
+
+    # ---------- Projects ----------
+    def handle_list_projects(self) -> None:
+        page = self.projects.list_projects_page(self.query.get("cursor"), self._page_size())
+        items = [project_to_json(p, self.tasks.count_tasks(p.id)) for p in page.items]
+        self._send_json(HTTPStatus.OK, {"items": items, "next_cursor": page.next_cursor})
+
+    def handle_create_project(self) -> None:
+        body = self._read_json()
+        proj = self.projects.create_project(_text(body, "name", ""), _text(body, "description", ""))
+        self._send_json(HTTPStatus.CREATED, project_to_json(proj, 0))
+
+    def handle_get_project(self, pid: str) -> None:
+        proj = self.projects.get_project(pid)
+        if proj is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, "Project not found.")
+        self._send_json(HTTPStatus.OK, project_to_json(proj, self.tasks.count_tasks(pid)))
+
+    def handle_edit_project(self, pid: str) -> None:
+        body = self._read_json()
+        current = self.projects.get_project(pid)
+        if current is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, "Project not found.")
+        proj = self.projects.edit_project(
+            pid, _text(body, "name", current.name), _text(body, "description", current.description)
+        )
+        self._send_json(HTTPStatus.OK, project_to_json(proj, self.tasks.count_tasks(pid)))
+
+    def handle_delete_project(self, pid: str) -> None:
+        if not self.projects.delete_project(pid):
+            raise HTTPError(HTTPStatus.NOT_FOUND, "Project not found.")
+        self._send_json(HTTPStatus.OK, {"deleted": pid})
+
+    def handle_project_summary(self, pid: str) -> None:
+        as_of = _parse_date(self.query.get("as_of"), "as_of")
+        self._send_json(HTTPStatus.OK, summary_to_json(self.tasks.project_summary(pid, as_of)))
+
+    # ---------- Tasks ----------
+    def handle_list_tasks(self, pid: str) -> None:
+        if self.query.get("stream") in ("1", "true"):
+            tasks = self.tasks.iter_tasks(pid, page_size=STREAM_CHUNK)
+            self._send_stream(task_to_json(t) for t in tasks)
+            return
+        page = self.tasks.list_tasks_page(pid, self.query.get("cursor"), self._page_size())
+        self._send_json(
+            HTTPStatus.OK,
+            {"items": [task_to_json(t) for t in page.items], "next_cursor": page.next_cursor},
+        )
+
+    def handle_add_task(self, pid: str) -> None:
+        body = self._read_json()
+        task = self.tasks.add_task(
+            pid,
+            _text(body, "title", ""),
+            _text(body, "description", ""),
+            _parse_date(_text(body, "deadline"), "deadline"),
+        )
+        self._send_json(HTTPStatus.CREATED, task_to_json(task))
+
+    def handle_get_task(self, pid: str, tid: str) -> None:
+        task = self.tasks.get_task(pid, tid)
+        if task is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, "Task not found.")
+        self._send_json(HTTPStatus.OK, task_to_json(task))
+
+    def handle_edit_task(self, pid: str, tid: str) -> None:
+        body = self._read_json()
+        task = self.tasks.edit_task(
+            pid,
+            tid,
+            title=_text(body, "title"),
+            description=_text(body, "description"),
+            status=_text(body, "status"),
+            deadline=_parse_date(_text(body, "deadline"), "deadline"),
+        )
+        self._send_json(HTTPStatus.OK, task_to_json(task))
+
+    def handle_delete_task(self, pid: str, tid: str) -> None:
+        if not self.tasks.delete_task(pid, tid):
+            raise HTTPError(HTTPStatus.NOT_FOUND, "Task not found.")
+        self._send_json(HTTPStatus.OK, {"deleted": tid})
+
+    # ---------- Queries ----------
+    def handle_query_tasks(self) -> None:
+        """``/tasks?status=`` or ``?due_from=&due_to=`` or ``?overdue_as_of=``; optional ``project``.
+
+        Returns the first ``limit`` hits and the total, or with ``?stream=1``
+        every hit as NDJSON.
+        """
+        pid = self.query.get("project")
+        if "status" in self.query:
+            hits = self.tasks.tasks_by_status(self.query["status"], pid)
+        elif "due_from" in self.query or "due_to" in self.query:
+            hits = self.tasks.tasks_due_between(
+                _parse_date(self.query.get("due_from", "0001-01-01"), "due_from"),
+                _parse_date(self.query.get("due_to", "9999-12-31"), "due_to"),
+                pid,
+            )
+        elif "overdue_as_of" in self.query:
+            hits = self.tasks.overdue_tasks(_parse_date(self.query["overdue_as_of"], "overdue_as_of"), pid)
+        else:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Give status, due_from/due_to or overdue_as_of.")
+        rows = (dict(task_to_json(t), project_id=p) for p, t in hits)
+        if self.query.get("stream") in ("1", "true"):
+            self._send_stream(rows)
+            return
+        items = list(islice(rows, self._page_size()))
+        self._send_json(HTTPStatus.OK, {"items": items, "total": len(hits)})
+
+    def handle_search(self) -> None:
+        hits = self.tasks.search(self.query.get("q", ""), self._page_size())
+        items = [
+            {"project_id": p.id, "project_name": p.name, "task": task_to_json(t) if t else None}
+            for p, t in hits
+        ]
+        self._send_json(HTTPStatus.OK, {"items": items})
+
+    # ---------- Metrics ----------
+    def handle_metrics(self) -> None:
+        text = metrics.REGISTRY.to_prometheus(self.server.storage)
+        self._send_text(HTTPStatus.OK, text, "text/plain; version=0.0.4; charset=utf-8")
+
+
+class TodoHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server: one thread per connection, sharing one storage."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], storage: Storage, verbose: bool = False) -> None:
+        super().__init__(address, TodoRequestHandler)
+        self.storage = storage
+        self.project_service = ProjectService(storage)
+        self.task_service = TaskService(storage)
+        self.verbose = verbose
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve the ToDoList JSON API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    storage = open_storage_from_env()
+    if get_settings().metrics_enabled:
+        metrics.instrument(storage)
+    server = TodoHTTPServer((args.host, args.port), storage, verbose=args.verbose)
+    print(f"Serving on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        close_storage(storage)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import json
+import shlex
+import time
+from collections import Counter
+from datetime import date
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO, Tuple
+
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.exceptions.limit_exceeded import LimitExceededError
+from todolist.core.exceptions.not_found import NotFoundError
+from todolist.core.services.project_service import ProjectService
+from todolist.core.services.task_service import TaskService
+from todolist.storage.base import Storage
+from todolist.utils.formatter import error, info, success
+
+
+# Commands run in chunks of this many lines: one storage transaction and
+# one write to the output per chunk.
+FLUSH_EVERY = 1000
+
+
+def parse_command(line: str) -> Tuple[str, Dict[str, Any]]:
+    """One command line as (op, arguments).
+
+    Either a JSON object with an "op" key, or ``op key=value ...`` with
+    shell-style quoting, e.g. ``add_task project=$home title="Buy milk"``.
+    """
+    if line.startswith("{"):
+        try:
+            fields = json.loads(line)
+        except ValueError:
+            raise InvalidEntityError("Line is not valid JSON.") from None
+        if not isinstance(fields, dict):
+            raise InvalidEntityError("A JSON command must be an object.")
+        op = fields.pop("op", None)
+        if not isinstance(op, str):
+            raise InvalidEntityError('A JSON command needs an "op".')
+        return op, fields
+    try:
+        words = shlex.split(line)
+    except ValueError as exc:
+        raise InvalidEntityError(f"Cannot parse command: {exc}.") from None
+    args: Dict[str, Any] = {}
+    for word in words[1:]:
+        key, sep, value = word.partition("=")
+        if not sep:
+            raise InvalidEntityError(f"Expected key=value, got {word!r}.")
+        args[key] = value
+    return words[0], args
+
+
+def _check_args(args: Dict[str, Any]) -> None:
+    # Every argument is text; JSON commands may also give "limit" as a number.
+    for key, value in args.items():
+        if isinstance(value, str) or (key == "limit" and type(value) is int):
+            continue
+        raise InvalidEntityError(f"Argument {key!r} must be text.")
+
+
+def _date(value: Any) -> Optional[date]:
+    if value in (None, ""):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise InvalidEntityError("Date must be in YYYY-MM-DD format.") from None
+
+
+class BatchRunner:
+    """Runs a stream of commands against the services, without menus or pauses.
+
+    Each command prints one result line (unless ``quiet``; errors are always
+    printed) to ``out``, which is written in chunks rather than per line. A
+    command may name its result with ``as=<name>``; later arguments written
+    ``$<name>`` are replaced by that id. A failing command is reported with
+    its line number and the run goes on.
+    """
+
+    def __init__(self, storage: Storage, out: TextIO, quiet: bool = False) -> None:
+        self.storage = storage
+        self.projects = ProjectService(storage)
+        self.tasks = TaskService(storage)
+        self.out = out
+        self.quiet = quiet
+        self.names: Dict[str, str] = {}
+        self.counts: Counter = Counter()
+        self.errors = 0
+        self._lines: List[str] = []
+        self._ops: Dict[str, Callable[[Dict[str, Any]], Tuple[str, Optional[str]]]] = {
+            "create_project": self._create_project,
+            "edit_project": self._edit_project,
+            "delete_project": self._delete_project,
+            "add_task": self._add_task,
+            "edit_task": self._edit_task,
+            "change_status": self._change_status,
+            "delete_task": self._delete_task,
+            "list_projects": self._list_projects,
+            "list_tasks": self._list_tasks,
+            "search": self._search,
+            "summary": self._summary,
+        }
+
+    # ---------- Running ----------
+    def run(self, lines: Iterable[str]) -> int:
+        """Run every command in ``lines``; returns the number that failed."""
+        start = time.perf_counter()
+        numbered = enumerate(lines, 1)
+        n = 0
+        while True:
+            chunk = list(islice(numbered, FLUSH_EVERY))
+            if not chunk:
+                break
+            with self.storage.transaction():
+                for n, line in chunk:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        self.execute(n, line)
+            self.flush()
+        self.summary(n, time.perf_counter() - start)
+        self.flush()
+        return self.errors
+
+    def execute(self, n: int, line: str) -> None:
+        op = "?"
+        try:
+            op, args = parse_command(line)
+            handler = self._ops.get(op)
+            if handler is None:
+                raise InvalidEntityError(f"Unknown command {op!r}.")
+            _check_args(args)
+            alias = args.pop("as", None)
+            args = {k: self._resolve(v) for k, v in args.items()}
+            text, created = handler(args)
+            if alias and created is not None:
+                self.names[alias] = created
+        except KeyError as exc:
+            self._fail(n, op, f"Missing argument {exc.args[0]!r}.")
+            return
+        except (InvalidEntityError, LimitExceededError, ValueError, TypeError) as exc:
+            self._fail(n, op, str(exc))
+            return
+        except Exception as exc:
+            # Anything else is still this command's failure: raising out of run()
+            # would roll back the whole chunk, including the commands that worked.
+            self._fail(n, op, f"{type(exc).__name__}: {exc}")
+            return
+        self.counts[op] += 1
+        if not self.quiet:
+            self._lines.append(success(f"{op}: {text}"))
+
+    def _fail(self, n: int, op: str, message: str) -> None:
+        self.errors += 1
+        self.counts[(op if op in self._ops else "unknown") + " failed"] += 1
+        self._lines.append(error(f"line {n} {op}: {message}"))
+
+    def _resolve(self, value: Any) -> Any:
+        if isinstance(value, str) and value.startswith("$"):
+            try:
+                return self.names[value[1:]]
+            except KeyError:
+                raise InvalidEntityError(f"Unknown name {value!r}.") from None
+        return value
+
+    def summary(self, lines: int, elapsed: float) -> None:
+        ran = sum(self.counts.values())
+        rate = ran / elapsed if elapsed else 0.0
+        self._lines.append(
+            info(f"{ran} command(s) from {lines} line(s), {self.errors} failed, {elapsed:.2f}s ({rate:,.0f}/s)")
+        )
+        for op, count in sorted(self.counts.items()):
+            self._lines.append(info(f"  {op:<22} {count}"))
+
+    def flush(self) -> None:
+        if self._lines:
+            self._lines.append("")
+            self.out.write("\n".join(self._lines))
+            self._lines.clear()
+        self.out.flush()
+
+    # ---------- Commands ----------
+    # Each returns the result text and the id it created, if any.
+    def _create_project(self, a: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        proj = self.projects.create_project(a["name"], a.get("description", ""))
+        return f"{proj.id} | {proj.name}", proj.id
+
+    def _edit_project(self, a: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        current = self.projects.get_project(a["project"])
+        if current is None:
+            raise NotFoundError("Project not found.")
+        proj = self.projects.edit_project(
+            current.id, a.get("name", current.name), a.get("description", current.description)
+        )
+        return f"{proj.id} | {proj.name}", None
+
+    def _delete_project(self, a: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        if not self.projects.delete_project(a["project"]):
+            raise NotFoundError("Project not found.")
+        return a["project"], None
+
+    def _add_task(self, a: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        task = self.tasks.add_task(a["project"], a["title"], a.get("description", ""), _date(a.get("deadline")))
+        return f"{task.id} | {task.title}", task.id
+
+    def _edit_task(self, a: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        task = self.tasks.edit_task(
+            a["project"], a["task"], a.get("title"), a.get("description"), a.get("status"), _date(a.get("deadline"))
+        )
+        return f"{task.id} | {task.title} | {task.status}", None
+
+    def _change_status(self, a: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        task = self.tasks.change_status(a["project"], a["task"], a["status"])
+        return f"{task.id} is now {task.status}", None
+
+    def _delete_task(self, a: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        if not self.tasks.delete_task(a["project"], a["task"]):
+            raise NotFoundError("Task not found.")
+        return a["task"], None
+
+    def _list_projects(self, a: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        rows = [f"{p.id} | {p.name}" for p in self.projects.iter_projects()]
+        return "\n".join([f"{len(rows)} project(s)", *rows]), None
+
+    def _list_tasks(self, a: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        rows = [
+            f"{t.id} | {t.title} | {t.status} | {t.deadline.isoformat() if t.deadline else '—'}"
+            for t in self.tasks.iter_tasks(a["project"])
+        ]
+        return "\n".join([f"{len(rows)} task(s)", *rows]), None
+
+    def _search(self, a: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        hits = self.tasks.search(a["query"], int(a.get("limit", 50)))
+        rows = [f"{p.name} | {t.id} | {t.title}" if t else f"{p.name} | (project)" for p, t in hits]
+        return "\n".join([f"{len(rows)} hit(s)", *rows]), None
+
+    def _summary(self, a: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        s = self.tasks.project_summary(a["project"], _date(a.get("as_of")))
+        return f"{s.total} task(s), {s.overdue} overdue, {s.by_status}", None
@@ -3,8 +3,13 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
+from todolist.cli.pager import Pager
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
 from todolist.core.services.project_service import ProjectService
 from todolist.core.services.task_service import TaskService
+from todolist.storage.base import Storage
+from todolist.utils import metrics
 from todolist.utils.formatter import success, error, info, format_entity
 
 
@@ -17,10 +22,28 @@ def parse_date(s: str) -> Optional[datetime.date]:
         raise ValueError("Date must be in YYYY-MM-DD format.")
 
 
+def _format_seconds(seconds: float) -> str:
+    if seconds == float("inf"):
+        return "inf"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f}µs"
+    return f"{seconds * 1e3:.1f}ms"
+
+
+def _file_format(path: str) -> str:
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def _timing_row(name: str, hist: metrics.Histogram) -> str:
+    p99 = _format_seconds(hist.quantile(0.99))
+    return f"{name:<48} | {hist.count:>9} | {hist.errors:>6} | {hist.sum * 1e3:>10.2f} | {p99:>9}"
+
+
 class CLI:
-    def __init__(self) -> None:
-        self.project_service = ProjectService()
-        self.task_service = TaskService()
+    def __init__(self, storage: Optional[Storage] = None) -> None:
+        self.project_service = ProjectService(storage)
+        self.task_service = TaskService(storage)
+        self.pager = Pager()
 
     # ---------- Utility ----------
     def pause_for_user(self) -> None:
@@ -28,58 +51,52 @@ class CLI:
         input(info("\nPress Enter to return to the menu..."))
 
     # ---------- Helper displays ----------
+    def _project_row(self, p: Project) -> str:
+        desc = p.description if len(p.description) <= 50 else p.description[:47] + "..."
+        summary = self.task_service.project_summary(p.id)
+        return f"{p.id:<6} | {p.name:<20} | {summary.total:<6} | {summary.overdue:<7} | {desc}"
+
+    @staticmethod
+    def _task_row(t: Task) -> str:
+        dl = t.deadline.isoformat() if t.deadline else "—"
+        return f"{t.id:<5} | {t.title:<25} | {t.status:<6} | {dl}"
+
     def show_projects(self, pause: bool = True) -> bool:
-        """Show all projects. Returns False if no projects exist."""
-        projects = self.project_service.list_projects()
-        if not projects:
+        """Show all projects page by page. Returns False if no projects exist."""
+        rule = "-" * 100 + "\n"
+        columns = f"{'ID':<6} | {'Name':<20} | {'Tasks':<6} | {'Overdue':<7} | {'Description'}"
+        header = f"\nAvailable Projects:\n{rule}{columns}\n{rule}"
+        rows = (self._project_row(p) for p in self.project_service.iter_projects(page_size=self.pager.page_size))
+        shown = self.pager.render(header, rows, rule)
+        if not shown:
             print(info("No projects found."))
-            if pause:
-                self.pause_for_user()
-            return False
-
-        print("\nAvailable Projects:")
-        print("-" * 100)
-        print(f"{'ID':<6} | {'Name':<20} | {'Tasks':<6} | {'Description'}")
-        print("-" * 100)
-        for p in projects:
-            desc = p.description if len(p.description) <= 50 else p.description[:47] + "..."
-            print(f"{p.id:<6} | {p.name:<20} | {len(p.tasks):<6} | {desc}")
-        print("-" * 100)
 
         if pause:
             self.pause_for_user()
 
-        return True
+        return shown > 0
 
     def show_tasks(self, project_id: str, pause: bool = True) -> bool:
-        """Show all tasks for a project. Returns False if no tasks exist."""
+        """Show all tasks for a project page by page. Returns False if no tasks exist."""
         try:
-            tasks = self.task_service.list_tasks(project_id)
+            tasks = self.task_service.iter_tasks(project_id, page_size=self.pager.page_size)
         except Exception as exc:
             print(error(str(exc)))
             if pause:
                 self.pause_for_user()
             return False
 
-        if not tasks:
+        rule = "-" * 70 + "\n"
+        header = f"\nTasks in Project:\n{rule}{'ID':<5} | {'Title':<25} | {'Status':<6} | Deadline\n{rule}"
+        rows = (self._task_row(t) for t in tasks)
+        shown = self.pager.render(header, rows, rule)
+        if not shown:
             print(info("No tasks found for this project."))
-            if pause:
-                self.pause_for_user()
-            return False
-
-        print("\nTasks in Project:")
-        print("-" * 70)
-        print(f"{'ID':<5} | {'Title':<25} | {'Status':<6} | Deadline")
-        print("-" * 70)
-        for t in tasks:
-            dl = t.deadline.isoformat() if t.deadline else "—"
-            print(f"{t.id:<5} | {t.title:<25} | {t.status:<6} | {dl}")
-        print("-" * 70)
 
         if pause:
             self.pause_for_user()
 
-        return True
+        return shown > 0
 
     # ---------- Project operations ----------
     def create_project(self) -> None:
@@ -225,6 +242,98 @@ class CLI:
             print(error(str(exc)))
         self.pause_for_user()
 
+    def import_tasks(self) -> None:
+        if not self.show_projects(pause=False):
+            return  # Stop if no projects
+
+        pid = input("Enter project id to import into: ").strip()
+        path = input("File to import (.csv or .jsonl): ").strip()
+        try:
+            with open(path, newline="", encoding="utf-8") as fh:
+                result = self.task_service.import_stream(pid, fh, _file_format(path))
+        except (OSError, ValueError) as exc:
+            print(error(str(exc)))
+            self.pause_for_user()
+            return
+
+        print(success(f"Imported {result.added} task(s); {len(result.errors)} row(s) rejected."))
+        for err in result.errors[:10]:
+            print(error(f"row {err.row}: {err.message}"))
+        if len(result.errors) > 10:
+            print(info(f"... and {len(result.errors) - 10} more"))
+        self.pause_for_user()
+
+    def export_tasks(self) -> None:
+        if not self.show_projects(pause=False):
+            return  # Stop if no projects
+
+        pid = input("Enter project id to export: ").strip()
+        path = input("File to write (.csv or .jsonl): ").strip()
+        try:
+            with open(path, "w", newline="", encoding="utf-8") as fh:
+                n = self.task_service.export_stream(pid, fh, _file_format(path))
+            print(success(f"Exported {n} task(s) to {path}"))
+        except (OSError, ValueError) as exc:
+            print(error(str(exc)))
+        self.pause_for_user()
+
+    def search(self) -> None:
+        query = input("Search for: ").strip()
+        try:
+            hits = self.task_service.search(query)
+        except Exception as exc:
+            print(error(str(exc)))
+            self.pause_for_user()
+            return
+
+        if not hits:
+            print(info("No matches found."))
+            self.pause_for_user()
+            return
+
+        print("\nSearch Results:")
+        print("-" * 70)
+        print(f"{'Project':<20} | {'Task ID':<7} | {'Title':<25} | Status")
+        print("-" * 70)
+        for proj, t in hits:
+            if t is None:
+                print(f"{proj.name:<20} | {'—':<7} | {'(project)':<25} | —")
+            else:
+                print(f"{proj.name:<20} | {t.id:<7} | {t.title:<25} | {t.status}")
+        print("-" * 70)
+        self.pause_for_user()
+
+    def stats(self) -> None:
+        projects, per_project = metrics.object_counts(self.task_service.storage)
+        print(f"\nProjects: {projects}   Tasks: {sum(n for _, n in per_project)}")
+        cache_stats = getattr(self.task_service.storage, "cache_stats", None)
+        if cache_stats is not None:
+            c = cache_stats()
+            print(f"Cache: {c.size}/{c.maxsize} entries   hits {c.hits}   misses {c.misses}"
+                  f"   hit rate {c.hit_rate:.0%}   evictions {c.evictions}")
+
+        if not metrics.is_instrumented():
+            print(info("Call timings are off; start with METRICS_ENABLED=1 to record them."))
+            self.pause_for_user()
+            return
+
+        rule = "-" * 98 + "\n"
+        columns = f"{'Method':<48} | {'Calls':>9} | {'Errors':>6} | {'Total ms':>10} | {'p99 <=':>9}"
+        header = f"\nCall Timings:\n{rule}{columns}\n{rule}"
+        hists = sorted(metrics.REGISTRY.snapshot().items(), key=lambda kv: kv[1].sum, reverse=True)
+        rows = (_timing_row(name, h) for name, h in hists if h.count)
+        if not self.pager.render(header, rows, rule):
+            print(info("No calls recorded yet."))
+
+        path = input("Write Prometheus metrics to file (blank to skip): ").strip()
+        if path:
+            try:
+                metrics.REGISTRY.dump(path, self.task_service.storage)
+                print(success(f"Metrics written to {path}"))
+            except OSError as exc:
+                print(error(str(exc)))
+        self.pause_for_user()
+
     # ---------- Menu ----------
     def run(self) -> None:
         actions = {
@@ -237,6 +346,10 @@ class CLI:
             "7": ("Edit task", self.edit_task),
             "8": ("Delete task", self.delete_task),
             "9": ("Change task status", self.change_task_status),
+            "10": ("Search", self.search),
+            "11": ("Stats", self.stats),
+            "12": ("Import tasks", self.import_tasks),
+            "13": ("Export tasks", self.export_tasks),
             "q": ("Quit", None),
         }
 
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import io
+import sys
+from typing import Callable, Iterable, Optional, TextIO
+
+from todolist.utils.formatter import info
+
+
+PAGE_SIZE = 50
+
+
+def ask_more() -> bool:
+    """Prompt between pages; anything starting with 'q' stops the listing."""
+    return not input(info("-- more -- Enter to continue, q to stop: ")).strip().lower().startswith("q")
+
+
+class Pager:
+    """Render rows a page at a time with one write per page.
+
+    Rows are pulled lazily from any iterable, so only the current page is
+    ever held in memory and the first page appears as soon as it is built,
+    however many rows follow.
+    """
+
+    def __init__(
+        self,
+        page_size: int = PAGE_SIZE,
+        out: Optional[TextIO] = None,
+        more: Callable[[], bool] = ask_more,
+    ) -> None:
+        self.page_size = page_size
+        self.out = out
+        self.more = more
+
+    def render(self, header: str, rows: Iterable[str], footer: str = "") -> int:
+        """Write ``header``, then ``rows`` page by page, then ``footer``.
+
+        Nothing is written for an empty iterable. Returns the number of rows shown.
+        """
+        out = self.out or sys.stdout
+        it = iter(rows)
+        row = next(it, None)
+        if row is None:
+            return 0
+
+        buf = io.StringIO()
+        buf.write(header)
+        shown = 0
+        while row is not None:
+            buf.write(row)
+            buf.write("\n")
+            shown += 1
+            row = next(it, None)
+            if row is not None and shown % self.page_size == 0:
+                out.write(buf.getvalue())
+                out.flush()
+                buf = io.StringIO()
+                if not self.more():
+                    return shown
+        buf.write(footer)
+        out.write(buf.getvalue())
+        out.flush()
+        return shown
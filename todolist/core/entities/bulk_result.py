@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class RowError:
+    row: int
+    message: str
+
+
+@dataclass
+class BulkResult:
+    """Outcome of a bulk add or import: rows added and the rows rejected, with why."""
+
+    added: int = 0
+    errors: List[RowError] = field(default_factory=list)
+
+    def merge(self, other: "BulkResult") -> None:
+        self.added += other.added
+        self.errors.extend(other.errors)
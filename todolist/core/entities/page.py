@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def iter_pages(fetch: Callable[[Optional[str]], Tuple[List[T], Optional[str]]]) -> Iterator[T]:
+    """Yield items from ``fetch(cursor)`` page by page until it returns no next cursor."""
+    cursor: Optional[str] = None
+    while True:
+        items, cursor = fetch(cursor)
+        yield from items
+        if cursor is None:
+            return
+
+
+# Cursors handed to clients name the listing they belong to ("projects" or
+# "tasks.<project id>") ahead of the storage's own cursor, so one passed back
+# to another listing is refused instead of paging from an unrelated place.
+def scope_cursor(scope: str, cursor: Optional[str]) -> Optional[str]:
+    """The client cursor for a storage ``cursor`` of the ``scope`` listing."""
+    return None if cursor is None else f"{scope}.{cursor}"
+
+
+def unscope_cursor(scope: str, cursor: Optional[str]) -> Optional[str]:
+    """The storage cursor inside a client ``cursor``; InvalidEntityError unless it was made for ``scope``."""
+    if cursor is None:
+        return None
+    prefix, _, inner = cursor.rpartition(".")
+    if prefix != scope or not inner.isdigit():
+        raise InvalidEntityError("Invalid cursor.")
+    return inner
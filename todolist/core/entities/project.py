@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
-import uuid
+from typing import Optional
+
 from todolist.core.entities.task import Task
+from todolist.core.entities.task_collection import TaskCollection
+from todolist.utils.ids import random_id
 
 
 @dataclass
@@ -11,23 +13,22 @@ class Project:
     id: str
     name: str
     description: str
-    tasks: List[Task] = field(default_factory=list)
+    tasks: TaskCollection = field(default_factory=TaskCollection)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.tasks, TaskCollection):
+            self.tasks = TaskCollection(self.tasks)
 
     @classmethod
-    def create(cls, name: str, description: str) -> "Project":
-        short_id = uuid.uuid4().hex[:4]
-        return cls(id=short_id, name=name, description=description)
-    
+    def create(cls, name: str, description: str, id: Optional[str] = None) -> "Project":
+        """A new project; services pass an ``id`` from their store's allocator."""
+        return cls(id=id or random_id(), name=name, description=description)
+
     def add_task(self, task: Task) -> None:
-        self.tasks.append(task)
+        self.tasks.add(task)
 
     def remove_task(self, task_id: str) -> bool:
-        before = len(self.tasks)
-        self.tasks = [t for t in self.tasks if t.id != task_id]
-        return len(self.tasks) < before
+        return self.tasks.remove(task_id)
 
     def get_task(self, task_id: str) -> Task | None:
-        for t in self.tasks:
-            if t.id == task_id:
-                return t
-        return None
+        return self.tasks.get(task_id)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, Optional
+
+from todolist.core.entities.task import STATUSES, Task
+
+
+@dataclass
+class ProjectSummary:
+    """Task counts of one project as of a given day."""
+
+    project_id: str
+    total: int
+    by_status: Dict[str, int]
+    # Earliest deadline on or after ``as_of`` among tasks not yet done.
+    next_deadline: Optional[date]
+    # Tasks not yet done whose deadline is before ``as_of``.
+    overdue: int
+    as_of: date
+
+    @classmethod
+    def from_tasks(cls, project_id: str, tasks: Iterable[Task], as_of: date) -> "ProjectSummary":
+        """Recount from scratch; the reference the maintained counters must agree with."""
+        by_status = dict.fromkeys(STATUSES, 0)
+        next_deadline: Optional[date] = None
+        overdue = 0
+        for t in tasks:
+            by_status[t.status] += 1
+            if t.deadline is None or t.status == "done":
+                continue
+            if t.deadline < as_of:
+                overdue += 1
+            elif next_deadline is None or t.deadline < next_deadline:
+                next_deadline = t.deadline
+        return cls(project_id, sum(by_status.values()), by_status, next_deadline, overdue, as_of)
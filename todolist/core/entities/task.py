@@ -1,18 +1,39 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from datetime import date
 from typing import Optional
-import uuid
+
+from todolist.utils.ids import random_id
+
+
+# Status codes are indexes into this tuple; order is the task lifecycle.
+STATUSES = ("todo", "doing", "done")
+_STATUS_CODES = {s: i for i, s in enumerate(STATUSES)}
 
 
-@dataclass
 class Task:
-    id: str
-    title: str
-    description: str
-    status: str = "todo"
-    deadline: Optional[date] = None
+    """A task in a project.
+
+    Slotted and compact: the status is kept as a small integer code into
+    STATUSES and the deadline as a date ordinal (0 for none). Both are still
+    read and written as ``str`` / ``date`` through properties.
+    """
+
+    __slots__ = ("id", "title", "description", "_status", "_deadline")
+
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        description: str,
+        status: str = "todo",
+        deadline: Optional[date] = None,
+    ) -> None:
+        self.id = id
+        self.title = title
+        self.description = description
+        self.status = status
+        self.deadline = deadline
 
     @classmethod
     def create(
@@ -21,6 +42,60 @@ class Task:
         description: str,
         status: str = "todo",
         deadline: Optional[date] = None,
+        id: Optional[str] = None,
     ) -> "Task":
-        short_id = uuid.uuid4().hex[:4]
-        return cls(id=short_id, title=title, description=description, status=status, deadline=deadline)
+        """A new task; services pass an ``id`` from their store's allocator."""
+        return cls(id=id or random_id(), title=title, description=description, status=status, deadline=deadline)
+
+    def copy(self) -> "Task":
+        clone = Task.__new__(Task)
+        clone.id, clone.title, clone.description = self.id, self.title, self.description
+        clone._status, clone._deadline = self._status, self._deadline
+        return clone
+
+    @property
+    def status(self) -> str:
+        return STATUSES[self._status]
+
+    @status.setter
+    def status(self, value: str) -> None:
+        try:
+            self._status = _STATUS_CODES[value]
+        except KeyError:
+            raise ValueError(f"Status must be one of {STATUSES}.") from None
+
+    @property
+    def status_code(self) -> int:
+        return self._status
+
+    @property
+    def deadline(self) -> Optional[date]:
+        return date.fromordinal(self._deadline) if self._deadline else None
+
+    @deadline.setter
+    def deadline(self, value: Optional[date]) -> None:
+        self._deadline = value.toordinal() if value is not None else 0
+
+    @property
+    def deadline_ordinal(self) -> int:
+        """Deadline as a proleptic Gregorian ordinal, or 0 if there is none."""
+        return self._deadline
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Task):
+            return NotImplemented
+        return (
+            self.id == other.id
+            and self.title == other.title
+            and self.description == other.description
+            and self._status == other._status
+            and self._deadline == other._deadline
+        )
+
+    __hash__ = None  # type: ignore[assignment]  # mutable, like the dataclass it replaces
+
+    def __repr__(self) -> str:
+        return (
+            f"Task(id={self.id!r}, title={self.title!r}, description={self.description!r}, "
+            f"status={self.status!r}, deadline={self.deadline!r})"
+        )
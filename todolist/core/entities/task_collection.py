@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union, overload
+
+from todolist.core.entities.task import Task
+from todolist.utils.seq_order import SeqOrder
+
+
+class TaskCollection:
+    """Insertion-ordered task container keyed by task id.
+
+    Behaves like the list it replaces (iteration, len, indexing, copy) while
+    making lookup and removal by id O(1). ``page`` resumes a listing from a
+    sequence number in O(log n), independent of how far in it is.
+    """
+
+    __slots__ = ("_by_id", "_order", "_sorted")
+
+    def __init__(self, tasks: Iterable[Task] = ()) -> None:
+        self._by_id: Dict[str, Task] = {}
+        self._order: SeqOrder[str] = SeqOrder()
+        # False once a restore put a task back mid-list; the dict is then
+        # put in sequence order again on the next iteration.
+        self._sorted = True
+        for t in tasks:
+            self.add(t)
+
+    def add(self, task: Task) -> None:
+        self._by_id[task.id] = task
+        self._order.add(task.id)
+
+    def restore(self, task: Task, seq: int) -> None:
+        """Put a removed task back at sequence number ``seq``, where it was listed before."""
+        if seq < self._order.next_seq:
+            self._sorted = False
+        self._by_id[task.id] = task
+        self._order.add(task.id, seq)
+
+    @property
+    def next_seq(self) -> int:
+        return self._order.next_seq
+
+    def advance(self, seq: int) -> None:
+        """Number tasks added from now on from ``seq`` at least."""
+        self._order.advance(seq)
+
+    def _by_id_sorted(self) -> Dict[str, Task]:
+        if not self._sorted:
+            by_id = self._by_id
+            self._by_id = {tid: by_id[tid] for _, tid in self._order.after(0, len(by_id))}
+            self._sorted = True
+        return self._by_id
+
+    # Kept so code written against the old list keeps working.
+    append = add
+
+    def get(self, task_id: str) -> Optional[Task]:
+        return self._by_id.get(task_id)
+
+    def seq_of(self, task_id: str) -> Optional[int]:
+        """Sequence number the task was added at, as used by ``page``."""
+        return self._order.seq_of(task_id)
+
+    def remove(self, task_id: str) -> bool:
+        if self._by_id.pop(task_id, None) is None:
+            return False
+        self._order.remove(task_id)
+        return True
+
+    def page(self, after: int, limit: int) -> Tuple[List[Task], Optional[int]]:
+        """Up to ``limit`` tasks added after sequence number ``after`` (0 = start).
+
+        Returns the tasks and the sequence number to resume from, or None
+        when the listing is exhausted.
+        """
+        entries = self._order.after(after, limit + 1)
+        more = len(entries) > limit
+        entries = entries[:limit]
+        tasks = [self._by_id[tid] for _, tid in entries]
+        return tasks, (entries[-1][0] if more else None)
+
+    def ids_after(self, after: int, limit: int) -> List[Tuple[int, str]]:
+        """Up to ``limit`` (sequence number, task id) pairs added after ``after``."""
+        return self._order.after(after, limit)
+
+    def entries(self, after: int, limit: int) -> List[Tuple[int, Task]]:
+        """Up to ``limit`` (sequence number, task) pairs added after ``after``."""
+        by_id = self._by_id
+        return [(seq, by_id[tid]) for seq, tid in self._order.after(after, limit)]
+
+    def copy(self) -> List[Task]:
+        return list(self._by_id_sorted().values())
+
+    def __contains__(self, item: object) -> bool:
+        if isinstance(item, Task):
+            return self._by_id.get(item.id) is item
+        return item in self._by_id
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._by_id_sorted().values())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    @overload
+    def __getitem__(self, index: int) -> Task: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Task]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Task, List[Task]]:
+        # Positional access is O(n); it exists only for list compatibility.
+        return self.copy()[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TaskCollection):
+            return self.copy() == other.copy()
+        if isinstance(other, list):
+            return self.copy() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TaskCollection({self.copy()!r})"
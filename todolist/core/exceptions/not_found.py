@@ -0,0 +1,5 @@
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+
+
+class NotFoundError(InvalidEntityError):
+    """Raised when the project or task a call refers to does not exist."""
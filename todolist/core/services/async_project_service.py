@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import AsyncIterator, List, Optional
+
+from todolist.core.entities.page import Page, scope_cursor, unscope_cursor
+from todolist.core.entities.project import Project
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.exceptions.not_found import NotFoundError
+from todolist.core.services.quota import quotas_for
+from todolist.core.services.reminders import project_removed
+from todolist.core.validators import page_validator, project_validator
+from todolist.core.validators.project_validator import MemoryStorageSingleton
+from todolist.storage.async_storage import AsyncMemoryStorage, AsyncStorage
+from todolist.utils.ids import ids_for
+
+
+class AsyncProjectService:
+    """asyncio counterpart of ProjectService with the same validation rules."""
+
+    def __init__(self, storage: Optional[AsyncStorage] = None) -> None:
+        self.storage = storage or AsyncMemoryStorage(MemoryStorageSingleton.get_instance())
+        # Keyed by the synchronous backend so sync and async services share them. Coroutines
+        # never call that backend: counts and id blocks are awaited through self.storage.
+        self.quotas = quotas_for(self.storage.storage)
+        self.ids = ids_for(self.storage.storage)
+
+    async def _validate_name(self, name: str, exclude_project_id: Optional[str] = None) -> None:
+        project_validator.validate_project_name_format(name)
+        existing = await self.storage.find_project_by_name(name)
+        if existing and existing.id != exclude_project_id:
+            raise InvalidEntityError("Project name must be unique.")
+
+    async def create_project(self, name: str, description: str) -> Project:
+        await self._validate_name(name)
+        project_id = await self.ids.next_id_async(self.storage.reserve_ids)
+        proj = Project.create(name=name, description=description, id=project_id)
+        if not self.quotas.knows_project_count():
+            self.quotas.prime_project_count(await self.storage.count_projects())
+        with self.quotas.project_slot(proj.id):
+            await self.storage.add_project(proj)
+        return proj
+
+    async def edit_project(self, project_id: str, new_name: str, new_description: str) -> Project:
+        proj = await self.storage.get_project(project_id)
+        if not proj:
+            raise NotFoundError("Project not found.")
+        await self._validate_name(new_name, exclude_project_id=project_id)
+        return await self.storage.update_project(project_id, name=new_name, description=new_description)
+
+    async def delete_project(self, project_id: str) -> bool:
+        if not await self.storage.remove_project(project_id):
+            return False
+        self.quotas.release_project(project_id)
+        project_removed(self.storage.storage, project_id)
+        return True
+
+    async def list_projects(self) -> List[Project]:
+        return await self.storage.get_all_projects()
+
+    async def list_projects_page(self, cursor: Optional[str] = None, limit: int = 100) -> Page[Project]:
+        page_validator.validate_page_size(limit)
+        items, next_cursor = await self.storage.list_projects_page(unscope_cursor("projects", cursor), limit)
+        return Page(items, scope_cursor("projects", next_cursor))
+
+    async def iter_projects(self, page_size: int = 500) -> AsyncIterator[Project]:
+        page_validator.validate_page_size(page_size)
+        cursor: Optional[str] = None
+        while True:
+            items, cursor = await self.storage.list_projects_page(cursor, page_size)
+            for project in items:
+                yield project
+            if cursor is None:
+                return
+
+    async def get_project(self, project_id: str) -> Optional[Project]:
+        return await self.storage.get_project(project_id)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import AsyncIterator, List, Optional, Tuple
+
+from todolist.core.entities.page import Page, scope_cursor, unscope_cursor
+from todolist.core.entities.project import Project
+from todolist.core.entities.project_summary import ProjectSummary
+from todolist.core.entities.task import Task
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.exceptions.not_found import NotFoundError
+from todolist.core.services.quota import quotas_for
+from todolist.core.services.reminders import task_changed, task_removed
+from todolist.core.validators import page_validator, task_validator
+from todolist.core.validators.project_validator import MemoryStorageSingleton
+from todolist.storage.async_storage import AsyncMemoryStorage, AsyncStorage
+from todolist.utils.ids import ids_for
+
+
+class AsyncTaskService:
+    """asyncio counterpart of TaskService with the same validation rules."""
+
+    def __init__(self, storage: Optional[AsyncStorage] = None) -> None:
+        self.storage = storage or AsyncMemoryStorage(MemoryStorageSingleton.get_instance())
+        # Keyed by the synchronous backend so sync and async services share them. Coroutines
+        # never call that backend: counts and id blocks are awaited through self.storage.
+        self.backend = self.storage.storage
+        self.quotas = quotas_for(self.backend)
+        self.ids = ids_for(self.backend)
+
+    async def _require_project(self, project_id: str) -> None:
+        if await self.storage.get_project(project_id) is None:
+            raise NotFoundError("Project not found.")
+
+    async def add_task(
+        self, project_id: str, title: str, description: str, deadline: Optional[date] = None
+    ) -> Task:
+        task_validator.validate_task_title(title)
+        task_validator.validate_task_description(description)
+        task_validator.validate_deadline(deadline)
+        await self._require_project(project_id)
+
+        task_id = await self.ids.next_id_async(self.storage.reserve_ids)
+        task = Task.create(title=title, description=description, deadline=deadline, id=task_id)
+        if not self.quotas.knows_task_count(project_id):
+            self.quotas.prime_task_count(project_id, await self.storage.count_tasks(project_id))
+        with self.quotas.task_slots(project_id):
+            await self.storage.add_task(project_id, task)
+        task_changed(self.backend, project_id, task)
+        return task
+
+    async def edit_task(
+        self,
+        project_id: str,
+        task_id: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline: Optional[date] = None,
+    ) -> Task:
+        await self._require_project(project_id)
+        if await self.storage.get_task(project_id, task_id) is None:
+            raise NotFoundError("Task not found.")
+
+        if title is not None:
+            task_validator.validate_task_title(title)
+        if description is not None:
+            task_validator.validate_task_description(description)
+        if status is not None:
+            task_validator.validate_status(status)
+        if deadline is not None:
+            task_validator.validate_deadline(deadline)
+
+        task = await self.storage.update_task(
+            project_id,
+            task_id,
+            title=title,
+            description=description,
+            status=status,
+            deadline=deadline,
+        )
+        if task is None:
+            raise NotFoundError("Task not found.")
+        task_changed(self.backend, project_id, task)
+        return task
+
+    async def delete_task(self, project_id: str, task_id: str) -> bool:
+        await self._require_project(project_id)
+        if not await self.storage.remove_task(project_id, task_id):
+            return False
+        self.quotas.release_tasks(project_id)
+        task_removed(self.backend, project_id, task_id)
+        return True
+
+    async def change_status(self, project_id: str, task_id: str, new_status: str) -> Task:
+        await self._require_project(project_id)
+        if await self.storage.get_task(project_id, task_id) is None:
+            raise NotFoundError("Task not found.")
+        task_validator.validate_status(new_status)
+        task = await self.storage.update_task(project_id, task_id, status=new_status)
+        if task is None:
+            raise NotFoundError("Task not found.")
+        task_changed(self.backend, project_id, task)
+        return task
+
+    async def get_task(self, project_id: str, task_id: str) -> Optional[Task]:
+        await self._require_project(project_id)
+        return await self.storage.get_task(project_id, task_id)
+
+    async def list_tasks(self, project_id: str) -> List[Task]:
+        await self._require_project(project_id)
+        return await self.storage.list_tasks(project_id)
+
+    async def list_tasks_page(self, project_id: str, cursor: Optional[str] = None, limit: int = 100) -> Page[Task]:
+        page_validator.validate_page_size(limit)
+        await self._require_project(project_id)
+        scope = f"tasks.{project_id}"
+        items, next_cursor = await self.storage.list_tasks_page(project_id, unscope_cursor(scope, cursor), limit)
+        return Page(items, scope_cursor(scope, next_cursor))
+
+    async def iter_tasks(self, project_id: str, page_size: int = 500) -> AsyncIterator[Task]:
+        page_validator.validate_page_size(page_size)
+        await self._require_project(project_id)
+        cursor: Optional[str] = None
+        while True:
+            items, cursor = await self.storage.list_tasks_page(project_id, cursor, page_size)
+            for task in items:
+                yield task
+            if cursor is None:
+                return
+
+    async def count_tasks(self, project_id: str) -> int:
+        return await self.storage.count_tasks(project_id)
+
+    # ---------- Queries ----------
+    async def tasks_by_status(self, status: str, project_id: Optional[str] = None) -> List[Tuple[str, Task]]:
+        task_validator.validate_status(status)
+        if project_id is not None:
+            await self._require_project(project_id)
+        return await self.storage.tasks_by_status(status, project_id)
+
+    async def tasks_due_between(
+        self, start: date, end: date, project_id: Optional[str] = None
+    ) -> List[Tuple[str, Task]]:
+        if not isinstance(start, date) or not isinstance(end, date):
+            raise InvalidEntityError("Start and end must be date objects.")
+        if project_id is not None:
+            await self._require_project(project_id)
+        return await self.storage.tasks_due_between(start, end, project_id)
+
+    async def overdue_tasks(
+        self, as_of: Optional[date] = None, project_id: Optional[str] = None
+    ) -> List[Tuple[str, Task]]:
+        task_validator.validate_deadline(as_of)
+        if project_id is not None:
+            await self._require_project(project_id)
+        return await self.storage.overdue_tasks(as_of or date.today(), project_id)
+
+    async def project_summary(self, project_id: str, as_of: Optional[date] = None) -> ProjectSummary:
+        task_validator.validate_deadline(as_of)
+        summary = await self.storage.project_summary(project_id, as_of or date.today())
+        if summary is None:
+            raise NotFoundError("Project not found.")
+        return summary
+
+    async def search(self, query: str, limit: int = 50) -> List[Tuple[Project, Optional[Task]]]:
+        if not query or not query.strip():
+            raise InvalidEntityError("Search query cannot be empty.")
+        hits = []
+        for project_id, task in await self.storage.search(query, limit):
+            proj = await self.storage.get_project(project_id)
+            if proj is not None:
+                hits.append((proj, task))
+        return hits
@@ -1,39 +1,63 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
+from todolist.core.entities.page import Page, iter_pages, scope_cursor, unscope_cursor
 from todolist.core.entities.project import Project
-from todolist.core.exceptions.invalid_entity import InvalidEntityError
-from todolist.core.exceptions.limit_exceeded import LimitExceededError
-from todolist.core.validators.project_validator import validate_project_name, validate_project_limits, MemoryStorageSingleton
-from todolist.storage.memory_storage import MemoryStorage
+from todolist.core.exceptions.not_found import NotFoundError
+from todolist.core.services.quota import quotas_for
+from todolist.core.services.reminders import project_removed
+from todolist.core.services.unit_of_work import UnitOfWork
+from todolist.core.validators import page_validator, project_validator
+from todolist.core.validators.project_validator import MemoryStorageSingleton
+from todolist.storage.base import Storage
+from todolist.utils.ids import ids_for
 
 
 class ProjectService:
-    def __init__(self, storage: Optional[MemoryStorage] = None) -> None:
+    def __init__(self, storage: Optional[Storage] = None) -> None:
         self.storage = storage or MemoryStorageSingleton.get_instance()
+        self.quotas = quotas_for(self.storage)
+        self.ids = ids_for(self.storage)
 
     def create_project(self, name: str, description: str) -> Project:
-        validate_project_name(name)
-        validate_project_limits()
-        proj = Project.create(name=name, description=description)
-        self.storage.add_project(proj)
+        project_validator.validate_project_name(name, storage=self.storage)
+        proj = Project.create(name=name, description=description, id=self.ids.next_id())
+        with self.quotas.project_slot(proj.id):
+            self.storage.add_project(proj)
         return proj
 
     def edit_project(self, project_id: str, new_name: str, new_description: str) -> Project:
         proj = self.storage.get_project(project_id)
         if not proj:
-            raise InvalidEntityError("Project not found.")
-        validate_project_name(new_name, exclude_project_id=project_id)
-        proj.name = new_name
-        proj.description = new_description
-        return proj
+            raise NotFoundError("Project not found.")
+        project_validator.validate_project_name(new_name, exclude_project_id=project_id, storage=self.storage)
+        return self.storage.update_project(project_id, name=new_name, description=new_description)
 
     def delete_project(self, project_id: str) -> bool:
-        return self.storage.remove_project(project_id)
+        if not self.storage.remove_project(project_id):
+            return False
+        self.quotas.release_project(project_id)
+        project_removed(self.storage, project_id)
+        return True
 
     def list_projects(self) -> List[Project]:
         return self.storage.get_all_projects()
 
+    def list_projects_page(self, cursor: Optional[str] = None, limit: int = 100) -> Page[Project]:
+        """One page of projects in creation order; pass ``next_cursor`` back to continue."""
+        page_validator.validate_page_size(limit)
+        items, next_cursor = self.storage.list_projects_page(unscope_cursor("projects", cursor), limit)
+        return Page(items, scope_cursor("projects", next_cursor))
+
+    def iter_projects(self, page_size: int = 500) -> Iterator[Project]:
+        """Every project, fetched lazily one page at a time."""
+        page_validator.validate_page_size(page_size)
+        return iter_pages(lambda cursor: self.storage.list_projects_page(cursor, page_size))
+
     def get_project(self, project_id: str) -> Optional[Project]:
         return self.storage.get_project(project_id)
+
+    def unit_of_work(self) -> UnitOfWork:
+        """Start a unit of project and task changes that is applied all or none."""
+        return UnitOfWork(self.storage)
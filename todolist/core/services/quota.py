@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.exceptions.limit_exceeded import LimitExceededError
+from todolist.storage.base import Storage
+from todolist.utils.settings import get_settings
+
+
+PROJECT_LIMIT_MESSAGE = "Maximum number of projects reached."
+TASK_LIMIT_MESSAGE = "Maximum number of tasks for this project reached."
+
+
+class QuotaEngine:
+    """Project and task limits, checked in O(1) against counters.
+
+    The project total and each project's task count are read from storage
+    the first time they are needed and from then on kept by the services:
+    ``reserve_*`` checks a limit and takes the slots in one step under a
+    lock, so concurrent callers cannot both pass the check for the last
+    slot, and ``release_*`` hands slots back on delete or on a failed write.
+
+    Limits default to MAX_NUMBER_OF_PROJECTS / MAX_NUMBER_OF_TASKS; single
+    projects can be given their own task limit. Overrides live in memory
+    only. Writes made straight to the storage, bypassing the services, are
+    not counted; ``resync`` re-reads the counters after such changes. On a
+    backend whose ``transaction()`` rolls back (one with ``on_rollback``)
+    the counters are forgotten after each rollback, so slots taken for the
+    rolled-back writes are not kept.
+    """
+
+    def __init__(self, storage: Storage, max_projects: Optional[int] = None, max_tasks: Optional[int] = None) -> None:
+        self.storage = storage
+        settings = get_settings()
+        self.max_projects = settings.max_projects if max_projects is None else max_projects
+        self.max_tasks = settings.max_tasks if max_tasks is None else max_tasks
+        self._task_limits: Dict[str, int] = {}
+        self._projects: Optional[int] = None
+        self._tasks: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    # ---------- Limits ----------
+    def task_limit(self, project_id: str) -> int:
+        return self._task_limits.get(project_id, self.max_tasks)
+
+    def task_limit_override(self, project_id: str) -> Optional[int]:
+        return self._task_limits.get(project_id)
+
+    def set_task_limit(self, project_id: str, limit: Optional[int]) -> None:
+        """Give one project its own task limit; None goes back to the default."""
+        if limit is not None and limit < 0:
+            raise InvalidEntityError("Task limit cannot be negative.")
+        with self._lock:
+            if limit is None:
+                self._task_limits.pop(project_id, None)
+            else:
+                self._task_limits[project_id] = limit
+
+    # ---------- Counters ----------
+    def _project_count(self) -> int:
+        if self._projects is None:
+            self._projects = self.storage.count_projects()
+        return self._projects
+
+    def _task_count(self, project_id: str) -> int:
+        count = self._tasks.get(project_id)
+        if count is None:
+            count = self._tasks[project_id] = self.storage.count_tasks(project_id)
+        return count
+
+    def project_count(self) -> int:
+        with self._lock:
+            return self._project_count()
+
+    def knows_project_count(self) -> bool:
+        return self._projects is not None
+
+    def knows_task_count(self, project_id: str) -> bool:
+        return project_id in self._tasks
+
+    def prime_project_count(self, count: int) -> None:
+        """Start the project counter at ``count``, read by the caller, unless it is already kept.
+
+        The async services await the count themselves so the engine never
+        calls a blocking backend from the event loop.
+        """
+        with self._lock:
+            if self._projects is None:
+                self._projects = count
+
+    def prime_task_count(self, project_id: str, count: int) -> None:
+        """Like ``prime_project_count``, for one project's task counter."""
+        with self._lock:
+            self._tasks.setdefault(project_id, count)
+
+    def task_count(self, project_id: str) -> int:
+        with self._lock:
+            return self._task_count(project_id)
+
+    def remaining_tasks(self, project_id: str) -> int:
+        with self._lock:
+            return max(self.task_limit(project_id) - self._task_count(project_id), 0)
+
+    def resync(self) -> None:
+        """Forget every counter; each is read from storage again on next use."""
+        with self._lock:
+            self._projects = None
+            self._tasks.clear()
+
+    def _rolled_back(self) -> None:
+        # Called by the backend with its lock held, while another thread may
+        # hold ours waiting for that lock (reading a count); so no lock here.
+        # Rebinding is atomic, and the next read sees the rolled-back rows.
+        self._projects = None
+        self._tasks = {}
+
+    # ---------- Reservations ----------
+    def reserve_project(self, force: bool = False) -> None:
+        """Take a project slot, raising LimitExceededError if none is left unless ``force``."""
+        with self._lock:
+            count = self._project_count()
+            if not force and count >= self.max_projects:
+                raise LimitExceededError(PROJECT_LIMIT_MESSAGE)
+            self._projects = count + 1
+
+    def release_project(self, project_id: str) -> None:
+        """Hand back the slot of a deleted (or never created) project, and its task counter."""
+        with self._lock:
+            if self._projects is not None:
+                self._projects = max(self._projects - 1, 0)
+            self._tasks.pop(project_id, None)
+            self._task_limits.pop(project_id, None)
+
+    def reserve_tasks(self, project_id: str, n: int = 1, force: bool = False) -> None:
+        """Take ``n`` task slots in a project, all or none."""
+        with self._lock:
+            count = self._task_count(project_id)
+            if not force and count + n > self.task_limit(project_id):
+                raise LimitExceededError(TASK_LIMIT_MESSAGE)
+            self._tasks[project_id] = count + n
+
+    def take_tasks(self, project_id: str, n: int) -> int:
+        """Take up to ``n`` task slots in a project; returns how many were taken."""
+        with self._lock:
+            count = self._task_count(project_id)
+            taken = max(min(n, self.task_limit(project_id) - count), 0)
+            self._tasks[project_id] = count + taken
+            return taken
+
+    def release_tasks(self, project_id: str, n: int = 1) -> None:
+        with self._lock:
+            count = self._tasks.get(project_id)
+            if count is not None:
+                self._tasks[project_id] = max(count - n, 0)
+
+    @contextmanager
+    def project_slot(self, project_id: str) -> Iterator[None]:
+        """Reserve a slot for creating ``project_id``; it is handed back if the block raises."""
+        self.reserve_project()
+        try:
+            yield
+        except BaseException:
+            self.release_project(project_id)
+            raise
+
+    @contextmanager
+    def task_slots(self, project_id: str, n: int = 1) -> Iterator[None]:
+        """Reserve ``n`` task slots for the block; they are handed back if it raises."""
+        self.reserve_tasks(project_id, n)
+        try:
+            yield
+        except BaseException:
+            self.release_tasks(project_id, n)
+            raise
+
+
+_engines: "weakref.WeakKeyDictionary[Any, QuotaEngine]" = weakref.WeakKeyDictionary()
+_engines_lock = threading.Lock()
+
+
+def quotas_for(storage: Storage) -> QuotaEngine:
+    """The engine shared by every service working on ``storage``."""
+    engine = _engines.get(storage)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(storage)
+            if engine is None:
+                engine = _engines[storage] = QuotaEngine(storage)
+                on_rollback = getattr(storage, "on_rollback", None)
+                if on_rollback is not None:
+                    on_rollback(engine._rolled_back)
+    return engine
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import heapq
+import threading
+import weakref
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from todolist.core.entities.task import Task
+from todolist.storage.base import Storage
+
+
+Reminder = Callable[[str, Task], None]
+
+# Stale heap entries tolerated before a rebuild, on top of one per live entry.
+_COMPACT_MIN = 64
+
+
+class ReminderScheduler:
+    """Calls reminder callbacks for tasks whose deadline has come.
+
+    Upcoming deadlines sit in a min-heap, so a run pops only the entries
+    that are due and its cost follows their number, not the number of
+    tasks. Changes are never searched for in the heap: ``track`` records
+    each task's current deadline and pushes a new entry when it moves;
+    entries that no longer match (deadline changed, task done or deleted)
+    are dropped when they surface, and the heap is rebuilt from the live
+    entries once stale ones make up more than half of it. A due task is
+    read once more from storage before its reminder, which also catches
+    changes made straight to the storage.
+
+    Use ``reminders_for(storage)`` so the services keep the scheduler up to
+    date. ``clock`` gives today's date and can be replaced, e.g. by tests;
+    ``lead`` reminds that many days before the deadline. Each task is
+    reminded once per deadline: edits that leave the deadline alone, or
+    reopening a done task, do not remind it again; a new deadline does.
+    """
+
+    def __init__(
+        self, storage: Storage, clock: Callable[[], date] = date.today, lead: timedelta = timedelta(0)
+    ) -> None:
+        self.storage = storage
+        self.clock = clock
+        self.lead = lead
+        self._heap: List[Tuple[date, str, str]] = []
+        self._due: Dict[Tuple[str, str], date] = {}  # (project id, task id) -> deadline to remind
+        self._reminded: Dict[Tuple[str, str], date] = {}  # -> deadline already reminded
+        self._callbacks: List[Reminder] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ---------- Callbacks ----------
+    def add_callback(self, callback: Reminder) -> None:
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Reminder) -> None:
+        self._callbacks.remove(callback)
+
+    # ---------- Tracking ----------
+    def load(self) -> int:
+        """Track every unfinished task with a deadline; returns how many are pending."""
+        hits = self.storage.tasks_due_between(date.min, date.max)
+        with self._lock:
+            for pid, task in hits:
+                # What track() has recorded meanwhile is newer than this scan.
+                key = (pid, task.id)
+                if (
+                    task.status != "done"
+                    and task.deadline is not None
+                    and key not in self._due
+                    and self._reminded.get(key) != task.deadline
+                ):
+                    self._due[key] = task.deadline
+                    self._heap.append((task.deadline, pid, task.id))
+            heapq.heapify(self._heap)
+            return len(self._due)
+
+    def track(self, project_id: str, task: Task) -> None:
+        """Take note of a task as it now is: added, edited or reopened."""
+        key = (project_id, task.id)
+        deadline = task.deadline
+        with self._lock:
+            reminded = self._reminded.get(key)
+            if reminded is not None and reminded != deadline:
+                # A new deadline (or none) gets its own reminder.
+                del self._reminded[key]
+                reminded = None
+            if deadline is None or task.status == "done" or reminded is not None:
+                if self._due.pop(key, None) is not None:
+                    self._compact()
+            elif self._due.get(key) != deadline:
+                self._due[key] = deadline
+                heapq.heappush(self._heap, (deadline, project_id, task.id))
+                self._compact()
+
+    def track_many(self, project_id: str, tasks: Iterable[Task]) -> None:
+        for task in tasks:
+            self.track(project_id, task)
+
+    def forget(self, project_id: str, task_id: str) -> None:
+        """Stop reminding a deleted task; its heap entry is dropped when it surfaces."""
+        key = (project_id, task_id)
+        with self._lock:
+            self._reminded.pop(key, None)
+            if self._due.pop(key, None) is not None:
+                self._compact()
+
+    def forget_project(self, project_id: str) -> None:
+        """Stop reminding every task of a deleted project."""
+        with self._lock:
+            for tracked in (self._due, self._reminded):
+                for key in [key for key in tracked if key[0] == project_id]:
+                    del tracked[key]
+            self._compact()
+
+    def pending(self) -> int:
+        """Number of tasks still to be reminded."""
+        with self._lock:
+            return len(self._due)
+
+    def next_due(self) -> Optional[date]:
+        """The earliest deadline still to be reminded."""
+        with self._lock:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def _compact(self) -> None:
+        # Every live entry has one matching heap entry; the rest are stale.
+        if len(self._heap) > 2 * len(self._due) + _COMPACT_MIN:
+            self._heap = [(deadline, pid, tid) for (pid, tid), deadline in self._due.items()]
+            heapq.heapify(self._heap)
+
+    def _drop_stale(self) -> None:
+        heap = self._heap
+        while heap and self._due.get((heap[0][1], heap[0][2])) != heap[0][0]:
+            heapq.heappop(heap)
+
+    # ---------- Running ----------
+    def run_pending(self, today: Optional[date] = None) -> List[Tuple[str, Task]]:
+        """Remind every task due by ``today`` (default: the clock); returns them.
+
+        If a callback raises, the other callbacks and tasks are still run,
+        and the first error is raised at the end.
+        """
+        horizon = (today or self.clock()) + self.lead
+        popped = []
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][0] <= horizon:
+                deadline, pid, tid = heapq.heappop(heap)
+                if self._due.get((pid, tid)) == deadline:
+                    del self._due[(pid, tid)]
+                    self._reminded[(pid, tid)] = deadline
+                    popped.append((deadline, pid, tid))
+
+        fired = []
+        error: Optional[BaseException] = None
+        for deadline, pid, tid in popped:
+            task = self.storage.get_task(pid, tid)
+            if task is None or task.status == "done":
+                continue
+            if task.deadline != deadline:
+                # Moved behind our back; remind at the new deadline instead.
+                self.track(pid, task)
+                continue
+            fired.append((pid, task))
+            for callback in list(self._callbacks):
+                try:
+                    callback(pid, task)
+                except Exception as exc:
+                    error = error or exc
+        if error is not None:
+            raise error
+        return fired
+
+    def start(self, interval: float = 60.0) -> None:
+        """Run pending reminders now and then every ``interval`` seconds in a thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, args=(interval,), name="todolist-reminders", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def _loop(self, interval: float) -> None:
+        while True:
+            try:
+                self.run_pending()
+            except Exception:
+                # A failing callback must not stop later reminders.
+                pass
+            if self._stop.wait(interval):
+                return
+
+
+_schedulers: "weakref.WeakKeyDictionary[Any, ReminderScheduler]" = weakref.WeakKeyDictionary()
+_schedulers_lock = threading.Lock()
+
+
+def reminders_for(storage: Storage) -> ReminderScheduler:
+    """The scheduler of ``storage``, created and loaded on first use."""
+    scheduler = _schedulers.get(storage)
+    if scheduler is None:
+        with _schedulers_lock:
+            scheduler = _schedulers.get(storage)
+            if scheduler is None:
+                scheduler = _schedulers[storage] = ReminderScheduler(storage)
+                # Registered first, so writes made while loading are tracked too.
+                scheduler.load()
+    return scheduler
+
+
+# Called by the services after each write; free when no scheduler exists.
+def task_changed(storage: Storage, project_id: str, task: Task) -> None:
+    scheduler = _schedulers.get(storage)
+    if scheduler is not None:
+        scheduler.track(project_id, task)
+
+
+def tasks_changed(storage: Storage, project_id: str, tasks: Iterable[Task]) -> None:
+    scheduler = _schedulers.get(storage)
+    if scheduler is not None:
+        scheduler.track_many(project_id, tasks)
+
+
+def task_removed(storage: Storage, project_id: str, task_id: str) -> None:
+    scheduler = _schedulers.get(storage)
+    if scheduler is not None:
+        scheduler.forget(project_id, task_id)
+
+
+def project_removed(storage: Storage, project_id: str) -> None:
+    scheduler = _schedulers.get(storage)
+    if scheduler is not None:
+        scheduler.forget_project(project_id)
+
+
+def project_restored(storage: Storage, project_id: str) -> None:
+    scheduler = _schedulers.get(storage)
+    if scheduler is not None:
+        scheduler.track_many(project_id, storage.list_tasks(project_id))
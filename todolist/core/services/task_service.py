@@ -1,35 +1,46 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Optional, List
+from itertools import islice
+from typing import Any, Iterable, Iterator, Mapping, Optional, List, TextIO, Tuple
 
+from todolist.core.entities.bulk_result import BulkResult, RowError
+from todolist.core.entities.page import Page, iter_pages, scope_cursor, unscope_cursor
+from todolist.core.entities.project import Project
+from todolist.core.entities.project_summary import ProjectSummary
 from todolist.core.entities.task import Task
 from todolist.core.exceptions.invalid_entity import InvalidEntityError
-from todolist.core.validators.task_validator import (
-    validate_task_title,
-    validate_task_description,
-    validate_status,
-    validate_deadline,
-)
+from todolist.core.exceptions.not_found import NotFoundError
+from todolist.core.services.quota import TASK_LIMIT_MESSAGE, quotas_for
+from todolist.core.services.reminders import task_changed, task_removed, tasks_changed
+from todolist.core.services.unit_of_work import UnitOfWork
+from todolist.core.validators import page_validator, task_validator
+from todolist.core.validators.task_validator import task_row_error
 from todolist.core.validators.project_validator import MemoryStorageSingleton
-from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.base import Storage
+from todolist.utils.ids import ids_for
+from todolist.utils.task_io import check_format, read_rows, write_tasks
 
 
 class TaskService:
-    def __init__(self, storage: Optional[MemoryStorage] = None) -> None:
+    def __init__(self, storage: Optional[Storage] = None) -> None:
         self.storage = storage or MemoryStorageSingleton.get_instance()
+        self.quotas = quotas_for(self.storage)
+        self.ids = ids_for(self.storage)
 
     def add_task(self, project_id: str, title: str, description: str, deadline: Optional[date] = None) -> Task:
-        validate_task_title(title)
-        validate_task_description(description)
-        validate_deadline(deadline)
+        task_validator.validate_task_title(title)
+        task_validator.validate_task_description(description)
+        task_validator.validate_deadline(deadline)
 
         proj = self.storage.get_project(project_id)
         if proj is None:
-            raise InvalidEntityError("Project not found.")
+            raise NotFoundError("Project not found.")
 
-        task = Task.create(title=title, description=description, deadline=deadline)
-        proj.add_task(task)
+        task = Task.create(title=title, description=description, deadline=deadline, id=self.ids.next_id())
+        with self.quotas.task_slots(project_id):
+            self.storage.add_task(project_id, task)
+        task_changed(self.storage, project_id, task)
         return task
 
     def edit_task(
@@ -43,45 +54,251 @@ class TaskService:
     ) -> Task:
         proj = self.storage.get_project(project_id)
         if proj is None:
-            raise InvalidEntityError("Project not found.")
-        task = proj.get_task(task_id)
+            raise NotFoundError("Project not found.")
+        task = self.storage.get_task(project_id, task_id)
         if task is None:
-            raise InvalidEntityError("Task not found.")
+            raise NotFoundError("Task not found.")
 
         if title is not None:
-            validate_task_title(title)
-            task.title = title
+            task_validator.validate_task_title(title)
         if description is not None:
-            validate_task_description(description)
-            task.description = description
+            task_validator.validate_task_description(description)
         if status is not None:
-            validate_status(status)
-            task.status = status
+            task_validator.validate_status(status)
         if deadline is not None:
-            validate_deadline(deadline)
-            task.deadline = deadline
+            task_validator.validate_deadline(deadline)
 
+        task = self.storage.update_task(
+            project_id,
+            task_id,
+            title=title,
+            description=description,
+            status=status,
+            deadline=deadline,
+        )
+        if task is None:
+            # Deleted by another caller since the lookup above.
+            raise NotFoundError("Task not found.")
+        task_changed(self.storage, project_id, task)
         return task
 
     def delete_task(self, project_id: str, task_id: str) -> bool:
         proj = self.storage.get_project(project_id)
         if proj is None:
-            raise InvalidEntityError("Project not found.")
-        return proj.remove_task(task_id)
+            raise NotFoundError("Project not found.")
+        if not self.storage.remove_task(project_id, task_id):
+            return False
+        self.quotas.release_tasks(project_id)
+        task_removed(self.storage, project_id, task_id)
+        return True
 
     def change_status(self, project_id: str, task_id: str, new_status: str) -> Task:
         proj = self.storage.get_project(project_id)
         if proj is None:
-            raise InvalidEntityError("Project not found.")
-        task = proj.get_task(task_id)
+            raise NotFoundError("Project not found.")
+        task = self.storage.get_task(project_id, task_id)
+        if task is None:
+            raise NotFoundError("Task not found.")
+        task_validator.validate_status(new_status)
+        task = self.storage.update_task(project_id, task_id, status=new_status)
         if task is None:
-            raise InvalidEntityError("Task not found.")
-        validate_status(new_status)
-        task.status = new_status
+            raise NotFoundError("Task not found.")
+        task_changed(self.storage, project_id, task)
         return task
 
+    def get_task(self, project_id: str, task_id: str) -> Optional[Task]:
+        proj = self.storage.get_project(project_id)
+        if proj is None:
+            raise NotFoundError("Project not found.")
+        return self.storage.get_task(project_id, task_id)
+
     def list_tasks(self, project_id: str) -> List[Task]:
         proj = self.storage.get_project(project_id)
         if proj is None:
-            raise InvalidEntityError("Project not found.")
-        return proj.tasks.copy()
+            raise NotFoundError("Project not found.")
+        return self.storage.list_tasks(project_id)
+
+    def list_tasks_page(self, project_id: str, cursor: Optional[str] = None, limit: int = 100) -> Page[Task]:
+        """One page of a project's tasks in insertion order; pass ``next_cursor`` back to continue."""
+        page_validator.validate_page_size(limit)
+        self._check_project(project_id)
+        scope = f"tasks.{project_id}"
+        items, next_cursor = self.storage.list_tasks_page(project_id, unscope_cursor(scope, cursor), limit)
+        return Page(items, scope_cursor(scope, next_cursor))
+
+    def iter_tasks(self, project_id: str, page_size: int = 500) -> Iterator[Task]:
+        """A project's tasks, fetched lazily one page at a time.
+
+        Only one page is held at once, so the first task arrives without
+        copying the whole project.
+        """
+        page_validator.validate_page_size(page_size)
+        self._check_project(project_id)
+        return iter_pages(lambda cursor: self.storage.list_tasks_page(project_id, cursor, page_size))
+
+    def count_tasks(self, project_id: str) -> int:
+        return self.storage.count_tasks(project_id)
+
+    def set_task_limit(self, project_id: str, limit: Optional[int]) -> None:
+        """Let one project hold up to ``limit`` tasks instead of MAX_NUMBER_OF_TASKS; None resets it."""
+        self._check_project(project_id)
+        self.quotas.set_task_limit(project_id, limit)
+
+    def unit_of_work(self) -> UnitOfWork:
+        """Start a unit of task and project changes, e.g. moving tasks, that is applied all or none."""
+        return UnitOfWork(self.storage)
+
+    # ---------- Queries ----------
+    def _check_project(self, project_id: Optional[str]) -> None:
+        if project_id is not None and self.storage.get_project(project_id) is None:
+            raise NotFoundError("Project not found.")
+
+    def tasks_by_status(self, status: str, project_id: Optional[str] = None) -> List[Tuple[str, Task]]:
+        """(project id, task) pairs with the given status, in one project or all of them."""
+        task_validator.validate_status(status)
+        self._check_project(project_id)
+        return self.storage.tasks_by_status(status, project_id)
+
+    def tasks_due_between(
+        self, start: date, end: date, project_id: Optional[str] = None
+    ) -> List[Tuple[str, Task]]:
+        """(project id, task) pairs due in [start, end], earliest first."""
+        if not isinstance(start, date) or not isinstance(end, date):
+            raise InvalidEntityError("Start and end must be date objects.")
+        self._check_project(project_id)
+        return self.storage.tasks_due_between(start, end, project_id)
+
+    def overdue_tasks(self, as_of: Optional[date] = None, project_id: Optional[str] = None) -> List[Tuple[str, Task]]:
+        """Unfinished (project id, task) pairs due before ``as_of`` (default today), earliest first."""
+        task_validator.validate_deadline(as_of)
+        self._check_project(project_id)
+        return self.storage.overdue_tasks(as_of or date.today(), project_id)
+
+    def project_summary(self, project_id: str, as_of: Optional[date] = None) -> ProjectSummary:
+        """Task counts by status, next open deadline and overdue count as of ``as_of`` (default today)."""
+        task_validator.validate_deadline(as_of)
+        summary = self.storage.project_summary(project_id, as_of or date.today())
+        if summary is None:
+            raise NotFoundError("Project not found.")
+        return summary
+
+    def search(self, query: str, limit: int = 50) -> List[Tuple[Project, Optional[Task]]]:
+        """Search project names and task titles/descriptions by word prefix.
+
+        Returns (project, task) pairs; task is None when the project name matched.
+        """
+        if not query or not query.strip():
+            raise InvalidEntityError("Search query cannot be empty.")
+        hits = []
+        for project_id, task in self.storage.search(query, limit):
+            proj = self.storage.get_project(project_id)
+            if proj is not None:
+                hits.append((proj, task))
+        return hits
+
+    # ---------- Bulk import/export ----------
+    def add_tasks_bulk(self, project_id: str, rows: Iterable[Mapping[str, Any]]) -> BulkResult:
+        """Add many tasks with one project lookup, one limit check and one storage write.
+
+        Rows are mappings with ``title`` and optional ``id``, ``description``,
+        ``status`` and ``deadline`` (a date or YYYY-MM-DD string). Invalid rows
+        are reported in the result, numbered from 1, and do not stop the others.
+        """
+        return self._add_batch(project_id, list(enumerate(rows, 1)))
+
+    def import_stream(
+        self, project_id: str, stream: TextIO, fmt: str = "jsonl", batch_size: int = 10_000
+    ) -> BulkResult:
+        """Import CSV or JSONL rows from ``stream``, ``batch_size`` rows at a time.
+
+        Only one batch is held in memory; each is added like ``add_tasks_bulk``.
+        """
+        check_format(fmt)
+        page_validator.validate_page_size(batch_size)
+        self._check_project(project_id)
+        result = BulkResult()
+        rows = read_rows(stream, fmt)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return result
+            result.merge(self._add_batch(project_id, batch))
+
+    def export_stream(self, project_id: str, out: TextIO, fmt: str = "jsonl") -> int:
+        """Write a project's tasks to ``out``; returns the number written.
+
+        Backends offering ``snapshot()`` export the project as of the call,
+        unaffected by concurrent writes; others are read page by page.
+        """
+        check_format(fmt)
+        snapshot = getattr(self.storage, "snapshot", None)
+        if snapshot is None:
+            return write_tasks(self.iter_tasks(project_id, page_size=1000), out, fmt)
+        self._check_project(project_id)
+        return write_tasks(snapshot().iter_tasks(project_id), out, fmt)
+
+    def _add_batch(self, project_id: str, rows: List[Tuple[int, Optional[Mapping[str, Any]]]]) -> BulkResult:
+        if self.storage.get_project(project_id) is None:
+            raise NotFoundError("Project not found.")
+        result = BulkResult()
+        errors = result.errors
+        remaining = self.quotas.remaining_tasks(project_id)
+        get_task = self.storage.get_task
+        tasks: List[Task] = []
+        numbers: List[int] = []
+        seen = set()
+
+        for n, row in rows:
+            if row is None:
+                errors.append(RowError(n, "Row could not be parsed."))
+                continue
+            title = row.get("title")
+            description = row.get("description") or ""
+            status = row.get("status") or "todo"
+            deadline = row.get("deadline") or None
+            if isinstance(deadline, str):
+                try:
+                    deadline = date.fromisoformat(deadline)
+                except ValueError:
+                    errors.append(RowError(n, "Deadline must be in YYYY-MM-DD format."))
+                    continue
+            message = task_row_error(title, description, status, deadline)
+            if message is not None:
+                errors.append(RowError(n, message))
+                continue
+            if len(tasks) >= remaining:
+                errors.append(RowError(n, TASK_LIMIT_MESSAGE))
+                continue
+
+            task_id = row.get("id")
+            if task_id:
+                task_id = str(task_id)
+                if task_id in seen or get_task(project_id, task_id) is not None:
+                    errors.append(RowError(n, "Task id must be unique within its project."))
+                    continue
+                seen.add(task_id)
+            # Rows without an id get one below, from a single batch.
+            tasks.append(
+                Task(id=task_id or "", title=title, description=description, status=status, deadline=deadline)
+            )
+            numbers.append(n)
+
+        taken = self.quotas.take_tasks(project_id, len(tasks))
+        if taken < len(tasks):
+            # Concurrent adds used up some of the slots counted above.
+            errors.extend(RowError(n, TASK_LIMIT_MESSAGE) for n in numbers[taken:])
+            errors.sort(key=lambda e: e.row)
+            del tasks[taken:]
+        if tasks:
+            self.ids.note_used(seen)
+            unnamed = [task for task in tasks if not task.id]
+            for task, task_id in zip(unnamed, self.ids.take(len(unnamed))):
+                task.id = task_id
+            try:
+                self.storage.add_tasks(project_id, tasks)
+            except BaseException:
+                self.quotas.release_tasks(project_id, taken)
+                raise
+            tasks_changed(self.storage, project_id, tasks)
+        result.added = len(tasks)
+        return result
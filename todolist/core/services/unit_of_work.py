@@ -0,0 +1,482 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.exceptions.limit_exceeded import LimitExceededError
+from todolist.core.exceptions.not_found import NotFoundError
+from todolist.core.services.quota import PROJECT_LIMIT_MESSAGE, TASK_LIMIT_MESSAGE, QuotaEngine, quotas_for
+from todolist.core.services.reminders import project_removed, project_restored, task_changed, task_removed
+from todolist.core.validators import project_validator, task_validator
+from todolist.storage.base import Storage
+from todolist.utils.ids import ids_for
+
+
+# An operation is (check, apply, args) over UnitOfWork methods: check runs
+# against the draft, apply makes the change and returns how to revert it as
+# (undo, args), or None when there is nothing to revert. Plain tuples rather
+# than closures, so a unit of many operations leaves few objects for the
+# garbage collector to walk while it is pending.
+_Undo = Tuple[Callable[..., None], Tuple[Any, ...]]
+_Op = Tuple[Callable[..., None], Callable[..., Optional[_Undo]], Tuple[Any, ...]]
+
+
+class _Draft:
+    """The storage as the operations checked so far would leave it.
+
+    Lookups fall through to storage the first time and are then tracked
+    here, so checking a unit reads each project, name and task at most once.
+    """
+
+    def __init__(self, storage: Storage, quotas: QuotaEngine) -> None:
+        self.storage = storage
+        self.quotas = quotas
+        self.project_count = quotas.project_count()
+        self._projects: Dict[str, Optional[str]] = {}  # id -> name, None if absent
+        self._owners: Dict[str, Optional[str]] = {}  # name -> project id, None if free
+        self._tasks: Dict[Tuple[str, str], bool] = {}
+        self._task_counts: Dict[str, int] = {}
+
+    def project_name(self, project_id: str) -> Optional[str]:
+        if project_id not in self._projects:
+            proj = self.storage.get_project(project_id)
+            self._projects[project_id] = proj.name if proj is not None else None
+        return self._projects[project_id]
+
+    def require_project(self, project_id: str) -> None:
+        if self.project_name(project_id) is None:
+            raise NotFoundError("Project not found.")
+
+    def require_free_name(self, name: str, project_id: Optional[str] = None) -> None:
+        if name not in self._owners:
+            proj = self.storage.find_project_by_name(name)
+            self._owners[name] = proj.id if proj is not None else None
+        owner = self._owners[name]
+        if owner is not None and owner != project_id:
+            raise InvalidEntityError("Project name must be unique.")
+
+    def set_project(self, project_id: str, name: Optional[str]) -> None:
+        old = self.project_name(project_id)
+        if old is not None:
+            self._owners[old] = None
+            self.project_count -= 1
+        if name is not None:
+            self._owners[name] = project_id
+            self.project_count += 1
+        if old is None or name is None:
+            # Created or deleted: either way it holds no tasks now.
+            self._task_counts[project_id] = 0
+        self._projects[project_id] = name
+
+    def has_task(self, project_id: str, task_id: str) -> bool:
+        if self.project_name(project_id) is None:
+            return False
+        key = (project_id, task_id)
+        if key not in self._tasks:
+            self._tasks[key] = self.storage.get_task(project_id, task_id) is not None
+        return self._tasks[key]
+
+    def require_task(self, project_id: str, task_id: str) -> None:
+        self.require_project(project_id)
+        if not self.has_task(project_id, task_id):
+            raise NotFoundError("Task not found.")
+
+    def task_count(self, project_id: str) -> int:
+        if project_id not in self._task_counts:
+            self._task_counts[project_id] = self.quotas.task_count(project_id)
+        return self._task_counts[project_id]
+
+    def set_task(self, project_id: str, task_id: str, exists: bool) -> None:
+        """Record a checked add or delete; the task's current state must be known."""
+        key = (project_id, task_id)
+        if self._tasks.get(key) != exists:
+            self._task_counts[project_id] = self.task_count(project_id) + (1 if exists else -1)
+        self._tasks[key] = exists
+
+
+class UnitOfWork:
+    """Collects project and task changes and applies them all or none.
+
+    Nothing touches storage until ``commit``. Every operation is first
+    checked, with the same rules as the services, against the storage as the
+    earlier operations of the unit would leave it; one bad operation rejects
+    the whole unit before anything changes. The operations then run inside
+    one ``storage.transaction()``, so persistent backends commit once per
+    unit. If one still fails there (another caller changed the same data in
+    the meantime, or the backend raised), the unit is reverted and the error
+    is re-raised.
+
+    On a backend whose transaction really rolls back (one with a true
+    ``transactional`` attribute, such as SQLiteStorage) the backend discards
+    the writes and the quota engine re-reads its counters, and the unit only
+    puts back the task limits and reminders it changed. Elsewhere the operations already applied are undone in
+    reverse order. Removed projects and tasks go back to their old place
+    through ``restore_project``/``restore_task`` where the backend has them
+    (MemoryStorage, JournalStorage), so listings and their cursors are as
+    before; other backends re-add them at the end.
+
+    Other callers are not isolated from a unit: on MemoryStorage they can
+    see its changes while it is being applied. Project and task limits are
+    checked with the rest, and the unit takes its quota slots as it applies.
+
+    Used as a context manager it commits when the block exits cleanly and
+    discards the queued operations when it raises.
+    """
+
+    def __init__(self, storage: Storage) -> None:
+        self.storage = storage
+        self.quotas = quotas_for(storage)
+        self.ids = ids_for(storage)
+        self._ops: List[_Op] = []
+        self._transactional = bool(getattr(storage, "transactional", False))
+        self._restores = hasattr(storage, "restore_task")
+
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type: object, *exc: object) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+    def discard(self) -> None:
+        self._ops.clear()
+
+    def commit(self) -> None:
+        ops, self._ops = self._ops, []
+        draft = _Draft(self.storage, self.quotas)
+        for check, _, args in ops:
+            check(self, draft, *args)
+
+        done: List[Optional[_Undo]] = []
+        try:
+            with self.storage.transaction():
+                try:
+                    for _, apply, args in ops:
+                        done.append(apply(self, *args))
+                except BaseException:
+                    if not self._transactional:
+                        # Undo inside the transaction: the journal records the undo next to what it reverts.
+                        self._revert(done)
+                    raise
+        except BaseException:
+            if self._transactional:
+                # The backend has rolled the writes back; in-memory state is left.
+                self._revert(done)
+            raise
+
+    def _revert(self, done: List[Optional[_Undo]]) -> None:
+        for entry in reversed(done):
+            if entry is None:
+                continue
+            undo, args = entry
+            try:
+                undo(self, *args)
+            except Exception:
+                # Keep undoing the rest; the original error matters more.
+                pass
+
+    # ---------- Queueing ----------
+    def create_project(self, name: str, description: str) -> Project:
+        """Queue a new project; its id is assigned now so later operations can use it."""
+        proj = Project.create(name=name, description=description, id=self.ids.next_id())
+        self._ops.append((UnitOfWork._check_create_project, UnitOfWork._create_project, (proj,)))
+        return proj
+
+    def edit_project(self, project_id: str, new_name: str, new_description: str) -> None:
+        self._ops.append(
+            (UnitOfWork._check_edit_project, UnitOfWork._edit_project, (project_id, new_name, new_description))
+        )
+
+    def delete_project(self, project_id: str) -> None:
+        self._ops.append((UnitOfWork._check_delete_project, UnitOfWork._delete_project, (project_id,)))
+
+    def add_task(self, project_id: str, title: str, description: str, deadline: Optional[date] = None) -> Task:
+        """Queue a new task; its id is assigned now so later operations can use it."""
+        task = Task.create(title=title, description=description, deadline=deadline, id=self.ids.next_id())
+        self._ops.append((UnitOfWork._check_add_task, UnitOfWork._add_task, (project_id, task)))
+        return task
+
+    def edit_task(
+        self,
+        project_id: str,
+        task_id: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline: Optional[date] = None,
+    ) -> None:
+        self._ops.append(
+            (
+                UnitOfWork._check_edit_task,
+                UnitOfWork._edit_task,
+                (project_id, task_id, title, description, status, deadline),
+            )
+        )
+
+    def change_status(self, project_id: str, task_id: str, new_status: str) -> None:
+        self.edit_task(project_id, task_id, status=new_status)
+
+    def delete_task(self, project_id: str, task_id: str) -> None:
+        self._ops.append((UnitOfWork._check_delete_task, UnitOfWork._delete_task, (project_id, task_id)))
+
+    def move_task(self, project_id: str, task_id: str, to_project_id: str) -> None:
+        """Queue moving a task, id and all, to another project."""
+        self._ops.append(
+            (UnitOfWork._check_move_task, UnitOfWork._move_task, (project_id, task_id, to_project_id))
+        )
+
+    # ---------- Undo helpers ----------
+    def _task_seq(self, project_id: str, task_id: str) -> Optional[int]:
+        return getattr(self.storage, "task_seq")(project_id, task_id) if self._restores else None
+
+    def _put_back(self, project_id: str, task: Task, seq: Optional[int]) -> None:
+        """Re-add a removed task, at its old place if the backend knew it."""
+        if seq is not None:
+            getattr(self.storage, "restore_task")(project_id, task, seq)
+        else:
+            self.storage.add_task(project_id, task)
+
+    def _retrack(self, project_id: str, task_id: str) -> None:
+        # After a rollback: reminders follow the task as storage has it again.
+        task = self.storage.get_task(project_id, task_id)
+        if task is not None:
+            task_changed(self.storage, project_id, task)
+
+    # ---------- Projects ----------
+    def _check_create_project(self, draft: _Draft, proj: Project) -> None:
+        project_validator.validate_project_name_format(proj.name)
+        draft.require_free_name(proj.name)
+        if draft.project_count >= self.quotas.max_projects:
+            raise LimitExceededError(PROJECT_LIMIT_MESSAGE)
+        draft.set_project(proj.id, proj.name)
+
+    def _create_project(self, proj: Project) -> _Undo:
+        with self.quotas.project_slot(proj.id):
+            self.storage.add_project(proj)
+        return (UnitOfWork._undo_create_project, (proj.id,))
+
+    def _undo_create_project(self, project_id: str) -> None:
+        if not self._transactional:
+            self.storage.remove_project(project_id)
+            self.quotas.release_project(project_id)
+
+    def _check_edit_project(self, draft: _Draft, project_id: str, new_name: str, new_description: str) -> None:
+        draft.require_project(project_id)
+        project_validator.validate_project_name_format(new_name)
+        draft.require_free_name(new_name, project_id)
+        draft.set_project(project_id, new_name)
+
+    def _edit_project(self, project_id: str, new_name: str, new_description: str) -> Optional[_Undo]:
+        if self._transactional:
+            if self.storage.update_project(project_id, name=new_name, description=new_description) is None:
+                raise NotFoundError("Project not found.")
+            return None
+        proj = self.storage.get_project(project_id)
+        if proj is None:
+            raise NotFoundError("Project not found.")
+        old_name, old_description = proj.name, proj.description
+        self.storage.update_project(project_id, name=new_name, description=new_description)
+        return (UnitOfWork._undo_edit_project, (project_id, old_name, old_description))
+
+    def _undo_edit_project(self, project_id: str, name: str, description: str) -> None:
+        self.storage.update_project(project_id, name=name, description=description)
+
+    def _check_delete_project(self, draft: _Draft, project_id: str) -> None:
+        draft.require_project(project_id)
+        draft.set_project(project_id, None)
+
+    def _delete_project(self, project_id: str) -> _Undo:
+        limit = self.quotas.task_limit_override(project_id)
+        proj: Optional[Project] = None
+        seq: Optional[int] = None
+        tasks: Optional[List[Task]] = None
+        if self._transactional:
+            if not self.storage.remove_project(project_id):
+                raise NotFoundError("Project not found.")
+        else:
+            proj = self.storage.get_project(project_id)
+            if proj is None:
+                raise NotFoundError("Project not found.")
+            if self._restores:
+                # Such a backend hands out the stored project, its tasks and their places included.
+                seq = getattr(self.storage, "project_seq")(project_id)
+            else:
+                tasks = self.storage.list_tasks(project_id)
+            self.storage.remove_project(project_id)
+        self.quotas.release_project(project_id)
+        project_removed(self.storage, project_id)
+        return (UnitOfWork._undo_delete_project, (project_id, limit, proj, seq, tasks))
+
+    def _undo_delete_project(
+        self,
+        project_id: str,
+        limit: Optional[int],
+        proj: Optional[Project],
+        seq: Optional[int],
+        tasks: Optional[List[Task]],
+    ) -> None:
+        if not self._transactional:
+            self.quotas.reserve_project(force=True)
+        if proj is not None:
+            if seq is not None:
+                getattr(self.storage, "restore_project")(proj, seq)
+            else:
+                self.storage.add_project(
+                    Project(id=proj.id, name=proj.name, description=proj.description, tasks=tasks or [])
+                )
+        self.quotas.set_task_limit(project_id, limit)
+        project_restored(self.storage, project_id)
+
+    # ---------- Tasks ----------
+    def _check_add_task(self, draft: _Draft, project_id: str, task: Task) -> None:
+        task_validator.validate_task_title(task.title)
+        task_validator.validate_task_description(task.description)
+        task_validator.validate_deadline(task.deadline)
+        draft.require_project(project_id)
+        if draft.has_task(project_id, task.id):
+            raise InvalidEntityError("Task id must be unique within its project.")
+        if draft.task_count(project_id) >= self.quotas.task_limit(project_id):
+            raise LimitExceededError(TASK_LIMIT_MESSAGE)
+        draft.set_task(project_id, task.id, True)
+
+    def _add_task(self, project_id: str, task: Task) -> _Undo:
+        with self.quotas.task_slots(project_id):
+            self.storage.add_task(project_id, task)
+        task_changed(self.storage, project_id, task)
+        return (UnitOfWork._undo_add_task, (project_id, task.id))
+
+    def _undo_add_task(self, project_id: str, task_id: str) -> None:
+        if not self._transactional:
+            self.storage.remove_task(project_id, task_id)
+            self.quotas.release_tasks(project_id)
+        task_removed(self.storage, project_id, task_id)
+
+    def _check_edit_task(
+        self,
+        draft: _Draft,
+        project_id: str,
+        task_id: str,
+        title: Optional[str],
+        description: Optional[str],
+        status: Optional[str],
+        deadline: Optional[date],
+    ) -> None:
+        draft.require_task(project_id, task_id)
+        if title is not None:
+            task_validator.validate_task_title(title)
+        if description is not None:
+            task_validator.validate_task_description(description)
+        if status is not None:
+            task_validator.validate_status(status)
+        if deadline is not None:
+            task_validator.validate_deadline(deadline)
+
+    def _edit_task(
+        self,
+        project_id: str,
+        task_id: str,
+        title: Optional[str],
+        description: Optional[str],
+        status: Optional[str],
+        deadline: Optional[date],
+    ) -> _Undo:
+        before = None
+        if not self._transactional:
+            task = self.storage.get_task(project_id, task_id)
+            if task is None:
+                raise NotFoundError("Task not found.")
+            before = task.copy()
+        after = self.storage.update_task(project_id, task_id, title, description, status, deadline)
+        if after is None:
+            raise NotFoundError("Task not found.")
+        task_changed(self.storage, project_id, after)
+        if before is None:
+            return (UnitOfWork._retrack, (project_id, task_id))
+        return (UnitOfWork._undo_edit_task, (project_id, before, deadline is not None))
+
+    def _undo_edit_task(self, project_id: str, before: Task, set_deadline: bool) -> None:
+        if before.deadline is None and set_deadline:
+            # update_task cannot clear a deadline; put the old task back whole, in its place.
+            seq = self._task_seq(project_id, before.id)
+            self.storage.remove_task(project_id, before.id)
+            self._put_back(project_id, before, seq)
+        else:
+            self.storage.update_task(
+                project_id, before.id, before.title, before.description, before.status, before.deadline
+            )
+        task_changed(self.storage, project_id, before)
+
+    def _check_delete_task(self, draft: _Draft, project_id: str, task_id: str) -> None:
+        draft.require_task(project_id, task_id)
+        draft.set_task(project_id, task_id, False)
+
+    def _delete_task(self, project_id: str, task_id: str) -> _Undo:
+        task: Optional[Task] = None
+        seq: Optional[int] = None
+        if self._transactional:
+            if not self.storage.remove_task(project_id, task_id):
+                raise NotFoundError("Task not found.")
+        else:
+            task = self.storage.get_task(project_id, task_id)
+            seq = self._task_seq(project_id, task_id)
+            if task is None or not self.storage.remove_task(project_id, task_id):
+                raise NotFoundError("Task not found.")
+        self.quotas.release_tasks(project_id)
+        task_removed(self.storage, project_id, task_id)
+        return (UnitOfWork._undo_delete_task, (project_id, task_id, task, seq))
+
+    def _undo_delete_task(self, project_id: str, task_id: str, task: Optional[Task], seq: Optional[int]) -> None:
+        if task is None:
+            self._retrack(project_id, task_id)
+            return
+        self.quotas.reserve_tasks(project_id, force=True)
+        self._put_back(project_id, task, seq)
+        task_changed(self.storage, project_id, task)
+
+    def _check_move_task(self, draft: _Draft, project_id: str, task_id: str, to_project_id: str) -> None:
+        draft.require_task(project_id, task_id)
+        draft.require_project(to_project_id)
+        if draft.has_task(to_project_id, task_id):
+            raise InvalidEntityError("Task id must be unique within its project.")
+        if draft.task_count(to_project_id) >= self.quotas.task_limit(to_project_id):
+            raise LimitExceededError(TASK_LIMIT_MESSAGE)
+        draft.set_task(project_id, task_id, False)
+        draft.set_task(to_project_id, task_id, True)
+
+    def _move_task(self, project_id: str, task_id: str, to_project_id: str) -> _Undo:
+        with self.quotas.task_slots(to_project_id):
+            task = self.storage.get_task(project_id, task_id)
+            seq = None if self._transactional else self._task_seq(project_id, task_id)
+            if task is None or not self.storage.remove_task(project_id, task_id):
+                raise NotFoundError("Task not found.")
+            try:
+                self.storage.add_task(to_project_id, task)
+            except BaseException:
+                if not self._transactional:
+                    self._put_back(project_id, task, seq)
+                raise
+        self.quotas.release_tasks(project_id)
+        task_removed(self.storage, project_id, task_id)
+        task_changed(self.storage, to_project_id, task)
+        return (UnitOfWork._undo_move_task, (project_id, task, to_project_id, seq))
+
+    def _undo_move_task(self, project_id: str, task: Task, to_project_id: str, seq: Optional[int]) -> None:
+        task_removed(self.storage, to_project_id, task.id)
+        if self._transactional:
+            self._retrack(project_id, task.id)
+            return
+        self.quotas.release_tasks(to_project_id)
+        self.quotas.reserve_tasks(project_id, force=True)
+        # Later operations' undos have already restored the task as it was moved.
+        moved = self.storage.get_task(to_project_id, task.id) or task
+        self.storage.remove_task(to_project_id, task.id)
+        self._put_back(project_id, moved, seq)
+        task_changed(self.storage, project_id, moved)
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+
+
+MAX_PAGE_SIZE = 10_000
+
+
+def validate_page_size(limit: int) -> None:
+    if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+        raise InvalidEntityError("Page size must be a positive integer.")
+    if limit > MAX_PAGE_SIZE:
+        raise InvalidEntityError(f"Page size must be <= {MAX_PAGE_SIZE}.")
@@ -3,26 +3,33 @@ from __future__ import annotations
 from datetime import date
 from typing import Optional
 
+from todolist.core.entities.task import STATUSES
 from todolist.core.exceptions.invalid_entity import InvalidEntityError
-from todolist.core.exceptions.limit_exceeded import LimitExceededError
-from todolist.utils.env_loader import get_env_int
-from todolist.storage.memory_storage import MemoryStorage
+from todolist.utils.settings import get_settings
 
 
-MAX_TASKS = get_env_int("MAX_NUMBER_OF_TASK", 100)
-VALID_STATUSES = {"todo", "doing", "done"}
+VALID_STATUSES = set(STATUSES)
+MAX_TITLE_LENGTH = 30
+MAX_DESCRIPTION_LENGTH = 150
+
+
+def __getattr__(name: str) -> int:
+    # MAX_TASKS used to be read at import time; it now comes from the settings.
+    if name == "MAX_TASKS":
+        return get_settings().max_tasks
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def validate_task_title(title: str) -> None:
     if not title or len(title.strip()) == 0:
         raise InvalidEntityError("Task title cannot be empty.")
-    if len(title) > 30:
-        raise InvalidEntityError("Task title must be <= 30 characters.")
+    if len(title) > MAX_TITLE_LENGTH:
+        raise InvalidEntityError(f"Task title must be <= {MAX_TITLE_LENGTH} characters.")
 
 
 def validate_task_description(description: str) -> None:
-    if description is not None and len(description) > 150:
-        raise InvalidEntityError("Task description must be <= 150 characters.")
+    if description is not None and len(description) > MAX_DESCRIPTION_LENGTH:
+        raise InvalidEntityError(f"Task description must be <= {MAX_DESCRIPTION_LENGTH} characters.")
 
 
 def validate_status(status: str) -> None:
@@ -35,8 +42,22 @@ def validate_deadline(deadline: Optional[date]) -> None:
         raise InvalidEntityError("Deadline must be a date object.")
 
 
-def validate_task_limits(project_id: str) -> None:
-    storage = MemoryStorage()
-    proj = storage.get_project(project_id)
-    if proj and len(proj.tasks) >= MAX_TASKS:
-        raise LimitExceededError("Maximum number of tasks for this project reached.")
+def task_row_error(title: object, description: object, status: object, deadline: object) -> Optional[str]:
+    """The first rule a bulk-import row breaks, or None if it is valid.
+
+    Same rules and messages as the validate_* functions, but returned rather
+    than raised so a batch can be checked in one pass.
+    """
+    if not isinstance(title, str) or not title.strip():
+        return "Task title cannot be empty."
+    if len(title) > MAX_TITLE_LENGTH:
+        return f"Task title must be <= {MAX_TITLE_LENGTH} characters."
+    if description is not None and not isinstance(description, str):
+        return "Task description must be text."
+    if description is not None and len(description) > MAX_DESCRIPTION_LENGTH:
+        return f"Task description must be <= {MAX_DESCRIPTION_LENGTH} characters."
+    if not isinstance(status, str) or status not in VALID_STATUSES:
+        return f"Status must be one of {VALID_STATUSES}."
+    if deadline is not None and not isinstance(deadline, date):
+        return "Deadline must be a date object."
+    return None
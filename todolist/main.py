@@ -1,12 +1,54 @@
 from __future__ import annotations
 
-from todolist.cli.menu import CLI
+import argparse
+import sys
+from typing import List, Optional
 
+from todolist.storage.factory import close_storage, open_storage_from_env
+from todolist.utils.settings import get_settings
 
-def main() -> None:
-    cli = CLI()
-    cli.run()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="ToDoList: the interactive menu, or a batch of commands.")
+    parser.add_argument(
+        "--batch",
+        nargs="?",
+        const="-",
+        metavar="FILE",
+        help="run commands from FILE (default: stdin), one per line as JSON or 'op key=value ...'",
+    )
+    parser.add_argument("--quiet", action="store_true", help="in batch mode, print only errors and the summary")
+    args = parser.parse_args(argv)
+
+    # Only what the chosen mode needs is imported, to keep short batch runs quick to start.
+    settings = get_settings()
+    storage = open_storage_from_env()
+    if settings.metrics_enabled:
+        from todolist.utils import metrics
+
+        metrics.instrument(storage)
+    try:
+        if args.batch is None:
+            from todolist.cli.menu import CLI
+
+            CLI(storage).run()
+            return 0
+        from todolist.cli.batch import BatchRunner
+
+        runner = BatchRunner(storage, sys.stdout, quiet=args.quiet)
+        if args.batch == "-":
+            failed = runner.run(sys.stdin)
+        else:
+            with open(args.batch, encoding="utf-8") as fh:
+                failed = runner.run(fh)
+        return 1 if failed else 0
+    finally:
+        if settings.metrics_path:
+            from todolist.utils import metrics
+
+            metrics.REGISTRY.dump(settings.metrics_path, storage)
+        close_storage(storage)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
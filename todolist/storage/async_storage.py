@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import date
+from functools import partial
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, List, Optional, Protocol, Tuple
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.project_summary import ProjectSummary
+from todolist.core.entities.task import Task
+from todolist.storage.base import Storage
+
+
+class AsyncStorage(Protocol):
+    """Awaitable counterpart of Storage used by the async services."""
+
+    # The synchronous backend underneath; the services keep its quota counters.
+    storage: Storage
+
+    async def add_project(self, project: Project) -> None: ...
+
+    async def get_project(self, project_id: str) -> Optional[Project]: ...
+
+    async def get_all_projects(self) -> List[Project]: ...
+
+    async def list_projects_page(self, cursor: Optional[str], limit: int) -> Tuple[List[Project], Optional[str]]: ...
+
+    async def update_project(
+        self,
+        project_id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Project]: ...
+
+    async def remove_project(self, project_id: str) -> bool: ...
+
+    async def find_project_by_name(self, name: str) -> Optional[Project]: ...
+
+    async def count_projects(self) -> int: ...
+
+    async def add_task(self, project_id: str, task: Task) -> None: ...
+
+    async def add_tasks(self, project_id: str, tasks: List[Task]) -> None: ...
+
+    async def get_task(self, project_id: str, task_id: str) -> Optional[Task]: ...
+
+    async def list_tasks(self, project_id: str) -> List[Task]: ...
+
+    async def list_tasks_page(
+        self, project_id: str, cursor: Optional[str], limit: int
+    ) -> Tuple[List[Task], Optional[str]]: ...
+
+    async def count_tasks(self, project_id: str) -> int: ...
+
+    async def update_task(
+        self,
+        project_id: str,
+        task_id: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline: Optional[date] = None,
+    ) -> Optional[Task]: ...
+
+    async def remove_task(self, project_id: str, task_id: str) -> bool: ...
+
+    async def reserve_ids(self, n: int, floor: int = 0) -> int: ...
+
+    async def tasks_by_status(self, status: str, project_id: Optional[str] = None) -> List[Tuple[str, Task]]: ...
+
+    async def tasks_due_between(
+        self, start: date, end: date, project_id: Optional[str] = None
+    ) -> List[Tuple[str, Task]]: ...
+
+    async def overdue_tasks(self, as_of: date, project_id: Optional[str] = None) -> List[Tuple[str, Task]]: ...
+
+    async def project_summary(self, project_id: str, as_of: date) -> Optional[ProjectSummary]: ...
+
+    async def search(self, query: str, limit: int = 50) -> List[Tuple[str, Optional[Task]]]: ...
+
+    def transaction(self) -> AsyncContextManager[None]: ...
+
+
+class _AsyncStorageAdapter(ABC):
+    """Implements AsyncStorage on top of a synchronous Storage via ``_call``."""
+
+    def __init__(self, storage: Storage) -> None:
+        self.storage = storage
+
+    @abstractmethod
+    async def _call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``fn(*args, **kwargs)`` against the backend and return its result."""
+
+    async def add_project(self, project: Project) -> None:
+        return await self._call(self.storage.add_project, project)
+
+    async def get_project(self, project_id: str) -> Optional[Project]:
+        return await self._call(self.storage.get_project, project_id)
+
+    async def get_all_projects(self) -> List[Project]:
+        return await self._call(self.storage.get_all_projects)
+
+    async def list_projects_page(self, cursor: Optional[str], limit: int) -> Tuple[List[Project], Optional[str]]:
+        return await self._call(self.storage.list_projects_page, cursor, limit)
+
+    async def update_project(
+        self,
+        project_id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Project]:
+        return await self._call(self.storage.update_project, project_id, name=name, description=description)
+
+    async def remove_project(self, project_id: str) -> bool:
+        return await self._call(self.storage.remove_project, project_id)
+
+    async def find_project_by_name(self, name: str) -> Optional[Project]:
+        return await self._call(self.storage.find_project_by_name, name)
+
+    async def count_projects(self) -> int:
+        return await self._call(self.storage.count_projects)
+
+    async def add_task(self, project_id: str, task: Task) -> None:
+        return await self._call(self.storage.add_task, project_id, task)
+
+    async def add_tasks(self, project_id: str, tasks: List[Task]) -> None:
+        return await self._call(self.storage.add_tasks, project_id, tasks)
+
+    async def get_task(self, project_id: str, task_id: str) -> Optional[Task]:
+        return await self._call(self.storage.get_task, project_id, task_id)
+
+    async def list_tasks(self, project_id: str) -> List[Task]:
+        return await self._call(self.storage.list_tasks, project_id)
+
+    async def list_tasks_page(
+        self, project_id: str, cursor: Optional[str], limit: int
+    ) -> Tuple[List[Task], Optional[str]]:
+        return await self._call(self.storage.list_tasks_page, project_id, cursor, limit)
+
+    async def count_tasks(self, project_id: str) -> int:
+        return await self._call(self.storage.count_tasks, project_id)
+
+    async def update_task(
+        self,
+        project_id: str,
+        task_id: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline: Optional[date] = None,
+    ) -> Optional[Task]:
+        return await self._call(
+            self.storage.update_task,
+            project_id,
+            task_id,
+            title=title,
+            description=description,
+            status=status,
+            deadline=deadline,
+        )
+
+    async def remove_task(self, project_id: str, task_id: str) -> bool:
+        return await self._call(self.storage.remove_task, project_id, task_id)
+
+    async def reserve_ids(self, n: int, floor: int = 0) -> int:
+        return await self._call(self.storage.reserve_ids, n, floor)
+
+    async def tasks_by_status(self, status: str, project_id: Optional[str] = None) -> List[Tuple[str, Task]]:
+        return await self._call(self.storage.tasks_by_status, status, project_id)
+
+    async def tasks_due_between(
+        self, start: date, end: date, project_id: Optional[str] = None
+    ) -> List[Tuple[str, Task]]:
+        return await self._call(self.storage.tasks_due_between, start, end, project_id)
+
+    async def overdue_tasks(self, as_of: date, project_id: Optional[str] = None) -> List[Tuple[str, Task]]:
+        return await self._call(self.storage.overdue_tasks, as_of, project_id)
+
+    async def project_summary(self, project_id: str, as_of: date) -> Optional[ProjectSummary]:
+        return await self._call(self.storage.project_summary, project_id, as_of)
+
+    async def search(self, query: str, limit: int = 50) -> List[Tuple[str, Optional[Task]]]:
+        return await self._call(self.storage.search, query, limit)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        cm = self.storage.transaction()
+        await self._call(cm.__enter__)
+        try:
+            yield
+        except BaseException as exc:
+            if not await self._call(cm.__exit__, type(exc), exc, exc.__traceback__):
+                raise
+        else:
+            await self._call(cm.__exit__, None, None, None)
+
+
+class AsyncMemoryStorage(_AsyncStorageAdapter):
+    """Runs a non-blocking Storage (e.g. MemoryStorage) directly on the event loop."""
+
+    async def _call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return fn(*args, **kwargs)
+
+
+class ExecutorStorage(_AsyncStorageAdapter):
+    """Offloads a blocking Storage (e.g. SQLiteStorage) to a thread pool.
+
+    The default single worker suits backends with one connection: calls run
+    in submission order and a transaction is entered and left on the same
+    thread. Note that calls issued by other coroutines while a transaction
+    is open run on that thread too and therefore join the transaction.
+    """
+
+    def __init__(self, storage: Storage, executor: Optional[ThreadPoolExecutor] = None) -> None:
+        super().__init__(storage)
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="todolist-storage")
+
+    async def _call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(fn, *args, **kwargs))
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
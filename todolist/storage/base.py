@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import ContextManager, List, Optional, Protocol, Tuple
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.project_summary import ProjectSummary
+from todolist.core.entities.task import Task
+
+
+class Storage(Protocol):
+    """Interface the services and validators need from a storage backend.
+
+    Every mutation goes through these methods so a backend can persist,
+    index or journal it; callers must not mutate returned entities directly.
+    """
+
+    # ---------- Projects ----------
+    def add_project(self, project: Project) -> None: ...
+
+    def get_project(self, project_id: str) -> Optional[Project]: ...
+
+    def get_all_projects(self) -> List[Project]: ...
+
+    def list_projects_page(self, cursor: Optional[str], limit: int) -> Tuple[List[Project], Optional[str]]:
+        """Up to ``limit`` projects after ``cursor`` (None = first page), plus the next cursor or None."""
+        ...
+
+    def update_project(
+        self,
+        project_id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Project]: ...
+
+    def remove_project(self, project_id: str) -> bool: ...
+
+    def find_project_by_name(self, name: str) -> Optional[Project]: ...
+
+    def count_projects(self) -> int: ...
+
+    # ---------- Tasks ----------
+    def add_task(self, project_id: str, task: Task) -> None: ...
+
+    def add_tasks(self, project_id: str, tasks: List[Task]) -> None:
+        """Add a batch of tasks at once: all of them or, on error, none."""
+        ...
+
+    def get_task(self, project_id: str, task_id: str) -> Optional[Task]: ...
+
+    def list_tasks(self, project_id: str) -> List[Task]: ...
+
+    def list_tasks_page(
+        self, project_id: str, cursor: Optional[str], limit: int
+    ) -> Tuple[List[Task], Optional[str]]:
+        """Up to ``limit`` tasks after ``cursor`` in insertion order, plus the next cursor or None.
+
+        Cursors are opaque and stay valid while other tasks are added or removed.
+        """
+        ...
+
+    def count_tasks(self, project_id: str) -> int: ...
+
+    def update_task(
+        self,
+        project_id: str,
+        task_id: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline: Optional[date] = None,
+    ) -> Optional[Task]: ...
+
+    def remove_task(self, project_id: str, task_id: str) -> bool: ...
+
+    # ---------- Ids ----------
+    def reserve_ids(self, n: int, floor: int = 0) -> int:
+        """Reserve ``n`` id numbers no lower than ``floor`` and return the first.
+
+        Reserved numbers are never returned again, also after a restart of
+        a persistent backend. See ``todolist.utils.ids.IdAllocator``.
+        """
+        ...
+
+    # ---------- Queries ----------
+    # Results are (project id, task) pairs; project_id=None searches every project.
+    def tasks_by_status(self, status: str, project_id: Optional[str] = None) -> List[Tuple[str, Task]]: ...
+
+    def tasks_due_between(
+        self, start: date, end: date, project_id: Optional[str] = None
+    ) -> List[Tuple[str, Task]]:
+        """Tasks with start <= deadline <= end, earliest deadline first."""
+        ...
+
+    def overdue_tasks(self, as_of: date, project_id: Optional[str] = None) -> List[Tuple[str, Task]]:
+        """Unfinished tasks whose deadline is before ``as_of``, earliest first."""
+        ...
+
+    def project_summary(self, project_id: str, as_of: date) -> Optional[ProjectSummary]:
+        """Live task counts of one project, or None if it does not exist."""
+        ...
+
+    def search(self, query: str, limit: int = 50) -> List[Tuple[str, Optional[Task]]]:
+        """Full-text search over project names and task titles/descriptions.
+
+        Returns (project id, task) pairs, with task None for a project-name hit.
+        """
+        ...
+
+    # ---------- Batching ----------
+    def transaction(self) -> ContextManager[None]:
+        """Group several calls into one unit; persistent backends commit once at the end."""
+        ...
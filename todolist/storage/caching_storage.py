@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.project_summary import ProjectSummary
+from todolist.core.entities.task import Task
+from todolist.storage.base import Storage
+
+
+DEFAULT_CACHE_SIZE = 10_000
+
+# Backend extras passed through as they are: none of them changes a project
+# or task, so none can leave a cached entry stale.
+_PASSED_THROUGH = frozenset(
+    {
+        "transactional", "on_rollback", "snapshot", "project_seq", "task_seq",
+        "path", "shards", "shard_of", "sync", "compact",
+    }
+)
+# Backend extras that write: wrapped so they drop the entries they touch.
+_RESTORES = frozenset({"restore_project", "restore_task"})
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachingStorage:
+    """Read-through LRU cache of projects and tasks in front of a slower Storage.
+
+    ``get_project`` and ``get_task`` are answered from one LRU holding at
+    most ``maxsize`` projects and tasks together; a miss reads the backend
+    and keeps the result, evicting the least recently used entry when full.
+    Every write through the wrapper stores its result or drops the entries
+    it touches, and an exception leaving ``transaction()`` drops them all,
+    as the backend may have rolled back. Every other call goes straight to
+    the backend. Of the backend's extras, only those in ``_PASSED_THROUGH``
+    and ``_RESTORES`` are available through the wrapper.
+
+    Writes made to the backend directly, bypassing the wrapper, are not
+    seen: wrap a backend once and use only the wrapper. Cached entities are
+    shared between callers, who must not mutate them (see Storage).
+    """
+
+    def __init__(self, backend: Storage, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        if maxsize < 1:
+            raise ValueError("The cache needs room for at least one entry.")
+        self.backend = backend
+        self.maxsize = maxsize
+        # (project id,) -> Project, (project id, task id) -> Task; most recently used last.
+        self._entries: "OrderedDict[Tuple[str, ...], Any]" = OrderedDict()
+        # project id -> ids of its cached tasks, so a project's entries are dropped without a scan.
+        self._task_ids: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names the class does not define; extras the backend lacks stay missing.
+        if name in _PASSED_THROUGH:
+            return getattr(self.backend, name)
+        if name in _RESTORES:
+            return getattr(self, "_" + name)(getattr(self.backend, name))
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def _restore_project(self, restore_project: Callable[[Project, int], None]) -> Callable[[Project, int], None]:
+        def restore(project: Project, seq: int) -> None:
+            try:
+                restore_project(project, seq)
+            finally:
+                self._dropped_project(project.id)
+
+        return restore
+
+    def _restore_task(self, restore_task: Callable[[str, Task, int], None]) -> Callable[[str, Task, int], None]:
+        def restore(project_id: str, task: Task, seq: int) -> None:
+            try:
+                restore_task(project_id, task, seq)
+            finally:
+                self._wrote((project_id, task.id))
+
+        return restore
+
+    def close(self) -> None:
+        close = getattr(self.backend, "close", None)
+        if close is not None:
+            close()
+
+    # ---------- Cache ----------
+    def cache_stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries), self.maxsize)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._writes += 1
+            self._entries.clear()
+            self._task_ids.clear()
+
+    def _read(self, key: Tuple[str, ...], load: Callable[[], Any]) -> Any:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+            self._misses += 1
+            writes = self._writes
+        value = load()
+        if value is not None:
+            with self._lock:
+                # A write that finished meanwhile may have made the value stale.
+                if self._writes == writes:
+                    self._put(key, value)
+        return value
+
+    def _put(self, key: Tuple[str, ...], value: Any) -> None:
+        entries = self._entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(key) == 2:
+            self._task_ids.setdefault(key[0], set()).add(key[1])
+        while len(entries) > self.maxsize:
+            self._unindex(entries.popitem(last=False)[0])
+            self._evictions += 1
+
+    def _pop(self, key: Tuple[str, ...]) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._unindex(key)
+
+    def _unindex(self, key: Tuple[str, ...]) -> None:
+        if len(key) == 2:
+            ids = self._task_ids[key[0]]
+            ids.discard(key[1])
+            if not ids:
+                del self._task_ids[key[0]]
+
+    def _wrote(self, key: Tuple[str, ...], value: Any = None) -> None:
+        """Record a write to ``key``: keep its new value, or drop it if None."""
+        with self._lock:
+            self._writes += 1
+            if value is None:
+                self._pop(key)
+            else:
+                self._put(key, value)
+
+    def _dropped_project(self, project_id: str) -> None:
+        """Drop a project and its cached tasks."""
+        with self._lock:
+            self._writes += 1
+            self._entries.pop((project_id,), None)
+            for task_id in self._task_ids.pop(project_id, ()):
+                del self._entries[(project_id, task_id)]
+
+    # ---------- Batching ----------
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        try:
+            with self.backend.transaction():
+                yield
+        except BaseException:
+            self.clear()
+            raise
+
+    # ---------- Projects ----------
+    def add_project(self, project: Project) -> None:
+        try:
+            self.backend.add_project(project)
+        finally:
+            # Not cached as given: backends differ in what get_project returns (tasks loaded or not).
+            # Its tasks need no dropping: missing ones are never cached, and remove_project drops the rest.
+            self._wrote((project.id,))
+
+    def get_project(self, project_id: str) -> Optional[Project]:
+        return self._read((project_id,), lambda: self.backend.get_project(project_id))
+
+    def get_all_projects(self) -> List[Project]:
+        return self.backend.get_all_projects()
+
+    def list_projects_page(self, cursor: Optional[str], limit: int) -> Tuple[List[Project], Optional[str]]:
+        return self.backend.list_projects_page(cursor, limit)
+
+    def update_project(
+        self,
+        project_id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Project]:
+        proj = None
+        try:
+            proj = self.backend.update_project(project_id, name=name, description=description)
+            return proj
+        finally:
+            self._wrote((project_id,), proj)
+
+    def remove_project(self, project_id: str) -> bool:
+        try:
+            return self.backend.remove_project(project_id)
+        finally:
+            self._dropped_project(project_id)
+
+    def find_project_by_name(self, name: str) -> Optional[Project]:
+        return self.backend.find_project_by_name(name)
+
+    def count_projects(self) -> int:
+        return self.backend.count_projects()
+
+    # ---------- Tasks ----------
+    def add_task(self, project_id: str, task: Task) -> None:
+        added = None
+        try:
+            self.backend.add_task(project_id, task)
+            added = task
+        finally:
+            self._wrote((project_id, task.id), added)
+
+    def add_tasks(self, project_id: str, tasks: List[Task]) -> None:
+        # Not cached: a bulk import would only push the hot entries out.
+        try:
+            self.backend.add_tasks(project_id, tasks)
+        finally:
+            with self._lock:
+                self._writes += 1
+                for t in tasks:
+                    self._pop((project_id, t.id))
+
+    def get_task(self, project_id: str, task_id: str) -> Optional[Task]:
+        return self._read((project_id, task_id), lambda: self.backend.get_task(project_id, task_id))
+
+    def list_tasks(self, project_id: str) -> List[Task]:
+        return self.backend.list_tasks(project_id)
+
+    def list_tasks_page(
+        self, project_id: str, cursor: Optional[str], limit: int
+    ) -> Tuple[List[Task], Optional[str]]:
+        return self.backend.list_tasks_page(project_id, cursor, limit)
+
+    def count_tasks(self, project_id: str) -> int:
+        return self.backend.count_tasks(project_id)
+
+    def update_task(
+        self,
+        project_id: str,
+        task_id: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline: Optional[date] = None,
+    ) -> Optional[Task]:
+        task = None
+        try:
+            task = self.backend.update_task(project_id, task_id, title, description, status, deadline)
+            return task
+        finally:
+            self._wrote((project_id, task_id), task)
+
+    def remove_task(self, project_id: str, task_id: str) -> bool:
+        try:
+            return self.backend.remove_task(project_id, task_id)
+        finally:
+            self._wrote((project_id, task_id))
+
+    # ---------- Ids ----------
+    def reserve_ids(self, n: int, floor: int = 0) -> int:
+        return self.backend.reserve_ids(n, floor)
+
+    # ---------- Queries ----------
+    def tasks_by_status(self, status: str, project_id: Optional[str] = None) -> List[Tuple[str, Task]]:
+        return self.backend.tasks_by_status(status, project_id)
+
+    def tasks_due_between(
+        self, start: date, end: date, project_id: Optional[str] = None
+    ) -> List[Tuple[str, Task]]:
+        return self.backend.tasks_due_between(start, end, project_id)
+
+    def overdue_tasks(self, as_of: date, project_id: Optional[str] = None) -> List[Tuple[str, Task]]:
+        return self.backend.overdue_tasks(as_of, project_id)
+
+    def project_summary(self, project_id: str, as_of: date) -> Optional[ProjectSummary]:
+        return self.backend.project_summary(project_id, as_of)
+
+    def search(self, query: str, limit: int = 50) -> List[Tuple[str, Optional[Task]]]:
+        return self.backend.search(query, limit)
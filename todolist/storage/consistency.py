@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import List, Optional
+
+from todolist.core.entities.page import iter_pages
+from todolist.core.entities.project_summary import ProjectSummary
+from todolist.storage.base import Storage
+
+
+def check_summaries(storage: Storage, as_of: Optional[date] = None) -> List[str]:
+    """Compare every project's maintained summary with a full recount of its tasks.
+
+    Returns one message per disagreeing project; an empty list means the
+    counters are consistent. Run it while no writers are active.
+    """
+    as_of = as_of or date.today()
+    problems = []
+    for proj in iter_pages(lambda cursor: storage.list_projects_page(cursor, 500)):
+        live = storage.project_summary(proj.id, as_of)
+        tasks = iter_pages(lambda cursor: storage.list_tasks_page(proj.id, cursor, 500))
+        expected = ProjectSummary.from_tasks(proj.id, tasks, as_of)
+        if live != expected:
+            problems.append(f"{proj.id}: maintained {live!r} != recounted {expected!r}")
+    return problems
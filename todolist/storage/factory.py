@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+
+from todolist.storage.base import Storage
+from todolist.utils.settings import get_settings
+
+
+def open_storage_from_env() -> Storage:
+    """Pick the backend from DATABASE_PATH / JOURNAL_PATH, defaulting to memory.
+
+    STORAGE_SHARDS above 1 splits the journal or memory backend across that
+    many worker processes, unless there is a single CPU for them to share.
+    A journal already split into shards must be opened with as many.
+    STORAGE_CACHE_SIZE above 0 puts an LRU of that
+    many projects and tasks in front of the SQLite or sharded backend; the
+    others already answer reads from memory.
+    """
+    settings = get_settings()
+    database_path = settings.database_path
+    if database_path:
+        from todolist.storage.sqlite_storage import SQLiteStorage
+
+        return _cached(SQLiteStorage(database_path), settings.storage_cache_size)
+
+    journal_path = settings.journal_path
+    manifest = _shard_manifest(journal_path) if journal_path else None
+    split = manifest is not None and os.path.exists(manifest)
+    shards = settings.storage_shards
+    # On one core the shard processes only take turns, adding the process hop.
+    if shards > 1 and (os.cpu_count() != 1 or split):
+        from functools import partial
+
+        from todolist.storage.sharded_storage import ShardedStorage, journal_shard, memory_shard
+
+        make_shard = partial(journal_shard, journal_path) if journal_path else memory_shard
+        return _cached(ShardedStorage(shards, make_shard, manifest), settings.storage_cache_size)
+
+    if journal_path:
+        if split:
+            raise ValueError(f"{journal_path} is split into shards (see {manifest}); set STORAGE_SHARDS to match.")
+        from todolist.storage.journal_storage import JournalStorage
+
+        return JournalStorage(journal_path)
+
+    from todolist.core.validators.project_validator import MemoryStorageSingleton
+
+    return MemoryStorageSingleton.get_instance()
+
+
+def _shard_manifest(journal_path: str) -> str:
+    """Where the shard count of ``<journal_path>.<n>`` journals is kept."""
+    return journal_path + ".shards"
+
+
+def _cached(storage: Storage, size: int) -> Storage:
+    if size <= 0:
+        return storage
+    from todolist.storage.caching_storage import CachingStorage
+
+    return CachingStorage(storage, size)
+
+
+def close_storage(storage: Storage) -> None:
+    close = getattr(storage, "close", None)
+    if close is not None:
+        close()
@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import weakref
+from contextlib import ExitStack, contextmanager
+from datetime import date
+from typing import Any, Iterator, List, Optional, Tuple
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.task import Task
+from todolist.core.entities.task_collection import TaskCollection
+from todolist.storage.memory_storage import MemoryStorage
+
+
+def _encode_task(task: Task) -> list:
+    dl = task.deadline.isoformat() if task.deadline else None
+    return [task.id, task.title, task.description, task.status, dl]
+
+
+def _decode_task(row: list) -> Task:
+    tid, title, desc, status, dl = row
+    deadline = date.fromisoformat(dl) if dl else None
+    return Task(id=tid, title=title, description=desc, status=status, deadline=deadline)
+
+
+def _encode_project(project: Project) -> list:
+    return [project.id, project.name, project.description, [_encode_task(t) for t in project.tasks]]
+
+
+def _decode_project(row: list) -> Project:
+    pid, name, desc, tasks = row
+    return Project(id=pid, name=name, description=desc, tasks=[_decode_task(t) for t in tasks])
+
+
+def _encode_placed(project: Project, seq: int) -> list:
+    # With its sequence number and its tasks', so it is listed exactly as before.
+    tasks = project.tasks
+    return [*_encode_project(project), seq, [tasks.seq_of(t.id) for t in tasks], tasks.next_seq]
+
+
+def _decode_placed(row: list) -> Tuple[Project, int]:
+    pid, name, desc, tasks, seq, task_seqs, next_seq = row
+    collection = TaskCollection()
+    for task, task_seq in zip(tasks, task_seqs):
+        collection.restore(_decode_task(task), task_seq)
+    collection.advance(next_seq)
+    return Project(id=pid, name=name, description=desc, tasks=collection), seq
+
+
+def _flusher(ref: "weakref.ref[JournalStorage]", stop: threading.Event, interval: float) -> None:
+    # Holds the storage only while syncing, so an unclosed storage can still be collected.
+    while not stop.wait(interval):
+        storage = ref()
+        if storage is None:
+            return
+        storage._sync_if_due()
+        del storage
+
+
+class JournalStorage(MemoryStorage):
+    """MemoryStorage that survives restarts by journaling every mutation.
+
+    Each mutation is appended to ``path`` as one JSON line, and the mutations
+    made inside ``transaction()`` as a single line together. Every record is
+    handed to the OS as soon as it is written, so a crash of the process
+    loses nothing; fsync is grouped: the journal is synced once
+    ``sync_every`` records are pending or ``sync_interval`` seconds have
+    passed since the last sync, whichever comes first (``sync_every=1``
+    syncs every write). A background thread syncs records still pending
+    after ``sync_interval`` when no further write comes. After ``compact_every``
+    records the whole state is written to ``path + ".snapshot"`` and the
+    journal is truncated. On start the snapshot is loaded and the journal is
+    replayed on top of it. The snapshot keeps every sequence number, so
+    projects and tasks are listed in the same order after a restart.
+
+    Writes keep MemoryStorage's per-project locking: a change is applied and
+    journaled under its project's stripe lock, so each project's records are
+    in the order its changes were applied, and writers to different projects
+    meet only on the short append to the file; fsync happens outside both.
+    Creating, renaming and removing projects and reserving ids also take one
+    catalog lock, since their order matters across projects (names stay
+    unique, ids are never handed out twice). ``transaction()`` and
+    ``compact()`` take every lock.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sync_every: int = 256,
+        sync_interval: float = 0.05,
+        compact_every: int = 500_000,
+    ) -> None:
+        super().__init__()
+        self.path = path
+        self.snapshot_path = path + ".snapshot"
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.compact_every = compact_every
+        self._seq = 0
+        self._pending = 0
+        self._since_compact = 0
+        self._tx_depth = 0
+        self._unit: List[list] = []
+        self._catalog_lock = threading.RLock()  # project names and ids, ordered across projects
+        self._sync_lock = threading.RLock()  # the file itself: syncing, swapping it on compaction
+        self._log_lock = threading.RLock()  # appends, sequence numbers and counters
+        self._last_sync = time.monotonic()
+        self._load()
+        self._log = open(self.path, "a", encoding="utf-8")
+        self._stop_flusher = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if sync_every > 1 and sync_interval > 0:
+            self._flusher = threading.Thread(
+                target=_flusher,
+                args=(weakref.ref(self), self._stop_flusher, sync_interval),
+                name="todolist-journal-sync",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    # ---------- Recovery ----------
+    def _load(self) -> None:
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "r", encoding="utf-8") as fh:
+                snap = json.load(fh)
+            for row in snap["projects"]:
+                if len(row) > 4:
+                    MemoryStorage.restore_project(self, *_decode_placed(row))
+                else:
+                    MemoryStorage.add_project(self, _decode_project(row))
+            self._project_order.advance(snap.get("project_next", 0))
+            self._seq = snap["seq"]
+            self._ids_end = snap.get("ids", 0)
+
+        if not os.path.exists(self.path):
+            return
+        good_offset = 0
+        with open(self.path, "rb") as fh:
+            for raw in fh:
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(raw)
+                except ValueError:
+                    # A torn tail from a crash mid-write; everything before it is intact.
+                    break
+                good_offset += len(raw)
+                seq, op, args = record[0], record[1], record[2:]
+                if seq <= self._seq:
+                    continue
+                self._apply(op, args)
+                self._seq = seq
+                self._since_compact += 1
+        if good_offset < os.path.getsize(self.path):
+            with open(self.path, "r+b") as fh:
+                fh.truncate(good_offset)
+
+    def _apply(self, op: str, args: List[Any]) -> None:
+        if op == "add_project":
+            MemoryStorage.add_project(self, _decode_project(args[0]))
+        elif op == "update_project":
+            MemoryStorage.update_project(self, args[0], name=args[1], description=args[2])
+        elif op == "remove_project":
+            MemoryStorage.remove_project(self, args[0])
+        elif op == "add_task":
+            MemoryStorage.add_task(self, args[0], _decode_task(args[1]))
+        elif op == "add_tasks":
+            MemoryStorage.add_tasks(self, args[0], [_decode_task(t) for t in args[1]])
+        elif op == "update_task":
+            pid, tid, title, desc, status, dl = args
+            deadline = date.fromisoformat(dl) if dl else None
+            MemoryStorage.update_task(self, pid, tid, title, desc, status, deadline)
+        elif op == "remove_task":
+            MemoryStorage.remove_task(self, args[0], args[1])
+        elif op == "restore_project":
+            MemoryStorage.restore_project(self, *_decode_placed(args[0]))
+        elif op == "restore_task":
+            MemoryStorage.restore_task(self, args[0], _decode_task(args[1]), args[2])
+        elif op == "reserve_ids":
+            MemoryStorage.reserve_ids(self, 0, args[0])
+        elif op == "unit":
+            for record in args[0]:
+                self._apply(record[0], record[1:])
+        else:
+            raise ValueError(f"Unknown journal operation: {op!r}")
+
+    # ---------- Journal writes ----------
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Hold off every writer; stripes are taken in order, then the catalog."""
+        with ExitStack() as stack:
+            for lock in self._stripes:
+                stack.enter_context(lock)
+            stack.enter_context(self._catalog_lock)
+            yield
+
+    def _append(self, op: str, *args: Any) -> None:
+        # The caller holds the lock(s) of what it changed.
+        with self._log_lock:
+            if self._tx_depth:
+                self._unit.append([op, *args])
+                return
+            self._write(op, *args)
+            self._log.flush()
+
+    def _after_write(self) -> None:
+        # Called with no lock held, so a sync or compaction does not stall the project.
+        if self._tx_depth:
+            return
+        if self._pending >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+        if self._since_compact >= self.compact_every:
+            with self._exclusive():
+                if self._since_compact >= self.compact_every:
+                    self.compact()
+
+    def _write(self, op: str, *args: Any) -> None:
+        self._seq += 1
+        self._log.write(json.dumps([self._seq, op, *args], separators=(",", ":")))
+        self._log.write("\n")
+        self._pending += 1
+        self._since_compact += 1
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Journal the enclosed writes as one record, fsynced once when the outermost block exits.
+
+        A crash replays all of the block or none of it. Every write lock is
+        held throughout, so other threads' writes wait rather than joining
+        the record. Writes are journaled even when the block raises, because
+        they have already been applied in memory.
+        """
+        with self._exclusive():
+            self._tx_depth += 1
+            try:
+                yield
+            finally:
+                self._tx_depth -= 1
+                if not self._tx_depth:
+                    with self._log_lock:
+                        unit, self._unit = self._unit, []
+                        if len(unit) == 1:
+                            self._write(*unit[0])
+                        elif unit:
+                            self._write("unit", unit)
+                    self.sync()
+                    if self._since_compact >= self.compact_every:
+                        self.compact()
+
+    def sync(self) -> None:
+        """Flush and fsync every pending journal record."""
+        with self._sync_lock:
+            with self._log_lock:
+                pending = self._pending
+                if pending:
+                    self._log.flush()
+                    self._pending = 0
+                self._last_sync = time.monotonic()
+            # Appends go on meanwhile; the file cannot be swapped under us.
+            if pending:
+                os.fsync(self._log.fileno())
+
+    def _sync_if_due(self) -> None:
+        with self._sync_lock:
+            if self._pending and not self._log.closed and time.monotonic() - self._last_sync >= self.sync_interval:
+                self.sync()
+
+    def compact(self) -> None:
+        """Write a snapshot of the current state and truncate the journal."""
+        with self._exclusive(), self._sync_lock, self._log_lock:
+            self.sync()
+            order = self._project_order
+            tmp = self.snapshot_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(
+                    {
+                        "seq": self._seq,
+                        "ids": self._ids_end,
+                        "project_next": order.next_seq,
+                        "projects": [_encode_placed(p, order.seq_of(p.id)) for p in self.projects.values()],
+                    },
+                    fh,
+                    separators=(",", ":"),
+                )
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp, self.snapshot_path)
+            # Records up to self._seq are in the snapshot, so replaying a
+            # journal left behind by a crash right here is harmless.
+            self._log.close()
+            self._log = open(self.path, "w", encoding="utf-8")
+            os.fsync(self._log.fileno())
+            self._since_compact = 0
+
+    def close(self) -> None:
+        self._stop_flusher.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        with self._sync_lock:
+            if self._log.closed:
+                return
+            self.sync()
+            self._log.close()
+
+    def __enter__(self) -> "JournalStorage":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # ---------- Mutations ----------
+    def add_project(self, project: Project) -> None:
+        with self._lock_for(project.id), self._catalog_lock:
+            super().add_project(project)
+            self._append("add_project", _encode_project(project))
+        self._after_write()
+
+    def update_project(
+        self,
+        project_id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Project]:
+        with self._lock_for(project_id), self._catalog_lock:
+            proj = super().update_project(project_id, name=name, description=description)
+            if proj is not None:
+                self._append("update_project", project_id, name, description)
+        self._after_write()
+        return proj
+
+    def remove_project(self, project_id: str) -> bool:
+        with self._lock_for(project_id), self._catalog_lock:
+            removed = super().remove_project(project_id)
+            if removed:
+                self._append("remove_project", project_id)
+        self._after_write()
+        return removed
+
+    def add_task(self, project_id: str, task: Task) -> None:
+        with self._lock_for(project_id):
+            super().add_task(project_id, task)
+            self._append("add_task", project_id, _encode_task(task))
+        self._after_write()
+
+    def add_tasks(self, project_id: str, tasks: List[Task]) -> None:
+        with self._lock_for(project_id):
+            super().add_tasks(project_id, tasks)
+            # One record, so a crash mid-write loses the whole batch or none of it.
+            self._append("add_tasks", project_id, [_encode_task(t) for t in tasks])
+        self._after_write()
+
+    def update_task(
+        self,
+        project_id: str,
+        task_id: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline: Optional[date] = None,
+    ) -> Optional[Task]:
+        with self._lock_for(project_id):
+            task = super().update_task(project_id, task_id, title, description, status, deadline)
+            if task is not None:
+                dl = deadline.isoformat() if deadline else None
+                self._append("update_task", project_id, task_id, title, description, status, dl)
+        self._after_write()
+        return task
+
+    def remove_task(self, project_id: str, task_id: str) -> bool:
+        with self._lock_for(project_id):
+            removed = super().remove_task(project_id, task_id)
+            if removed:
+                self._append("remove_task", project_id, task_id)
+        self._after_write()
+        return removed
+
+    def restore_project(self, project: Project, seq: int) -> None:
+        with self._lock_for(project.id), self._catalog_lock:
+            super().restore_project(project, seq)
+            self._append("restore_project", _encode_placed(project, seq))
+        self._after_write()
+
+    def restore_task(self, project_id: str, task: Task, seq: int) -> None:
+        with self._lock_for(project_id):
+            super().restore_task(project_id, task, seq)
+            self._append("restore_task", project_id, _encode_task(task), seq)
+        self._after_write()
+
+    # ---------- Ids ----------
+    def reserve_ids(self, n: int, floor: int = 0) -> int:
+        # Journaled before any write using the ids, so replay never hands them out again.
+        with self._catalog_lock:
+            start = super().reserve_ids(n, floor)
+            self._append("reserve_ids", start + n)
+        self._after_write()
+        return start
@@ -1,33 +1,643 @@
 from __future__ import annotations
 
-from typing import Dict, Optional, List
+import threading
+import weakref
+from bisect import bisect_right
+from contextlib import ExitStack, contextmanager
+from datetime import date
+from operator import itemgetter
+from typing import Callable, Dict, Hashable, Iterable, Iterator, Mapping, Optional, List, Tuple, TypeVar
 from todolist.core.entities.project import Project
-from todolist.core.entities.task import Task
+from todolist.core.entities.project_summary import ProjectSummary
+from todolist.core.entities.task import STATUSES, Task
+from todolist.core.entities.task_collection import TaskCollection
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.exceptions.not_found import NotFoundError
+from todolist.storage.search_index import SearchIndex
+from todolist.storage.task_index import TaskIndex
+from todolist.utils.seq_order import SeqOrder
+
+
+K = TypeVar("K", bound=Hashable)
+
+
+def _decode_cursor(cursor: Optional[str]) -> int:
+    if cursor is None:
+        return 0
+    try:
+        return int(cursor)
+    except ValueError:
+        raise InvalidEntityError("Invalid cursor.") from None
+
+
+def _merge_saved(
+    live: Callable[[int, int], List[Tuple[int, K]]],
+    saved: Mapping[K, Optional[tuple]],
+    after: int,
+    limit: int,
+) -> List[Tuple[int, K]]:
+    """Up to ``limit`` (seq, key) pairs after ``after`` as a snapshot sees them.
+
+    ``live(after, limit)`` lists the storage's current pairs. Keys in
+    ``saved`` are skipped there and placed by their saved ``(seq, ...)``
+    entry instead; a None entry means the key did not exist yet.
+    """
+    out: List[Tuple[int, K]] = []
+    cursor = after
+    bound: Optional[int] = None
+    while True:
+        chunk = live(cursor, limit)
+        out.extend(entry for entry in chunk if entry[1] not in saved)
+        if len(chunk) < limit:
+            break
+        cursor = chunk[-1][0]
+        if len(out) >= limit:
+            # Later live keys sort after ``cursor``; so must the saved ones used.
+            bound = cursor
+            break
+    for key, entry in saved.items():
+        if entry is not None and after < entry[0] and (bound is None or entry[0] <= bound):
+            out.append((entry[0], key))
+    out.sort(key=itemgetter(0))
+    return out[:limit]
+
+
+class Snapshot:
+    """Read-only view of a MemoryStorage's projects and tasks at one moment.
+
+    Taking one copies nothing. While it is referenced, a writer about to
+    change a project or task first saves it here as it was (once per
+    snapshot); reads merge those saved values over the live state. With no
+    snapshot alive, writers skip all of this. Reads are consistent with each
+    other whatever writers do meanwhile, and cursors are the storage's own,
+    so a listing can switch between a snapshot and the live storage.
+    Projects come back without their tasks (use the task methods) and tasks
+    come back as copies.
+    """
+
+    __slots__ = ("_storage", "_projects", "_tasks", "_removed", "__weakref__")
+
+    def __init__(self, storage: MemoryStorage) -> None:
+        self._storage = storage
+        # project id -> (seq, name, description) before its first change; None if it did not exist.
+        self._projects: Dict[str, Optional[Tuple[int, str, str]]] = {}
+        # project id -> task id -> (seq, task copy) before its first change; None if it did not exist.
+        self._tasks: Dict[str, Dict[str, Optional[Tuple[int, Task]]]] = {}
+        # Projects removed or replaced since: all their tasks, in order (also kept in ``_tasks``).
+        self._removed: Dict[str, List[Tuple[int, Task]]] = {}
+
+    # ---------- Saving (called by writers, under the locks of what they change) ----------
+    def _frozen(self, project_id: str) -> bool:
+        """True once the project's tasks are no longer read from the live storage."""
+        return project_id in self._removed or (project_id in self._projects and self._projects[project_id] is None)
+
+    def _save_project(self, project_id: str, project: Optional[Project], seq: Optional[int]) -> None:
+        if project_id not in self._projects:
+            self._projects[project_id] = (seq, project.name, project.description) if project is not None else None
+
+    def _save_task(self, project_id: str, task_id: str, task: Optional[Task], seq: Optional[int]) -> None:
+        if self._frozen(project_id):
+            return
+        saved = self._tasks.setdefault(project_id, {})
+        if task_id not in saved:
+            saved[task_id] = (seq, task.copy()) if task is not None else None
+
+    def _freeze(self, project_id: str, tasks: TaskCollection) -> None:
+        """Keep every task the project had, before it is removed or replaced."""
+        if self._frozen(project_id):
+            return
+        saved = self._tasks.get(project_id, {})
+        entries = self._task_entries(tasks, saved, 0, len(tasks) + len(saved))
+        self._tasks[project_id] = {task.id: (seq, task) for seq, task in entries}
+        self._removed[project_id] = entries
+
+    # ---------- Projects ----------
+    def _project(self, project_id: str) -> Optional[Project]:
+        if project_id in self._projects:
+            saved = self._projects[project_id]
+            return Project(id=project_id, name=saved[1], description=saved[2]) if saved is not None else None
+        live = self._storage.projects.get(project_id)
+        return Project(id=project_id, name=live.name, description=live.description) if live is not None else None
+
+    def count_projects(self) -> int:
+        storage = self._storage
+        with storage._projects_lock:
+            existed = sum(1 for saved in self._projects.values() if saved is not None)
+            exists = sum(1 for pid in self._projects if pid in storage.projects)
+            return len(storage.projects) + existed - exists
+
+    def get_project(self, project_id: str) -> Optional[Project]:
+        with self._storage._projects_lock:
+            return self._project(project_id)
+
+    def iter_projects(self) -> Iterator[Project]:
+        after = 0
+        while True:
+            page, after_next = self.list_projects_page(str(after), 1000)
+            yield from page
+            if after_next is None:
+                return
+            after = int(after_next)
+
+    def list_projects_page(self, cursor: Optional[str], limit: int) -> Tuple[List[Project], Optional[str]]:
+        after = _decode_cursor(cursor)
+        storage = self._storage
+        with storage._projects_lock:
+            keys = _merge_saved(storage._project_order.after, self._projects, after, limit + 1)
+            projects = [self._project(pid) for _, pid in keys[:limit]]
+        next_cursor = str(keys[limit - 1][0]) if len(keys) > limit else None
+        return projects, next_cursor
+
+    # ---------- Tasks ----------
+    def _live(self, project_id: str) -> Optional[Project]:
+        """The live project this snapshot reads tasks through, if any; needs its stripe."""
+        return None if self._frozen(project_id) else self._storage.projects.get(project_id)
+
+    @staticmethod
+    def _task_entries(
+        tasks: TaskCollection, saved: Dict[str, Optional[Tuple[int, Task]]], after: int, limit: int
+    ) -> List[Tuple[int, Task]]:
+        if not saved:
+            return [(seq, task.copy()) for seq, task in tasks.entries(after, limit)]
+        keys = _merge_saved(tasks.ids_after, saved, after, limit)
+        return [(seq, saved[tid][1] if tid in saved else tasks.get(tid).copy()) for seq, tid in keys]
+
+    def _entries(self, project_id: str, after: int, limit: int) -> List[Tuple[int, Task]]:
+        with self._storage._lock_for(project_id):
+            removed = self._removed.get(project_id)
+            if removed is not None:
+                i = bisect_right(removed, after, key=itemgetter(0))
+                return removed[i:i + limit]
+            proj = self._live(project_id)
+            if proj is None:
+                return []
+            return self._task_entries(proj.tasks, self._tasks.get(project_id, {}), after, limit)
+
+    def count_tasks(self, project_id: str) -> int:
+        with self._storage._lock_for(project_id):
+            removed = self._removed.get(project_id)
+            if removed is not None:
+                return len(removed)
+            proj = self._live(project_id)
+            if proj is None:
+                return 0
+            saved = self._tasks.get(project_id, {})
+            existed = sum(1 for entry in saved.values() if entry is not None)
+            exists = sum(1 for tid in saved if tid in proj.tasks)
+            return len(proj.tasks) + existed - exists
+
+    def get_task(self, project_id: str, task_id: str) -> Optional[Task]:
+        with self._storage._lock_for(project_id):
+            saved = self._tasks.get(project_id, {})
+            if task_id in saved:
+                entry = saved[task_id]
+                return entry[1] if entry is not None else None
+            proj = self._live(project_id)
+            task = proj.get_task(task_id) if proj is not None else None
+            return task.copy() if task is not None else None
+
+    def iter_tasks(self, project_id: str) -> Iterator[Task]:
+        """A project's tasks in insertion order, read a page at a time."""
+        after = 0
+        while True:
+            entries = self._entries(project_id, after, 1000)
+            for _, task in entries:
+                yield task
+            if len(entries) < 1000:
+                return
+            after = entries[-1][0]
+
+    def list_tasks_page(
+        self, project_id: str, cursor: Optional[str], limit: int
+    ) -> Tuple[List[Task], Optional[str]]:
+        entries = self._entries(project_id, _decode_cursor(cursor), limit + 1)
+        next_cursor = str(entries[limit - 1][0]) if len(entries) > limit else None
+        return [task for _, task in entries[:limit]], next_cursor
+
+    def project_summary(self, project_id: str, as_of: date) -> Optional[ProjectSummary]:
+        if self.get_project(project_id) is None:
+            return None
+        return ProjectSummary.from_tasks(project_id, self.iter_tasks(project_id), as_of)
 
 
 class MemoryStorage:
-    """Simple in-memory storage singleton-ish instance (you can instantiate normally)."""
+    """Simple in-memory storage singleton-ish instance (you can instantiate normally).
 
-    def __init__(self) -> None:
+    Safe to share between threads. Task operations lock only the stripe their
+    project hashes to, so writers to different projects rarely contend.
+    Project-level changes additionally take a short lock over the project
+    table and name index. Locks are always taken stripe -> projects ->
+    search, never the other way round.
+
+    Entities are changed in place. While a ``snapshot`` is referenced, each
+    write first saves the old value of what it changes into that snapshot.
+    """
+
+    def __init__(self, lock_stripes: int = 64) -> None:
         self.projects: Dict[str, Project] = {}
+        self._ids_by_name: Dict[str, str] = {}
+        self._indexes: Dict[str, TaskIndex] = {}
+        # Built by the first search(); until then writes skip it.
+        self._search: Optional[SearchIndex] = None
+        self._project_order: SeqOrder[str] = SeqOrder()
+        self._stripes = [threading.RLock() for _ in range(lock_stripes)]
+        self._projects_lock = threading.RLock()
+        self._search_lock = threading.Lock()
+        self._snapshots: "weakref.WeakSet[Snapshot]" = weakref.WeakSet()
+        self._ids_end = 0
+        self._ids_lock = threading.Lock()
+
+    def _lock_for(self, project_id: str) -> threading.RLock:
+        return self._stripes[hash(project_id) % len(self._stripes)]
+
+    @contextmanager
+    def _all_stripes(self) -> Iterator[None]:
+        """Hold every stripe, taken in order, shutting out all task writers."""
+        with ExitStack() as stack:
+            for lock in self._stripes:
+                stack.enter_context(lock)
+            yield
 
+    # ---------- Projects ----------
     def add_project(self, project: Project) -> None:
-        self.projects[project.id] = project
+        self._put_project(project)
+
+    def _put_project(self, project: Project, seq: Optional[int] = None) -> None:
+        with self._lock_for(project.id), self._projects_lock:
+            owner = self._ids_by_name.get(project.name)
+            if owner is not None and owner != project.id:
+                raise InvalidEntityError("Project name must be unique.")
+            old = self.projects.get(project.id)
+            self._save_project(project.id, tasks_too=old is not None)
+            if old is not None:
+                self._ids_by_name.pop(old.name, None)
+            self.projects[project.id] = project
+            if seq is not None and seq < self._project_order.next_seq:
+                self._project_order.add(project.id, seq)
+                # Back in the middle: keep the dict in listing order too.
+                projects = self.projects
+                self.projects = {pid: projects[pid] for _, pid in self._project_order.after(0, len(projects))}
+            else:
+                self._project_order.add(project.id, seq)
+            self._ids_by_name[project.name] = project.id
+            index = TaskIndex()
+            for t in project.tasks:
+                index.add(t)
+            self._indexes[project.id] = index
+            with self._search_lock:
+                if self._search is not None:
+                    if old is not None:
+                        self._search.remove_project(project.id)
+                    self._index_project(self._search, project)
 
     def get_project(self, project_id: str) -> Optional[Project]:
         return self.projects.get(project_id)
 
     def get_all_projects(self) -> List[Project]:
-        return list(self.projects.values())
+        with self._projects_lock:
+            return list(self.projects.values())
+
+    def list_projects_page(self, cursor: Optional[str], limit: int) -> Tuple[List[Project], Optional[str]]:
+        after = _decode_cursor(cursor)
+        with self._projects_lock:
+            entries = self._project_order.after(after, limit + 1)
+            projects = [self.projects[pid] for _, pid in entries[:limit]]
+        next_cursor = str(entries[limit - 1][0]) if len(entries) > limit else None
+        return projects, next_cursor
+
+    def update_project(
+        self,
+        project_id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Project]:
+        """Apply changes to a stored project, keeping the name index in sync."""
+        with self._lock_for(project_id), self._projects_lock:
+            proj = self.projects.get(project_id)
+            if proj is None:
+                return None
+            self._save_project(project_id)
+            if name is not None and name != proj.name:
+                owner = self._ids_by_name.get(name)
+                if owner is not None and owner != project_id:
+                    raise InvalidEntityError("Project name must be unique.")
+                if self._ids_by_name.get(proj.name) == project_id:
+                    del self._ids_by_name[proj.name]
+                proj.name = name
+                self._ids_by_name[name] = project_id
+                with self._search_lock:
+                    if self._search is not None:
+                        self._search.put((project_id, None), name)
+            if description is not None:
+                proj.description = description
+            return proj
 
     def remove_project(self, project_id: str) -> bool:
-        if project_id in self.projects:
+        with self._lock_for(project_id), self._projects_lock:
+            proj = self.projects.get(project_id)
+            if proj is None:
+                return False
+            self._save_project(project_id, tasks_too=True)
             del self.projects[project_id]
+            self._project_order.remove(project_id)
+            if self._ids_by_name.get(proj.name) == project_id:
+                del self._ids_by_name[proj.name]
+            del self._indexes[project_id]
+            with self._search_lock:
+                if self._search is not None:
+                    self._search.remove_project(project_id)
             return True
-        return False
+
+    def count_projects(self) -> int:
+        return len(self.projects)
 
     def find_project_by_name(self, name: str) -> Optional[Project]:
-        for p in self.projects.values():
-            if p.name == name:
-                return p
-        return None
\ No newline at end of file
+        project_id = self._ids_by_name.get(name)
+        if project_id is None:
+            return None
+        return self.projects.get(project_id)
+
+    # ---------- Tasks ----------
+    def add_task(self, project_id: str, task: Task) -> None:
+        with self._lock_for(project_id):
+            proj = self.projects.get(project_id)
+            if proj is None:
+                raise NotFoundError("Project not found.")
+            self._save_tasks(proj, (task.id,))
+            proj.add_task(task)
+            self._indexes[project_id].add(task)
+            with self._search_lock:
+                if self._search is not None:
+                    self._search.put((project_id, task.id), task.title, task.description)
+
+    def add_tasks(self, project_id: str, tasks: List[Task]) -> None:
+        with self._lock_for(project_id):
+            proj = self.projects.get(project_id)
+            if proj is None:
+                raise NotFoundError("Project not found.")
+            ids = {task.id for task in tasks}
+            if len(ids) != len(tasks) or any(tid in proj.tasks for tid in ids):
+                raise InvalidEntityError("Task id must be unique within its project.")
+            self._save_tasks(proj, ids)
+            for task in tasks:
+                proj.add_task(task)
+            self._indexes[project_id].add_many(tasks)
+            with self._search_lock:
+                if self._search is not None:
+                    self._search.put_new(((project_id, t.id), t.title, t.description) for t in tasks)
+
+    def get_task(self, project_id: str, task_id: str) -> Optional[Task]:
+        proj = self.projects.get(project_id)
+        if proj is None:
+            return None
+        return proj.get_task(task_id)
+
+    def list_tasks(self, project_id: str) -> List[Task]:
+        with self._lock_for(project_id):
+            proj = self.projects.get(project_id)
+            if proj is None:
+                return []
+            return proj.tasks.copy()
+
+    def list_tasks_page(
+        self, project_id: str, cursor: Optional[str], limit: int
+    ) -> Tuple[List[Task], Optional[str]]:
+        after = _decode_cursor(cursor)
+        with self._lock_for(project_id):
+            proj = self.projects.get(project_id)
+            if proj is None:
+                return [], None
+            tasks, next_seq = proj.tasks.page(after, limit)
+        return tasks, (str(next_seq) if next_seq is not None else None)
+
+    def count_tasks(self, project_id: str) -> int:
+        proj = self.projects.get(project_id)
+        if proj is None:
+            return 0
+        return len(proj.tasks)
+
+    def update_task(
+        self,
+        project_id: str,
+        task_id: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline: Optional[date] = None,
+    ) -> Optional[Task]:
+        """Apply already-validated changes to a stored task. None means unchanged."""
+        with self._lock_for(project_id):
+            proj = self.projects.get(project_id)
+            task = proj.get_task(task_id) if proj is not None else None
+            if task is None:
+                return None
+            self._save_tasks(proj, (task_id,))
+            old_status, old_deadline = task.status_code, task.deadline_ordinal
+            if title is not None:
+                task.title = title
+            if description is not None:
+                task.description = description
+            if status is not None:
+                task.status = status
+            if deadline is not None:
+                task.deadline = deadline
+            self._indexes[project_id].update(task, old_status, old_deadline)
+            if title is not None or description is not None:
+                with self._search_lock:
+                    if self._search is not None:
+                        self._search.put((project_id, task_id), task.title, task.description)
+            return task
+
+    def remove_task(self, project_id: str, task_id: str) -> bool:
+        with self._lock_for(project_id):
+            proj = self.projects.get(project_id)
+            if proj is None:
+                return False
+            task = proj.get_task(task_id)
+            if task is None:
+                return False
+            self._save_tasks(proj, (task_id,))
+            proj.remove_task(task_id)
+            self._indexes[project_id].remove(task)
+            with self._search_lock:
+                if self._search is not None:
+                    self._search.remove((project_id, task_id))
+            return True
+
+    # ---------- Restoring ----------
+    # Used to undo removals: an entity put back at its old sequence number
+    # keeps its place in listings, and cursors handed out around it stay valid.
+    def project_seq(self, project_id: str) -> Optional[int]:
+        with self._projects_lock:
+            return self._project_order.seq_of(project_id)
+
+    def task_seq(self, project_id: str, task_id: str) -> Optional[int]:
+        proj = self.projects.get(project_id)
+        return proj.tasks.seq_of(task_id) if proj is not None else None
+
+    def restore_project(self, project: Project, seq: int) -> None:
+        """Put back a removed project, tasks and all, at sequence number ``seq``."""
+        with self._lock_for(project.id), self._projects_lock:
+            if project.id in self.projects:
+                raise InvalidEntityError("Project already exists.")
+            self._put_project(project, seq)
+
+    def restore_task(self, project_id: str, task: Task, seq: int) -> None:
+        """Put back a removed task at sequence number ``seq`` of its project."""
+        with self._lock_for(project_id):
+            proj = self.projects.get(project_id)
+            if proj is None:
+                raise NotFoundError("Project not found.")
+            if task.id in proj.tasks:
+                raise InvalidEntityError("Task id must be unique within its project.")
+            self._save_tasks(proj, (task.id,))
+            proj.tasks.restore(task, seq)
+            self._indexes[project_id].add(task)
+            with self._search_lock:
+                if self._search is not None:
+                    self._search.put((project_id, task.id), task.title, task.description)
+
+    # ---------- Queries ----------
+    def _scoped_indexes(self, project_id: Optional[str]) -> List[Tuple[str, TaskIndex]]:
+        if project_id is None:
+            with self._projects_lock:
+                return list(self._indexes.items())
+        index = self._indexes.get(project_id)
+        return [(project_id, index)] if index is not None else []
+
+    def _resolve(self, hits: List[Tuple[int, str, str]]) -> List[Tuple[str, Task]]:
+        hits.sort()
+        resolved = []
+        for _, pid, tid in hits:
+            # A hit can disappear between reading the index and resolving it.
+            task = self.get_task(pid, tid)
+            if task is not None:
+                resolved.append((pid, task))
+        return resolved
+
+    def tasks_by_status(self, status: str, project_id: Optional[str] = None) -> List[Tuple[str, Task]]:
+        code = STATUSES.index(status)
+        hits = []
+        for pid, index in self._scoped_indexes(project_id):
+            with self._lock_for(pid):
+                hits.extend((pid, t) for t in index.by_status(code))
+        return hits
+
+    def tasks_due_between(
+        self, start: date, end: date, project_id: Optional[str] = None
+    ) -> List[Tuple[str, Task]]:
+        lo, hi = start.toordinal(), end.toordinal()
+        hits = []
+        for pid, index in self._scoped_indexes(project_id):
+            with self._lock_for(pid):
+                hits.extend((dl, pid, tid) for dl, tid in index.due_between(lo, hi))
+        return self._resolve(hits)
+
+    def overdue_tasks(self, as_of: date, project_id: Optional[str] = None) -> List[Tuple[str, Task]]:
+        cutoff = as_of.toordinal()
+        hits = []
+        for pid, index in self._scoped_indexes(project_id):
+            with self._lock_for(pid):
+                hits.extend((dl, pid, tid) for dl, tid in index.overdue(cutoff))
+        return self._resolve(hits)
+
+    def project_summary(self, project_id: str, as_of: date) -> Optional[ProjectSummary]:
+        cutoff = as_of.toordinal()
+        with self._lock_for(project_id):
+            index = self._indexes.get(project_id)
+            if index is None:
+                return None
+            by_status = {s: index.count_status(code) for code, s in enumerate(STATUSES)}
+            next_deadline = index.next_open_deadline(cutoff)
+            overdue = index.count_overdue(cutoff)
+        return ProjectSummary(
+            project_id,
+            sum(by_status.values()),
+            by_status,
+            date.fromordinal(next_deadline) if next_deadline else None,
+            overdue,
+            as_of,
+        )
+
+    @staticmethod
+    def _index_project(index: SearchIndex, project: Project) -> None:
+        index.put((project.id, None), project.name)
+        index.put_new(((project.id, t.id), t.title, t.description) for t in project.tasks)
+
+    def _search_index(self) -> SearchIndex:
+        """The search index, built over every project on first use.
+
+        Projects that are never searched pay nothing for it. The build holds
+        off all writers, so it cannot miss or double a concurrent change.
+        """
+        index = self._search
+        if index is not None:
+            return index
+        with self._all_stripes(), self._projects_lock, self._search_lock:
+            if self._search is None:
+                index = SearchIndex()
+                for project in self.projects.values():
+                    self._index_project(index, project)
+                self._search = index
+            return self._search
+
+    def search(self, query: str, limit: int = 50) -> List[Tuple[str, Optional[Task]]]:
+        index = self._search_index()
+        with self._search_lock:
+            keys = index.search(query, limit)
+        hits = []
+        for pid, tid in keys:
+            if tid is None:
+                hits.append((pid, None))
+                continue
+            task = self.get_task(pid, tid)
+            if task is not None:
+                hits.append((pid, task))
+        return hits
+
+    # ---------- Ids ----------
+    def reserve_ids(self, n: int, floor: int = 0) -> int:
+        with self._ids_lock:
+            start = max(self._ids_end, floor)
+            self._ids_end = start + n
+            return start
+
+    # ---------- Snapshots ----------
+    def snapshot(self) -> Snapshot:
+        """A consistent read-only view of every project and task as of now, taken in O(1)."""
+        # No write is half done while the snapshot is registered.
+        with self._all_stripes(), self._projects_lock:
+            snap = Snapshot(self)
+            self._snapshots.add(snap)
+        return snap
+
+    def _save_project(self, project_id: str, tasks_too: bool = False) -> None:
+        """Let live snapshots keep the project as it is before a change; needs its stripe and the projects lock.
+
+        ``tasks_too`` when the change drops its tasks (removal or replacement).
+        """
+        if not self._snapshots:
+            return
+        proj = self.projects.get(project_id)
+        seq = self._project_order.seq_of(project_id)
+        for snap in list(self._snapshots):
+            if tasks_too and proj is not None:
+                snap._freeze(project_id, proj.tasks)
+            snap._save_project(project_id, proj, seq)
+
+    def _save_tasks(self, proj: Project, task_ids: Iterable[str]) -> None:
+        """Let live snapshots keep the tasks as they are before a change; needs the project's stripe."""
+        if not self._snapshots:
+            return
+        snaps = list(self._snapshots)
+        tasks = proj.tasks
+        for task_id in task_ids:
+            task, seq = tasks.get(task_id), tasks.seq_of(task_id)
+            for snap in snaps:
+                snap._save_task(proj.id, task_id, task, seq)
+
+    # ---------- Batching ----------
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """No-op here; subclasses that persist use it to commit once per batch."""
+        yield
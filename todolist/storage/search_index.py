@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import heapq
+import re
+from bisect import bisect_left, insort
+from sys import intern
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+
+# (project id, task id); task id is None for the project's own document.
+DocKey = Tuple[str, Optional[str]]
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _doc_tokens(texts: Iterable[str]) -> Tuple[str, ...]:
+    # Interned, so every document holding a token shares one string.
+    return tuple(sorted({intern(tok) for text in texts if text for tok in tokenize(text)}))
+
+
+class SearchIndex:
+    """Incremental inverted index over project names and task titles/descriptions.
+
+    Every query term is matched as a prefix of indexed tokens and a document
+    must match all terms. The vocabulary is kept sorted so a prefix maps to a
+    contiguous range found by bisection.
+
+    Documents are numbered and postings hold those small ints; the key and
+    tokens of document ``n`` sit at position ``n`` of flat lists, and the
+    numbers of removed documents are reused. A token found in one document
+    only (ids, numbers) posts that bare int instead of a one-item set.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Union[int, Set[int]]] = {}
+        self._vocab: List[str] = []
+        self._docs: Dict[str, Dict[Optional[str], int]] = {}  # project id -> task id -> doc
+        self._doc_project: List[Optional[str]] = []
+        self._doc_task: List[Optional[str]] = []
+        self._doc_tokens: List[Tuple[str, ...]] = []
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._doc_tokens) - len(self._free)
+
+    def _new_doc(self, key: DocKey) -> int:
+        project_id, task_id = key
+        if self._free:
+            doc = self._free.pop()
+            self._doc_project[doc], self._doc_task[doc] = project_id, task_id
+        else:
+            doc = len(self._doc_tokens)
+            self._doc_project.append(project_id)
+            self._doc_task.append(task_id)
+            self._doc_tokens.append(())
+        docs_of = self._docs.get(project_id)
+        if docs_of is None:
+            docs_of = self._docs[project_id] = {}
+        docs_of[task_id] = doc
+        return doc
+
+    def _post(self, tok: str, doc: int) -> None:
+        postings = self._postings.get(tok)
+        if postings is None:
+            self._postings[tok] = doc
+            insort(self._vocab, tok)
+        elif type(postings) is int:
+            self._postings[tok] = {postings, doc}
+        else:
+            postings.add(doc)
+
+    def put(self, key: DocKey, *texts: str) -> None:
+        """Index (or re-index) a document from its text fields."""
+        tokens = _doc_tokens(texts)
+        doc = self._docs.get(key[0], {}).get(key[1])
+        if doc is None:
+            doc = self._new_doc(key)
+            old: Tuple[str, ...] = ()
+        else:
+            old = self._doc_tokens[doc]
+            if tokens == old:
+                return
+        kept = set(tokens)
+        for tok in old:
+            if tok not in kept:
+                self._unpost(tok, doc)
+        dropped = set(old)
+        for tok in tokens:
+            if tok not in dropped:
+                self._post(tok, doc)
+        self._doc_tokens[doc] = tokens
+
+    def put_new(self, docs: Iterable[Tuple[DocKey, str, str]]) -> None:
+        """Index a batch of (key, title, description) documents not yet in the index.
+
+        Batches repeat the same titles and descriptions a lot, so each
+        distinct pair is tokenized once and its documents share one tuple.
+        """
+        token_cache: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        postings_of = self._postings
+        doc_tokens = self._doc_tokens
+        for key, title, description in docs:
+            tokens = token_cache.get((title, description))
+            if tokens is None:
+                tokens = token_cache[(title, description)] = _doc_tokens((title, description))
+            doc = self._new_doc(key)
+            for tok in tokens:
+                postings = postings_of.get(tok)
+                if type(postings) is set:
+                    postings.add(doc)
+                else:
+                    self._post(tok, doc)
+            doc_tokens[doc] = tokens
+
+    def remove(self, key: DocKey) -> None:
+        docs_of = self._docs.get(key[0])
+        doc = docs_of.pop(key[1], None) if docs_of is not None else None
+        if doc is None:
+            return
+        if not docs_of:
+            del self._docs[key[0]]
+        self._drop(doc)
+
+    def remove_project(self, project_id: str) -> None:
+        """Drop the project's document and those of all its tasks."""
+        for doc in self._docs.pop(project_id, {}).values():
+            self._drop(doc)
+
+    def _drop(self, doc: int) -> None:
+        for tok in self._doc_tokens[doc]:
+            self._unpost(tok, doc)
+        self._doc_project[doc] = self._doc_task[doc] = None
+        self._doc_tokens[doc] = ()
+        self._free.append(doc)
+
+    def _unpost(self, tok: str, doc: int) -> None:
+        postings = self._postings[tok]
+        if type(postings) is int:
+            del self._postings[tok]
+            del self._vocab[bisect_left(self._vocab, tok)]
+            return
+        postings.discard(doc)
+        if len(postings) == 1:
+            self._postings[tok] = postings.pop()
+
+    def _prefix_matches(self, prefix: str) -> Set[int]:
+        matches: Set[int] = set()
+        i = bisect_left(self._vocab, prefix)
+        while i < len(self._vocab) and self._vocab[i].startswith(prefix):
+            postings = self._postings[self._vocab[i]]
+            if type(postings) is int:
+                matches.add(postings)
+            else:
+                matches |= postings
+            i += 1
+        return matches
+
+    def search(self, query: str, limit: int = 50) -> List[DocKey]:
+        """Documents matching every term of ``query``.
+
+        Documents where more terms match a whole token rank first.
+        """
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not terms:
+            return []
+        # Longest terms first: they usually have the smallest candidate sets.
+        result = self._prefix_matches(terms[0])
+        for term in terms[1:]:
+            if not result:
+                break
+            result &= self._prefix_matches(term)
+
+        doc_project, doc_task, doc_tokens = self._doc_project, self._doc_task, self._doc_tokens
+
+        def rank(doc: int) -> Tuple[int, str, str]:
+            tokens = doc_tokens[doc]
+            exact = sum(1 for term in terms if term in tokens)
+            return (-exact, doc_project[doc] or "", doc_task[doc] or "")
+
+        return [(doc_project[doc] or "", doc_task[doc]) for doc in heapq.nsmallest(limit, result, key=rank)]
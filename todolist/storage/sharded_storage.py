@@ -0,0 +1,441 @@
+from __future__ import annotations
+
+import heapq
+import json
+import multiprocessing
+import os
+import threading
+import zlib
+from contextlib import ExitStack, contextmanager
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.project_summary import ProjectSummary
+from todolist.core.entities.task import Task
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.storage.base import Storage
+from todolist.storage.memory_storage import MemoryStorage
+from todolist.storage.search_index import tokenize
+from todolist.utils.seq_order import SeqOrder
+
+
+def _decode_cursor(cursor: Optional[str]) -> int:
+    if cursor is None:
+        return 0
+    try:
+        return int(cursor)
+    except ValueError:
+        raise InvalidEntityError("Invalid cursor.") from None
+
+
+def memory_shard(index: int) -> Storage:
+    return MemoryStorage()
+
+
+def journal_shard(path: str, index: int) -> Storage:
+    """One journal file per shard: ``<path>.<index>``."""
+    from todolist.storage.journal_storage import JournalStorage
+
+    return JournalStorage(f"{path}.{index}")
+
+
+def _bare(project: Optional[Project]) -> Optional[Project]:
+    # Projects cross the process boundary without their tasks; those are
+    # fetched with the task methods, as from a Snapshot.
+    if project is None:
+        return None
+    return Project(id=project.id, name=project.name, description=project.description)
+
+
+# Worker-side commands besides the Storage methods themselves.
+def _get_projects(storage: Storage, project_ids: List[str]) -> List[Optional[Project]]:
+    return [_bare(storage.get_project(pid)) for pid in project_ids]
+
+
+def _directory(storage: MemoryStorage) -> List[Tuple[int, str, str]]:
+    return [(storage.project_seq(p.id), p.id, p.name) for p in storage.get_all_projects()]
+
+
+def _add_project_at(storage: MemoryStorage, project: Project, seq: int) -> None:
+    """Add ``project`` under its number in the global creation order, which a journal keeps."""
+    if storage.get_project(project.id) is not None:
+        storage.add_project(project)  # a replacement keeps its number
+    else:
+        storage.restore_project(project, seq)
+
+
+_COMMANDS: Dict[str, Callable[..., Any]] = {
+    "get_projects": _get_projects,
+    "directory": _directory,
+    "add_project_at": _add_project_at,
+}
+_BARE_RESULT = {"get_project", "update_project"}
+
+
+def _serve(conn: Any, make_shard: Callable[[int], Storage], index: int) -> None:
+    """Shard process main loop: run each request against its own storage, in order."""
+    storage = make_shard(index)
+    try:
+        while True:
+            request = conn.recv()
+            if request is None:
+                return
+            name, args = request
+            try:
+                command = _COMMANDS.get(name)
+                if command is not None:
+                    result = command(storage, *args)
+                else:
+                    result = getattr(storage, name)(*args)
+                    if name in _BARE_RESULT:
+                        result = _bare(result)
+                reply = (True, result)
+            except Exception as exc:
+                reply = (False, exc)
+            try:
+                conn.send(reply)
+            except Exception as exc:
+                # The result or exception would not pickle; report that instead.
+                conn.send((False, RuntimeError(f"{name} on shard {index}: {exc!r}")))
+    finally:
+        close = getattr(storage, "close", None)
+        if close is not None:
+            close()
+
+
+def _check_manifest(path: str, shards: int) -> None:
+    """Record the shard count at ``path``, or refuse a count other than the recorded one.
+
+    Projects are placed by their hash modulo the count, so shards written
+    with one count and opened with another would miss most projects.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            recorded = json.load(fh)["shards"]
+    except FileNotFoundError:
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"shards": shards}, fh)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+        return
+    if recorded != shards:
+        raise ValueError(f"{path} records {recorded} shards; opening them as {shards} would misplace projects.")
+
+
+class ShardedStorage:
+    """Storage split by project across worker processes, one MemoryStorage each.
+
+    A project lives on shard ``crc32(project id) % shards`` together with
+    all its tasks, so every task call goes to exactly one process and
+    shards work in parallel on separate cores. Queries over all projects
+    are sent to every shard at once and merged here.
+
+    The router keeps the project directory itself: names, for global
+    uniqueness and lookups by name, and creation order, for project
+    listings and their cursors. Each shard stores its projects under their
+    global creation number, so the order survives a restart. Projects come
+    back without their tasks; entities are copies, so changing them changes
+    nothing stored.
+
+    ``make_shard`` must return a MemoryStorage (or a subclass such as the
+    journal). Pass ``manifest`` when the shards persist: the shard count is
+    recorded there and opening with another count raises ValueError.
+
+    Calls to one shard are serialized; the router is safe to share between
+    threads. ``transaction`` groups nothing across processes: each call is
+    applied on its shard as it arrives. Call ``close`` to stop the workers.
+    """
+
+    def __init__(
+        self, shards: int = 4, make_shard: Callable[[int], Storage] = memory_shard, manifest: Optional[str] = None
+    ) -> None:
+        if shards < 1:
+            raise ValueError("At least one shard is needed.")
+        if manifest is not None:
+            _check_manifest(manifest, shards)
+        # Spawned rather than forked: the parent may already run threads.
+        context = multiprocessing.get_context("spawn")
+        self._conns = []
+        self._workers = []
+        for index in range(shards):
+            parent, child = context.Pipe()
+            worker = context.Process(
+                target=_serve, args=(child, make_shard, index), name=f"todolist-shard-{index}", daemon=True
+            )
+            worker.start()
+            child.close()
+            self._conns.append(parent)
+            self._workers.append(worker)
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._names: Dict[str, str] = {}  # name -> project id, including names being claimed
+        self._project_names: Dict[str, str] = {}  # project id -> name
+        self._order: SeqOrder[str] = SeqOrder()
+        self._directory_lock = threading.Lock()
+        # Creation order across shards; shards written before numbers were
+        # global repeat them, and those projects get fresh ones in shard order.
+        entries = sorted(
+            (seq, index, pid, name)
+            for index, directory in enumerate(self._broadcast("directory"))
+            for seq, pid, name in directory
+        )
+        for seq, _, pid, name in entries:
+            self._names[name] = pid
+            self._project_names[pid] = name
+            self._order.add(pid, seq if seq >= self._order.next_seq else None)
+
+    @property
+    def shards(self) -> int:
+        return len(self._conns)
+
+    def shard_of(self, project_id: str) -> int:
+        return zlib.crc32(project_id.encode("utf-8")) % len(self._conns)
+
+    # ---------- Transport ----------
+    def _send(self, index: int, name: str, args: Tuple[Any, ...]) -> None:
+        try:
+            self._conns[index].send((name, args))
+        except OSError as exc:
+            raise RuntimeError(f"Shard {index} is not running.") from exc
+
+    def _receive(self, index: int) -> Tuple[bool, Any]:
+        try:
+            return self._conns[index].recv()
+        except (EOFError, OSError) as exc:
+            raise RuntimeError(f"Shard {index} is not running.") from exc
+
+    def _call(self, index: int, name: str, *args: Any) -> Any:
+        with self._locks[index]:
+            self._send(index, name, args)
+            ok, value = self._receive(index)
+        if not ok:
+            raise value
+        return value
+
+    def _route(self, project_id: str, name: str, *args: Any) -> Any:
+        return self._call(self.shard_of(project_id), name, project_id, *args)
+
+    def _broadcast(self, name: str, *args: Any) -> List[Any]:
+        """Run ``name`` on every shard concurrently; results in shard order."""
+        with ExitStack() as stack:
+            # Always locked in index order, so two broadcasts cannot deadlock.
+            for lock in self._locks:
+                stack.enter_context(lock)
+            for index in range(len(self._conns)):
+                self._send(index, name, args)
+            replies = [self._receive(index) for index in range(len(self._conns))]
+        results = []
+        for ok, value in replies:
+            if not ok:
+                raise value
+            results.append(value)
+        return results
+
+    def close(self) -> None:
+        for index, conn in enumerate(self._conns):
+            with self._locks[index]:
+                try:
+                    conn.send(None)
+                except OSError:
+                    pass
+        for worker, conn in zip(self._workers, self._conns):
+            worker.join(timeout=10)
+            if worker.is_alive():
+                worker.terminate()
+            conn.close()
+
+    # ---------- Projects ----------
+    def _claim_name(self, name: str, project_id: str) -> bool:
+        """Reserve ``name`` for the project; False if it already holds it."""
+        with self._directory_lock:
+            owner = self._names.get(name)
+            if owner is not None and owner != project_id:
+                raise InvalidEntityError("Project name must be unique.")
+            self._names[name] = project_id
+            return owner is None
+
+    def _release_name(self, name: str, project_id: str) -> None:
+        with self._directory_lock:
+            if self._names.get(name) == project_id:
+                del self._names[name]
+
+    def add_project(self, project: Project) -> None:
+        claimed = self._claim_name(project.name, project.id)
+        with self._directory_lock:
+            new = self._order.seq_of(project.id) is None
+            seq = self._order.add(project.id)
+        try:
+            self._call(self.shard_of(project.id), "add_project_at", project, seq)
+        except BaseException:
+            with self._directory_lock:
+                if new:
+                    self._order.remove(project.id)
+            if claimed:
+                self._release_name(project.name, project.id)
+            raise
+        with self._directory_lock:
+            old = self._project_names.get(project.id)
+            if old is not None and old != project.name and self._names.get(old) == project.id:
+                del self._names[old]
+            self._project_names[project.id] = project.name
+
+    def get_project(self, project_id: str) -> Optional[Project]:
+        return self._route(project_id, "get_project")
+
+    def _get_projects(self, project_ids: List[str]) -> List[Project]:
+        by_shard: Dict[int, List[str]] = {}
+        for pid in project_ids:
+            by_shard.setdefault(self.shard_of(pid), []).append(pid)
+        found: Dict[str, Project] = {}
+        for index, ids in by_shard.items():
+            for project in self._call(index, "get_projects", ids):
+                if project is not None:
+                    found[project.id] = project
+        return [found[pid] for pid in project_ids if pid in found]
+
+    def get_all_projects(self) -> List[Project]:
+        with self._directory_lock:
+            ids = [pid for _, pid in self._order.after(0, len(self._order))]
+        return self._get_projects(ids)
+
+    def list_projects_page(self, cursor: Optional[str], limit: int) -> Tuple[List[Project], Optional[str]]:
+        after = _decode_cursor(cursor)
+        with self._directory_lock:
+            entries = self._order.after(after, limit + 1)
+        next_cursor = str(entries[limit - 1][0]) if len(entries) > limit else None
+        return self._get_projects([pid for _, pid in entries[:limit]]), next_cursor
+
+    def update_project(
+        self,
+        project_id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Project]:
+        claimed = name is not None and self._claim_name(name, project_id)
+        try:
+            proj = self._route(project_id, "update_project", name, description)
+        except BaseException:
+            if claimed:
+                self._release_name(name, project_id)
+            raise
+        if proj is None:
+            if claimed:
+                self._release_name(name, project_id)
+            return None
+        with self._directory_lock:
+            old = self._project_names.get(project_id)
+            if old is not None and old != proj.name and self._names.get(old) == project_id:
+                del self._names[old]
+            self._project_names[project_id] = proj.name
+        return proj
+
+    def remove_project(self, project_id: str) -> bool:
+        if not self._route(project_id, "remove_project"):
+            return False
+        with self._directory_lock:
+            name = self._project_names.pop(project_id, None)
+            if name is not None and self._names.get(name) == project_id:
+                del self._names[name]
+            self._order.remove(project_id)
+        return True
+
+    def find_project_by_name(self, name: str) -> Optional[Project]:
+        with self._directory_lock:
+            project_id = self._names.get(name)
+            if project_id is None or project_id not in self._project_names:
+                # Unknown, or only claimed by a create still in flight.
+                return None
+        return self.get_project(project_id)
+
+    def count_projects(self) -> int:
+        return len(self._project_names)
+
+    # ---------- Tasks ----------
+    def add_task(self, project_id: str, task: Task) -> None:
+        self._route(project_id, "add_task", task)
+
+    def add_tasks(self, project_id: str, tasks: List[Task]) -> None:
+        self._route(project_id, "add_tasks", tasks)
+
+    def get_task(self, project_id: str, task_id: str) -> Optional[Task]:
+        return self._route(project_id, "get_task", task_id)
+
+    def list_tasks(self, project_id: str) -> List[Task]:
+        return self._route(project_id, "list_tasks")
+
+    def list_tasks_page(
+        self, project_id: str, cursor: Optional[str], limit: int
+    ) -> Tuple[List[Task], Optional[str]]:
+        return self._route(project_id, "list_tasks_page", cursor, limit)
+
+    def count_tasks(self, project_id: str) -> int:
+        return self._route(project_id, "count_tasks")
+
+    def update_task(
+        self,
+        project_id: str,
+        task_id: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline: Optional[date] = None,
+    ) -> Optional[Task]:
+        return self._route(project_id, "update_task", task_id, title, description, status, deadline)
+
+    def remove_task(self, project_id: str, task_id: str) -> bool:
+        return self._route(project_id, "remove_task", task_id)
+
+    # ---------- Ids ----------
+    def reserve_ids(self, n: int, floor: int = 0) -> int:
+        # Shard 0 keeps the counter for the whole store, persisted with its data.
+        return self._call(0, "reserve_ids", n, floor)
+
+    # ---------- Queries ----------
+    def tasks_by_status(self, status: str, project_id: Optional[str] = None) -> List[Tuple[str, Task]]:
+        if project_id is not None:
+            return self._call(self.shard_of(project_id), "tasks_by_status", status, project_id)
+        return [hit for hits in self._broadcast("tasks_by_status", status, None) for hit in hits]
+
+    def _by_deadline(self, name: str, *args: Any) -> List[Tuple[str, Task]]:
+        # Each shard answers in (deadline, project id, task id) order, like MemoryStorage.
+        return list(
+            heapq.merge(*self._broadcast(name, *args, None), key=lambda hit: (hit[1].deadline, hit[0], hit[1].id))
+        )
+
+    def tasks_due_between(
+        self, start: date, end: date, project_id: Optional[str] = None
+    ) -> List[Tuple[str, Task]]:
+        if project_id is not None:
+            return self._call(self.shard_of(project_id), "tasks_due_between", start, end, project_id)
+        return self._by_deadline("tasks_due_between", start, end)
+
+    def overdue_tasks(self, as_of: date, project_id: Optional[str] = None) -> List[Tuple[str, Task]]:
+        if project_id is not None:
+            return self._call(self.shard_of(project_id), "overdue_tasks", as_of, project_id)
+        return self._by_deadline("overdue_tasks", as_of)
+
+    def project_summary(self, project_id: str, as_of: date) -> Optional[ProjectSummary]:
+        return self._route(project_id, "project_summary", as_of)
+
+    def search(self, query: str, limit: int = 50) -> List[Tuple[str, Optional[Task]]]:
+        terms = set(tokenize(query))
+
+        def rank(hit: Tuple[str, Optional[Task]]) -> Tuple[int, str, str]:
+            # Same order as SearchIndex: most whole-token matches, then by key.
+            pid, task = hit
+            if task is None:
+                tokens = set(tokenize(self._project_names.get(pid, "")))
+            else:
+                tokens = set(tokenize(task.title)) | set(tokenize(task.description or ""))
+            return (-len(terms & tokens), pid, task.id if task is not None else "")
+
+        # Each shard's own top ``limit`` includes its share of the overall top.
+        return heapq.nsmallest(limit, (hit for hits in self._broadcast("search", query, limit) for hit in hits), rank)
+
+    # ---------- Batching ----------
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """No-op: shards apply each call as it arrives."""
+        yield
@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from todolist.core.entities.project import Project
+from todolist.core.entities.project_summary import ProjectSummary
+from todolist.core.entities.task import STATUSES, Task
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+from todolist.core.exceptions.not_found import NotFoundError
+from todolist.storage.search_index import SearchIndex
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id          TEXT PRIMARY KEY,
+    name        TEXT NOT NULL UNIQUE,
+    description TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    project_id  TEXT NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    id          TEXT NOT NULL,
+    title       TEXT NOT NULL,
+    description TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    deadline    TEXT,
+    PRIMARY KEY (project_id, id)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status, project_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_deadline ON tasks(deadline);
+-- Entries are ordered (project_id, rowid), so a task page is one index seek.
+CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id);
+CREATE TABLE IF NOT EXISTS counters (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Statements are module constants so sqlite3's per-connection statement
+# cache hands back the same prepared statement on every call.
+_INSERT_PROJECT = "INSERT INTO projects (id, name, description) VALUES (?, ?, ?)"
+_SELECT_PROJECT = "SELECT id, name, description FROM projects WHERE id = ?"
+_SELECT_PROJECT_BY_NAME = "SELECT id, name, description FROM projects WHERE name = ?"
+_SELECT_PROJECTS = "SELECT id, name, description FROM projects ORDER BY rowid"
+_PAGE_PROJECTS = "SELECT rowid, id, name, description FROM projects WHERE rowid > ? ORDER BY rowid LIMIT ?"
+_COUNT_PROJECTS = "SELECT COUNT(*) FROM projects"
+_UPDATE_PROJECT = (
+    "UPDATE projects SET name = COALESCE(?, name), description = COALESCE(?, description) WHERE id = ?"
+)
+_DELETE_PROJECT = "DELETE FROM projects WHERE id = ?"
+
+_TASK_COLUMNS = "id, title, description, status, deadline"
+_INSERT_TASK = (
+    "INSERT INTO tasks (project_id, id, title, description, status, deadline) VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SELECT_TASK = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE project_id = ? AND id = ?"
+_SELECT_TASKS = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE project_id = ? ORDER BY rowid"
+_PAGE_TASKS = (
+    f"SELECT rowid, {_TASK_COLUMNS} FROM tasks WHERE project_id = ? AND rowid > ? ORDER BY rowid LIMIT ?"
+)
+_COUNT_TASKS = "SELECT COUNT(*) FROM tasks WHERE project_id = ?"
+_UPDATE_TASK = (
+    "UPDATE tasks SET title = COALESCE(?, title), description = COALESCE(?, description),"
+    " status = COALESCE(?, status), deadline = COALESCE(?, deadline)"
+    " WHERE project_id = ? AND id = ?"
+)
+_DELETE_TASK = "DELETE FROM tasks WHERE project_id = ? AND id = ?"
+_SELECT_SEARCH_TEXT = "SELECT project_id, id, title, description FROM tasks"
+_SELECT_COUNTER = "SELECT value FROM counters WHERE name = ?"
+_SET_COUNTER = "INSERT OR REPLACE INTO counters (name, value) VALUES (?, ?)"
+
+_QUERY_COLUMNS = f"project_id, {_TASK_COLUMNS}"
+_BY_STATUS = f"SELECT {_QUERY_COLUMNS} FROM tasks WHERE status = ? ORDER BY rowid"
+_BY_STATUS_IN_PROJECT = f"SELECT {_QUERY_COLUMNS} FROM tasks WHERE status = ? AND project_id = ? ORDER BY rowid"
+_DUE_BETWEEN = f"SELECT {_QUERY_COLUMNS} FROM tasks WHERE deadline BETWEEN ? AND ? ORDER BY deadline, project_id, id"
+_DUE_BETWEEN_IN_PROJECT = (
+    f"SELECT {_QUERY_COLUMNS} FROM tasks WHERE deadline BETWEEN ? AND ? AND project_id = ?"
+    " ORDER BY deadline, project_id, id"
+)
+_OVERDUE = (
+    f"SELECT {_QUERY_COLUMNS} FROM tasks WHERE deadline < ? AND status != 'done'"
+    " ORDER BY deadline, project_id, id"
+)
+_OVERDUE_IN_PROJECT = (
+    f"SELECT {_QUERY_COLUMNS} FROM tasks WHERE deadline < ? AND status != 'done' AND project_id = ?"
+    " ORDER BY deadline, project_id, id"
+)
+
+# One pass over the project's rows via idx_tasks_project; SQLite has no
+# counters to maintain, so the aggregate is computed on read.
+_SUMMARY = (
+    "SELECT "
+    + ", ".join(f"SUM(status = '{s}')" for s in STATUSES)
+    + ", MIN(CASE WHEN status != 'done' AND deadline >= ? THEN deadline END)"
+    ", SUM(status != 'done' AND deadline < ?)"
+    " FROM tasks WHERE project_id = ?"
+)
+
+
+def _row_to_task(row: tuple) -> Task:
+    tid, title, desc, status, dl = row
+    deadline = date.fromisoformat(dl) if dl else None
+    return Task(id=tid, title=title, description=desc, status=status, deadline=deadline)
+
+
+def _row_to_project(row: tuple) -> Project:
+    pid, name, desc = row
+    return Project(id=pid, name=name, description=desc)
+
+
+def _decode_cursor(cursor: Optional[str]) -> int:
+    if cursor is None:
+        return 0
+    try:
+        return int(cursor)
+    except ValueError:
+        raise InvalidEntityError("Invalid cursor.") from None
+
+
+class SQLiteStorage:
+    """Storage backend that persists projects and tasks to a SQLite database.
+
+    One connection is opened and reused for the lifetime of the storage.
+    Outside ``transaction()`` every write commits on its own; inside it all
+    writes are committed together when the outermost block exits, and a
+    nested block that raises rolls back to where it began.
+
+    Projects are returned without their tasks loaded (``project.tasks`` is
+    empty); use ``get_task``, ``list_tasks`` and ``count_tasks`` instead.
+
+    The full-text index lives in memory: it is built from the database on the
+    first ``search`` and kept up to date by every write after that.
+
+    The connection is shared between threads behind one lock (SQLite allows
+    a single writer anyway); a thread inside ``transaction()`` holds it until
+    the block exits, so other threads' writes never leak into its batch.
+    """
+
+    # transaction() rolls back every write of a block that raises, so a unit
+    # of work need not undo its writes one by one.
+    transactional = True
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self.conn = sqlite3.connect(
+            path, isolation_level=None, cached_statements=64, check_same_thread=False
+        )
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self._tx_depth = 0
+        self._search: Optional[SearchIndex] = None
+        self._ids_end: Optional[int] = None
+        self._rollback_hooks: List[Callable[[], None]] = []
+        self._lock = threading.RLock()
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self) -> "SQLiteStorage":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # ---------- Batching ----------
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run the enclosed calls in one transaction.
+
+        A nested block is a savepoint: if it raises, only its own writes are
+        rolled back, and what the outer block did before and after it still
+        commits with the outer block.
+        """
+        with self._lock:
+            depth = self._tx_depth
+            savepoint = f"block{depth}"
+            self.conn.execute("BEGIN" if depth == 0 else f"SAVEPOINT {savepoint}")
+            self._tx_depth += 1
+            try:
+                yield
+            except BaseException:
+                self._tx_depth -= 1
+                if depth == 0:
+                    self.conn.execute("ROLLBACK")
+                else:
+                    self.conn.execute(f"ROLLBACK TO {savepoint}")
+                    self.conn.execute(f"RELEASE {savepoint}")
+                # The search index may hold rolled-back writes; rebuild it on demand.
+                self._search = None
+                if self._ids_end is not None:
+                    # Ids reserved in the block may already be in use elsewhere; keep them reserved.
+                    self.conn.execute(_SET_COUNTER, ("ids", self._ids_end))
+                for hook in self._rollback_hooks:
+                    hook()
+                raise
+            self._tx_depth -= 1
+            self.conn.execute("COMMIT" if depth == 0 else f"RELEASE {savepoint}")
+
+    def on_rollback(self, hook: Callable[[], None]) -> None:
+        """Call ``hook`` after every rollback, with the storage lock held.
+
+        State kept in memory over this storage (such as quota counters) uses
+        it to forget what the rolled-back writes did.
+        """
+        with self._lock:
+            self._rollback_hooks.append(hook)
+
+    # ---------- Projects ----------
+    def add_project(self, project: Project) -> None:
+        with self._lock:
+            try:
+                with self.transaction():
+                    self.conn.execute(_INSERT_PROJECT, (project.id, project.name, project.description))
+                    for t in project.tasks:
+                        self.add_task(project.id, t)
+            except sqlite3.IntegrityError as exc:
+                raise InvalidEntityError("Project id and name must be unique.") from exc
+            if self._search is not None:
+                self._search.put((project.id, None), project.name)
+
+    def get_project(self, project_id: str) -> Optional[Project]:
+        with self._lock:
+            row = self.conn.execute(_SELECT_PROJECT, (project_id,)).fetchone()
+            return _row_to_project(row) if row else None
+
+    def get_all_projects(self) -> List[Project]:
+        with self._lock:
+            return [_row_to_project(r) for r in self.conn.execute(_SELECT_PROJECTS)]
+
+    def list_projects_page(self, cursor: Optional[str], limit: int) -> Tuple[List[Project], Optional[str]]:
+        with self._lock:
+            rows = self.conn.execute(_PAGE_PROJECTS, (_decode_cursor(cursor), limit + 1)).fetchall()
+        next_cursor = str(rows[limit - 1][0]) if len(rows) > limit else None
+        return [_row_to_project(r[1:]) for r in rows[:limit]], next_cursor
+
+    def update_project(
+        self,
+        project_id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Project]:
+        with self._lock:
+            try:
+                cur = self.conn.execute(_UPDATE_PROJECT, (name, description, project_id))
+            except sqlite3.IntegrityError as exc:
+                raise InvalidEntityError("Project name must be unique.") from exc
+            if cur.rowcount == 0:
+                return None
+            proj = self.get_project(project_id)
+            if self._search is not None and name is not None:
+                self._search.put((project_id, None), proj.name)
+            return proj
+
+    def remove_project(self, project_id: str) -> bool:
+        with self._lock:
+            removed = self.conn.execute(_DELETE_PROJECT, (project_id,)).rowcount > 0
+            if removed and self._search is not None:
+                self._search.remove_project(project_id)
+            return removed
+
+    def find_project_by_name(self, name: str) -> Optional[Project]:
+        with self._lock:
+            row = self.conn.execute(_SELECT_PROJECT_BY_NAME, (name,)).fetchone()
+            return _row_to_project(row) if row else None
+
+    def count_projects(self) -> int:
+        with self._lock:
+            return self.conn.execute(_COUNT_PROJECTS).fetchone()[0]
+
+    # ---------- Tasks ----------
+    def add_task(self, project_id: str, task: Task) -> None:
+        with self._lock:
+            dl = task.deadline.isoformat() if task.deadline else None
+            try:
+                self.conn.execute(
+                    _INSERT_TASK, (project_id, task.id, task.title, task.description, task.status, dl)
+                )
+            except sqlite3.IntegrityError as exc:
+                if "FOREIGN KEY" in str(exc):
+                    raise NotFoundError("Project not found.") from exc
+                raise InvalidEntityError("Task id must be unique within its project.") from exc
+            if self._search is not None:
+                self._search.put((project_id, task.id), task.title, task.description)
+
+    def add_tasks(self, project_id: str, tasks: List[Task]) -> None:
+        rows = [
+            (project_id, t.id, t.title, t.description, t.status, t.deadline.isoformat() if t.deadline else None)
+            for t in tasks
+        ]
+        with self._lock, self.transaction():
+            try:
+                self.conn.executemany(_INSERT_TASK, rows)
+            except sqlite3.IntegrityError as exc:
+                if "FOREIGN KEY" in str(exc):
+                    raise NotFoundError("Project not found.") from exc
+                raise InvalidEntityError("Task id must be unique within its project.") from exc
+            if self._search is not None:
+                self._search.put_new(((project_id, t.id), t.title, t.description) for t in tasks)
+
+    def get_task(self, project_id: str, task_id: str) -> Optional[Task]:
+        with self._lock:
+            row = self.conn.execute(_SELECT_TASK, (project_id, task_id)).fetchone()
+            return _row_to_task(row) if row else None
+
+    def list_tasks(self, project_id: str) -> List[Task]:
+        with self._lock:
+            return [_row_to_task(r) for r in self.conn.execute(_SELECT_TASKS, (project_id,))]
+
+    def list_tasks_page(
+        self, project_id: str, cursor: Optional[str], limit: int
+    ) -> Tuple[List[Task], Optional[str]]:
+        with self._lock:
+            rows = self.conn.execute(_PAGE_TASKS, (project_id, _decode_cursor(cursor), limit + 1)).fetchall()
+        next_cursor = str(rows[limit - 1][0]) if len(rows) > limit else None
+        return [_row_to_task(r[1:]) for r in rows[:limit]], next_cursor
+
+    def count_tasks(self, project_id: str) -> int:
+        with self._lock:
+            return self.conn.execute(_COUNT_TASKS, (project_id,)).fetchone()[0]
+
+    def update_task(
+        self,
+        project_id: str,
+        task_id: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline: Optional[date] = None,
+    ) -> Optional[Task]:
+        with self._lock:
+            dl = deadline.isoformat() if deadline else None
+            cur = self.conn.execute(_UPDATE_TASK, (title, description, status, dl, project_id, task_id))
+            if cur.rowcount == 0:
+                return None
+            task = self.get_task(project_id, task_id)
+            if self._search is not None and (title is not None or description is not None):
+                self._search.put((project_id, task_id), task.title, task.description)
+            return task
+
+    def remove_task(self, project_id: str, task_id: str) -> bool:
+        with self._lock:
+            removed = self.conn.execute(_DELETE_TASK, (project_id, task_id)).rowcount > 0
+            if removed and self._search is not None:
+                self._search.remove((project_id, task_id))
+            return removed
+
+    # ---------- Ids ----------
+    def reserve_ids(self, n: int, floor: int = 0) -> int:
+        with self._lock:
+            if self._ids_end is None:
+                row = self.conn.execute(_SELECT_COUNTER, ("ids",)).fetchone()
+                self._ids_end = row[0] if row else 0
+            start = max(self._ids_end, floor)
+            self._ids_end = start + n
+            self.conn.execute(_SET_COUNTER, ("ids", self._ids_end))
+            return start
+
+    # ---------- Queries ----------
+    def _query(
+        self, sql: str, sql_in_project: str, params: tuple, project_id: Optional[str]
+    ) -> List[Tuple[str, Task]]:
+        with self._lock:
+            if project_id is None:
+                rows = self.conn.execute(sql, params)
+            else:
+                rows = self.conn.execute(sql_in_project, params + (project_id,))
+            return [(r[0], _row_to_task(r[1:])) for r in rows]
+
+    def tasks_by_status(self, status: str, project_id: Optional[str] = None) -> List[Tuple[str, Task]]:
+        with self._lock:
+            return self._query(_BY_STATUS, _BY_STATUS_IN_PROJECT, (status,), project_id)
+
+    def tasks_due_between(
+        self, start: date, end: date, project_id: Optional[str] = None
+    ) -> List[Tuple[str, Task]]:
+        with self._lock:
+            params = (start.isoformat(), end.isoformat())
+            return self._query(_DUE_BETWEEN, _DUE_BETWEEN_IN_PROJECT, params, project_id)
+
+    def overdue_tasks(self, as_of: date, project_id: Optional[str] = None) -> List[Tuple[str, Task]]:
+        with self._lock:
+            return self._query(_OVERDUE, _OVERDUE_IN_PROJECT, (as_of.isoformat(),), project_id)
+
+    def project_summary(self, project_id: str, as_of: date) -> Optional[ProjectSummary]:
+        day = as_of.isoformat()
+        with self._lock:
+            if self.conn.execute(_SELECT_PROJECT, (project_id,)).fetchone() is None:
+                return None
+            row = self.conn.execute(_SUMMARY, (day, day, project_id)).fetchone()
+        by_status = {s: row[i] or 0 for i, s in enumerate(STATUSES)}
+        next_deadline, overdue = row[len(STATUSES):]
+        return ProjectSummary(
+            project_id,
+            sum(by_status.values()),
+            by_status,
+            date.fromisoformat(next_deadline) if next_deadline else None,
+            overdue or 0,
+            as_of,
+        )
+
+    def _search_index(self) -> SearchIndex:
+        if self._search is None:
+            index = SearchIndex()
+            for pid, name, _ in self.conn.execute(_SELECT_PROJECTS):
+                index.put((pid, None), name)
+            for pid, tid, title, desc in self.conn.execute(_SELECT_SEARCH_TEXT):
+                index.put((pid, tid), title, desc)
+            self._search = index
+        return self._search
+
+    def search(self, query: str, limit: int = 50) -> List[Tuple[str, Optional[Task]]]:
+        with self._lock:
+            return [
+                (pid, self.get_task(pid, tid) if tid is not None else None)
+                for pid, tid in self._search_index().search(query, limit)
+            ]
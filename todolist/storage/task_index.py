@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+from todolist.core.entities.task import STATUSES, Task
+from todolist.utils.sorted_blocks import SortedBlocks
+
+
+DONE = STATUSES.index("done")
+
+
+class TaskIndex:
+    """Secondary indexes over one project's tasks.
+
+    Keeps status code -> tasks (in insertion order) and two sorted
+    (deadline ordinal, task id) lists: one over every task with a deadline
+    and one over those not yet done, so overdue lookups need no filtering.
+    The sorted lists are blocked (``SortedBlocks``), so adding or removing
+    an entry stays cheap in a million-task project. Per-status counts are
+    the sizes of the status maps and overdue counts are a bisection, so a
+    project summary never walks the tasks.
+    The owner must report every change through add/remove/update.
+    """
+
+    __slots__ = ("_by_status", "_deadlines", "_open_deadlines")
+
+    def __init__(self) -> None:
+        self._by_status: List[Dict[str, Task]] = [{} for _ in STATUSES]
+        self._deadlines: SortedBlocks[Tuple[int, str]] = SortedBlocks()
+        self._open_deadlines: SortedBlocks[Tuple[int, str]] = SortedBlocks()
+
+    def add(self, task: Task) -> None:
+        self._insert(task.id, task, task.status_code, task.deadline_ordinal)
+
+    def add_many(self, tasks: List[Task]) -> None:
+        """Index a batch; a batch large next to the index is merged in rather than added one by one."""
+        by_status = self._by_status
+        deadlines = []
+        open_deadlines = []
+        for task in tasks:
+            code = task.status_code
+            by_status[code][task.id] = task
+            dl = task.deadline_ordinal
+            if dl:
+                deadlines.append((dl, task.id))
+                if code != DONE:
+                    open_deadlines.append((dl, task.id))
+        self._deadlines.update(deadlines)
+        self._open_deadlines.update(open_deadlines)
+
+    def remove(self, task: Task) -> None:
+        self._delete(task.id, task.status_code, task.deadline_ordinal)
+
+    def update(self, task: Task, old_status_code: int, old_deadline_ordinal: int) -> None:
+        """Re-index ``task`` whose status/deadline used to be the given values."""
+        if old_status_code == task.status_code and old_deadline_ordinal == task.deadline_ordinal:
+            return
+        self._delete(task.id, old_status_code, old_deadline_ordinal)
+        self._insert(task.id, task, task.status_code, task.deadline_ordinal)
+
+    def _insert(self, task_id: str, task: Task, status_code: int, deadline: int) -> None:
+        self._by_status[status_code][task_id] = task
+        if deadline:
+            self._deadlines.add((deadline, task_id))
+            if status_code != DONE:
+                self._open_deadlines.add((deadline, task_id))
+
+    def _delete(self, task_id: str, status_code: int, deadline: int) -> None:
+        self._by_status[status_code].pop(task_id, None)
+        if deadline:
+            self._deadlines.discard((deadline, task_id))
+            if status_code != DONE:
+                self._open_deadlines.discard((deadline, task_id))
+
+    # ---------- Queries ----------
+    def by_status(self, status_code: int) -> List[Task]:
+        return list(self._by_status[status_code].values())
+
+    def count_status(self, status_code: int) -> int:
+        return len(self._by_status[status_code])
+
+    def count_overdue(self, as_of: int) -> int:
+        return self._open_deadlines.index((as_of, ""))
+
+    def next_open_deadline(self, as_of: int) -> int:
+        """Earliest deadline ordinal >= ``as_of`` among unfinished tasks, or 0 if none."""
+        entry = self._open_deadlines.first_from((as_of, ""))
+        return entry[0] if entry is not None else 0
+
+    def due_between(self, start: int, end: int) -> List[Tuple[int, str]]:
+        """(deadline, task id) pairs with start <= deadline <= end, earliest first."""
+        return self._deadlines.irange((start, ""), (end + 1, ""))
+
+    def overdue(self, as_of: int) -> List[Tuple[int, str]]:
+        """(deadline, task id) pairs of unfinished tasks due before ``as_of``, earliest first."""
+        return self._open_deadlines.irange(None, (as_of, ""))
+
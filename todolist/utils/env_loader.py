@@ -1,16 +1,59 @@
 from __future__ import annotations
 
 import os
-from dotenv import load_dotenv
+from typing import Optional
 
-load_dotenv()
+_loaded = False
+
+
+def _find_dotenv() -> Optional[str]:
+    # Same places python-dotenv searches: this package's directory and its
+    # parents, then the working directory.
+    here = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        candidate = os.path.join(here, ".env")
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(here)
+        if parent == here:
+            break
+        here = parent
+    candidate = os.path.join(os.getcwd(), ".env")
+    return candidate if os.path.isfile(candidate) else None
+
+
+def load_env() -> None:
+    """Load .env into the environment once; python-dotenv is imported only if there is one."""
+    global _loaded
+    if _loaded:
+        return
+    _loaded = True
+    path = _find_dotenv()
+    if path is not None:
+        from dotenv import load_dotenv
+
+        load_dotenv(path)
+
+
+def get_env_str(key: str, default: Optional[str] = None) -> Optional[str]:
+    load_env()
+    return os.getenv(key) or default
 
 
 def get_env_int(key: str, default: int) -> int:
+    load_env()
     val = os.getenv(key)
     if val is None:
         return default
     try:
         return int(val)
     except ValueError:
-        return default
\ No newline at end of file
+        return default
+
+
+def get_env_bool(key: str, default: bool = False) -> bool:
+    load_env()
+    val = os.getenv(key)
+    if val is None:
+        return default
+    return val.strip().lower() in ("1", "true", "yes", "on")
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from todolist.storage.base import Storage
+
+
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+_DIGIT_SET = frozenset(_DIGITS)
+# Two base-36 digits at a time: halves the divmod steps of encode_id.
+_PAIRS = [a + b for a in _DIGITS for b in _DIGITS]
+_FIRST_PREFIX = ord("g")
+_MAX_LENGTH = ord("z") - _FIRST_PREFIX + 1
+
+
+def encode_id(n: int) -> str:
+    """Short id for the number ``n``, e.g. 0 -> "g0", 36 -> "h10", 50_000 -> "j12kw".
+
+    The base-36 digits follow a letter giving their count, so ids of
+    increasing numbers also sort as increasing strings. Prefixes run from
+    "g" on, so no id is ever a hex string like the older 4-character ids.
+    """
+    if n < 36:
+        return "g" + _DIGITS[n]
+    chunks = []
+    while n >= 1296:
+        n, r = divmod(n, 1296)
+        chunks.append(_PAIRS[r])
+    chunks.append(_PAIRS[n] if n >= 36 else _DIGITS[n])
+    digits = "".join(reversed(chunks))
+    return chr(_FIRST_PREFIX + len(digits) - 1) + digits
+
+
+def decode_id(value: str) -> Optional[int]:
+    """The number behind an ``encode_id`` id, or None for any other string."""
+    if len(value) < 2:
+        return None
+    length = ord(value[0]) - _FIRST_PREFIX + 1
+    digits = value[1:]
+    if not 1 <= length <= _MAX_LENGTH or len(digits) != length:
+        return None
+    if not _DIGIT_SET.issuperset(digits):
+        return None
+    return int(digits, 36)
+
+
+def random_id() -> str:
+    """A random id for entities created outside any store; never in ``encode_id`` form."""
+    return os.urandom(8).hex()
+
+
+class IdAllocator:
+    """Hands out unique, sortable ids for one store.
+
+    Numbers are reserved from the store a block at a time through
+    ``reserve(n, floor)``, which returns the first of ``n`` numbers no lower
+    than ``floor`` and never returns them again, also after a restart. Within
+    a block, ``next_id`` takes no lock: it draws from an ``itertools.count``,
+    whose ``next`` is atomic in CPython, and only the thread that runs past
+    the block's end reserves the next one, so its ids come out in
+    increasing order.
+
+    ``next_id_async`` is for coroutines: it refills through an awaitable
+    ``reserve``, so a blocking backend is never called on the event loop.
+    ``take`` reserves a whole batch in one call for bulk creation.
+    ``note_used`` moves past ids that arrived from elsewhere, e.g. an
+    import, so they are never handed out again.
+    """
+
+    def __init__(self, reserve: Callable[[int, int], int], block: int = 1024) -> None:
+        self._reserve = reserve
+        self.block = block
+        self._lock = threading.Lock()
+        # The current block: numbers to draw from and the end of the block.
+        self._current: Tuple[Iterator[int], int] = (itertools.count(), 0)
+
+    def next_id(self) -> str:
+        while True:
+            current = self._current
+            n = next(current[0])
+            if n < current[1]:
+                return encode_id(n)
+            self._refill(current)
+
+    async def next_id_async(self, reserve: Callable[[int, int], Awaitable[int]]) -> str:
+        """``next_id``, reserving a new block by awaiting ``reserve`` (e.g. AsyncStorage.reserve_ids)."""
+        while True:
+            current = self._current
+            n = next(current[0])
+            if n < current[1]:
+                return encode_id(n)
+            start = await reserve(self.block, 0)
+            with self._lock:
+                # Another caller may have installed a later block meanwhile; ids
+                # must not go backwards, so an older block is left unused.
+                if start >= self._current[1]:
+                    self._current = (itertools.count(start), start + self.block)
+
+    def _refill(self, exhausted: Tuple[Iterator[int], int]) -> None:
+        with self._lock:
+            if self._current is exhausted:
+                start = self._reserve(self.block, 0)
+                self._current = (itertools.count(start), start + self.block)
+
+    def take(self, n: int) -> List[str]:
+        """``n`` fresh ids reserved in one step, in increasing order."""
+        if n <= 0:
+            return []
+        with self._lock:
+            start = self._reserve(n, 0)
+        return [encode_id(i) for i in range(start, start + n)]
+
+    def note_used(self, ids: Iterable[str]) -> None:
+        """Make sure none of ``ids`` is handed out later."""
+        highest = max((n for n in map(decode_id, ids) if n is not None), default=None)
+        if highest is None:
+            return
+        with self._lock:
+            self._reserve(0, highest + 1)
+            if self._current[1] > highest:
+                # The current block may still hold numbers up to ``highest``.
+                self._current = (itertools.count(), 0)
+
+
+_allocators: "weakref.WeakKeyDictionary[Any, IdAllocator]" = weakref.WeakKeyDictionary()
+_allocators_lock = threading.Lock()
+
+
+def ids_for(storage: "Storage") -> IdAllocator:
+    """The allocator shared by every service working on ``storage``."""
+    allocator = _allocators.get(storage)
+    if allocator is None:
+        with _allocators_lock:
+            allocator = _allocators.get(storage)
+            if allocator is None:
+                allocator = _allocators[storage] = IdAllocator(storage.reserve_ids)
+    return allocator
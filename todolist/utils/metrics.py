@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from todolist.core.entities.page import iter_pages
+from todolist.storage.base import Storage
+
+
+# Upper bounds in seconds: 1 µs, 4 µs, 16 µs, ... ~4.2 s.
+BUCKETS: Tuple[float, ...] = tuple(1e-6 * 4 ** i for i in range(12))
+
+
+class Histogram:
+    """Call count, error count and latency histogram of one instrumented callable."""
+
+    __slots__ = ("counts", "count", "sum", "errors", "_lock")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.errors = 0
+
+    def observe(self, seconds: float, failed: bool = False) -> None:
+        i = bisect_left(BUCKETS, seconds)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.sum += seconds
+            if failed:
+                self.errors += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile (inf past the last bucket)."""
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(BUCKETS + (float("inf"),), self.counts):
+            seen += n
+            if seen >= rank and seen:
+                return bound
+        return 0.0
+
+
+class MetricsRegistry:
+    """Histograms keyed by qualified method name, e.g. ``TaskService.add_task``."""
+
+    def __init__(self) -> None:
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str) -> Histogram:
+        hist = self._histograms.get(name)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(name, Histogram())
+        return hist
+
+    def snapshot(self) -> Dict[str, Histogram]:
+        with self._lock:
+            return dict(self._histograms)
+
+    def reset(self) -> None:
+        # Zeroed in place: installed wrappers keep their histogram objects.
+        for hist in self.snapshot().values():
+            with hist._lock:
+                hist.reset()
+
+    def to_prometheus(self, storage: Optional[Storage] = None) -> str:
+        """Prometheus text exposition of every histogram, plus object counts when ``storage`` is given."""
+        lines = [
+            "# HELP todolist_call_seconds Latency of instrumented service, validator and storage calls.",
+            "# TYPE todolist_call_seconds histogram",
+        ]
+        errors = []
+        for name, hist in sorted(self.snapshot().items()):
+            label = f'method="{name}"'
+            cumulative = 0
+            for bound, n in zip(BUCKETS, hist.counts):
+                cumulative += n
+                lines.append(f'todolist_call_seconds_bucket{{{label},le="{bound:g}"}} {cumulative}')
+            lines.append(f'todolist_call_seconds_bucket{{{label},le="+Inf"}} {hist.count}')
+            lines.append(f"todolist_call_seconds_sum{{{label}}} {hist.sum:.9f}")
+            lines.append(f"todolist_call_seconds_count{{{label}}} {hist.count}")
+            errors.append(f"todolist_call_errors_total{{{label}}} {hist.errors}")
+        lines.append("# HELP todolist_call_errors_total Instrumented calls that raised.")
+        lines.append("# TYPE todolist_call_errors_total counter")
+        lines.extend(errors)
+        if storage is not None:
+            projects, tasks = object_counts(storage)
+            lines.append("# HELP todolist_projects Projects in storage.")
+            lines.append("# TYPE todolist_projects gauge")
+            lines.append(f"todolist_projects {projects}")
+            lines.append("# HELP todolist_tasks Tasks per project.")
+            lines.append("# TYPE todolist_tasks gauge")
+            lines.extend(f'todolist_tasks{{project="{pid}"}} {n}' for pid, n in tasks)
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str, storage: Optional[Storage] = None) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus(storage))
+
+
+REGISTRY = MetricsRegistry()
+
+
+def object_counts(storage: Storage) -> Tuple[int, List[Tuple[str, int]]]:
+    """Project count and (project id, task count) pairs, read without copying any task lists."""
+    per_project = [
+        (p.id, storage.count_tasks(p.id))
+        for p in iter_pages(lambda cursor: storage.list_projects_page(cursor, 500))
+    ]
+    return len(per_project), per_project
+
+
+# ---------- Instrumentation ----------
+# Instrumenting swaps the targets for timing wrappers and uninstrumenting puts
+# the originals back, so while metrics are off no wrapper is on the call path.
+_patched: List[Tuple[Any, str, Any]] = []
+
+
+def _timed(name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    hist = REGISTRY.histogram(name)
+    clock = time.perf_counter
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = clock()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            hist.observe(clock() - start, failed=True)
+            raise
+        hist.observe(clock() - start)
+        return result
+
+    return wrapper
+
+
+def _timed_block(name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    # For context managers such as transaction(): times the whole with-block,
+    # not just the call that creates the context manager.
+    hist = REGISTRY.histogram(name)
+    clock = time.perf_counter
+
+    @contextmanager
+    def block(*args: Any, **kwargs: Any) -> Iterator[Any]:
+        start = clock()
+        try:
+            with fn(*args, **kwargs) as value:
+                yield value
+        except BaseException:
+            hist.observe(clock() - start, failed=True)
+            raise
+        hist.observe(clock() - start)
+
+    return functools.wraps(fn)(block)
+
+
+def _storage_classes(storage: Optional[Storage]) -> List[type]:
+    """The classes behind ``storage``, through wrappers such as CachingStorage, base classes included."""
+    if storage is None:
+        from todolist.storage.memory_storage import MemoryStorage
+
+        return [MemoryStorage]
+    classes: List[type] = []
+    while storage is not None:
+        classes.extend(cls for cls in type(storage).__mro__ if cls is not object and cls not in classes)
+        storage = vars(storage).get("backend")
+    return classes
+
+
+def _targets(storage: Optional[Storage]) -> Tuple[List[type], List[Any]]:
+    from todolist.core.services.project_service import ProjectService
+    from todolist.core.services.task_service import TaskService
+    from todolist.core.validators import page_validator, project_validator, task_validator
+
+    classes = [ProjectService, TaskService] + _storage_classes(storage)
+    return classes, [project_validator, task_validator, page_validator]
+
+
+def is_instrumented() -> bool:
+    return bool(_patched)
+
+
+def instrument(storage: Optional[Storage] = None) -> None:
+    """Start recording every public ProjectService, TaskService, storage and validator call.
+
+    The storage methods measured are those of the classes behind ``storage``
+    (MemoryStorage when it is not given), so pass the storage in use.
+    """
+    if _patched:
+        return
+    classes, validator_modules = _targets(storage)
+    for cls in classes:
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not callable(value) or isinstance(value, (staticmethod, classmethod)):
+                continue
+            _patched.append((cls, attr, value))
+            timed = _timed_block if attr == "transaction" else _timed
+            setattr(cls, attr, timed(f"{cls.__name__}.{attr}", value))
+
+    # Validators are wrapped where they are defined. Callers go through the
+    # module (``task_validator.validate_status(...)``), so modules imported
+    # after this call are measured too.
+    for module in validator_modules:
+        for attr, fn in list(vars(module).items()):
+            if not attr.startswith("validate_") or not callable(fn):
+                continue
+            _patched.append((module, attr, fn))
+            setattr(module, attr, _timed(f"{module.__name__.rsplit('.', 1)[1]}.{attr}", fn))
+
+
+def uninstrument() -> None:
+    """Put the original callables back; recorded histograms are kept."""
+    while _patched:
+        owner, attr, original = _patched.pop()
+        setattr(owner, attr, original)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+
+
+class SeqOrder(Generic[K]):
+    """Insertion order of keys with stable, resumable positions.
+
+    Every key gets a monotonically increasing sequence number. ``after(seq)``
+    finds where to resume by bisection, so a cursor is just the last seq
+    seen and stays valid while keys before or after it come and go.
+    Removals leave tombstones that are compacted once they outnumber the
+    live keys.
+    """
+
+    __slots__ = ("_seqs", "_keys", "_seq_of", "_next", "_dead")
+
+    def __init__(self) -> None:
+        self._seqs = array("q")
+        self._keys: List[Optional[K]] = []
+        self._seq_of: Dict[K, int] = {}
+        self._next = 1
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._seq_of)
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next appended key will get."""
+        return self._next
+
+    def advance(self, seq: int) -> None:
+        """Number keys appended from now on from ``seq`` at least."""
+        self._next = max(self._next, seq)
+
+    def add(self, key: K, seq: Optional[int] = None) -> int:
+        """Append ``key``; with ``seq``, put it back at the number it had before.
+
+        Putting a key back below the last number costs a list insert unless
+        its tombstone is still there. Returns the key's number.
+        """
+        old = self._seq_of.get(key)
+        if old is not None:
+            return old
+        if seq is None or seq >= self._next:
+            if seq is None:
+                seq = self._next
+            self._next = seq + 1
+            self._seqs.append(seq)
+            self._keys.append(key)
+        else:
+            i = bisect_left(self._seqs, seq)
+            if i < len(self._seqs) and self._seqs[i] == seq:
+                if self._keys[i] is not None:
+                    raise ValueError(f"Sequence number {seq} is taken.")
+                self._keys[i] = key
+                self._dead -= 1
+            else:
+                self._seqs.insert(i, seq)
+                self._keys.insert(i, key)
+        self._seq_of[key] = seq
+        return seq
+
+    def seq_of(self, key: K) -> Optional[int]:
+        return self._seq_of.get(key)
+
+    def remove(self, key: K) -> None:
+        seq = self._seq_of.pop(key, None)
+        if seq is None:
+            return
+        self._keys[bisect_left(self._seqs, seq)] = None
+        self._dead += 1
+        if self._dead > 64 and self._dead > len(self._seq_of):
+            self._compact()
+
+    def _compact(self) -> None:
+        live = [(s, k) for s, k in zip(self._seqs, self._keys) if k is not None]
+        self._seqs = array("q", (s for s, _ in live))
+        self._keys = [k for _, k in live]
+        self._dead = 0
+
+    def after(self, seq: int, limit: int) -> List[Tuple[int, K]]:
+        """Up to ``limit`` (seq, key) pairs with a sequence number above ``seq``."""
+        out: List[Tuple[int, K]] = []
+        i = bisect_right(self._seqs, seq)
+        n = len(self._seqs)
+        while i < n and len(out) < limit:
+            key = self._keys[i]
+            if key is not None:
+                out.append((self._seqs[i], key))
+            i += 1
+        return out
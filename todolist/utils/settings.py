@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from todolist.utils.env_loader import get_env_bool, get_env_int, get_env_str
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Everything the app reads from the environment, read once."""
+
+    max_projects: int = 10
+    max_tasks: int = 100
+    database_path: Optional[str] = None
+    journal_path: Optional[str] = None
+    storage_shards: int = 1
+    storage_cache_size: int = 0
+    metrics_enabled: bool = False
+    metrics_path: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        # The singular keys are what earlier versions read; they still work as a fallback.
+        return cls(
+            max_projects=get_env_int("MAX_NUMBER_OF_PROJECTS", get_env_int("MAX_NUMBER_OF_PROJECT", 10)),
+            max_tasks=get_env_int("MAX_NUMBER_OF_TASKS", get_env_int("MAX_NUMBER_OF_TASK", 100)),
+            database_path=get_env_str("DATABASE_PATH"),
+            journal_path=get_env_str("JOURNAL_PATH"),
+            storage_shards=get_env_int("STORAGE_SHARDS", 1),
+            storage_cache_size=get_env_int("STORAGE_CACHE_SIZE", 0),
+            metrics_enabled=get_env_bool("METRICS_ENABLED"),
+            metrics_path=get_env_str("METRICS_PATH"),
+        )
+
+
+_settings: Optional[Settings] = None
+_lock = threading.Lock()
+
+
+def get_settings() -> Settings:
+    """The process-wide settings, read from the environment on first use."""
+    global _settings
+    if _settings is None:
+        with _lock:
+            if _settings is None:
+                _settings = Settings.from_env()
+    return _settings
+
+
+def reload_settings() -> Settings:
+    """Re-read the environment, e.g. after changing ``os.environ``."""
+    global _settings
+    with _lock:
+        _settings = Settings.from_env()
+    return _settings
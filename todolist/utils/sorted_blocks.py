@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from itertools import accumulate, chain, islice
+from typing import Any, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+# Items per block after a split; a block is split once it holds twice that.
+DEFAULT_LOAD = 1000
+
+
+class SortedBlocks(Generic[T]):
+    """A sorted list stored as a list of sorted blocks.
+
+    Inserting into or deleting from one flat list moves every later item,
+    which makes each change O(n). Here a change bisects the block maxima
+    and edits one block of at most ``2 * load`` items, so its cost stays
+    flat as the list grows. A position (``index``) sums the lengths of the
+    blocks before it, from offsets rebuilt on the first lookup after a change.
+    """
+
+    __slots__ = ("_load", "_blocks", "_maxes", "_len", "_offsets")
+
+    def __init__(self, items: Iterable[T] = (), load: int = DEFAULT_LOAD) -> None:
+        self._load = load
+        self._blocks: List[List[T]] = []
+        self._maxes: List[T] = []
+        self._len = 0
+        self._offsets: Optional[List[int]] = None
+        self._rebuild(sorted(items))
+
+    def _rebuild(self, items: List[T]) -> None:
+        load = self._load
+        self._blocks = [items[i:i + load] for i in range(0, len(items), load)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = len(items)
+        self._offsets = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self._blocks)
+
+    def __repr__(self) -> str:
+        return f"SortedBlocks({list(self)!r})"
+
+    # ---------- Changes ----------
+    def add(self, item: T) -> None:
+        blocks, maxes = self._blocks, self._maxes
+        self._len += 1
+        self._offsets = None
+        if not blocks:
+            blocks.append([item])
+            maxes.append(item)
+            return
+        i = bisect_left(maxes, item)
+        if i == len(maxes):
+            i -= 1
+            blocks[i].append(item)
+            maxes[i] = item
+        else:
+            insort(blocks[i], item)
+        block = blocks[i]
+        if len(block) > 2 * self._load:
+            tail = block[self._load:]
+            del block[self._load:]
+            blocks.insert(i + 1, tail)
+            maxes[i] = block[-1]
+            maxes.insert(i + 1, tail[-1])
+
+    def update(self, items: Iterable[T]) -> None:
+        """Add many items; a batch large next to the list is merged in one sort."""
+        batch = list(items)
+        if len(batch) * 8 > self._len:
+            # Both runs are sorted already, which the sort detects and merges in O(n).
+            batch.sort()
+            self._rebuild(sorted(chain(self, batch)))
+            return
+        for item in batch:
+            self.add(item)
+
+    def discard(self, item: T) -> bool:
+        """Remove one occurrence of ``item``; False if there is none."""
+        blocks, maxes = self._blocks, self._maxes
+        i = bisect_left(maxes, item)
+        if i == len(maxes):
+            return False
+        block = blocks[i]
+        j = bisect_left(block, item)
+        if block[j] != item:
+            return False
+        del block[j]
+        self._len -= 1
+        self._offsets = None
+        if not block:
+            del blocks[i]
+            del maxes[i]
+            return True
+        maxes[i] = block[-1]
+        # Fold a shrunken block into its successor so blocks stay well filled.
+        if len(block) < self._load // 2 and i + 1 < len(blocks) and len(block) + len(blocks[i + 1]) <= self._load:
+            block.extend(blocks[i + 1])
+            maxes[i] = block[-1]
+            del blocks[i + 1]
+            del maxes[i + 1]
+        return True
+
+    # ---------- Lookups ----------
+    def index(self, item: Any) -> int:
+        """How many items are less than ``item`` (where bisect_left would insert it)."""
+        i = bisect_left(self._maxes, item)
+        if i == len(self._maxes):
+            return self._len
+        if self._offsets is None:
+            self._offsets = [0, *accumulate(map(len, self._blocks))]
+        return self._offsets[i] + bisect_left(self._blocks[i], item)
+
+    def first_from(self, item: Any) -> Optional[T]:
+        """The smallest item not less than ``item``, or None."""
+        i = bisect_left(self._maxes, item)
+        if i == len(self._maxes):
+            return None
+        block = self._blocks[i]
+        return block[bisect_left(block, item)]
+
+    def irange(self, start: Any = None, stop: Any = None) -> List[T]:
+        """Items with ``start <= item < stop`` in order; None leaves that end open."""
+        blocks, maxes = self._blocks, self._maxes
+        i = 0 if start is None else bisect_left(maxes, start)
+        if i == len(maxes):
+            return []
+        out: List[T] = []
+        j = 0 if start is None else bisect_left(blocks[i], start)
+        for block in islice(blocks, i, None):
+            if stop is not None and block[-1] >= stop:
+                out.extend(block[j:bisect_left(block, stop, j)])
+                break
+            out.extend(block[j:] if j else block)
+            j = 0
+        return out
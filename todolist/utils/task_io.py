@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import csv
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional, TextIO, Tuple
+
+from todolist.core.entities.task import Task
+from todolist.core.exceptions.invalid_entity import InvalidEntityError
+
+
+FORMATS = ("csv", "jsonl")
+FIELDS = ("id", "title", "description", "status", "deadline")
+
+
+def check_format(fmt: str) -> None:
+    if fmt not in FORMATS:
+        raise InvalidEntityError(f"Format must be one of {FORMATS}.")
+
+
+def read_rows(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    """Yield (row number, row) pairs lazily; the row is None when it cannot be parsed.
+
+    Row numbers are 1-based data rows: the CSV header is not counted, and
+    blank JSONL lines are skipped but still counted.
+    """
+    check_format(fmt)
+    if fmt == "csv":
+        for n, row in enumerate(csv.DictReader(stream), 1):
+            yield n, row
+        return
+    # Each line is decoded on its own. Joining a block of lines into one JSON
+    # array is faster but cannot tell where a line's value ends: a line holding
+    # '{"a":1},{"b":2}' yields two rows, and a line leaving a bracket open
+    # swallows the next one, so later rows land on the wrong line numbers.
+    loads = json.loads
+    for n, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            row = loads(line)
+        except ValueError:
+            row = None
+        yield n, row if isinstance(row, dict) else None
+
+
+def write_tasks(tasks: Iterable[Task], out: TextIO, fmt: str) -> int:
+    """Write tasks one row at a time; returns the number written."""
+    check_format(fmt)
+    n = 0
+    if fmt == "csv":
+        writer = csv.writer(out)
+        writer.writerow(FIELDS)
+        for t in tasks:
+            writer.writerow((t.id, t.title, t.description, t.status, t.deadline.isoformat() if t.deadline else ""))
+            n += 1
+        return n
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    for t in tasks:
+        out.write(dumps({
+            "id": t.id,
+            "title": t.title,
+            "description": t.description,
+            "status": t.status,
+            "deadline": t.deadline.isoformat() if t.deadline else None,
+        }))
+        out.write("\n")
+        n += 1
+    return n